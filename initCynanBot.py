@@ -1,3 +1,8 @@
+# this is captured before anything else is imported, so that the startup profiler's
+# report includes the time spent importing all of the modules below
+import time
+startTime = time.perf_counter()
+
 import asyncio
 import locale
 from asyncio import AbstractEventLoop
@@ -31,6 +36,8 @@ from src.chatActions.persistAllUsersChatAction import PersistAllUsersChatAction
 from src.chatActions.recurringActionsWizardChatAction import RecurringActionsWizardChatAction
 from src.chatActions.saveMostRecentAnivMessageChatAction import SaveMostRecentAnivMessageChatAction
 from src.chatActions.schubertWalkChatAction import SchubertWalkChatAction
+from src.chatLogger.chatArchive import ChatArchive
+from src.chatLogger.chatArchiveInterface import ChatArchiveInterface
 from src.chatLogger.chatLogger import ChatLogger
 from src.chatLogger.chatLoggerInterface import ChatLoggerInterface
 from src.cheerActions.beanChance.beanChanceCheerActionHelper import BeanChanceCheerActionHelper
@@ -59,9 +66,7 @@ from src.cuteness.cutenessRepositoryInterface import CutenessRepositoryInterface
 from src.cuteness.cutenessUtils import CutenessUtils
 from src.cuteness.cutenessUtilsInterface import CutenessUtilsInterface
 from src.cynanBot import CynanBot
-from src.deepL.deepLApiService import DeepLApiService
 from src.deepL.deepLApiServiceInterface import DeepLApiServiceInterface
-from src.deepL.deepLJsonMapper import DeepLJsonMapper
 from src.deepL.deepLJsonMapperInterface import DeepLJsonMapperInterface
 from src.emojiHelper.emojiHelper import EmojiHelper
 from src.emojiHelper.emojiHelperInterface import EmojiHelperInterface
@@ -77,13 +82,9 @@ from src.funtoon.funtoonTokensRepository import FuntoonTokensRepository
 from src.funtoon.funtoonTokensRepositoryInterface import FuntoonTokensRepositoryInterface
 from src.funtoon.funtoonUserIdProvider import FuntoonUserIdProvider
 from src.funtoon.funtoonUserIdProviderInterface import FuntoonUserIdProviderInterface
-from src.google.googleApiAccessTokenStorage import GoogleApiAccessTokenStorage
 from src.google.googleApiAccessTokenStorageInterface import GoogleApiAccessTokenStorageInterface
-from src.google.googleApiService import GoogleApiService
 from src.google.googleApiServiceInterface import GoogleApiServiceInterface
-from src.google.googleJsonMapper import GoogleJsonMapper
 from src.google.googleJsonMapperInterface import GoogleJsonMapperInterface
-from src.google.googleJwtBuilder import GoogleJwtBuilder
 from src.google.googleJwtBuilderInterface import GoogleJwtBuilderInterface
 from src.jisho.jishoApiService import JishoApiService
 from src.jisho.jishoApiServiceInterface import JishoApiServiceInterface
@@ -95,14 +96,12 @@ from src.language.jishoHelper import JishoHelper
 from src.language.jishoHelperInterface import JishoHelperInterface
 from src.language.languagesRepository import LanguagesRepository
 from src.language.languagesRepositoryInterface import LanguagesRepositoryInterface
-from src.language.translation.deepLTranslationApi import DeepLTranslationApi
-from src.language.translation.googleTranslationApi import GoogleTranslationApi
-from src.language.translationHelper import TranslationHelper
 from src.language.translationHelperInterface import TranslationHelperInterface
 from src.language.wordOfTheDayPresenter import WordOfTheDayPresenter
 from src.language.wordOfTheDayPresenterInterface import WordOfTheDayPresenterInterface
-from src.language.wordOfTheDayRepository import WordOfTheDayRepository
 from src.language.wordOfTheDayRepositoryInterface import WordOfTheDayRepositoryInterface
+from src.latencyTracing.latencyTracer import LatencyTracer
+from src.latencyTracing.latencyTracerInterface import LatencyTracerInterface
 from src.location.locationsRepository import LocationsRepository
 from src.location.locationsRepositoryInterface import LocationsRepositoryInterface
 from src.location.timeZoneRepository import TimeZoneRepository
@@ -115,6 +114,7 @@ from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from src.misc.cynanBotUserIdsProvider import CynanBotUserIdsProvider
 from src.misc.cynanBotUserIdsProviderInterface import CynanBotUserIdsProviderInterface
 from src.misc.generalSettingsRepository import GeneralSettingsRepository
+from src.misc.startupProfiler import StartupProfiler
 from src.mostRecentChat.mostRecentChatsRepository import MostRecentChatsRepository
 from src.mostRecentChat.mostRecentChatsRepositoryInterface import MostRecentChatsRepositoryInterface
 from src.network.aioHttpClientProvider import AioHttpClientProvider
@@ -129,9 +129,7 @@ from src.openWeather.openWeatherApiService import OpenWeatherApiService
 from src.openWeather.openWeatherApiServiceInterface import OpenWeatherApiServiceInterface
 from src.openWeather.openWeatherJsonMapper import OpenWeatherJsonMapper
 from src.openWeather.openWeatherJsonMapperInterface import OpenWeatherJsonMapperInterface
-from src.pkmn.pokepediaJsonMapper import PokepediaJsonMapper
 from src.pkmn.pokepediaJsonMapperInterface import PokepediaJsonMapperInterface
-from src.pkmn.pokepediaRepository import PokepediaRepository
 from src.pkmn.pokepediaRepositoryInterface import PokepediaRepositoryInterface
 from src.puptime.puptimeUserIdProvider import PuptimeUserIdProvider
 from src.puptime.puptimeUserIdProviderInterface import PuptimeUserIdProviderInterface
@@ -163,9 +161,13 @@ from src.soundPlayerManager.stub.stubSoundPlayerRandomizerHelper import StubSoun
 from src.starWars.starWarsQuotesRepository import StarWarsQuotesRepository
 from src.starWars.starWarsQuotesRepositoryInterface import StarWarsQuotesRepositoryInterface
 from src.storage.backingDatabase import BackingDatabase
+from src.storage.backingPooledSqliteDatabase import BackingPooledSqliteDatabase
 from src.storage.backingPsqlDatabase import BackingPsqlDatabase
 from src.storage.backingSqliteDatabase import BackingSqliteDatabase
 from src.storage.databaseType import DatabaseType
+from src.storage.migrations.databaseMigrationsHelper import DatabaseMigrationsHelper
+from src.storage.migrations.databaseMigrationsHelperInterface import DatabaseMigrationsHelperInterface
+from src.storage.migrations.databaseMigrationsRegistry import DatabaseMigrationsRegistry
 from src.storage.jsonFileReader import JsonFileReader
 from src.storage.linesFileReader import LinesFileReader
 from src.storage.psqlCredentialsProvider import PsqlCredentialsProvider
@@ -196,9 +198,7 @@ from src.timeout.timeoutActionJsonMapper import TimeoutActionJsonMapper
 from src.timeout.timeoutActionJsonMapperInterface import TimeoutActionJsonMapperInterface
 from src.timeout.timeoutActionSettingsRepository import TimeoutActionSettingsRepository
 from src.timeout.timeoutActionSettingsRepositoryInterface import TimeoutActionSettingsRepositoryInterface
-from src.transparent.transparentApiService import TransparentApiService
 from src.transparent.transparentApiServiceInterface import TransparentApiServiceInterface
-from src.transparent.transparentXmlMapper import TransparentXmlMapper
 from src.transparent.transparentXmlMapperInterface import TransparentXmlMapperInterface
 from src.trivia.additionalAnswers.additionalTriviaAnswersRepository import AdditionalTriviaAnswersRepository
 from src.trivia.additionalAnswers.additionalTriviaAnswersRepositoryInterface import \
@@ -298,6 +298,9 @@ from src.trivia.triviaRepositories.openTriviaQa.openTriviaQaQuestionTypeParserIn
 from src.trivia.triviaRepositories.openTriviaQaTriviaQuestionRepository import OpenTriviaQaTriviaQuestionRepository
 from src.trivia.triviaRepositories.pkmnTriviaQuestionRepository import PkmnTriviaQuestionRepository
 from src.trivia.triviaRepositories.quizApiTriviaQuestionRepository import QuizApiTriviaQuestionRepository
+from src.trivia.triviaRepositories.readOnlySqliteConnectionManager import ReadOnlySqliteConnectionManager
+from src.trivia.triviaRepositories.readOnlySqliteConnectionManagerInterface import \
+    ReadOnlySqliteConnectionManagerInterface
 from src.trivia.triviaRepositories.triviaDatabase.triviaDatabaseQuestionStorage import TriviaDatabaseQuestionStorage
 from src.trivia.triviaRepositories.triviaDatabase.triviaDatabaseQuestionStorageInterface import \
     TriviaDatabaseQuestionStorageInterface
@@ -306,6 +309,8 @@ from src.trivia.triviaRepositories.triviaQuestionCompanyTriviaQuestionRepository
     TriviaQuestionCompanyTriviaQuestionRepository
 from src.trivia.triviaRepositories.triviaRepository import TriviaRepository
 from src.trivia.triviaRepositories.triviaRepositoryInterface import TriviaRepositoryInterface
+from src.trivia.triviaRepositories.triviaSourceAvailabilityCache import TriviaSourceAvailabilityCache
+from src.trivia.triviaRepositories.triviaSourceAvailabilityCacheInterface import TriviaSourceAvailabilityCacheInterface
 from src.trivia.triviaRepositories.willFry.willFryTriviaApiService import WillFryTriviaApiService
 from src.trivia.triviaRepositories.willFry.willFryTriviaApiServiceInterface import WillFryTriviaApiServiceInterface
 from src.trivia.triviaRepositories.willFry.willFryTriviaJsonParser import WillFryTriviaJsonParser
@@ -314,6 +319,8 @@ from src.trivia.triviaRepositories.willFryTriviaQuestionRepository import WillFr
 from src.trivia.triviaRepositories.wwtbamTriviaQuestionRepository import WwtbamTriviaQuestionRepository
 from src.trivia.triviaSettingsRepository import TriviaSettingsRepository
 from src.trivia.triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
+from src.trivia.triviaSourceCircuitBreaker import TriviaSourceCircuitBreaker
+from src.trivia.triviaSourceCircuitBreakerInterface import TriviaSourceCircuitBreakerInterface
 from src.trivia.triviaSourceInstabilityHelper import TriviaSourceInstabilityHelper
 from src.trivia.triviaUtils import TriviaUtils
 from src.trivia.triviaUtilsInterface import TriviaUtilsInterface
@@ -412,6 +419,13 @@ from src.weather.weatherRepositoryInterface import WeatherRepositoryInterface
 locale.setlocale(locale.LC_ALL, 'en_US.utf8')
 
 
+startupProfiler = StartupProfiler(
+    startTime = startTime
+)
+
+startupProfiler.markSection('Imports')
+
+
 #################################
 ## Core initialization section ##
 #################################
@@ -441,6 +455,11 @@ generalSettingsRepository = GeneralSettingsRepository(
 
 generalSettingsSnapshot = generalSettingsRepository.getAll()
 
+timber.setLevels(
+    defaultLevel = generalSettingsSnapshot.getTimberLevel(),
+    tagLevels = generalSettingsSnapshot.getTimberTagLevels()
+)
+
 backingDatabase: BackingDatabase
 psqlCredentialsProvider: PsqlCredentialsProviderInterface | None = None
 
@@ -457,13 +476,28 @@ match generalSettingsSnapshot.requireDatabaseType():
         )
 
     case DatabaseType.SQLITE:
-        backingDatabase = BackingSqliteDatabase(
-            eventLoop = eventLoop
-        )
+        if generalSettingsSnapshot.isSqliteConnectionPoolEnabled():
+            backingDatabase = BackingPooledSqliteDatabase(
+                eventLoop = eventLoop,
+                timber = timber
+            )
+        else:
+            backingDatabase = BackingSqliteDatabase(
+                eventLoop = eventLoop
+            )
 
     case _:
         raise RuntimeError(f'Unknown/misconfigured DatabaseType: \"{generalSettingsSnapshot.requireDatabaseType()}\"')
 
+databaseMigrationsHelper: DatabaseMigrationsHelperInterface = DatabaseMigrationsHelper(
+    backingDatabase = backingDatabase,
+    databaseMigrationsRegistry = DatabaseMigrationsRegistry(),
+    timber = timber,
+    timeZoneRepository = timeZoneRepository
+)
+
+eventLoop.run_until_complete(databaseMigrationsHelper.migrate())
+
 networkClientProvider: NetworkClientProvider
 match generalSettingsSnapshot.requireNetworkClientType():
     case NetworkClientType.AIOHTTP:
@@ -601,22 +635,35 @@ addOrRemoveUserDataHelper: AddOrRemoveUserDataHelperInterface = AddOrRemoveUserD
     timeZoneRepository = timeZoneRepository
 )
 
+chatArchive: ChatArchiveInterface | None = None
+
+if generalSettingsSnapshot.isChatArchiveEnabled():
+    chatArchive = ChatArchive(
+        timber = timber,
+        timeZoneRepository = timeZoneRepository
+    )
+
 chatLogger: ChatLoggerInterface = ChatLogger(
     backgroundTaskHelper = backgroundTaskHelper,
+    chatArchive = chatArchive,
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
 
 
-#####################################
-## CynanBot initialization section ##
-#####################################
+startupProfiler.markSection('Core')
+
+##############################################
+## User ID Providers initialization section ##
+##############################################
 
 cynanBotUserIdsProvider: CynanBotUserIdsProviderInterface = CynanBotUserIdsProvider()
 
 twitchFriendsUserIdRepository: TwitchFriendsUserIdRepositoryInterface = TwitchFriendsUserIdRepository()
 
 
+startupProfiler.markSection('User ID Providers')
+
 #####################################
 ## Cuteness initialization section ##
 #####################################
@@ -631,6 +678,8 @@ cutenessRepository: CutenessRepositoryInterface = CutenessRepository(
 cutenessUtils: CutenessUtilsInterface = CutenessUtils()
 
 
+startupProfiler.markSection('Cuteness')
+
 #####################################
 ## Nightbot initialization section ##
 #####################################
@@ -638,6 +687,8 @@ cutenessUtils: CutenessUtilsInterface = CutenessUtils()
 nightbotUserIdProvider: NightbotUserIdProviderInterface = NightbotUserIdProvider()
 
 
+startupProfiler.markSection('Nightbot')
+
 ###################################
 ## Tangia initialization section ##
 ###################################
@@ -645,6 +696,8 @@ nightbotUserIdProvider: NightbotUserIdProviderInterface = NightbotUserIdProvider
 tangiaBotUserIdProvider: TangiaBotUserIdProviderInterface = TangiaBotUserIdProvider()
 
 
+startupProfiler.markSection('Tangia')
+
 ######################################
 ## Trollmoji initialization section ##
 ######################################
@@ -661,6 +714,8 @@ trollmojiHelper: TrollmojiHelperInterface = TrollmojiHelper(
 )
 
 
+startupProfiler.markSection('Trollmoji')
+
 ####################################
 ## Funtoon initialization section ##
 ####################################
@@ -689,6 +744,13 @@ funtoonRepository: FuntoonRepositoryInterface = FuntoonRepository(
     timber = timber
 )
 
+
+startupProfiler.markSection('Funtoon')
+
+#################################
+## Misc initialization section ##
+#################################
+
 emojiRepository: EmojiRepositoryInterface = EmojiRepository(
     emojiJsonReader = JsonFileReader('emojiRepository.json'),
     timber = timber
@@ -714,20 +776,28 @@ locationsRepository: LocationsRepositoryInterface = LocationsRepository(
 )
 
 mostRecentChatsRepository: MostRecentChatsRepositoryInterface = MostRecentChatsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
-    timeZoneRepository = timeZoneRepository
+    timeZoneRepository = timeZoneRepository,
+    writeBehindEnabled = generalSettingsSnapshot.isMostRecentChatsWriteBehindEnabled()
 )
 
-pokepediaJsonMapper: PokepediaJsonMapperInterface = PokepediaJsonMapper(
-    timber = timber
-)
+pokepediaRepository: PokepediaRepositoryInterface | None = None
 
-pokepediaRepository: PokepediaRepositoryInterface = PokepediaRepository(
-    networkClientProvider = networkClientProvider,
-    pokepediaJsonMapper = pokepediaJsonMapper,
-    timber = timber
-)
+if generalSettingsSnapshot.isPokepediaEnabled():
+    from src.pkmn.pokepediaJsonMapper import PokepediaJsonMapper
+    from src.pkmn.pokepediaRepository import PokepediaRepository
+
+    pokepediaJsonMapper: PokepediaJsonMapperInterface = PokepediaJsonMapper(
+        timber = timber
+    )
+
+    pokepediaRepository = PokepediaRepository(
+        networkClientProvider = networkClientProvider,
+        pokepediaJsonMapper = pokepediaJsonMapper,
+        timber = timber
+    )
 
 systemCommandHelper: SystemCommandHelperInterface = SystemCommandHelper(
     timber = timber
@@ -806,79 +876,99 @@ twitchTimeoutHelper: TwitchTimeoutHelperInterface = TwitchTimeoutHelper(
     userIdsRepository = userIdsRepository
 )
 
-transparentXmlMapper: TransparentXmlMapperInterface = TransparentXmlMapper(
-    timeZoneRepository = timeZoneRepository
-)
+wordOfTheDayRepository: WordOfTheDayRepositoryInterface | None = None
 
-transparentApiService: TransparentApiServiceInterface = TransparentApiService(
-    networkClientProvider = networkClientProvider,
-    timber = timber,
-    transparentXmlMapper = transparentXmlMapper
-)
+if generalSettingsSnapshot.isWordOfTheDayEnabled():
+    from src.language.wordOfTheDayRepository import WordOfTheDayRepository
+    from src.transparent.transparentApiService import TransparentApiService
+    from src.transparent.transparentXmlMapper import TransparentXmlMapper
 
-wordOfTheDayRepository: WordOfTheDayRepositoryInterface = WordOfTheDayRepository(
-    timber = timber,
-    transparentApiService = transparentApiService
-)
+    transparentXmlMapper: TransparentXmlMapperInterface = TransparentXmlMapper(
+        timeZoneRepository = timeZoneRepository
+    )
+
+    transparentApiService: TransparentApiServiceInterface = TransparentApiService(
+        networkClientProvider = networkClientProvider,
+        timber = timber,
+        transparentXmlMapper = transparentXmlMapper
+    )
+
+    wordOfTheDayRepository = WordOfTheDayRepository(
+        timber = timber,
+        transparentApiService = transparentApiService
+    )
 
 wordOfTheDayPresenter: WordOfTheDayPresenterInterface = WordOfTheDayPresenter()
 
-deepLJsonMapper: DeepLJsonMapperInterface = DeepLJsonMapper(
-    languagesRepository = languagesRepository,
-    timber = timber
-)
+translationHelper: TranslationHelperInterface | None = None
+
+if generalSettingsSnapshot.isTranslateEnabled():
+    from src.deepL.deepLApiService import DeepLApiService
+    from src.deepL.deepLJsonMapper import DeepLJsonMapper
+    from src.google.googleApiAccessTokenStorage import GoogleApiAccessTokenStorage
+    from src.google.googleApiService import GoogleApiService
+    from src.google.googleJsonMapper import GoogleJsonMapper
+    from src.google.googleJwtBuilder import GoogleJwtBuilder
+    from src.language.translation.deepLTranslationApi import DeepLTranslationApi
+    from src.language.translation.googleTranslationApi import GoogleTranslationApi
+    from src.language.translationHelper import TranslationHelper
+
+    deepLJsonMapper: DeepLJsonMapperInterface = DeepLJsonMapper(
+        languagesRepository = languagesRepository,
+        timber = timber
+    )
 
-deepLApiService: DeepLApiServiceInterface = DeepLApiService(
-    deepLAuthKeyProvider = authRepository,
-    deepLJsonMapper = deepLJsonMapper,
-    networkClientProvider = networkClientProvider,
-    timber = timber
-)
+    deepLApiService: DeepLApiServiceInterface = DeepLApiService(
+        deepLAuthKeyProvider = authRepository,
+        deepLJsonMapper = deepLJsonMapper,
+        networkClientProvider = networkClientProvider,
+        timber = timber
+    )
 
-deepLTranslationApi = DeepLTranslationApi(
-    deepLApiService = deepLApiService,
-    deepLAuthKeyProvider = authRepository,
-    timber = timber
-)
+    deepLTranslationApi = DeepLTranslationApi(
+        deepLApiService = deepLApiService,
+        deepLAuthKeyProvider = authRepository,
+        timber = timber
+    )
 
-googleApiAccessTokenStorage: GoogleApiAccessTokenStorageInterface = GoogleApiAccessTokenStorage(
-    timber = timber,
-    timeZoneRepository = timeZoneRepository
-)
+    googleApiAccessTokenStorage: GoogleApiAccessTokenStorageInterface = GoogleApiAccessTokenStorage(
+        timber = timber,
+        timeZoneRepository = timeZoneRepository
+    )
 
-googleJsonMapper: GoogleJsonMapperInterface = GoogleJsonMapper(
-    timber = timber,
-    timeZoneRepository = timeZoneRepository
-)
+    googleJsonMapper: GoogleJsonMapperInterface = GoogleJsonMapper(
+        timber = timber,
+        timeZoneRepository = timeZoneRepository
+    )
 
-googleJwtBuilder: GoogleJwtBuilderInterface = GoogleJwtBuilder(
-    googleCloudCredentialsProvider = authRepository,
-    googleJsonMapper = googleJsonMapper,
-    timeZoneRepository = timeZoneRepository
-)
+    googleJwtBuilder: GoogleJwtBuilderInterface = GoogleJwtBuilder(
+        googleCloudCredentialsProvider = authRepository,
+        googleJsonMapper = googleJsonMapper,
+        timeZoneRepository = timeZoneRepository
+    )
 
-googleApiService: GoogleApiServiceInterface = GoogleApiService(
-    googleApiAccessTokenStorage = googleApiAccessTokenStorage,
-    googleCloudProjectCredentialsProvider = authRepository,
-    googleJsonMapper = googleJsonMapper,
-    googleJwtBuilder = googleJwtBuilder,
-    networkClientProvider = networkClientProvider,
-    timber = timber
-)
+    googleApiService: GoogleApiServiceInterface = GoogleApiService(
+        googleApiAccessTokenStorage = googleApiAccessTokenStorage,
+        googleCloudProjectCredentialsProvider = authRepository,
+        googleJsonMapper = googleJsonMapper,
+        googleJwtBuilder = googleJwtBuilder,
+        networkClientProvider = networkClientProvider,
+        timber = timber
+    )
 
-googleTranslationApi = GoogleTranslationApi(
-    googleApiService = googleApiService,
-    googleCloudProjectCredentialsProvider = authRepository,
-    languagesRepository = languagesRepository,
-    timber = timber
-)
+    googleTranslationApi = GoogleTranslationApi(
+        googleApiService = googleApiService,
+        googleCloudProjectCredentialsProvider = authRepository,
+        languagesRepository = languagesRepository,
+        timber = timber
+    )
 
-translationHelper: TranslationHelperInterface | None = TranslationHelper(
-    deepLTranslationApi = deepLTranslationApi,
-    googleTranslationApi = googleTranslationApi,
-    languagesRepository = languagesRepository,
-    timber = timber
-)
+    translationHelper = TranslationHelper(
+        deepLTranslationApi = deepLTranslationApi,
+        googleTranslationApi = googleTranslationApi,
+        languagesRepository = languagesRepository,
+        timber = timber
+    )
 
 twitchWebsocketAllowedUsersRepository: TwitchWebsocketAllowedUsersRepositoryInterface = TwitchWebsocketAllowedUsersRepository(
     timber = timber,
@@ -900,6 +990,8 @@ if generalSettingsSnapshot.isEventSubEnabled():
     )
 
 
+startupProfiler.markSection('Misc')
+
 ####################################
 ## Weather initialization section ##
 ####################################
@@ -925,6 +1017,8 @@ weatherRepository: WeatherRepositoryInterface = WeatherRepository(
 )
 
 
+startupProfiler.markSection('Weather')
+
 ###################################
 ## Trivia initialization section ##
 ###################################
@@ -948,6 +1042,13 @@ triviaQuestionCompiler: TriviaQuestionCompilerInterface = TriviaQuestionCompiler
     timber = timber
 )
 triviaIdGenerator: TriviaIdGeneratorInterface = TriviaIdGenerator()
+triviaSourceAvailabilityCache: TriviaSourceAvailabilityCacheInterface = TriviaSourceAvailabilityCache(
+    backgroundTaskHelper = backgroundTaskHelper,
+    timber = timber
+)
+triviaSourceCircuitBreaker: TriviaSourceCircuitBreakerInterface = TriviaSourceCircuitBreaker(
+    timber = timber
+)
 triviaSourceInstabilityHelper: TriviaSourceInstabilityHelper = TriviaSourceInstabilityHelper(
     timber = timber,
     timeZoneRepository = timeZoneRepository
@@ -1112,8 +1213,13 @@ openTriviaQaQuestionTypeParser: OpenTriviaQaQuestionTypeParserInterface = OpenTr
     timber = timber
 )
 
+readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface = ReadOnlySqliteConnectionManager(
+    timber = timber
+)
+
 openTriviaQaQuestionStorage: OpenTriviaQaQuestionStorageInterface = OpenTriviaQaQuestionStorage(
     questionTypeParser = openTriviaQaQuestionTypeParser,
+    readOnlySqliteConnectionManager = readOnlySqliteConnectionManager,
     timber = timber
 )
 
@@ -1124,6 +1230,7 @@ openTriviaQaTriviaQuestionRepository = OpenTriviaQaTriviaQuestionRepository(
 )
 
 triviaDatabaseQuestionStorage: TriviaDatabaseQuestionStorageInterface = TriviaDatabaseQuestionStorage(
+    readOnlySqliteConnectionManager = readOnlySqliteConnectionManager,
     timber = timber,
     triviaDifficultyParser = triviaDifficultyParser,
     triviaQuestionTypeParser = triviaQuestionTypeParser
@@ -1164,6 +1271,7 @@ glacialTriviaQuestionRepository: GlacialTriviaQuestionRepositoryInterface = Glac
 )
 
 lotrDatabaseQuestionStorage: LotrDatabaseQuestionStorageInterface = LotrDatabaseQuestionStorage(
+    readOnlySqliteConnectionManager = readOnlySqliteConnectionManager,
     timber = timber
 )
 
@@ -1177,6 +1285,7 @@ lotrTriviaQuestionRepository = LotrTriviaQuestionRepository(
 )
 
 millionaireTriviaQuestionStorage: MillionaireTriviaQuestionStorageInterface = MillionaireTriviaQuestionStorage(
+    readOnlySqliteConnectionManager = readOnlySqliteConnectionManager,
     timber = timber
 )
 
@@ -1241,18 +1350,22 @@ triviaRepository: TriviaRepositoryInterface = TriviaRepository(
     timber = timber,
     triviaDatabaseTriviaQuestionRepository = triviaDatabaseTriviaQuestionRepository,
     triviaQuestionCompanyTriviaQuestionRepository = TriviaQuestionCompanyTriviaQuestionRepository(
+        readOnlySqliteConnectionManager = readOnlySqliteConnectionManager,
         timber = timber,
         triviaQuestionCompiler = triviaQuestionCompiler,
         triviaSettingsRepository = triviaSettingsRepository
     ),
     triviaScraper = triviaScraper,
     triviaSettingsRepository = triviaSettingsRepository,
+    triviaSourceAvailabilityCache = triviaSourceAvailabilityCache,
+    triviaSourceCircuitBreaker = triviaSourceCircuitBreaker,
     triviaSourceInstabilityHelper = triviaSourceInstabilityHelper,
     triviaVerifier = triviaVerifier,
     twitchHandleProvider = authRepository,
     userIdsRepository = userIdsRepository,
     willFryTriviaQuestionRepository = willFryTriviaQuestionRepository,
     wwtbamTriviaQuestionRepository = WwtbamTriviaQuestionRepository(
+        readOnlySqliteConnectionManager = readOnlySqliteConnectionManager,
         timber = timber,
         triviaQuestionCompiler = triviaQuestionCompiler,
         triviaSettingsRepository = triviaSettingsRepository
@@ -1296,6 +1409,8 @@ triviaGameMachine: TriviaGameMachineInterface = TriviaGameMachine(
 )
 
 
+startupProfiler.markSection('Trivia')
+
 #################################
 ## Aniv initialization section ##
 #################################
@@ -1347,6 +1462,8 @@ if mostRecentAnivMessageRepository is not None:
     )
 
 
+startupProfiler.markSection('Aniv')
+
 ##############################################
 ## Recurring Actions initialization section ##
 ##############################################
@@ -1396,6 +1513,8 @@ recurringActionsWizard: RecurringActionsWizardInterface = RecurringActionsWizard
 )
 
 
+startupProfiler.markSection('Recurring Actions')
+
 #################################
 ## Bean initialization section ##
 #################################
@@ -1410,6 +1529,8 @@ beanStatsRepository: BeanStatsRepositoryInterface = BeanStatsRepository(
 )
 
 
+startupProfiler.markSection('Bean')
+
 #########################################
 ## Sound Player initialization section ##
 #########################################
@@ -1421,6 +1542,8 @@ soundPlayerManagerProvider: SoundPlayerManagerProviderInterface = StubSoundPlaye
 immediateSoundPlayerManager: ImmediateSoundPlayerManagerInterface = StubImmediateSoundPlayerManager()
 
 
+startupProfiler.markSection('Sound Player')
+
 ##################################################
 ## Stream Alerts Manager initialization section ##
 ##################################################
@@ -1428,6 +1551,8 @@ immediateSoundPlayerManager: ImmediateSoundPlayerManagerInterface = StubImmediat
 streamAlertsManager: StreamAlertsManagerInterface = StubStreamAlertsManager()
 
 
+startupProfiler.markSection('Stream Alerts Manager')
+
 ####################################
 ## Timeout initialization section ##
 ####################################
@@ -1464,6 +1589,8 @@ timeoutActionHelper: TimeoutActionHelperInterface = TimeoutActionHelper(
 )
 
 
+startupProfiler.markSection('Timeout')
+
 ##########################################
 ## Cheer Actions initialization section ##
 ##########################################
@@ -1514,6 +1641,8 @@ cheerActionHelper: CheerActionHelperInterface = CheerActionHelper(
 )
 
 
+startupProfiler.markSection('Cheer Actions')
+
 #############################################
 ## Star Wars Quotes initialization section ##
 #############################################
@@ -1523,6 +1652,8 @@ starWarsQuotesRepository: StarWarsQuotesRepositoryInterface = StarWarsQuotesRepo
 )
 
 
+startupProfiler.markSection('Star Wars Quotes')
+
 ##################################
 ## Jisho initialization section ##
 ##################################
@@ -1546,6 +1677,8 @@ jishoHelper: JishoHelperInterface = JishoHelper(
 )
 
 
+startupProfiler.markSection('Jisho')
+
 #########################################
 ## Chat Actions initialization section ##
 #########################################
@@ -1601,6 +1734,11 @@ supStreamerRepository: SupStreamerRepositoryInterface = SupStreamerRepository(
     timeZoneRepository = timeZoneRepository
 )
 
+latencyTracer: LatencyTracerInterface = LatencyTracer(
+    backgroundTaskHelper = backgroundTaskHelper,
+    timber = timber
+)
+
 chatActionsManager: ChatActionsManagerInterface = ChatActionsManager(
     activeChattersRepository = activeChattersRepository,
     anivCheckChatAction = AnivCheckChatAction(
@@ -1622,6 +1760,7 @@ chatActionsManager: ChatActionsManagerInterface = ChatActionsManager(
         twitchUtils = twitchUtils
     ),
     generalSettingsRepository = generalSettingsRepository,
+    latencyTracer = latencyTracer,
     mostRecentAnivMessageTimeoutHelper = mostRecentAnivMessageTimeoutHelper,
     mostRecentChatsRepository = mostRecentChatsRepository,
     persistAllUsersChatAction = persistAllUsersChatAction,
@@ -1640,6 +1779,8 @@ chatActionsManager: ChatActionsManagerInterface = ChatActionsManager(
 )
 
 
+startupProfiler.markSection('Chat Actions')
+
 ##########################################
 ## Twitch events initialization section ##
 ##########################################
@@ -1690,6 +1831,8 @@ twitchSubscriptionHandler: AbsTwitchSubscriptionHandler | None = TwitchSubscript
 )
 
 
+startupProfiler.markSection('Twitch events')
+
 #####################################
 ## CynanBot initialization section ##
 #####################################
@@ -1710,6 +1853,7 @@ cynanBot = CynanBot(
     anivSettingsRepository = anivSettingsRepository,
     authRepository = authRepository,
     backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = backingDatabase,
     bannedTriviaGameControllersRepository = bannedTriviaGameControllersRepository,
     bannedWordsRepository = bannedWordsRepository,
     beanChanceCheerActionHelper = beanChanceCheerActionHelper,
@@ -1739,6 +1883,7 @@ cynanBot = CynanBot(
     isLiveOnTwitchRepository = isLiveOnTwitchRepository,
     jishoHelper = jishoHelper,
     languagesRepository = languagesRepository,
+    latencyTracer = latencyTracer,
     locationsRepository = locationsRepository,
     mostRecentAnivMessageRepository = mostRecentAnivMessageRepository,
     mostRecentAnivMessageTimeoutHelper = mostRecentAnivMessageTimeoutHelper,
@@ -1813,9 +1958,12 @@ cynanBot = CynanBot(
 )
 
 
+startupProfiler.markSection('CynanBot')
+
 #########################################
 ## Section for starting the actual bot ##
 #########################################
 
+timber.log('initCynanBot', startupProfiler.getReport())
 timber.log('initCynanBot', 'Starting CynanBot...')
 cynanBot.run()
@@ -12,6 +12,8 @@ from src.chatActions.cheerActionsWizardChatAction import CheerActionsWizardChatA
 from src.chatActions.persistAllUsersChatAction import PersistAllUsersChatAction
 from src.chatBand.chatBandInstrumentSoundsRepository import ChatBandInstrumentSoundsRepository
 from src.chatBand.chatBandInstrumentSoundsRepositoryInterface import ChatBandInstrumentSoundsRepositoryInterface
+from src.chatLogger.chatArchive import ChatArchive
+from src.chatLogger.chatArchiveInterface import ChatArchiveInterface
 from src.chatLogger.chatLogger import ChatLogger
 from src.chatLogger.chatLoggerInterface import ChatLoggerInterface
 from src.cheerActions.cheerActionHelper import CheerActionHelper
@@ -55,6 +57,8 @@ from src.google.googleJwtBuilder import GoogleJwtBuilder
 from src.google.googleJwtBuilderInterface import GoogleJwtBuilderInterface
 from src.language.languagesRepository import LanguagesRepository
 from src.language.languagesRepositoryInterface import LanguagesRepositoryInterface
+from src.latencyTracing.latencyTracer import LatencyTracer
+from src.latencyTracing.latencyTracerInterface import LatencyTracerInterface
 from src.location.locationsRepository import LocationsRepository
 from src.location.locationsRepositoryInterface import LocationsRepositoryInterface
 from src.location.timeZoneRepository import TimeZoneRepository
@@ -94,9 +98,13 @@ from src.soundPlayerManager.soundPlayerSettingsRepository import SoundPlayerSett
 from src.soundPlayerManager.soundPlayerSettingsRepositoryInterface import SoundPlayerSettingsRepositoryInterface
 from src.soundPlayerManager.vlc.vlcSoundPlayerManagerProvider import VlcSoundPlayerManagerProvider
 from src.storage.backingDatabase import BackingDatabase
+from src.storage.backingPooledSqliteDatabase import BackingPooledSqliteDatabase
 from src.storage.backingPsqlDatabase import BackingPsqlDatabase
 from src.storage.backingSqliteDatabase import BackingSqliteDatabase
 from src.storage.databaseType import DatabaseType
+from src.storage.migrations.databaseMigrationsHelper import DatabaseMigrationsHelper
+from src.storage.migrations.databaseMigrationsHelperInterface import DatabaseMigrationsHelperInterface
+from src.storage.migrations.databaseMigrationsRegistry import DatabaseMigrationsRegistry
 from src.storage.jsonFileReader import JsonFileReader
 from src.storage.linesFileReader import LinesFileReader
 from src.storage.psqlCredentialsProvider import PsqlCredentialsProvider
@@ -218,6 +226,11 @@ generalSettingsRepository = GeneralSettingsRepository(
 
 generalSettingsSnapshot = generalSettingsRepository.getAll()
 
+timber.setLevels(
+    defaultLevel = generalSettingsSnapshot.getTimberLevel(),
+    tagLevels = generalSettingsSnapshot.getTimberTagLevels()
+)
+
 backingDatabase: BackingDatabase
 psqlCredentialsProvider: PsqlCredentialsProviderInterface | None = None
 
@@ -234,13 +247,28 @@ match generalSettingsSnapshot.requireDatabaseType():
         )
 
     case DatabaseType.SQLITE:
-        backingDatabase = BackingSqliteDatabase(
-            eventLoop = eventLoop
-        )
+        if generalSettingsSnapshot.isSqliteConnectionPoolEnabled():
+            backingDatabase = BackingPooledSqliteDatabase(
+                eventLoop = eventLoop,
+                timber = timber
+            )
+        else:
+            backingDatabase = BackingSqliteDatabase(
+                eventLoop = eventLoop
+            )
 
     case _:
         raise RuntimeError(f'Unknown/misconfigured DatabaseType: \"{generalSettingsSnapshot.requireDatabaseType()}\"')
 
+databaseMigrationsHelper: DatabaseMigrationsHelperInterface = DatabaseMigrationsHelper(
+    backingDatabase = backingDatabase,
+    databaseMigrationsRegistry = DatabaseMigrationsRegistry(),
+    timber = timber,
+    timeZoneRepository = timeZoneRepository
+)
+
+eventLoop.run_until_complete(databaseMigrationsHelper.migrate())
+
 networkClientProvider: NetworkClientProvider
 match generalSettingsSnapshot.requireNetworkClientType():
     case NetworkClientType.AIOHTTP:
@@ -385,8 +413,17 @@ addOrRemoveUserDataHelper: AddOrRemoveUserDataHelperInterface = AddOrRemoveUserD
     timeZoneRepository = timeZoneRepository
 )
 
+chatArchive: ChatArchiveInterface | None = None
+
+if generalSettingsSnapshot.isChatArchiveEnabled():
+    chatArchive = ChatArchive(
+        timber = timber,
+        timeZoneRepository = timeZoneRepository
+    )
+
 chatLogger: ChatLoggerInterface = ChatLogger(
     backgroundTaskHelper = backgroundTaskHelper,
+    chatArchive = chatArchive,
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
@@ -468,9 +505,11 @@ locationsRepository: LocationsRepositoryInterface = LocationsRepository(
 )
 
 mostRecentChatsRepository: MostRecentChatsRepositoryInterface = MostRecentChatsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
-    timeZoneRepository = timeZoneRepository
+    timeZoneRepository = timeZoneRepository,
+    writeBehindEnabled = generalSettingsSnapshot.isMostRecentChatsWriteBehindEnabled()
 )
 
 systemCommandHelper: SystemCommandHelperInterface = SystemCommandHelper(
@@ -715,6 +754,11 @@ persistAllUsersChatAction = PersistAllUsersChatAction(
     userIdsRepository = userIdsRepository
 )
 
+latencyTracer: LatencyTracerInterface = LatencyTracer(
+    backgroundTaskHelper = backgroundTaskHelper,
+    timber = timber
+)
+
 chatActionsManager: ChatActionsManagerInterface = ChatActionsManager(
     activeChattersRepository = activeChattersRepository,
     anivCheckChatAction = None,
@@ -723,6 +767,7 @@ chatActionsManager: ChatActionsManagerInterface = ChatActionsManager(
     cheerActionsWizardChatAction = cheerActionsWizardChatAction,
     deerForceChatAction = None,
     generalSettingsRepository = generalSettingsRepository,
+    latencyTracer = latencyTracer,
     mostRecentAnivMessageTimeoutHelper = None,
     mostRecentChatsRepository = mostRecentChatsRepository,
     persistAllUsersChatAction = persistAllUsersChatAction,
@@ -757,6 +802,7 @@ cynanBot = CynanBot(
     anivSettingsRepository = None,
     authRepository = authRepository,
     backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = backingDatabase,
     bannedTriviaGameControllersRepository = None,
     bannedWordsRepository = None,
     beanChanceCheerActionHelper = None,
@@ -786,6 +832,7 @@ cynanBot = CynanBot(
     isLiveOnTwitchRepository = isLiveOnTwitchRepository,
     jishoHelper = None,
     languagesRepository = languagesRepository,
+    latencyTracer = latencyTracer,
     locationsRepository = locationsRepository,
     mostRecentAnivMessageRepository = None,
     mostRecentAnivMessageTimeoutHelper = None,
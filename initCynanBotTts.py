@@ -27,6 +27,8 @@ from src.chatActions.persistAllUsersChatAction import PersistAllUsersChatAction
 from src.chatActions.saveMostRecentAnivMessageChatAction import SaveMostRecentAnivMessageChatAction
 from src.chatActions.supStreamerChatAction import SupStreamerChatAction
 from src.chatBand.chatBandInstrumentSoundsRepositoryInterface import ChatBandInstrumentSoundsRepositoryInterface
+from src.chatLogger.chatArchive import ChatArchive
+from src.chatLogger.chatArchiveInterface import ChatArchiveInterface
 from src.chatLogger.chatLogger import ChatLogger
 from src.chatLogger.chatLoggerInterface import ChatLoggerInterface
 from src.cheerActions.beanChance.beanChanceCheerActionHelper import BeanChanceCheerActionHelper
@@ -99,6 +101,8 @@ from src.google.settings.googleSettingsRepository import GoogleSettingsRepositor
 from src.google.settings.googleSettingsRepositoryInterface import GoogleSettingsRepositoryInterface
 from src.language.languagesRepository import LanguagesRepository
 from src.language.languagesRepositoryInterface import LanguagesRepositoryInterface
+from src.latencyTracing.latencyTracer import LatencyTracer
+from src.latencyTracing.latencyTracerInterface import LatencyTracerInterface
 from src.location.locationsRepository import LocationsRepository
 from src.location.locationsRepositoryInterface import LocationsRepositoryInterface
 from src.location.timeZoneRepository import TimeZoneRepository
@@ -138,9 +142,13 @@ from src.soundPlayerManager.soundPlayerSettingsRepository import SoundPlayerSett
 from src.soundPlayerManager.soundPlayerSettingsRepositoryInterface import SoundPlayerSettingsRepositoryInterface
 from src.soundPlayerManager.vlc.vlcSoundPlayerManagerProvider import VlcSoundPlayerManagerProvider
 from src.storage.backingDatabase import BackingDatabase
+from src.storage.backingPooledSqliteDatabase import BackingPooledSqliteDatabase
 from src.storage.backingPsqlDatabase import BackingPsqlDatabase
 from src.storage.backingSqliteDatabase import BackingSqliteDatabase
 from src.storage.databaseType import DatabaseType
+from src.storage.migrations.databaseMigrationsHelper import DatabaseMigrationsHelper
+from src.storage.migrations.databaseMigrationsHelperInterface import DatabaseMigrationsHelperInterface
+from src.storage.migrations.databaseMigrationsRegistry import DatabaseMigrationsRegistry
 from src.storage.jsonFileReader import JsonFileReader
 from src.storage.linesFileReader import LinesFileReader
 from src.storage.psqlCredentialsProvider import PsqlCredentialsProvider
@@ -365,6 +373,11 @@ generalSettingsRepository = GeneralSettingsRepository(
 
 generalSettingsSnapshot = generalSettingsRepository.getAll()
 
+timber.setLevels(
+    defaultLevel = generalSettingsSnapshot.getTimberLevel(),
+    tagLevels = generalSettingsSnapshot.getTimberTagLevels()
+)
+
 backingDatabase: BackingDatabase
 psqlCredentialsProvider: PsqlCredentialsProviderInterface | None = None
 
@@ -381,13 +394,28 @@ match generalSettingsSnapshot.requireDatabaseType():
         )
 
     case DatabaseType.SQLITE:
-        backingDatabase = BackingSqliteDatabase(
-            eventLoop = eventLoop
-        )
+        if generalSettingsSnapshot.isSqliteConnectionPoolEnabled():
+            backingDatabase = BackingPooledSqliteDatabase(
+                eventLoop = eventLoop,
+                timber = timber
+            )
+        else:
+            backingDatabase = BackingSqliteDatabase(
+                eventLoop = eventLoop
+            )
 
     case _:
         raise RuntimeError(f'Unknown/misconfigured DatabaseType: \"{generalSettingsSnapshot.requireDatabaseType()}\"')
 
+databaseMigrationsHelper: DatabaseMigrationsHelperInterface = DatabaseMigrationsHelper(
+    backingDatabase = backingDatabase,
+    databaseMigrationsRegistry = DatabaseMigrationsRegistry(),
+    timber = timber,
+    timeZoneRepository = timeZoneRepository
+)
+
+eventLoop.run_until_complete(databaseMigrationsHelper.migrate())
+
 networkClientProvider: NetworkClientProvider
 match generalSettingsSnapshot.requireNetworkClientType():
     case NetworkClientType.AIOHTTP:
@@ -534,8 +562,17 @@ addOrRemoveUserDataHelper: AddOrRemoveUserDataHelperInterface = AddOrRemoveUserD
     timeZoneRepository = timeZoneRepository
 )
 
+chatArchive: ChatArchiveInterface | None = None
+
+if generalSettingsSnapshot.isChatArchiveEnabled():
+    chatArchive = ChatArchive(
+        timber = timber,
+        timeZoneRepository = timeZoneRepository
+    )
+
 chatLogger: ChatLoggerInterface = ChatLogger(
     backgroundTaskHelper = backgroundTaskHelper,
+    chatArchive = chatArchive,
     timber = timber,
     timeZoneRepository = timeZoneRepository
 )
@@ -633,9 +670,11 @@ locationsRepository: LocationsRepositoryInterface = LocationsRepository(
 )
 
 mostRecentChatsRepository: MostRecentChatsRepositoryInterface = MostRecentChatsRepository(
+    backgroundTaskHelper = backgroundTaskHelper,
     backingDatabase = backingDatabase,
     timber = timber,
-    timeZoneRepository = timeZoneRepository
+    timeZoneRepository = timeZoneRepository,
+    writeBehindEnabled = generalSettingsSnapshot.isMostRecentChatsWriteBehindEnabled()
 )
 
 systemCommandHelper: SystemCommandHelperInterface = SystemCommandHelper(
@@ -1304,6 +1343,11 @@ if streamAlertsManager is not None:
         timeZoneRepository = timeZoneRepository
     )
 
+latencyTracer: LatencyTracerInterface = LatencyTracer(
+    backgroundTaskHelper = backgroundTaskHelper,
+    timber = timber
+)
+
 chatActionsManager: ChatActionsManagerInterface = ChatActionsManager(
     activeChattersRepository = activeChattersRepository,
     anivCheckChatAction = None,
@@ -1312,6 +1356,7 @@ chatActionsManager: ChatActionsManagerInterface = ChatActionsManager(
     cheerActionsWizardChatAction = cheerActionsWizardChatAction,
     deerForceChatAction = None,
     generalSettingsRepository = generalSettingsRepository,
+    latencyTracer = latencyTracer,
     mostRecentAnivMessageTimeoutHelper = mostRecentAnivMessageTimeoutHelper,
     mostRecentChatsRepository = mostRecentChatsRepository,
     persistAllUsersChatAction = persistAllUsersChatAction,
@@ -1396,6 +1441,7 @@ cynanBot = CynanBot(
     anivSettingsRepository = anivSettingsRepository,
     authRepository = authRepository,
     backgroundTaskHelper = backgroundTaskHelper,
+    backingDatabase = backingDatabase,
     bannedTriviaGameControllersRepository = None,
     bannedWordsRepository = bannedWordsRepository,
     beanChanceCheerActionHelper = beanChanceCheerActionHelper,
@@ -1425,6 +1471,7 @@ cynanBot = CynanBot(
     isLiveOnTwitchRepository = isLiveOnTwitchRepository,
     jishoHelper = None,
     languagesRepository = languagesRepository,
+    latencyTracer = latencyTracer,
     locationsRepository = locationsRepository,
     mostRecentAnivMessageRepository = mostRecentAnivMessageRepository,
     mostRecentAnivMessageTimeoutHelper = mostRecentAnivMessageTimeoutHelper,
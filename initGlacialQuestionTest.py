@@ -18,9 +18,13 @@ from src.network.networkJsonMapper import NetworkJsonMapper
 from src.network.networkJsonMapperInterface import NetworkJsonMapperInterface
 from src.network.requestsClientProvider import RequestsClientProvider
 from src.storage.backingDatabase import BackingDatabase
+from src.storage.backingPooledSqliteDatabase import BackingPooledSqliteDatabase
 from src.storage.backingPsqlDatabase import BackingPsqlDatabase
 from src.storage.backingSqliteDatabase import BackingSqliteDatabase
 from src.storage.databaseType import DatabaseType
+from src.storage.migrations.databaseMigrationsHelper import DatabaseMigrationsHelper
+from src.storage.migrations.databaseMigrationsHelperInterface import DatabaseMigrationsHelperInterface
+from src.storage.migrations.databaseMigrationsRegistry import DatabaseMigrationsRegistry
 from src.storage.jsonFileReader import JsonFileReader
 from src.storage.psqlCredentialsProvider import PsqlCredentialsProvider
 from src.storage.storageJsonMapper import StorageJsonMapper
@@ -97,6 +101,11 @@ generalSettingsRepository = GeneralSettingsRepository(
 
 generalSettingsSnapshot = generalSettingsRepository.getAll()
 
+timber.setLevels(
+    defaultLevel = generalSettingsSnapshot.getTimberLevel(),
+    tagLevels = generalSettingsSnapshot.getTimberTagLevels()
+)
+
 backingDatabase: BackingDatabase
 match generalSettingsSnapshot.requireDatabaseType():
     case DatabaseType.POSTGRESQL:
@@ -109,13 +118,28 @@ match generalSettingsSnapshot.requireDatabaseType():
         )
 
     case DatabaseType.SQLITE:
-        backingDatabase = BackingSqliteDatabase(
-            eventLoop = eventLoop
-        )
+        if generalSettingsSnapshot.isSqliteConnectionPoolEnabled():
+            backingDatabase = BackingPooledSqliteDatabase(
+                eventLoop = eventLoop,
+                timber = timber
+            )
+        else:
+            backingDatabase = BackingSqliteDatabase(
+                eventLoop = eventLoop
+            )
 
     case _:
         raise RuntimeError(f'Unknown/misconfigured DatabaseType: \"{generalSettingsSnapshot.requireDatabaseType()}\"')
 
+databaseMigrationsHelper: DatabaseMigrationsHelperInterface = DatabaseMigrationsHelper(
+    backingDatabase = backingDatabase,
+    databaseMigrationsRegistry = DatabaseMigrationsRegistry(),
+    timber = timber,
+    timeZoneRepository = timeZoneRepository
+)
+
+eventLoop.run_until_complete(databaseMigrationsHelper.migrate())
+
 networkClientProvider: NetworkClientProvider
 match generalSettingsSnapshot.requireNetworkClientType():
     case NetworkClientType.AIOHTTP:
@@ -201,6 +225,7 @@ tries = 0
 questionRetrievalTask = eventLoop.create_task(glacialTriviaQuestionRepository.fetchAllQuestionAnswerTriviaQuestions(fetchOptions=triviaFetchOptions))
 
 questions = eventLoop.run_until_complete(questionRetrievalTask)
+eventLoop.run_until_complete(backingDatabase.close())
 
 columns = ["Question", "Correct Answers", "Possible Optional Answer Words", "Trivia Type"]
 
@@ -6,7 +6,6 @@ from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..users.userIdsRepositoryInterface import UserIdsRepositoryInterface
 
 
@@ -29,8 +28,6 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
-
     async def __createDefaultScore(
         self,
         chatterUserId: str,
@@ -59,7 +56,6 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
         )
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
     async def getScore(
@@ -210,47 +206,6 @@ class AnivCopyMessageTimeoutScoreRepository(AnivCopyMessageTimeoutScoreRepositor
         await self.__saveScoreToDatabase(score)
         return score
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
-                            mostrecentdodge text DEFAULT NULL,
-                            mostrecenttimeout text DEFAULT NULL,
-                            dodgescore int DEFAULT 0 NOT NULL,
-                            timeoutscore int DEFAULT 0 NOT NULL,
-                            chatteruserid text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
-                            mostrecentdodge TEXT DEFAULT NULL,
-                            mostrecenttimeout TEXT DEFAULT NULL,
-                            dodgescore INTEGER NOT NULL DEFAULT 0,
-                            timeoutscore INTEGER NOT NULL DEFAULT 0,
-                            chatteruserid TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
     async def __saveScoreToDatabase(self, score: AnivCopyMessageTimeoutScore):
         if not isinstance(score, AnivCopyMessageTimeoutScore):
             raise TypeError(f'score argument is malformed: \"{score}\"')
@@ -6,7 +6,6 @@ from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..timber.timberInterface import TimberInterface
 
 
@@ -29,7 +28,6 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
 
-        self.__isDatabaseReady: bool = False
         self.__cache: dict[str, MostRecentAnivMessage | None] = dict()
 
     async def clearCaches(self):
@@ -68,7 +66,6 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
         return message
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
     async def __getFromDatabase(self, twitchChannelId: str) -> MostRecentAnivMessage | None:
@@ -102,39 +99,6 @@ class MostRecentAnivMessageRepository(MostRecentAnivMessageRepositoryInterface):
         else:
             return None
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentanivmessages (
-                            datetime text NOT NULL,
-                            message public.citext DEFAULT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentanivmessages (
-                            datetime TEXT NOT NULL,
-                            message TEXT DEFAULT NULL COLLATE NOCASE,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
     async def __saveMessage(self, message: str, twitchChannelId: str):
         if not utils.isValidStr(message):
             raise TypeError(f'message argument is malformed: \"{message}\"')
@@ -6,7 +6,6 @@ from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..timber.timberInterface import TimberInterface
 from ..users.userIdsRepositoryInterface import UserIdsRepositoryInterface
 
@@ -34,8 +33,6 @@ class BeanStatsRepository(BeanStatsRepositoryInterface):
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
-
     async def getStats(
         self,
         chatterUserId: str,
@@ -92,7 +89,6 @@ class BeanStatsRepository(BeanStatsRepositoryInterface):
         )
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
     async def incrementFails(
@@ -205,47 +201,6 @@ class BeanStatsRepository(BeanStatsRepositoryInterface):
         await self.__saveStatsToDatabase(newBeanStats)
         return newBeanStats
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS beanstats (
-                            fails int DEFAULT 0 NOT NULL,
-                            successes int DEFAULT 0 NOT NULL,
-                            mostrecentfail text DEFAULT NULL,
-                            mostrecentsuccess text DEFAULT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS beanstats (
-                            fails INTEGER NOT NULL DEFAULT 0,
-                            successes INTEGER NOT NULL DEFAULT 0,
-                            mostrecentfail TEXT DEFAULT NULL,
-                            mostrecentsuccess TEXT DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
     async def __saveStatsToDatabase(self, stats: ChatterBeanStats):
         if not isinstance(stats, ChatterBeanStats):
             raise TypeError(f'stats argument is malformed: \"{stats}\"')
@@ -1,3 +1,5 @@
+import time
+
 from .absChatAction import AbsChatAction
 from .anivCheckChatAction import AnivCheckChatAction
 from .catJamChatAction import CatJamChatAction
@@ -11,6 +13,8 @@ from .saveMostRecentAnivMessageChatAction import SaveMostRecentAnivMessageChatAc
 from .schubertWalkChatAction import SchubertWalkChatAction
 from .supStreamerChatAction import SupStreamerChatAction
 from ..aniv.mostRecentAnivMessageTimeoutHelperInterface import MostRecentAnivMessageTimeoutHelperInterface
+from ..latencyTracing.latencyStage import LatencyStage
+from ..latencyTracing.latencyTracerInterface import LatencyTracerInterface
 from ..misc.generalSettingsRepository import GeneralSettingsRepository
 from ..mostRecentChat.mostRecentChat import MostRecentChat
 from ..mostRecentChat.mostRecentChatsRepositoryInterface import MostRecentChatsRepositoryInterface
@@ -34,6 +38,7 @@ class ChatActionsManager(ChatActionsManagerInterface):
         cheerActionsWizardChatAction: CheerActionsWizardChatAction | None,
         deerForceChatAction: DeerForceChatAction | None,
         generalSettingsRepository: GeneralSettingsRepository,
+        latencyTracer: LatencyTracerInterface,
         mostRecentAnivMessageTimeoutHelper: MostRecentAnivMessageTimeoutHelperInterface | None,
         mostRecentChatsRepository: MostRecentChatsRepositoryInterface,
         persistAllUsersChatAction: PersistAllUsersChatAction | None,
@@ -60,6 +65,8 @@ class ChatActionsManager(ChatActionsManagerInterface):
             raise TypeError(f'deerForceChatAction argument is malformed: \"{deerForceChatAction}\"')
         elif not isinstance(generalSettingsRepository, GeneralSettingsRepository):
             raise TypeError(f'generalSettingsRepository argument is malformed: \"{generalSettingsRepository}\"')
+        elif not isinstance(latencyTracer, LatencyTracerInterface):
+            raise TypeError(f'latencyTracer argument is malformed: \"{latencyTracer}\"')
         elif mostRecentAnivMessageTimeoutHelper is not None and not isinstance(mostRecentAnivMessageTimeoutHelper, MostRecentAnivMessageTimeoutHelperInterface):
             raise TypeError(f'mostRecentAnivMessageTimeoutHelper argument is malformed: \"{mostRecentAnivMessageTimeoutHelper}\"')
         elif not isinstance(mostRecentChatsRepository, MostRecentChatsRepositoryInterface):
@@ -89,6 +96,7 @@ class ChatActionsManager(ChatActionsManagerInterface):
         self.__chatLoggerChatAction: AbsChatAction | None = chatLoggerChatAction
         self.__cheerActionsWizardChatAction: CheerActionsWizardChatAction | None = cheerActionsWizardChatAction
         self.__deerForceChatAction: AbsChatAction | None = deerForceChatAction
+        self.__latencyTracer: LatencyTracerInterface = latencyTracer
         self.__mostRecentAnivMessageTimeoutHelper: MostRecentAnivMessageTimeoutHelperInterface | None = mostRecentAnivMessageTimeoutHelper
         self.__mostRecentChatsRepository: MostRecentChatsRepositoryInterface =  mostRecentChatsRepository
         self.__persistAllUsersChatAction: AbsChatAction | None = persistAllUsersChatAction
@@ -140,30 +148,43 @@ class ChatActionsManager(ChatActionsManagerInterface):
         if not isinstance(message, TwitchMessage):
             raise TypeError(f'message argument is malformed: \"{message}\"')
 
+        twitchChannelId = await message.getTwitchChannelId()
+        stageStartTime = time.perf_counter()
+
         await self.__activeChattersRepository.add(
             chatterUserId = message.getAuthorId(),
             chatterUserName = message.getAuthorName(),
-            twitchChannelId = await message.getTwitchChannelId()
+            twitchChannelId = twitchChannelId
         )
 
+        stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.ACTIVE_CHATTERS, stageStartTime)
+
         mostRecentChat = await self.__mostRecentChatsRepository.get(
             chatterUserId = message.getAuthorId(),
-            twitchChannelId = await message.getTwitchChannelId()
+            twitchChannelId = twitchChannelId
         )
 
+        stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.GET_MOST_RECENT_CHAT, stageStartTime)
+
         await self.__mostRecentChatsRepository.set(
             chatterUserId = message.getAuthorId(),
-            twitchChannelId = await message.getTwitchChannelId()
+            twitchChannelId = twitchChannelId
         )
 
+        stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.SET_MOST_RECENT_CHAT, stageStartTime)
+
         user = await self.__usersRepository.getUserAsync(message.getTwitchChannelName())
 
+        stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.GET_USER, stageStartTime)
+
         await self.__handleAnivChatActions(
             mostRecentChat = mostRecentChat,
             message = message,
             user = user
         )
 
+        stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.ANIV_CHAT_ACTIONS, stageStartTime)
+
         if self.__chatLoggerChatAction is not None:
             await self.__chatLoggerChatAction.handleChat(
                 mostRecentChat = mostRecentChat,
@@ -171,6 +192,8 @@ class ChatActionsManager(ChatActionsManagerInterface):
                 user = user
             )
 
+            stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.CHAT_LOGGER, stageStartTime)
+
         if self.__cheerActionsWizardChatAction is not None:
             await self.__cheerActionsWizardChatAction.handleChat(
                 mostRecentChat = mostRecentChat,
@@ -178,6 +201,8 @@ class ChatActionsManager(ChatActionsManagerInterface):
                 user = user
             )
 
+            stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.CHEER_ACTIONS_WIZARD, stageStartTime)
+
         if self.__persistAllUsersChatAction is not None:
             await self.__persistAllUsersChatAction.handleChat(
                 mostRecentChat = mostRecentChat,
@@ -185,6 +210,8 @@ class ChatActionsManager(ChatActionsManagerInterface):
                 user = user
             )
 
+            stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.PERSIST_ALL_USERS, stageStartTime)
+
         if self.__recurringActionsWizardChatAction is not None:
             await self.__recurringActionsWizardChatAction.handleChat(
                 mostRecentChat = mostRecentChat,
@@ -192,6 +219,8 @@ class ChatActionsManager(ChatActionsManagerInterface):
                 user = user
             )
 
+            stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.RECURRING_ACTIONS_WIZARD, stageStartTime)
+
         if self.__supStreamerChatAction is not None:
             await self.__supStreamerChatAction.handleChat(
                 mostRecentChat = mostRecentChat,
@@ -199,12 +228,16 @@ class ChatActionsManager(ChatActionsManagerInterface):
                 user = user
             )
 
+            stageStartTime = self.__latencyTracer.record(twitchChannelId, LatencyStage.SUP_STREAMER, stageStartTime)
+
         await self.__handleSimpleMessageChatActions(
             mostRecentChat = mostRecentChat,
             message = message,
             user = user
         )
 
+        self.__latencyTracer.record(twitchChannelId, LatencyStage.SIMPLE_CHAT_ACTIONS, stageStartTime)
+
     async def __handleSimpleMessageChatActions(
         self,
         mostRecentChat: MostRecentChat | None,
@@ -0,0 +1,59 @@
+from .absChatCommand import AbsChatCommand
+from ..latencyTracing.latencyTracerInterface import LatencyTracerInterface
+from ..misc import utils as utils
+from ..misc.administratorProviderInterface import AdministratorProviderInterface
+from ..timber.timberInterface import TimberInterface
+from ..twitch.configuration.twitchContext import TwitchContext
+from ..twitch.twitchUtilsInterface import TwitchUtilsInterface
+from ..users.usersRepositoryInterface import UsersRepositoryInterface
+
+
+class LatencyChatCommand(AbsChatCommand):
+
+    def __init__(
+        self,
+        administratorProvider: AdministratorProviderInterface,
+        latencyTracer: LatencyTracerInterface,
+        timber: TimberInterface,
+        twitchUtils: TwitchUtilsInterface,
+        usersRepository: UsersRepositoryInterface
+    ):
+        if not isinstance(administratorProvider, AdministratorProviderInterface):
+            raise TypeError(f'administratorProvider argument is malformed: \"{administratorProvider}\"')
+        elif not isinstance(latencyTracer, LatencyTracerInterface):
+            raise TypeError(f'latencyTracer argument is malformed: \"{latencyTracer}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(twitchUtils, TwitchUtilsInterface):
+            raise TypeError(f'twitchUtils argument is malformed: \"{twitchUtils}\"')
+        elif not isinstance(usersRepository, UsersRepositoryInterface):
+            raise TypeError(f'usersRepository argument is malformed: \"{usersRepository}\"')
+
+        self.__administratorProvider: AdministratorProviderInterface = administratorProvider
+        self.__latencyTracer: LatencyTracerInterface = latencyTracer
+        self.__timber: TimberInterface = timber
+        self.__twitchUtils: TwitchUtilsInterface = twitchUtils
+        self.__usersRepository: UsersRepositoryInterface = usersRepository
+
+    async def handleChatCommand(self, ctx: TwitchContext):
+        user = await self.__usersRepository.getUserAsync(ctx.getTwitchChannelName())
+        twitchChannelId = await ctx.getTwitchChannelId()
+        administrator = await self.__administratorProvider.getAdministratorUserId()
+
+        if twitchChannelId != ctx.getAuthorId() and administrator != ctx.getAuthorId():
+            self.__timber.log('LatencyChatCommand', f'Attempted use of !latency command by {ctx.getAuthorName()}:{ctx.getAuthorId()} in {user.getHandle()}')
+            return
+
+        report = self.__latencyTracer.getReport(twitchChannelId)
+
+        if not utils.isValidStr(report):
+            report = 'no chat messages have been traced yet'
+
+        await self.__twitchUtils.safeSend(
+            messageable = ctx,
+            message = f'ⓘ Chat latency {report}',
+            maxMessages = 5,
+            replyMessageId = await ctx.getMessageId()
+        )
+
+        self.__timber.log('LatencyChatCommand', f'Handled !latency command for {ctx.getAuthorName()}:{ctx.getAuthorId()} in {user.getHandle()}')
@@ -0,0 +1,459 @@
+import asyncio
+import gzip
+import json
+import os
+from asyncio import Lock
+from datetime import datetime
+from typing import Any
+
+import aiofiles
+import aiofiles.os
+import aiofiles.ospath
+
+from .absChatMessage import AbsChatMessage
+from .chatArchiveInterface import ChatArchiveInterface
+from .chatArchiveSegment import ChatArchiveSegment
+from .chatMessage import ChatMessage
+from .raidMessage import RaidMessage
+from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from ..misc import utils as utils
+from ..misc.simpleDateTime import SimpleDateTime
+from ..timber.timberInterface import TimberInterface
+
+
+class ChatArchive(ChatArchiveInterface):
+
+    # Each channel gets its own directory, named after its Twitch channel ID, containing:
+    #   - "segment-<n>.jsonl", the active segment, to which compact JSON records are appended
+    #   - "segment-<n>.jsonl.gz", sealed segments, compressed once they reach maxSegmentRecords
+    #   - "index.json", the side index of every sealed segment's time range and user IDs
+    # The active segment is also held in memory, so lookups on recent chat never touch the disk,
+    # and the index lets lookups into older chat skip any segments that can't possibly match.
+    #
+    # Sealing compresses the active segment into a temporary file, records it in the index, and
+    # only then moves it into place and deletes the active segment. So if the bot dies partway
+    # through, the index never points past a segment that hasn't been sealed yet, and loading a
+    # channel finishes off any such seal. Loading a channel also picks up any sealed segments
+    # that are missing from the index, rather than sealing over them.
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        timeZoneRepository: TimeZoneRepositoryInterface,
+        maxSegmentRecords: int = 5000,
+        archiveRootDirectory: str = 'logs/chatArchive'
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
+            raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
+        elif not utils.isValidInt(maxSegmentRecords):
+            raise TypeError(f'maxSegmentRecords argument is malformed: \"{maxSegmentRecords}\"')
+        elif maxSegmentRecords < 1 or maxSegmentRecords > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxSegmentRecords argument is out of bounds: {maxSegmentRecords}')
+        elif not utils.isValidStr(archiveRootDirectory):
+            raise TypeError(f'archiveRootDirectory argument is malformed: \"{archiveRootDirectory}\"')
+
+        self.__timber: TimberInterface = timber
+        self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
+        self.__maxSegmentRecords: int = maxSegmentRecords
+        self.__archiveRootDirectory: str = archiveRootDirectory
+
+        self.__lock: Lock = Lock()
+        self.__activeRecords: dict[str, list[dict[str, Any]]] = dict()
+        self.__activeSegmentNumbers: dict[str, int] = dict()
+        self.__sealedSegments: dict[str, list[ChatArchiveSegment]] = dict()
+        self.__twitchChannels: dict[str, str] = dict()
+
+    async def append(self, messages: list[AbsChatMessage]) -> list[AbsChatMessage]:
+        if not isinstance(messages, list):
+            raise TypeError(f'messages argument is malformed: \"{messages}\"')
+
+        if len(messages) == 0:
+            return list()
+
+        messagesByChannelId: dict[str, list[AbsChatMessage]] = dict()
+        recordsByChannelId: dict[str, list[dict[str, Any]]] = dict()
+
+        for message in messages:
+            messagesByChannelId.setdefault(message.twitchChannelId, list()).append(message)
+            recordsByChannelId.setdefault(message.twitchChannelId, list()).append(self.__encodeRecord(message))
+            self.__twitchChannels[message.twitchChannelId] = message.twitchChannel
+
+        unarchivedMessages: list[AbsChatMessage] = list()
+
+        async with self.__lock:
+            for twitchChannelId, records in recordsByChannelId.items():
+                unarchivedMessages.extend(await self.__appendRecords(
+                    twitchChannelId = twitchChannelId,
+                    messages = messagesByChannelId[twitchChannelId],
+                    records = records
+                ))
+
+        return unarchivedMessages
+
+    async def __appendRecords(
+        self,
+        twitchChannelId: str,
+        messages: list[AbsChatMessage],
+        records: list[dict[str, Any]]
+    ) -> list[AbsChatMessage]:
+        try:
+            await self.__requireChannelLoaded(twitchChannelId)
+        except Exception as e:
+            self.__timber.log('ChatArchive', f'Failed to load chat archive channel ({twitchChannelId=}) ({len(records)=}): {e}', e)
+            return messages
+
+        activeRecords = self.__activeRecords[twitchChannelId]
+        recordsIndex = 0
+
+        while recordsIndex < len(records):
+            remainingCapacity = self.__maxSegmentRecords - len(activeRecords)
+
+            if remainingCapacity < 1:
+                # an earlier seal failed, so keep on appending to the active segment until one succeeds
+                remainingCapacity = len(records) - recordsIndex
+
+            recordsToWrite = records[recordsIndex:recordsIndex + remainingCapacity]
+            contents = ''.join(f'{json.dumps(record, ensure_ascii = False, separators = (",", ":"))}\n' for record in recordsToWrite)
+
+            try:
+                async with aiofiles.open(self.__getActiveSegmentPath(twitchChannelId), mode = 'a', encoding = 'utf-8') as file:
+                    await file.write(contents)
+            except Exception as e:
+                self.__timber.log('ChatArchive', f'Failed to append to active chat archive segment ({twitchChannelId=}) ({recordsIndex=}) ({len(records)=}): {e}', e)
+                return messages[recordsIndex:]
+
+            activeRecords.extend(recordsToWrite)
+            recordsIndex += len(recordsToWrite)
+
+            if len(activeRecords) >= self.__maxSegmentRecords:
+                try:
+                    await self.__sealActiveSegment(twitchChannelId)
+                except Exception as e:
+                    # these records have already been safely written to the active segment, so only the seal is retried later
+                    self.__timber.log('ChatArchive', f'Failed to seal active chat archive segment ({twitchChannelId=}) ({len(activeRecords)=}): {e}', e)
+
+                activeRecords = self.__activeRecords[twitchChannelId]
+
+        return list()
+
+    def __compressSegment(self, sourcePath: str, destinationPath: str):
+        with open(sourcePath, mode = 'rb') as source, gzip.open(destinationPath, mode = 'wb') as destination:
+            destination.write(source.read())
+
+    def __createSegment(self, fileName: str, records: list[dict[str, Any]]) -> ChatArchiveSegment:
+        userIds: set[str] = set()
+
+        for record in records:
+            userId = record.get('u')
+
+            if utils.isValidStr(userId):
+                userIds.add(userId)
+
+        return ChatArchiveSegment(
+            endTime = max(record['t'] for record in records),
+            fileName = fileName,
+            recordCount = len(records),
+            startTime = min(record['t'] for record in records),
+            userIds = frozenset(userIds)
+        )
+
+    def __decodeRecord(self, twitchChannelId: str, record: dict[str, Any]) -> AbsChatMessage:
+        dateTime = SimpleDateTime(
+            now = datetime.fromtimestamp(record['t'], self.__timeZoneRepository.getDefault())
+        )
+
+        twitchChannel = self.__twitchChannels.get(twitchChannelId, twitchChannelId)
+
+        if record['e'] == 'r':
+            return RaidMessage(
+                raidSize = record['s'],
+                dateTime = dateTime,
+                fromWho = record['f'],
+                twitchChannel = twitchChannel,
+                twitchChannelId = twitchChannelId
+            )
+        else:
+            return ChatMessage(
+                dateTime = dateTime,
+                msg = record['m'],
+                twitchChannel = twitchChannel,
+                twitchChannelId = twitchChannelId,
+                userId = record['u'],
+                userName = record['n']
+            )
+
+    async def __discoverSealedSegments(self, twitchChannelId: str) -> bool:
+        isIndexChanged = False
+
+        while True:
+            activeSegmentPath = self.__getActiveSegmentPath(twitchChannelId)
+            sealedSegmentPath = f'{activeSegmentPath}.gz'
+
+            # if the active segment still exists, then its seal never finished, and the next
+            # seal will replace this sealed segment with a complete one
+            if not await aiofiles.ospath.exists(sealedSegmentPath) or await aiofiles.ospath.exists(activeSegmentPath):
+                return isIndexChanged
+
+            records: list[dict[str, Any]] = list()
+
+            try:
+                records = await asyncio.to_thread(self.__readRecords, sealedSegmentPath)
+            except Exception as e:
+                # leave it where it is, but still skip over its segment number so that it isn't overwritten
+                self.__timber.log('ChatArchive', f'Failed to read sealed chat archive segment that was missing from the index ({twitchChannelId=}) ({sealedSegmentPath=}): {e}', e)
+
+            if len(records) >= 1:
+                segment = self.__createSegment(os.path.basename(sealedSegmentPath), records)
+                self.__sealedSegments[twitchChannelId].append(segment)
+                self.__timber.log('ChatArchive', f'Discovered a sealed chat archive segment that was missing from the index ({twitchChannelId=}) ({segment.fileName=}) ({segment.recordCount=})')
+
+            self.__activeSegmentNumbers[twitchChannelId] += 1
+            isIndexChanged = True
+
+    def __encodeRecord(self, message: AbsChatMessage) -> dict[str, Any]:
+        timestamp = message.dateTime.getDateTime().timestamp()
+
+        if isinstance(message, ChatMessage):
+            return { 'e': 'm', 't': timestamp, 'u': message.userId, 'n': message.userName, 'm': message.msg }
+        elif isinstance(message, RaidMessage):
+            return { 'e': 'r', 't': timestamp, 'f': message.fromWho, 's': message.raidSize }
+        else:
+            raise RuntimeError(f'AbsChatMessage has unknown type: \"{type(message)=}\"')
+
+    def __getActiveSegmentPath(self, twitchChannelId: str) -> str:
+        return f'{self.__getChannelDirectory(twitchChannelId)}/segment-{self.__activeSegmentNumbers[twitchChannelId]}.jsonl'
+
+    def __getChannelDirectory(self, twitchChannelId: str) -> str:
+        return f'{self.__archiveRootDirectory}/{twitchChannelId}'
+
+    def __getIndexPath(self, twitchChannelId: str) -> str:
+        return f'{self.__getChannelDirectory(twitchChannelId)}/index.json'
+
+    def __getSealedSegmentPath(self, twitchChannelId: str, fileName: str) -> str:
+        return f'{self.__getChannelDirectory(twitchChannelId)}/{fileName}'
+
+    async def getLastMessagesFromUser(
+        self,
+        twitchChannelId: str,
+        userId: str,
+        count: int
+    ) -> list[ChatMessage]:
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not utils.isValidStr(userId):
+            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+        elif not utils.isValidInt(count):
+            raise TypeError(f'count argument is malformed: \"{count}\"')
+        elif count < 1 or count > utils.getIntMaxSafeSize():
+            raise ValueError(f'count argument is out of bounds: {count}')
+
+        async with self.__lock:
+            await self.__requireChannelLoaded(twitchChannelId)
+            activeRecords = list(self.__activeRecords[twitchChannelId])
+            sealedSegments = list(self.__sealedSegments[twitchChannelId])
+
+        matchingRecords: list[dict[str, Any]] = list()
+
+        def collect(records: list[dict[str, Any]]) -> bool:
+            for record in reversed(records):
+                if record.get('u') == userId:
+                    matchingRecords.append(record)
+
+                    if len(matchingRecords) >= count:
+                        return True
+
+            return False
+
+        if not collect(activeRecords):
+            for segment in reversed(sealedSegments):
+                if userId in segment.userIds and collect(await self.__readSealedSegment(twitchChannelId, segment)):
+                    break
+
+        messages: list[ChatMessage] = list()
+
+        for record in reversed(matchingRecords):
+            message = self.__decodeRecord(twitchChannelId, record)
+
+            if isinstance(message, ChatMessage):
+                messages.append(message)
+
+        return messages
+
+    async def getMessagesInWindow(
+        self,
+        twitchChannelId: str,
+        startTime: datetime,
+        endTime: datetime
+    ) -> list[AbsChatMessage]:
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not isinstance(startTime, datetime):
+            raise TypeError(f'startTime argument is malformed: \"{startTime}\"')
+        elif not isinstance(endTime, datetime):
+            raise TypeError(f'endTime argument is malformed: \"{endTime}\"')
+
+        startTimestamp = startTime.timestamp()
+        endTimestamp = endTime.timestamp()
+
+        async with self.__lock:
+            await self.__requireChannelLoaded(twitchChannelId)
+            activeRecords = list(self.__activeRecords[twitchChannelId])
+            sealedSegments = list(self.__sealedSegments[twitchChannelId])
+
+        records: list[dict[str, Any]] = list()
+
+        for segment in sealedSegments:
+            if segment.endTime >= startTimestamp and segment.startTime <= endTimestamp:
+                records.extend(await self.__readSealedSegment(twitchChannelId, segment))
+
+        records.extend(activeRecords)
+        messages: list[AbsChatMessage] = list()
+
+        for record in records:
+            if startTimestamp <= record['t'] <= endTimestamp:
+                messages.append(self.__decodeRecord(twitchChannelId, record))
+
+        return messages
+
+    def __parseRecords(self, contents: str) -> list[dict[str, Any]]:
+        records: list[dict[str, Any]] = list()
+
+        for line in contents.splitlines():
+            if utils.isValidStr(line):
+                records.append(json.loads(line))
+
+        return records
+
+    def __readRecords(self, sealedSegmentPath: str) -> list[dict[str, Any]]:
+        with gzip.open(sealedSegmentPath, mode = 'rt', encoding = 'utf-8') as file:
+            return self.__parseRecords(file.read())
+
+    async def __readSealedSegment(self, twitchChannelId: str, segment: ChatArchiveSegment) -> list[dict[str, Any]]:
+        sealedSegmentPath = self.__getSealedSegmentPath(twitchChannelId, segment.fileName)
+
+        try:
+            return await asyncio.to_thread(self.__readRecords, sealedSegmentPath)
+        except Exception as e:
+            self.__timber.log('ChatArchive', f'Failed to read sealed chat archive segment ({twitchChannelId=}) ({segment=}): {e}', e)
+            return list()
+
+    async def __recoverSealedSegment(self, twitchChannelId: str, segment: ChatArchiveSegment):
+        sealedSegmentPath = self.__getSealedSegmentPath(twitchChannelId, segment.fileName)
+        activeSegmentPath = sealedSegmentPath.removesuffix('.gz')
+
+        if not await aiofiles.ospath.exists(activeSegmentPath):
+            return
+
+        if not await aiofiles.ospath.exists(sealedSegmentPath):
+            temporarySegmentPath = f'{sealedSegmentPath}.tmp'
+            await asyncio.to_thread(self.__compressSegment, activeSegmentPath, temporarySegmentPath)
+            await aiofiles.os.replace(temporarySegmentPath, sealedSegmentPath)
+
+        await aiofiles.os.remove(activeSegmentPath)
+        self.__timber.log('ChatArchive', f'Finished an interrupted seal of a chat archive segment ({twitchChannelId=}) ({segment.fileName=})')
+
+    async def __requireChannelLoaded(self, twitchChannelId: str):
+        if twitchChannelId in self.__activeRecords:
+            return
+
+        sealedSegments: list[ChatArchiveSegment] = list()
+        activeSegmentNumber = 1
+        indexPath = self.__getIndexPath(twitchChannelId)
+
+        if await aiofiles.ospath.exists(indexPath):
+            async with aiofiles.open(indexPath, mode = 'r', encoding = 'utf-8') as file:
+                indexJson: dict[str, Any] = json.loads(await file.read())
+
+            activeSegmentNumber = utils.getIntFromDict(indexJson, 'activeSegment', 1)
+            twitchChannel = indexJson.get('twitchChannel')
+
+            if utils.isValidStr(twitchChannel):
+                self.__twitchChannels.setdefault(twitchChannelId, twitchChannel)
+
+            for segmentJson in indexJson.get('segments', list()):
+                sealedSegments.append(ChatArchiveSegment(
+                    endTime = segmentJson['endTime'],
+                    fileName = segmentJson['fileName'],
+                    recordCount = segmentJson['recordCount'],
+                    startTime = segmentJson['startTime'],
+                    userIds = frozenset(segmentJson['userIds'])
+                ))
+        else:
+            await aiofiles.os.makedirs(self.__getChannelDirectory(twitchChannelId), exist_ok = True)
+
+        if len(sealedSegments) >= 1:
+            # only the most recently sealed segment can have had its seal interrupted
+            await self.__recoverSealedSegment(twitchChannelId, sealedSegments[-1])
+
+        self.__activeSegmentNumbers[twitchChannelId] = activeSegmentNumber
+        self.__sealedSegments[twitchChannelId] = sealedSegments
+
+        if await self.__discoverSealedSegments(twitchChannelId):
+            await self.__writeIndex(twitchChannelId)
+
+        activeRecords: list[dict[str, Any]] = list()
+        activeSegmentPath = self.__getActiveSegmentPath(twitchChannelId)
+
+        if await aiofiles.ospath.exists(activeSegmentPath):
+            async with aiofiles.open(activeSegmentPath, mode = 'r', encoding = 'utf-8') as file:
+                activeRecords = self.__parseRecords(await file.read())
+
+        self.__activeRecords[twitchChannelId] = activeRecords
+
+    async def __sealActiveSegment(self, twitchChannelId: str):
+        activeRecords = self.__activeRecords[twitchChannelId]
+
+        if len(activeRecords) == 0:
+            return
+
+        activeSegmentPath = self.__getActiveSegmentPath(twitchChannelId)
+        sealedSegmentPath = f'{activeSegmentPath}.gz'
+        temporarySegmentPath = f'{sealedSegmentPath}.tmp'
+        await asyncio.to_thread(self.__compressSegment, activeSegmentPath, temporarySegmentPath)
+
+        segment = self.__createSegment(os.path.basename(sealedSegmentPath), activeRecords)
+        sealedSegments = self.__sealedSegments[twitchChannelId]
+        sealedSegments.append(segment)
+        self.__activeSegmentNumbers[twitchChannelId] += 1
+
+        try:
+            await self.__writeIndex(twitchChannelId)
+        except Exception:
+            sealedSegments.pop()
+            self.__activeSegmentNumbers[twitchChannelId] -= 1
+            raise
+
+        self.__activeRecords[twitchChannelId] = list()
+        await aiofiles.os.replace(temporarySegmentPath, sealedSegmentPath)
+        await aiofiles.os.remove(activeSegmentPath)
+
+        self.__timber.log('ChatArchive', f'Sealed chat archive segment ({twitchChannelId=}) ({segment.fileName=}) ({segment.recordCount=})')
+
+    async def __writeIndex(self, twitchChannelId: str):
+        segmentsJson: list[dict[str, Any]] = list()
+
+        for segment in self.__sealedSegments[twitchChannelId]:
+            segmentsJson.append({
+                'endTime': segment.endTime,
+                'fileName': segment.fileName,
+                'recordCount': segment.recordCount,
+                'startTime': segment.startTime,
+                'userIds': sorted(segment.userIds)
+            })
+
+        indexJson: dict[str, Any] = {
+            'activeSegment': self.__activeSegmentNumbers[twitchChannelId],
+            'segments': segmentsJson,
+            'twitchChannel': self.__twitchChannels.get(twitchChannelId, twitchChannelId)
+        }
+
+        # write to a temporary file first, so that a crash mid-write can't corrupt the index
+        indexPath = self.__getIndexPath(twitchChannelId)
+        temporaryIndexPath = f'{indexPath}.tmp'
+
+        async with aiofiles.open(temporaryIndexPath, mode = 'w', encoding = 'utf-8') as file:
+            await file.write(json.dumps(indexJson, ensure_ascii = False, separators = (',', ':')))
+
+        await aiofiles.os.replace(temporaryIndexPath, indexPath)
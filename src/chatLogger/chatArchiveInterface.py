@@ -0,0 +1,30 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from .absChatMessage import AbsChatMessage
+from .chatMessage import ChatMessage
+
+
+class ChatArchiveInterface(ABC):
+
+    @abstractmethod
+    async def append(self, messages: list[AbsChatMessage]) -> list[AbsChatMessage]:
+        pass
+
+    @abstractmethod
+    async def getLastMessagesFromUser(
+        self,
+        twitchChannelId: str,
+        userId: str,
+        count: int
+    ) -> list[ChatMessage]:
+        pass
+
+    @abstractmethod
+    async def getMessagesInWindow(
+        self,
+        twitchChannelId: str,
+        startTime: datetime,
+        endTime: datetime
+    ) -> list[AbsChatMessage]:
+        pass
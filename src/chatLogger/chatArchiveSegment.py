@@ -0,0 +1,10 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class ChatArchiveSegment:
+    endTime: float
+    fileName: str
+    recordCount: int
+    startTime: float
+    userIds: frozenset[str]
@@ -1,20 +1,19 @@
-import asyncio
-import queue
 import traceback
 from collections import defaultdict
-from queue import SimpleQueue
 
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
 
 from .absChatMessage import AbsChatMessage
+from .chatArchiveInterface import ChatArchiveInterface
 from .chatLoggerInterface import ChatLoggerInterface
 from .chatMessage import ChatMessage
 from .raidMessage import RaidMessage
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.batchingQueue import BatchingQueue
 from ..misc.simpleDateTime import SimpleDateTime
 from ..timber.timberInterface import TimberInterface
 
@@ -24,30 +23,47 @@ class ChatLogger(ChatLoggerInterface):
     def __init__(
         self,
         backgroundTaskHelper: BackgroundTaskHelperInterface,
+        chatArchive: ChatArchiveInterface | None,
         timber: TimberInterface,
         timeZoneRepository: TimeZoneRepositoryInterface,
-        sleepTimeSeconds: float = 15,
+        maxLatencySeconds: float = 15,
+        maxBatchSize: int = 1000,
+        maxQueueSize: int = 100000,
         logRootDirectory: str = 'logs/chatLogger'
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif chatArchive is not None and not isinstance(chatArchive, ChatArchiveInterface):
+            raise TypeError(f'chatArchive argument is malformed: \"{chatArchive}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
-        elif not utils.isValidNum(sleepTimeSeconds):
-            raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
-        elif sleepTimeSeconds < 1 or sleepTimeSeconds > 60:
-            raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
+        elif not utils.isValidNum(maxLatencySeconds):
+            raise TypeError(f'maxLatencySeconds argument is malformed: \"{maxLatencySeconds}\"')
+        elif maxLatencySeconds < 0 or maxLatencySeconds > 60:
+            raise ValueError(f'maxLatencySeconds argument is out of bounds: {maxLatencySeconds}')
+        elif not utils.isValidInt(maxBatchSize):
+            raise TypeError(f'maxBatchSize argument is malformed: \"{maxBatchSize}\"')
+        elif maxBatchSize < 1 or maxBatchSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxBatchSize argument is out of bounds: {maxBatchSize}')
+        elif not utils.isValidInt(maxQueueSize):
+            raise TypeError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
         elif not utils.isValidStr(logRootDirectory):
             raise TypeError(f'logRootDirectory argument is malformed: \"{logRootDirectory}\"')
 
         self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
+        self.__chatArchive: ChatArchiveInterface | None = chatArchive
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
-        self.__sleepTimeSeconds: float = sleepTimeSeconds
         self.__logRootDirectory: str = logRootDirectory
 
         self.__isStarted: bool = False
-        self.__messageQueue: SimpleQueue[AbsChatMessage] = SimpleQueue()
+        self.__messageQueue: BatchingQueue[AbsChatMessage] = BatchingQueue(
+            maxBatchSize = maxBatchSize,
+            maxLatencySeconds = maxLatencySeconds,
+            maxSize = maxQueueSize
+        )
 
     def __getLogStatement(self, message: AbsChatMessage) -> str:
         if not isinstance(message, AbsChatMessage):
@@ -92,7 +108,8 @@ class ChatLogger(ChatLoggerInterface):
             userName = userName
         )
 
-        self.__messageQueue.put(chatMessage)
+        if not self.__messageQueue.put(chatMessage):
+            self.__timber.log('ChatLogger', f'Dropped chat message as the message queue is full ({self.__messageQueue.getMetrics()=})')
 
     def logRaid(
         self,
@@ -120,7 +137,8 @@ class ChatLogger(ChatLoggerInterface):
             twitchChannelId = twitchChannelId
         )
 
-        self.__messageQueue.put(raidMessage)
+        if not self.__messageQueue.put(raidMessage):
+            self.__timber.log('ChatLogger', f'Dropped raid message as the message queue is full ({self.__messageQueue.getMetrics()=})')
 
     def start(self):
         if self.__isStarted:
@@ -133,17 +151,30 @@ class ChatLogger(ChatLoggerInterface):
 
     async def __startMessageLoop(self):
         while True:
-            messages: list[AbsChatMessage] = list()
+            messages = await self.__messageQueue.getBatch()
+            chatArchive = self.__chatArchive
+
+            if chatArchive is None:
+                await self.__writeToLogFiles(messages)
+                continue
+
+            try:
+                unarchivedMessages = await chatArchive.append(messages)
+            except Exception as e:
+                # append() only raises before it has archived any of these messages
+                self.__timber.log('ChatLogger', f'Encountered unknown Exception when appending messages to the chat archive ({len(messages)=}): {e}', e, traceback.format_exc())
+                unarchivedMessages = messages
+
+            if len(unarchivedMessages) == 0:
+                continue
+
+            # rather than losing these messages entirely, fall back to the plain text logs
+            self.__timber.log('ChatLogger', f'Writing messages that could not be archived to the log files instead ({len(unarchivedMessages)=}) ({len(messages)=})')
 
             try:
-                while not self.__messageQueue.empty():
-                    message = self.__messageQueue.get_nowait()
-                    messages.append(message)
-            except queue.Empty as e:
-                self.__timber.log('ChatLogger', f'Encountered queue.Empty when building up messages list (queue size: {self.__messageQueue.qsize()}) (messages size: {len(messages)}): {e}', e, traceback.format_exc())
-
-            await self.__writeToLogFiles(messages)
-            await asyncio.sleep(self.__sleepTimeSeconds)
+                await self.__writeToLogFiles(unarchivedMessages)
+            except Exception as e:
+                self.__timber.log('ChatLogger', f'Encountered unknown Exception when writing messages to the log files ({len(unarchivedMessages)=}): {e}', e, traceback.format_exc())
 
     async def __writeToLogFiles(self, messages: list[AbsChatMessage]):
         if len(messages) == 0:
@@ -19,7 +19,6 @@ from .exceptions import CheerActionAlreadyExistsException, TooManyCheerActionsEx
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..timber.timberInterface import TimberInterface
 
 
@@ -46,7 +45,6 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         self.__cheerActionSettingsRepository: CheerActionSettingsRepositoryInterface = cheerActionSettingsRepository
         self.__timber: TimberInterface = timber
 
-        self.__isDatabaseReady: bool = False
         self.__cache: dict[str, FrozenList[AbsCheerAction] | None] = dict()
 
     async def clearCaches(self):
@@ -309,52 +307,8 @@ class CheerActionsRepository(CheerActionsRepositoryInterface):
         return frozenActions
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cheeractions (
-                            bits integer NOT NULL,
-                            isenabled smallint DEFAULT 1 NOT NULL,
-                            actiontype text NOT NULL,
-                            configurationjson text DEFAULT NULL,
-                            streamstatusrequirement text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (bits, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cheeractions (
-                            bits INTEGER NOT NULL,
-                            isenabled INTEGER DEFAULT 1 NOT NULL,
-                            actiontype TEXT NOT NULL,
-                            configurationjson TEXT DEFAULT NULL,
-                            streamstatusrequirement TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (bits, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def setAction(self, action: AbsCheerAction):
         if not isinstance(action, AbsCheerAction):
             raise TypeError(f'action argument is malformed: \"{action}\"')
@@ -1,8 +1,6 @@
 import asyncio
-import queue
 import traceback
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 
 from .actions.buttonPressCrowdControlAction import ButtonPressCrowdControlAction
 from .actions.crowdControlAction import CrowdControlAction
@@ -15,6 +13,7 @@ from .exceptions import ActionHandlerProcessCantBeConnectedToException, ActionHa
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.batchingQueue import BatchingQueue
 from ..soundPlayerManager.immediateSoundPlayerManagerInterface import ImmediateSoundPlayerManagerInterface
 from ..soundPlayerManager.soundAlert import SoundAlert
 from ..timber.timberInterface import TimberInterface
@@ -29,7 +28,7 @@ class CrowdControlMachine(CrowdControlMachineInterface):
         immediateSoundPlayerManager: ImmediateSoundPlayerManagerInterface,
         timber: TimberInterface,
         timeZoneRepository: TimeZoneRepositoryInterface,
-        queueTimeoutSeconds: int = 3
+        maxQueueSize: int = 1000
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -41,21 +40,23 @@ class CrowdControlMachine(CrowdControlMachineInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
             raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
-        elif not utils.isValidInt(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
+        elif not utils.isValidInt(maxQueueSize):
+            raise TypeError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
 
         self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__crowdControlSettingsRepository: CrowdControlSettingsRepositoryInterface = crowdControlSettingsRepository
         self.__immediateSoundPlayerManager: ImmediateSoundPlayerManagerInterface = immediateSoundPlayerManager
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
-        self.__queueTimeoutSeconds: int = queueTimeoutSeconds
 
         self.__isStarted: bool = False
         self.__actionHandler: CrowdControlActionHandler | None = None
-        self.__actionQueue: SimpleQueue[CrowdControlAction] = SimpleQueue()
+        self.__actionQueue: BatchingQueue[CrowdControlAction] = BatchingQueue(
+            maxBatchSize = 1,
+            maxSize = maxQueueSize
+        )
 
     async def __announceGigaShuffle(self, action: CrowdControlAction):
         if not isinstance(action, GameShuffleCrowdControlAction):
@@ -187,34 +188,33 @@ class CrowdControlMachine(CrowdControlMachineInterface):
 
     async def __startActionLoop(self):
         while True:
+            actionCooldownSeconds = await self.__crowdControlSettingsRepository.getActionCooldownSeconds()
             actionHandler = self.__actionHandler
 
-            if actionHandler is not None:
-                action: CrowdControlAction | None = None
+            if actionHandler is None:
+                # leave any actions in the queue until there is a handler around to process them
+                await asyncio.sleep(actionCooldownSeconds)
+                continue
 
-                try:
-                    if not self.__actionQueue.empty():
-                        action = self.__actionQueue.get_nowait()
-                except queue.Empty as e:
-                    self.__timber.log('CrowdControlMachine', f'Encountered queue.Empty when grabbing action (queue size: {self.__actionQueue.qsize()}) ({action=}): {e}', e, traceback.format_exc())
+            actions = await self.__actionQueue.getBatch(actionCooldownSeconds)
 
-                if action is not None:
-                    result = await self.__handleAction(
-                        action = action,
-                        actionHandler = actionHandler
-                    )
+            if len(actions) == 0:
+                continue
 
-                    if result is CrowdControlActionHandleResult.RETRY:
-                        self.submitAction(action)
+            for action in actions:
+                result = await self.__handleAction(
+                    action = action,
+                    actionHandler = actionHandler
+                )
+
+                if result is CrowdControlActionHandleResult.RETRY:
+                    self.submitAction(action)
 
-            actionCooldownSeconds = await self.__crowdControlSettingsRepository.getActionCooldownSeconds()
             await asyncio.sleep(actionCooldownSeconds)
 
     def submitAction(self, action: CrowdControlAction):
         if not isinstance(action, CrowdControlAction):
             raise TypeError(f'action argument is malformed: \"{action}\"')
 
-        try:
-            self.__actionQueue.put(action, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('CrowdControlMachine', f'Encountered queue.Full when submitting a new action ({action}) into the action queue (queue size: {self.__actionQueue.qsize()}): {e}', e, traceback.format_exc())
+        if not self.__actionQueue.put(action):
+            self.__timber.log('CrowdControlMachine', f'Dropped action ({action}) as the action queue is full ({self.__actionQueue.getMetrics()=})')
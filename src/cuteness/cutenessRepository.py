@@ -12,7 +12,6 @@ from .cutenessResult import CutenessResult
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..users.userIdsRepositoryInterface import UserIdsRepositoryInterface
 
 
@@ -49,8 +48,6 @@ class CutenessRepository(CutenessRepositoryInterface):
         self.__historySize: int = historySize
         self.__leaderboardSize: int = leaderboardSize
 
-        self.__isDatabaseReady: bool = False
-
     async def fetchCuteness(
         self,
         twitchChannel: str,
@@ -466,44 +463,5 @@ class CutenessRepository(CutenessRepositoryInterface):
         )
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cuteness (
-                            cuteness bigint DEFAULT 0 NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            utcyearandmonth text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS cuteness (
-                            cuteness INTEGER NOT NULL DEFAULT 0,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            utcyearandmonth TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
@@ -1,3 +1,4 @@
+import time
 import traceback
 from asyncio import AbstractEventLoop
 
@@ -64,6 +65,7 @@ from .chatCommands.getTriviaAnswersChatCommand import GetTriviaAnswersChatComman
 from .chatCommands.getTriviaControllersChatCommand import GetTriviaControllersChatCommand
 from .chatCommands.giveCutenessCommand import GiveCutenessCommand
 from .chatCommands.jishoChatCommand import JishoChatCommand
+from .chatCommands.latencyChatCommand import LatencyChatCommand
 from .chatCommands.loremIpsumChatCommand import LoremIpsumChatCommand
 from .chatCommands.myCutenessChatCommand import MyCutenessChatCommand
 from .chatCommands.removeBannedTriviaControllerChatCommand import RemoveBannedTriviaControllerChatCommand
@@ -114,6 +116,8 @@ from .language.languagesRepositoryInterface import LanguagesRepositoryInterface
 from .language.translationHelper import TranslationHelper
 from .language.wordOfTheDayPresenterInterface import WordOfTheDayPresenterInterface
 from .language.wordOfTheDayRepositoryInterface import WordOfTheDayRepositoryInterface
+from .latencyTracing.latencyStage import LatencyStage
+from .latencyTracing.latencyTracerInterface import LatencyTracerInterface
 from .location.locationsRepositoryInterface import LocationsRepositoryInterface
 from .location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from .misc import utils as utils
@@ -138,6 +142,7 @@ from .soundPlayerManager.immediateSoundPlayerManagerInterface import ImmediateSo
 from .soundPlayerManager.soundPlayerRandomizerHelper import SoundPlayerRandomizerHelperInterface
 from .soundPlayerManager.soundPlayerSettingsRepositoryInterface import SoundPlayerSettingsRepositoryInterface
 from .starWars.starWarsQuotesRepositoryInterface import StarWarsQuotesRepositoryInterface
+from .storage.backingDatabase import BackingDatabase
 from .storage.psqlCredentialsProviderInterface import PsqlCredentialsProviderInterface
 from .streamAlertsManager.streamAlertsManagerInterface import StreamAlertsManagerInterface
 from .streamAlertsManager.streamAlertsSettingsRepositoryInterface import StreamAlertsSettingsRepositoryInterface
@@ -262,6 +267,7 @@ class CynanBot(
         anivSettingsRepository: AnivSettingsRepositoryInterface | None,
         authRepository: AuthRepository,
         backgroundTaskHelper: BackgroundTaskHelperInterface,
+        backingDatabase: BackingDatabase,
         bannedTriviaGameControllersRepository: BannedTriviaGameControllersRepositoryInterface | None,
         bannedWordsRepository: BannedWordsRepositoryInterface | None,
         beanChanceCheerActionHelper: BeanChanceCheerActionHelperInterface | None,
@@ -291,6 +297,7 @@ class CynanBot(
         isLiveOnTwitchRepository: IsLiveOnTwitchRepositoryInterface | None,
         jishoHelper: JishoHelperInterface | None,
         languagesRepository: LanguagesRepositoryInterface,
+        latencyTracer: LatencyTracerInterface,
         locationsRepository: LocationsRepositoryInterface | None,
         mostRecentAnivMessageRepository: MostRecentAnivMessageRepositoryInterface | None,
         mostRecentAnivMessageTimeoutHelper: MostRecentAnivMessageTimeoutHelperInterface | None,
@@ -404,6 +411,8 @@ class CynanBot(
             raise TypeError(f'authRepository argument is malformed: \"{authRepository}\"')
         elif not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(backingDatabase, BackingDatabase):
+            raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
         elif bannedTriviaGameControllersRepository is not None and not isinstance(bannedTriviaGameControllersRepository, BannedTriviaGameControllersRepositoryInterface):
             raise TypeError(f'bannedTriviaGameControllersRepository argument is malformed: \"{bannedTriviaGameControllersRepository}\"')
         elif bannedWordsRepository is not None and not isinstance(bannedWordsRepository, BannedWordsRepositoryInterface):
@@ -460,6 +469,8 @@ class CynanBot(
             raise TypeError(f'jishoHelper argument is malformed: \"{jishoHelper}\"')
         elif not isinstance(languagesRepository, LanguagesRepositoryInterface):
             raise TypeError(f'languagesRepository argument is malformed: \"{languagesRepository}\"')
+        elif not isinstance(latencyTracer, LatencyTracerInterface):
+            raise TypeError(f'latencyTracer argument is malformed: \"{latencyTracer}\"')
         elif locationsRepository is not None and not isinstance(locationsRepository, LocationsRepositoryInterface):
             raise TypeError(f'locationsRepository argument is malformed: \"{locationsRepository}\"')
         elif mostRecentAnivMessageRepository is not None and not isinstance(mostRecentAnivMessageRepository, MostRecentAnivMessageRepositoryInterface):
@@ -611,6 +622,7 @@ class CynanBot(
         self.__twitchSubscriptionHandler: AbsTwitchSubscriptionHandler | None = twitchSubscriptionHandler
         self.__addOrRemoveUserDataHelper: AddOrRemoveUserDataHelperInterface = addOrRemoveUserDataHelper
         self.__authRepository: AuthRepository = authRepository
+        self.__backingDatabase: BackingDatabase = backingDatabase
         self.__beanChanceCheerActionHelper: BeanChanceCheerActionHelperInterface | None = beanChanceCheerActionHelper
         self.__chatActionsManager: ChatActionsManagerInterface | None = chatActionsManager
         self.__chatLogger: ChatLoggerInterface = chatLogger
@@ -619,7 +631,9 @@ class CynanBot(
         self.__crowdControlMachine: CrowdControlMachineInterface | None = crowdControlMachine
         self.__cutenessPresenter: CutenessPresenterInterface | None = cutenessPresenter
         self.__generalSettingsRepository: GeneralSettingsRepository = generalSettingsRepository
+        self.__latencyTracer: LatencyTracerInterface = latencyTracer
         self.__mostRecentAnivMessageTimeoutHelper: MostRecentAnivMessageTimeoutHelperInterface | None = mostRecentAnivMessageTimeoutHelper
+        self.__mostRecentChatsRepository: MostRecentChatsRepositoryInterface | None = mostRecentChatsRepository
         self.__recurringActionsMachine: RecurringActionsMachineInterface | None = recurringActionsMachine
         self.__sentMessageLogger: SentMessageLoggerInterface = sentMessageLogger
         self.__streamAlertsManager: StreamAlertsManagerInterface = streamAlertsManager
@@ -651,6 +665,7 @@ class CynanBot(
         self.__confirmCommand: AbsCommand = ConfirmCommand(addOrRemoveUserDataHelper, administratorProvider, timber, twitchUtils, usersRepository)
         self.__cynanSourceCommand: AbsCommand = CynanSourceCommand(timber, twitchUtils, usersRepository)
         self.__discordCommand: AbsCommand = DiscordCommand(timber, twitchUtils, usersRepository)
+        self.__latencyCommand: AbsChatCommand = LatencyChatCommand(administratorProvider, latencyTracer, timber, twitchUtils, usersRepository)
         self.__loremIpsumCommand: AbsChatCommand = LoremIpsumChatCommand(administratorProvider, timber, twitchUtils, usersRepository)
         self.__mastodonCommand: AbsCommand = StubCommand()
         self.__pbsCommand: AbsCommand = PbsCommand(timber, twitchUtils, usersRepository)
@@ -865,6 +880,16 @@ class CynanBot(
 
         self.__timber.log('CynanBot', f'Finished initialization of {self.__authRepository.getAll().requireTwitchHandle()}')
 
+    async def close(self):
+        self.__timber.log('CynanBot', 'Closing CynanBot...')
+
+        if self.__mostRecentChatsRepository is not None:
+            await self.__mostRecentChatsRepository.flush()
+
+        await super().close()
+        await self.__backingDatabase.close()
+        await self.__timber.close()
+
     async def event_channel_join_failure(self, channel: str):
         userId = await self.__userIdsRepository.fetchUserId(channel)
         user: UserInterface | None = None
@@ -903,11 +928,18 @@ class CynanBot(
         if await twitchMessage.isMessageFromExternalSharedChat():
             return
 
+        twitchChannelId = await twitchMessage.getTwitchChannelId()
+        messageStartTime = time.perf_counter()
+
         if self.__chatActionsManager is not None:
             await self.__chatActionsManager.handleMessage(twitchMessage)
 
+        commandsStartTime = time.perf_counter()
         await self.handle_commands(message)
 
+        self.__latencyTracer.record(twitchChannelId, LatencyStage.CHAT_COMMANDS, commandsStartTime)
+        self.__latencyTracer.record(twitchChannelId, LatencyStage.TOTAL, messageStartTime)
+
     async def event_ready(self):
         await self.wait_for_ready()
 
@@ -981,12 +1013,16 @@ class CynanBot(
 
         self.__addOrRemoveUserDataHelper.setAddOrRemoveUserEventListener(self)
         self.__timber.start()
+        self.__latencyTracer.start()
         self.__twitchTokensRepository.start()
         self.__sentMessageLogger.start()
         self.__chatLogger.start()
         self.__streamAlertsManager.start()
         self.__twitchUtils.start()
 
+        if self.__mostRecentChatsRepository is not None:
+            self.__mostRecentChatsRepository.start()
+
         if self.__beanChanceCheerActionHelper is not None:
             self.__beanChanceCheerActionHelper.setTwitchChannelProvider(self)
 
@@ -1554,6 +1590,11 @@ class CynanBot(
         context = self.__twitchConfiguration.getContext(ctx)
         await self.__jishoCommand.handleChatCommand(context)
 
+    @commands.command(name = 'latency')
+    async def command_latency(self, ctx: Context):
+        context = self.__twitchConfiguration.getContext(ctx)
+        await self.__latencyCommand.handleChatCommand(context)
+
     @commands.command(name = 'lorem')
     async def command_lorem(self, ctx: Context):
         context = self.__twitchConfiguration.getContext(ctx)
@@ -5,7 +5,6 @@ from .funtoonTokensRepositoryInterface import FuntoonTokensRepositoryInterface
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..storage.jsonReaderInterface import JsonReaderInterface
 from ..timber.timberInterface import TimberInterface
 from ..users.userIdsRepositoryInterface import UserIdsRepositoryInterface
@@ -34,7 +33,6 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
         self.__seedFileReader: JsonReaderInterface | None = seedFileReader
 
-        self.__isDatabaseReady: bool = False
         self.__cache: dict[str, str | None] = dict()
 
     async def clearCaches(self):
@@ -77,7 +75,7 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         self.__timber.log('FuntoonTokensRepository', f'Finished reading in seed file \"{seedFileReader}\"')
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
+        await self.__consumeSeedFile()
         return await self.__backingDatabase.getConnection()
 
     async def getToken(
@@ -109,40 +107,6 @@ class FuntoonTokensRepository(FuntoonTokensRepositoryInterface):
         self.__cache[twitchChannelId] = token
         return token
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS funtoontokens (
-                            token text DEFAULT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS funtoontokens (
-                            token TEXT DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-        await self.__consumeSeedFile()
-
     async def requireToken(
         self,
         twitchChannelId: str
@@ -0,0 +1,59 @@
+import math
+from collections import deque
+
+from .latencyStage import LatencyStage
+from .latencyStageSnapshot import LatencyStageSnapshot
+from ..misc import utils as utils
+
+
+class LatencyHistogram:
+
+    # A rolling window over the most recent samples for a single stage. Recording is just a
+    # deque append, which is cheap enough to do for every chat message. All of the sorting
+    # needed for the percentiles is deferred until a snapshot is actually requested.
+
+    def __init__(
+        self,
+        stage: LatencyStage,
+        maxSamples: int = 512
+    ):
+        if not isinstance(stage, LatencyStage):
+            raise TypeError(f'stage argument is malformed: \"{stage}\"')
+        elif not utils.isValidInt(maxSamples):
+            raise TypeError(f'maxSamples argument is malformed: \"{maxSamples}\"')
+        elif maxSamples < 1 or maxSamples > 65536:
+            raise ValueError(f'maxSamples argument is out of bounds: {maxSamples}')
+
+        self.__stage: LatencyStage = stage
+
+        self.__samples: deque[float] = deque(maxlen = maxSamples)
+        self.__totalCount: int = 0
+
+    def __percentile(self, sortedSamples: list[float], percentile: float) -> float:
+        # nearest-rank method
+        rank = math.ceil(percentile / 100 * len(sortedSamples))
+        return sortedSamples[max(0, rank - 1)]
+
+    def record(self, durationMillis: float):
+        self.__samples.append(durationMillis)
+        self.__totalCount += 1
+
+    def toSnapshot(self) -> LatencyStageSnapshot | None:
+        if len(self.__samples) == 0:
+            return None
+
+        sortedSamples = sorted(self.__samples)
+
+        return LatencyStageSnapshot(
+            maxMillis = sortedSamples[-1],
+            p50Millis = self.__percentile(sortedSamples, 50),
+            p95Millis = self.__percentile(sortedSamples, 95),
+            p99Millis = self.__percentile(sortedSamples, 99),
+            sampleCount = len(sortedSamples),
+            totalCount = self.__totalCount,
+            stage = self.__stage
+        )
+
+    @property
+    def totalCount(self) -> int:
+        return self.__totalCount
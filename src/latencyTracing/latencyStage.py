@@ -0,0 +1,20 @@
+from enum import auto
+
+from ..misc.enumWithToFromStr import EnumWithToFromStr
+
+
+class LatencyStage(EnumWithToFromStr):
+
+    ACTIVE_CHATTERS = auto()
+    ANIV_CHAT_ACTIONS = auto()
+    CHAT_COMMANDS = auto()
+    CHAT_LOGGER = auto()
+    CHEER_ACTIONS_WIZARD = auto()
+    GET_MOST_RECENT_CHAT = auto()
+    GET_USER = auto()
+    PERSIST_ALL_USERS = auto()
+    RECURRING_ACTIONS_WIZARD = auto()
+    SET_MOST_RECENT_CHAT = auto()
+    SIMPLE_CHAT_ACTIONS = auto()
+    SUP_STREAMER = auto()
+    TOTAL = auto()
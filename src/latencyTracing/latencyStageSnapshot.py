@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from .latencyStage import LatencyStage
+
+
+@dataclass(frozen = True)
+class LatencyStageSnapshot:
+    maxMillis: float
+    p50Millis: float
+    p95Millis: float
+    p99Millis: float
+    sampleCount: int
+    stage: LatencyStage
+    totalCount: int
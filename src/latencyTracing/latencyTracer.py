@@ -0,0 +1,138 @@
+import asyncio
+import time
+
+from .latencyHistogram import LatencyHistogram
+from .latencyStage import LatencyStage
+from .latencyStageSnapshot import LatencyStageSnapshot
+from .latencyTracerInterface import LatencyTracerInterface
+from ..misc import utils as utils
+from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..timber.timberInterface import TimberInterface
+
+
+class LatencyTracer(LatencyTracerInterface):
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
+        timber: TimberInterface,
+        logIntervalSeconds: int = 900,
+        maxSamplesPerStage: int = 512
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(logIntervalSeconds):
+            raise TypeError(f'logIntervalSeconds argument is malformed: \"{logIntervalSeconds}\"')
+        elif logIntervalSeconds < 1 or logIntervalSeconds > 86400:
+            raise ValueError(f'logIntervalSeconds argument is out of bounds: {logIntervalSeconds}')
+        elif not utils.isValidInt(maxSamplesPerStage):
+            raise TypeError(f'maxSamplesPerStage argument is malformed: \"{maxSamplesPerStage}\"')
+        elif maxSamplesPerStage < 1 or maxSamplesPerStage > 65536:
+            raise ValueError(f'maxSamplesPerStage argument is out of bounds: {maxSamplesPerStage}')
+
+        self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
+        self.__timber: TimberInterface = timber
+        self.__logIntervalSeconds: int = logIntervalSeconds
+        self.__maxSamplesPerStage: int = maxSamplesPerStage
+
+        self.__isStarted: bool = False
+        self.__histograms: dict[str, dict[LatencyStage, LatencyHistogram]] = dict()
+        self.__recentlyRecordedTwitchChannelIds: set[str] = set()
+
+    def getReport(self, twitchChannelId: str) -> str | None:
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        snapshots = self.getSnapshots(twitchChannelId)
+
+        if len(snapshots) == 0:
+            return None
+
+        snapshotStrs: list[str] = list()
+
+        for snapshot in snapshots:
+            snapshotStrs.append(f'{snapshot.stage.toStr()} {snapshot.p50Millis:.1f}/{snapshot.p95Millis:.1f}/{snapshot.p99Millis:.1f}')
+
+        snapshotsStr = ', '.join(snapshotStrs)
+        return f'p50/p95/p99 ms — {snapshotsStr}'
+
+    def getSnapshots(self, twitchChannelId: str) -> list[LatencyStageSnapshot]:
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        histograms = self.__histograms.get(twitchChannelId, None)
+
+        if histograms is None:
+            return list()
+
+        snapshots: list[LatencyStageSnapshot] = list()
+
+        for stage in LatencyStage:
+            histogram = histograms.get(stage, None)
+
+            if histogram is None:
+                continue
+
+            snapshot = histogram.toSnapshot()
+
+            if snapshot is not None:
+                snapshots.append(snapshot)
+
+        return snapshots
+
+    def __logRecentReports(self):
+        twitchChannelIds = self.__recentlyRecordedTwitchChannelIds
+        self.__recentlyRecordedTwitchChannelIds = set()
+
+        for twitchChannelId in twitchChannelIds:
+            report = self.getReport(twitchChannelId)
+
+            if utils.isValidStr(report):
+                self.__timber.log('LatencyTracer', f'Chat pipeline latency ({twitchChannelId=}): {report}')
+
+    def record(
+        self,
+        twitchChannelId: str,
+        stage: LatencyStage,
+        startTime: float
+    ) -> float:
+        # This is called several times for every single chat message, so it intentionally skips
+        # the usual argument validation. The end time is returned so that consecutive stages can
+        # be chained together without needing any extra calls to perf_counter().
+        endTime = time.perf_counter()
+        histograms = self.__histograms.get(twitchChannelId, None)
+
+        if histograms is None:
+            histograms = dict()
+            self.__histograms[twitchChannelId] = histograms
+
+        histogram = histograms.get(stage, None)
+
+        if histogram is None:
+            histogram = LatencyHistogram(
+                stage = stage,
+                maxSamples = self.__maxSamplesPerStage
+            )
+
+            histograms[stage] = histogram
+
+        histogram.record((endTime - startTime) * 1000)
+        self.__recentlyRecordedTwitchChannelIds.add(twitchChannelId)
+
+        return endTime
+
+    def start(self):
+        if self.__isStarted:
+            self.__timber.log('LatencyTracer', 'Not starting LatencyTracer as it has already been started')
+            return
+
+        self.__isStarted = True
+        self.__timber.log('LatencyTracer', 'Starting LatencyTracer...')
+        self.__backgroundTaskHelper.createTask(self.__startLogLoop())
+
+    async def __startLogLoop(self):
+        while True:
+            await asyncio.sleep(self.__logIntervalSeconds)
+            self.__logRecentReports()
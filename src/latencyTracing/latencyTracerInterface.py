@@ -0,0 +1,28 @@
+from abc import ABC, abstractmethod
+
+from .latencyStage import LatencyStage
+from .latencyStageSnapshot import LatencyStageSnapshot
+
+
+class LatencyTracerInterface(ABC):
+
+    @abstractmethod
+    def getReport(self, twitchChannelId: str) -> str | None:
+        pass
+
+    @abstractmethod
+    def getSnapshots(self, twitchChannelId: str) -> list[LatencyStageSnapshot]:
+        pass
+
+    @abstractmethod
+    def record(
+        self,
+        twitchChannelId: str,
+        stage: LatencyStage,
+        startTime: float
+    ) -> float:
+        pass
+
+    @abstractmethod
+    def start(self):
+        pass
@@ -0,0 +1,155 @@
+import asyncio
+from asyncio import AbstractEventLoop
+from collections import deque
+from typing import Generic, TypeVar
+
+from . import utils as utils
+from .batchingQueueMetrics import BatchingQueueMetrics
+
+T = TypeVar('T')
+
+
+class BatchingQueue(Generic[T]):
+
+    # A bounded queue whose consumer sleeps until something is actually put into it, rather than
+    # polling on a fixed interval. Once woken, the consumer may optionally linger for up to
+    # maxLatencySeconds in order to collect a bigger batch, but it will never be handed more than
+    # maxBatchSize items at once. put() is safe to call from any thread, and from outside of a
+    # running event loop.
+
+    def __init__(
+        self,
+        maxBatchSize: int = 100,
+        maxLatencySeconds: float = 0,
+        maxSize: int = 1000
+    ):
+        if not utils.isValidInt(maxBatchSize):
+            raise TypeError(f'maxBatchSize argument is malformed: \"{maxBatchSize}\"')
+        elif maxBatchSize < 1 or maxBatchSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxBatchSize argument is out of bounds: {maxBatchSize}')
+        elif not utils.isValidNum(maxLatencySeconds):
+            raise TypeError(f'maxLatencySeconds argument is malformed: \"{maxLatencySeconds}\"')
+        elif maxLatencySeconds < 0 or maxLatencySeconds > 60:
+            raise ValueError(f'maxLatencySeconds argument is out of bounds: {maxLatencySeconds}')
+        elif not utils.isValidInt(maxSize):
+            raise TypeError(f'maxSize argument is malformed: \"{maxSize}\"')
+        elif maxSize < 1 or maxSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxSize argument is out of bounds: {maxSize}')
+
+        self.__maxBatchSize: int = maxBatchSize
+        self.__maxLatencySeconds: float = maxLatencySeconds
+        self.__maxSize: int = maxSize
+
+        self.__eventLoop: AbstractEventLoop | None = None
+        self.__itemsAvailable: asyncio.Event = asyncio.Event()
+        self.__items: deque[T] = deque()
+        self.__highWaterMark: int = 0
+        self.__totalBatches: int = 0
+        self.__totalDequeued: int = 0
+        self.__totalDropped: int = 0
+        self.__totalEnqueued: int = 0
+
+    def drain(self) -> list[T]:
+        # hands over everything that's currently queued right away, ignoring both maxBatchSize and
+        # maxLatencySeconds, e.g. for one final flush when shutting down
+        batch = list(self.__items)
+        self.__items.clear()
+
+        if len(batch) >= 1:
+            self.__totalBatches += 1
+            self.__totalDequeued += len(batch)
+
+        return batch
+
+    def empty(self) -> bool:
+        return len(self.__items) == 0
+
+    async def getBatch(self, timeoutSeconds: float | None = None) -> list[T]:
+        if timeoutSeconds is not None and (not utils.isValidNum(timeoutSeconds) or timeoutSeconds < 0):
+            raise TypeError(f'timeoutSeconds argument is malformed: \"{timeoutSeconds}\"')
+
+        eventLoop = asyncio.get_running_loop()
+        self.__eventLoop = eventLoop
+
+        if timeoutSeconds is None:
+            while len(self.__items) == 0:
+                await self.__waitForItems(None)
+        elif len(self.__items) == 0 and not await self.__waitForItems(timeoutSeconds):
+            return list()
+
+        if self.__maxLatencySeconds > 0:
+            deadline = eventLoop.time() + self.__maxLatencySeconds
+
+            while len(self.__items) < self.__maxBatchSize:
+                remainingSeconds = deadline - eventLoop.time()
+
+                if remainingSeconds <= 0 or not await self.__waitForItems(remainingSeconds):
+                    break
+
+        batch: list[T] = list()
+
+        while len(batch) < self.__maxBatchSize and len(self.__items) >= 1:
+            batch.append(self.__items.popleft())
+
+        if len(batch) >= 1:
+            self.__totalBatches += 1
+            self.__totalDequeued += len(batch)
+
+        return batch
+
+    def getMetrics(self) -> BatchingQueueMetrics:
+        return BatchingQueueMetrics(
+            depth = len(self.__items),
+            highWaterMark = self.__highWaterMark,
+            maxSize = self.__maxSize,
+            totalBatches = self.__totalBatches,
+            totalDequeued = self.__totalDequeued,
+            totalDropped = self.__totalDropped,
+            totalEnqueued = self.__totalEnqueued
+        )
+
+    def __len__(self) -> int:
+        return len(self.__items)
+
+    def put(self, item: T) -> bool:
+        if len(self.__items) >= self.__maxSize:
+            self.__totalDropped += 1
+            return False
+
+        self.__items.append(item)
+        self.__totalEnqueued += 1
+        self.__highWaterMark = max(self.__highWaterMark, len(self.__items))
+        self.__wakeConsumer()
+        return True
+
+    def qsize(self) -> int:
+        return len(self.__items)
+
+    def __repr__(self) -> str:
+        return str(self.getMetrics())
+
+    async def __waitForItems(self, timeoutSeconds: float | None) -> bool:
+        self.__itemsAvailable.clear()
+
+        try:
+            await asyncio.wait_for(self.__itemsAvailable.wait(), timeout = timeoutSeconds)
+            return True
+        except asyncio.TimeoutError:
+            return False
+
+    def __wakeConsumer(self):
+        eventLoop = self.__eventLoop
+
+        if eventLoop is None:
+            # no consumer has started waiting yet, so it will see this item as soon as it does
+            return
+
+        try:
+            runningEventLoop = asyncio.get_running_loop()
+        except RuntimeError:
+            runningEventLoop = None
+
+        if runningEventLoop is eventLoop:
+            self.__itemsAvailable.set()
+        elif not eventLoop.is_closed():
+            eventLoop.call_soon_threadsafe(self.__itemsAvailable.set)
@@ -0,0 +1,12 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class BatchingQueueMetrics:
+    depth: int
+    highWaterMark: int
+    maxSize: int
+    totalBatches: int
+    totalDequeued: int
+    totalDropped: int
+    totalEnqueued: int
@@ -0,0 +1,89 @@
+import hashlib
+import math
+
+from . import utils as utils
+
+
+class BloomFilter:
+
+    # A fixed size set membership filter that can say "definitely not present" or "probably
+    # present", in a small fraction of the memory of an actual set. The number of bits and hash
+    # functions are sized from the expected capacity and the desired false positive rate. Each
+    # key is hashed once with BLAKE2b, and the two halves of that digest are combined to derive
+    # every bit position (the Kirsch-Mitzenmacher technique). Adding more keys than the capacity
+    # still works, but the false positive rate climbs as it does, which isSaturated reports.
+
+    def __init__(
+        self,
+        capacity: int,
+        falsePositiveRate: float = 0.01
+    ):
+        if not utils.isValidInt(capacity):
+            raise TypeError(f'capacity argument is malformed: \"{capacity}\"')
+        elif capacity < 1 or capacity > utils.getIntMaxSafeSize():
+            raise ValueError(f'capacity argument is out of bounds: {capacity}')
+        elif not utils.isValidNum(falsePositiveRate):
+            raise TypeError(f'falsePositiveRate argument is malformed: \"{falsePositiveRate}\"')
+        elif falsePositiveRate <= 0 or falsePositiveRate >= 1:
+            raise ValueError(f'falsePositiveRate argument is out of bounds: {falsePositiveRate}')
+
+        self.__capacity: int = capacity
+        self.__falsePositiveRate: float = falsePositiveRate
+
+        bitCount = math.ceil(-capacity * math.log(falsePositiveRate) / (math.log(2) ** 2))
+        self.__bitCount: int = max(8, bitCount)
+        self.__hashCount: int = max(1, round(self.__bitCount / capacity * math.log(2)))
+        self.__bits: bytearray = bytearray(math.ceil(self.__bitCount / 8))
+        self.__size: int = 0
+
+    def add(self, key: str):
+        isNewKey = False
+
+        for bitIndex in self.__getBitIndexes(key):
+            byteIndex = bitIndex >> 3
+            bitMask = 1 << (bitIndex & 7)
+
+            if self.__bits[byteIndex] & bitMask == 0:
+                self.__bits[byteIndex] |= bitMask
+                isNewKey = True
+
+        if isNewKey:
+            self.__size += 1
+
+    @property
+    def bitCount(self) -> int:
+        return self.__bitCount
+
+    @property
+    def capacity(self) -> int:
+        return self.__capacity
+
+    def __contains__(self, key: str) -> bool:
+        for bitIndex in self.__getBitIndexes(key):
+            if self.__bits[bitIndex >> 3] & (1 << (bitIndex & 7)) == 0:
+                return False
+
+        return True
+
+    @property
+    def falsePositiveRate(self) -> float:
+        return self.__falsePositiveRate
+
+    def __getBitIndexes(self, key: str) -> list[int]:
+        digest = hashlib.blake2b(key.encode('utf-8'), digest_size = 16).digest()
+        firstHash = int.from_bytes(digest[:8], 'little')
+        secondHash = int.from_bytes(digest[8:], 'little') | 1
+
+        return [ (firstHash + index * secondHash) % self.__bitCount for index in range(self.__hashCount) ]
+
+    @property
+    def hashCount(self) -> int:
+        return self.__hashCount
+
+    @property
+    def isSaturated(self) -> bool:
+        return self.__size >= self.__capacity
+
+    def __len__(self) -> int:
+        # an approximation, as a new key whose bits all happened to already be set isn't counted
+        return self.__size
@@ -5,6 +5,7 @@ from ..network.networkClientType import NetworkClientType
 from ..network.networkJsonMapperInterface import NetworkJsonMapperInterface
 from ..storage.databaseType import DatabaseType
 from ..storage.storageJsonMapperInterface import StorageJsonMapperInterface
+from ..timber.timberLevel import TimberLevel
 
 
 class GeneralSettingsRepositorySnapshot:
@@ -63,6 +64,29 @@ class GeneralSettingsRepositorySnapshot:
     def getSuperTriviaGameToxicPunishmentMultiplier(self) -> int:
         return utils.getIntFromDict(self.__jsonContents, 'superTriviaGameToxicPunishmentMultiplier', 2)
 
+    def getTimberLevel(self) -> TimberLevel:
+        timberLevel = self.__jsonContents.get('timberLevel')
+
+        if utils.isValidStr(timberLevel):
+            return TimberLevel.fromStr(timberLevel)
+        else:
+            return TimberLevel.INFO
+
+    def getTimberTagLevels(self) -> dict[str, TimberLevel]:
+        timberTagLevelsJson: dict[str, Any] | Any | None = self.__jsonContents.get('timberTagLevels')
+        timberTagLevels: dict[str, TimberLevel] = dict()
+
+        if not isinstance(timberTagLevelsJson, dict):
+            return timberTagLevels
+
+        for tag, timberLevel in timberTagLevelsJson.items():
+            if not utils.isValidStr(tag) or not utils.isValidStr(timberLevel):
+                raise ValueError(f'\"timberTagLevels\" in General Settings file is malformed: \"{timberTagLevelsJson}\"')
+
+            timberTagLevels[tag] = TimberLevel.fromStr(timberLevel)
+
+        return timberTagLevels
+
     def getTriviaGamePoints(self) -> int:
         return utils.getIntFromDict(self.__jsonContents, 'triviaGamePoints', 5)
 
@@ -78,6 +102,9 @@ class GeneralSettingsRepositorySnapshot:
     def isCatJamMessageEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'catJamMessageEnabled', False)
 
+    def isChatArchiveEnabled(self) -> bool:
+        return utils.getBoolFromDict(self.__jsonContents, 'chatArchiveEnabled', False)
+
     def isChatBandEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'chatBandEnabled', False)
 
@@ -114,6 +141,9 @@ class GeneralSettingsRepositorySnapshot:
     def isJishoEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'jishoEnabled', True)
 
+    def isMostRecentChatsWriteBehindEnabled(self) -> bool:
+        return utils.getBoolFromDict(self.__jsonContents, 'mostRecentChatsWriteBehindEnabled', False)
+
     def isPersistAllUsersEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'persistAllUsersEnabled', False)
 
@@ -144,6 +174,9 @@ class GeneralSettingsRepositorySnapshot:
     def isSchubertWalkMessageEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'schubertWalkMessageEnabled', False)
 
+    def isSqliteConnectionPoolEnabled(self) -> bool:
+        return utils.getBoolFromDict(self.__jsonContents, 'sqliteConnectionPoolEnabled', True)
+
     def isSuperTriviaGameEnabled(self) -> bool:
         return utils.getBoolFromDict(self.__jsonContents, 'superTriviaGameEnabled', False)
 
@@ -0,0 +1,69 @@
+import sys
+import time
+
+from . import utils as utils
+
+
+class StartupProfiler:
+
+    # Tracks how long each section of an init script takes to run, so that we can see what's
+    # actually worth making lazy. An init script should capture time.perf_counter() before any
+    # of its other imports and pass it in as startTime, so that the time spent importing is
+    # measured too (the first markSection() call then covers just those imports).
+
+    def __init__(self, startTime: float | None = None):
+        if startTime is not None and not utils.isValidNum(startTime):
+            raise TypeError(f'startTime argument is malformed: \"{startTime}\"')
+
+        if startTime is None:
+            startTime = time.perf_counter()
+
+        self.__startTime: float = startTime
+        self.__lastMarkTime: float = self.__startTime
+        self.__sections: list[tuple[str, float]] = list()
+
+    def __getPeakRssMebibytes(self) -> float | None:
+        if sys.platform == 'win32':
+            return None
+
+        import resource
+        peakRss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+        if sys.platform == 'darwin':
+            # macOS reports this value in bytes, rather than in kibibytes
+            return peakRss / 1048576
+        else:
+            return peakRss / 1024
+
+    def getReport(self, maxSections: int = 8) -> str:
+        if not utils.isValidInt(maxSections):
+            raise TypeError(f'maxSections argument is malformed: \"{maxSections}\"')
+        elif maxSections < 1 or maxSections > 100:
+            raise ValueError(f'maxSections argument is out of bounds: {maxSections}')
+
+        totalMillis = (time.perf_counter() - self.__startTime) * 1000
+        processCpuSeconds = time.process_time()
+        loadedModules = len(sys.modules)
+
+        peakRssMebibytes = self.__getPeakRssMebibytes()
+        peakRssStr = 'n/a' if peakRssMebibytes is None else f'{peakRssMebibytes:.1f} MiB'
+
+        slowestSections = sorted(self.__sections, key = lambda section: section[1], reverse = True)[:maxSections]
+        sectionStrs: list[str] = list()
+
+        for sectionName, sectionMillis in slowestSections:
+            sectionStrs.append(f'{sectionName} {sectionMillis:.0f}ms')
+
+        sectionsStr = ', '.join(sectionStrs)
+        return f'Initialized in {totalMillis:.0f}ms (processCpu={processCpuSeconds:.2f}s) (peakRss={peakRssStr}) (loadedModules={loadedModules}) (slowestSections=[{sectionsStr}])'
+
+    def getSections(self) -> list[tuple[str, float]]:
+        return list(self.__sections)
+
+    def markSection(self, sectionName: str):
+        if not utils.isValidStr(sectionName):
+            raise TypeError(f'sectionName argument is malformed: \"{sectionName}\"')
+
+        now = time.perf_counter()
+        self.__sections.append((sectionName, (now - self.__lastMarkTime) * 1000))
+        self.__lastMarkTime = now
@@ -1,5 +1,8 @@
 from __future__ import annotations
 
+import asyncio
+import time
+import traceback
 from collections import defaultdict
 from datetime import datetime
 
@@ -9,9 +12,9 @@ from .mostRecentChat import MostRecentChat
 from .mostRecentChatsRepositoryInterface import MostRecentChatsRepositoryInterface
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
+from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..timber.timberInterface import TimberInterface
 
 
@@ -19,29 +22,49 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
 
     def __init__(
         self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
         backingDatabase: BackingDatabase,
         timber: TimberInterface,
         timeZoneRepository: TimeZoneRepositoryInterface,
-        cacheSize: int = 100
+        writeBehindEnabled: bool = False,
+        cacheSize: int = 100,
+        writeBehindSleepTimeSeconds: float = 10
     ):
-        if not isinstance(backingDatabase, BackingDatabase):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(backingDatabase, BackingDatabase):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
             raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
+        elif not utils.isValidBool(writeBehindEnabled):
+            raise TypeError(f'writeBehindEnabled argument is malformed: \"{writeBehindEnabled}\"')
         elif not utils.isValidInt(cacheSize):
             raise TypeError(f'cacheSize argument is malformed: \"{cacheSize}\"')
         elif cacheSize < 1 or cacheSize > utils.getIntMaxSafeSize():
             raise ValueError(f'cacheSize argument is out of bounds: {cacheSize}')
+        elif not utils.isValidNum(writeBehindSleepTimeSeconds):
+            raise TypeError(f'writeBehindSleepTimeSeconds argument is malformed: \"{writeBehindSleepTimeSeconds}\"')
+        elif writeBehindSleepTimeSeconds < 1 or writeBehindSleepTimeSeconds > 300:
+            raise ValueError(f'writeBehindSleepTimeSeconds argument is out of bounds: {writeBehindSleepTimeSeconds}')
 
+        self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
+        self.__writeBehindEnabled: bool = writeBehindEnabled
+        self.__writeBehindSleepTimeSeconds: float = writeBehindSleepTimeSeconds
 
-        self.__isDatabaseReady: bool = False
+        self.__isStarted: bool = False
         self.__caches: dict[str, LRU[str, MostRecentChat | None]] = defaultdict(lambda: LRU(cacheSize))
 
+        # When write-behind is enabled, this dictionary holds every chat that has been set but
+        # not yet persisted. It is keyed by (chatterUserId, twitchChannelId), so repeated chats
+        # from the same user are coalesced down into just a single row for the next flush.
+        self.__dirtyChats: dict[tuple[str, str], MostRecentChat] = dict()
+        self.__flushLock: asyncio.Lock = asyncio.Lock()
+
     async def clearCaches(self):
         self.__caches.clear()
         self.__timber.log('MostRecentChatsRepository', 'Caches cleared')
@@ -61,6 +84,12 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
         if chatterUserId in cache:
             return cache[chatterUserId]
 
+        dirtyChat = self.__dirtyChats.get((chatterUserId, twitchChannelId), None)
+
+        if dirtyChat is not None:
+            cache[chatterUserId] = dirtyChat
+            return dirtyChat
+
         connection = await self.__getDatabaseConnection()
         record = await connection.fetchRow(
             '''
@@ -84,46 +113,34 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
         cache[chatterUserId] = mostRecentChat
         return mostRecentChat
 
-    async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
+    async def flush(self):
+        if len(self.__dirtyChats) == 0:
             return
 
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentchats (
-                            chatteruserid text NOT NULL,
-                            mostrecentchat text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentchats (
-                            chatteruserid TEXT NOT NULL,
-                            mostrecentchat TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+        async with self.__flushLock:
+            dirtyChats = list(self.__dirtyChats.values())
+            self.__dirtyChats.clear()
 
-        await connection.close()
+            if len(dirtyChats) == 0:
+                return
+
+            startTime = time.perf_counter()
+
+            try:
+                await self.__upsertMostRecentChats(dirtyChats)
+            except Exception as e:
+                # put the failed rows back, but don't clobber anything newer that came in meanwhile
+                for dirtyChat in dirtyChats:
+                    self.__dirtyChats.setdefault((dirtyChat.userId, dirtyChat.twitchChannelId), dirtyChat)
+
+                self.__timber.log('MostRecentChatsRepository', f'Encountered unknown Exception when flushing most recent chats ({len(dirtyChats)=}): {e}', e, traceback.format_exc())
+                return
+
+            elapsedMillis = (time.perf_counter() - startTime) * 1000
+            self.__timber.log('MostRecentChatsRepository', f'Flushed most recent chats ({len(dirtyChats)=}) ({elapsedMillis=:.2f})')
+
+    async def __getDatabaseConnection(self) -> DatabaseConnection:
+        return await self.__backingDatabase.getConnection()
 
     async def set(
         self,
@@ -135,22 +152,56 @@ class MostRecentChatsRepository(MostRecentChatsRepositoryInterface):
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        mostRecentChat = datetime.now(self.__timeZoneRepository.getDefault())
-
-        self.__caches[twitchChannelId][chatterUserId] = MostRecentChat(
-            mostRecentChat = mostRecentChat,
+        mostRecentChat = MostRecentChat(
+            mostRecentChat = datetime.now(self.__timeZoneRepository.getDefault()),
             twitchChannelId = twitchChannelId,
             userId = chatterUserId
         )
 
+        self.__caches[twitchChannelId][chatterUserId] = mostRecentChat
+
+        if self.__writeBehindEnabled:
+            self.__dirtyChats[(chatterUserId, twitchChannelId)] = mostRecentChat
+        else:
+            await self.__upsertMostRecentChats([ mostRecentChat ])
+
+    def start(self):
+        if not self.__writeBehindEnabled:
+            return
+        elif self.__isStarted:
+            self.__timber.log('MostRecentChatsRepository', 'Not starting MostRecentChatsRepository as it has already been started')
+            return
+
+        self.__isStarted = True
+        self.__timber.log('MostRecentChatsRepository', 'Starting MostRecentChatsRepository...')
+        self.__backgroundTaskHelper.createTask(self.__startFlushLoop())
+
+    async def __startFlushLoop(self):
+        while True:
+            await self.flush()
+            await asyncio.sleep(self.__writeBehindSleepTimeSeconds)
+
+    async def __upsertMostRecentChats(self, mostRecentChats: list[MostRecentChat]):
+        if not isinstance(mostRecentChats, list):
+            raise TypeError(f'mostRecentChats argument is malformed: \"{mostRecentChats}\"')
+        elif len(mostRecentChats) == 0:
+            return
+
+        records: list[tuple[str, str, str]] = list()
+
+        for mostRecentChat in mostRecentChats:
+            records.append((mostRecentChat.userId, mostRecentChat.mostRecentChat.isoformat(), mostRecentChat.twitchChannelId))
+
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO mostrecentchats (chatteruserid, mostrecentchat, twitchchannelid)
-                VALUES ($1, $2, $3)
-                ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentchat = EXCLUDED.mostrecentchat
-            ''',
-            chatterUserId, mostRecentChat.isoformat(), twitchChannelId
-        )
 
-        await connection.close()
+        try:
+            await connection.executeMany(
+                '''
+                    INSERT INTO mostrecentchats (chatteruserid, mostrecentchat, twitchchannelid)
+                    VALUES ($1, $2, $3)
+                    ON CONFLICT (chatteruserid, twitchchannelid) DO UPDATE SET mostrecentchat = EXCLUDED.mostrecentchat
+                ''',
+                records
+            )
+        finally:
+            await connection.close()
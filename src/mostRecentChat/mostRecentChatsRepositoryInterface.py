@@ -6,6 +6,10 @@ from ..misc.clearable import Clearable
 
 class MostRecentChatsRepositoryInterface(Clearable):
 
+    @abstractmethod
+    async def flush(self):
+        pass
+
     @abstractmethod
     async def get(
         self,
@@ -21,3 +25,7 @@ class MostRecentChatsRepositoryInterface(Clearable):
         twitchChannelId: str
     ):
         pass
+
+    @abstractmethod
+    def start(self):
+        pass
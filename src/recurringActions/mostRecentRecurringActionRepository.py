@@ -8,7 +8,6 @@ from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..timber.timberInterface import TimberInterface
 
 
@@ -35,10 +34,7 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
 
-        self.__isDatabaseReady: bool = False
-
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
     async def getMostRecentRecurringAction(
@@ -76,41 +72,6 @@ class MostRecentRecurringActionRepository(MostRecentRecurringActionRepositoryInt
             twitchChannelId = twitchChannelId
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
-                            actiontype text NOT NULL,
-                            datetime text NOT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
-                            actiontype TEXT NOT NULL,
-                            datetime TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def setMostRecentRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
             raise ValueError(f'action argument is malformed: \"{action}\"')
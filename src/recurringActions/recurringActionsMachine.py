@@ -55,7 +55,7 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         userIdsRepository: UserIdsRepositoryInterface,
         usersRepository: UsersRepositoryInterface,
         weatherRepository: WeatherRepositoryInterface | None,
-        wordOfTheDayRepository: WordOfTheDayRepositoryInterface,
+        wordOfTheDayRepository: WordOfTheDayRepositoryInterface | None,
         queueSleepTimeSeconds: float = 3,
         refreshSleepTimeSeconds: float = 90,
         queueTimeoutSeconds: int = 3,
@@ -88,7 +88,7 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
             raise TypeError(f'usersRepository argument is malformed: \"{usersRepository}\"')
         elif weatherRepository is not None and not isinstance(weatherRepository, WeatherRepositoryInterface):
             raise TypeError(f'weatherRepository argument is malformed: \"{weatherRepository}\"')
-        elif not isinstance(wordOfTheDayRepository, WordOfTheDayRepositoryInterface):
+        elif wordOfTheDayRepository is not None and not isinstance(wordOfTheDayRepository, WordOfTheDayRepositoryInterface):
             raise TypeError(f'wordOfTheDayRepository argument is malformed: \"{wordOfTheDayRepository}\"')
         elif not utils.isValidNum(queueSleepTimeSeconds):
             raise TypeError(f'queueSleepTimeSeconds argument is malformed: \"{queueSleepTimeSeconds}\"')
@@ -122,7 +122,7 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
         self.__usersRepository: UsersRepositoryInterface = usersRepository
         self.__weatherRepository: WeatherRepositoryInterface | None = weatherRepository
-        self.__wordOfTheDayRepository: WordOfTheDayRepositoryInterface = wordOfTheDayRepository
+        self.__wordOfTheDayRepository: WordOfTheDayRepositoryInterface | None = wordOfTheDayRepository
         self.__queueSleepTimeSeconds: float = queueSleepTimeSeconds
         self.__refreshSleepTimeSeconds: float = refreshSleepTimeSeconds
         self.__queueTimeoutSeconds: int = queueTimeoutSeconds
@@ -344,6 +344,9 @@ class RecurringActionsMachine(RecurringActionsMachineInterface):
         elif not isinstance(action, WordOfTheDayRecurringAction):
             raise TypeError(f'action argument is malformed: \"{action}\"')
 
+        if self.__wordOfTheDayRepository is None:
+            return False
+
         languageEntry = action.languageEntry
 
         if languageEntry is None:
@@ -11,7 +11,6 @@ from .wordOfTheDayRecurringAction import WordOfTheDayRecurringAction
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..timber.timberInterface import TimberInterface
 
 
@@ -34,8 +33,6 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         self.__recurringActionsJsonParser: RecurringActionsJsonParserInterface = recurringActionsJsonParser
         self.__timber: TimberInterface = timber
 
-        self.__isDatabaseReady: bool = False
-
     async def getAllRecurringActions(
         self,
         twitchChannel: str,
@@ -109,7 +106,6 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
         )
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
     async def __getRecurringAction(
@@ -219,47 +215,6 @@ class RecurringActionsRepository(RecurringActionsRepositoryInterface):
             twitchChannelId = twitchChannelId
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS recurringactions (
-                            actiontype text NOT NULL,
-                            configurationjson text DEFAULT NULL,
-                            isenabled smallint DEFAULT 1 NOT NULL,
-                            minutesbetween integer DEFAULT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (actiontype, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS recurringactions (
-                            actiontype TEXT NOT NULL,
-                            configurationjson TEXT DEFAULT NULL,
-                            isenabled INTEGER DEFAULT 1 NOT NULL,
-                            minutesbetween INTEGER DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (actiontype, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def setRecurringAction(self, action: RecurringAction):
         if not isinstance(action, RecurringAction):
             raise TypeError(f'action argument is malformed: \"{action}\"')
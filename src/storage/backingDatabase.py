@@ -6,6 +6,10 @@ from .databaseType import DatabaseType
 
 class BackingDatabase(ABC):
 
+    @abstractmethod
+    async def close(self):
+        pass
+
     @property
     @abstractmethod
     def databaseType(self) -> DatabaseType:
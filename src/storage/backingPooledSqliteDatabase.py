@@ -0,0 +1,154 @@
+from asyncio import AbstractEventLoop, Lock, Queue
+
+import aiosqlite
+
+from .backingDatabase import BackingDatabase
+from .databaseConnection import DatabaseConnection
+from .databaseType import DatabaseType
+from .exceptions import DatabaseConnectionIsClosedException
+from .pooledSqliteDatabaseConnection import PooledSqliteDatabaseConnection
+from .sqliteDatabaseConnection import SqliteDatabaseConnection
+from ..misc import utils as utils
+from ..timber.timberInterface import TimberInterface
+
+
+class BackingPooledSqliteDatabase(BackingDatabase):
+
+    def __init__(
+        self,
+        eventLoop: AbstractEventLoop,
+        timber: TimberInterface,
+        backingDatabaseFile: str = 'database.sqlite',
+        readerConnectionCount: int = 4,
+        busyTimeoutMillis: int = 5000,
+        cacheSizeKibibytes: int = 16384,
+        mmapSizeBytes: int = 268435456
+    ):
+        if not isinstance(eventLoop, AbstractEventLoop):
+            raise TypeError(f'eventLoop argument is malformed: \"{eventLoop}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidStr(backingDatabaseFile):
+            raise TypeError(f'backingDatabaseFile argument is malformed: \"{backingDatabaseFile}\"')
+        elif not utils.isValidInt(readerConnectionCount):
+            raise TypeError(f'readerConnectionCount argument is malformed: \"{readerConnectionCount}\"')
+        elif readerConnectionCount < 1 or readerConnectionCount > 32:
+            raise ValueError(f'readerConnectionCount argument is out of bounds: {readerConnectionCount}')
+        elif not utils.isValidInt(busyTimeoutMillis):
+            raise TypeError(f'busyTimeoutMillis argument is malformed: \"{busyTimeoutMillis}\"')
+        elif busyTimeoutMillis < 0 or busyTimeoutMillis > utils.getIntMaxSafeSize():
+            raise ValueError(f'busyTimeoutMillis argument is out of bounds: {busyTimeoutMillis}')
+        elif not utils.isValidInt(cacheSizeKibibytes):
+            raise TypeError(f'cacheSizeKibibytes argument is malformed: \"{cacheSizeKibibytes}\"')
+        elif cacheSizeKibibytes < 1 or cacheSizeKibibytes > utils.getIntMaxSafeSize():
+            raise ValueError(f'cacheSizeKibibytes argument is out of bounds: {cacheSizeKibibytes}')
+        elif not utils.isValidInt(mmapSizeBytes):
+            raise TypeError(f'mmapSizeBytes argument is malformed: \"{mmapSizeBytes}\"')
+        elif mmapSizeBytes < 0 or mmapSizeBytes > utils.getLongMaxSafeSize():
+            raise ValueError(f'mmapSizeBytes argument is out of bounds: {mmapSizeBytes}')
+
+        self.__eventLoop: AbstractEventLoop = eventLoop
+        self.__timber: TimberInterface = timber
+        self.__backingDatabaseFile: str = backingDatabaseFile
+        self.__readerConnectionCount: int = readerConnectionCount
+        self.__busyTimeoutMillis: int = busyTimeoutMillis
+        self.__cacheSizeKibibytes: int = cacheSizeKibibytes
+        self.__mmapSizeBytes: int = mmapSizeBytes
+
+        self.__isClosed: bool = False
+        self.__initLock: Lock = Lock()
+        self.__writerLock: Lock = Lock()
+        self.__readerConnections: Queue[SqliteDatabaseConnection] = Queue()
+        self.__writerConnection: SqliteDatabaseConnection | None = None
+
+    async def close(self):
+        async with self.__initLock:
+            if self.__isClosed:
+                return
+
+            self.__isClosed = True
+            writerConnection = self.__writerConnection
+
+            if writerConnection is None:
+                return
+
+            # wait for every reader connection to come back from any query that is still in
+            # flight, and for any transaction to finish up with the writer connection
+            readerConnections: list[SqliteDatabaseConnection] = list()
+
+            for _ in range(self.__readerConnectionCount):
+                readerConnections.append(await self.__readerConnections.get())
+
+            for readerConnection in readerConnections:
+                await readerConnection.close()
+
+            async with self.__writerLock:
+                await writerConnection.close()
+
+            # the closed reader connections go back into the pool, so that a lease that is still
+            # being held onto fails fast, instead of waiting forever on an empty pool
+            for readerConnection in readerConnections:
+                self.__readerConnections.put_nowait(readerConnection)
+
+            self.__timber.log('BackingPooledSqliteDatabase', f'Closed SQLite connection pool ({self.__backingDatabaseFile=})')
+
+    async def __connect(self, isWriter: bool) -> SqliteDatabaseConnection:
+        connection = await aiosqlite.connect(
+            database = self.__backingDatabaseFile,
+            loop = self.__eventLoop
+        )
+
+        await connection.execute(f'PRAGMA busy_timeout = {self.__busyTimeoutMillis}')
+        await connection.execute(f'PRAGMA cache_size = -{self.__cacheSizeKibibytes}')
+        await connection.execute(f'PRAGMA mmap_size = {self.__mmapSizeBytes}')
+        await connection.execute('PRAGMA temp_store = MEMORY')
+
+        if isWriter:
+            # journal_mode is persisted in the database file itself, so the writer only needs to
+            # set it once, and then every reader connection will pick it up automatically
+            await connection.execute('PRAGMA journal_mode = WAL')
+            await connection.execute('PRAGMA synchronous = NORMAL')
+        else:
+            await connection.execute('PRAGMA query_only = ON')
+
+        return SqliteDatabaseConnection(connection)
+
+    @property
+    def databaseType(self) -> DatabaseType:
+        return DatabaseType.SQLITE
+
+    async def getConnection(self) -> DatabaseConnection:
+        if self.__isClosed:
+            raise DatabaseConnectionIsClosedException(f'This database connection pool has already been closed! ({self.databaseType})')
+
+        writerConnection = await self.__requireWriterConnection()
+
+        return PooledSqliteDatabaseConnection(
+            readerConnections = self.__readerConnections,
+            writerConnection = writerConnection,
+            writerLock = self.__writerLock
+        )
+
+    async def __requireWriterConnection(self) -> SqliteDatabaseConnection:
+        writerConnection = self.__writerConnection
+
+        if writerConnection is not None:
+            return writerConnection
+
+        async with self.__initLock:
+            writerConnection = self.__writerConnection
+
+            if writerConnection is not None:
+                return writerConnection
+            elif self.__isClosed:
+                raise DatabaseConnectionIsClosedException(f'This database connection pool has already been closed! ({self.databaseType})')
+
+            writerConnection = await self.__connect(isWriter = True)
+
+            for _ in range(self.__readerConnectionCount):
+                self.__readerConnections.put_nowait(await self.__connect(isWriter = False))
+
+            self.__writerConnection = writerConnection
+            self.__timber.log('BackingPooledSqliteDatabase', f'Opened SQLite connection pool ({self.__backingDatabaseFile=}) ({self.__readerConnectionCount=})')
+
+            return writerConnection
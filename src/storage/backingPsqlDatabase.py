@@ -32,6 +32,16 @@ class BackingPsqlDatabase(BackingDatabase):
 
         self.__connectionPool: asyncpg.Pool | None = None
 
+    async def close(self):
+        connectionPool = self.__connectionPool
+
+        if connectionPool is None:
+            return
+
+        self.__connectionPool = None
+        await connectionPool.close()
+        self.__timber.log('BackingPsqlDatabase', 'Closed PostgreSQL connection pool')
+
     async def __createCollations(self, databaseConnection: DatabaseConnection):
         if not isinstance(databaseConnection, DatabaseConnection):
             raise TypeError(f'databaseConnection argument is malformed: \"{databaseConnection}\"')
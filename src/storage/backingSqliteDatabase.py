@@ -24,6 +24,10 @@ class BackingSqliteDatabase(BackingDatabase):
         self.__eventLoop: AbstractEventLoop = eventLoop
         self.__backingDatabaseFile: str = backingDatabaseFile
 
+    async def close(self):
+        # every connection handed out by this class is owned (and closed) by its caller
+        pass
+
     @property
     def databaseType(self) -> DatabaseType:
         return DatabaseType.SQLITE
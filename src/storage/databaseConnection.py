@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
 from typing import Any
 
 from .databaseType import DatabaseType
@@ -23,6 +24,10 @@ class DatabaseConnection(ABC):
     async def execute(self, query: str, *args: Any | None):
         pass
 
+    @abstractmethod
+    async def executeMany(self, query: str, records: list[tuple[Any, ...]]):
+        pass
+
     @abstractmethod
     async def fetchRow(self, query: str, *args: Any | None) -> list[Any] | None:
         pass
@@ -34,3 +39,7 @@ class DatabaseConnection(ABC):
     @abstractmethod
     def isClosed(self) -> bool:
         pass
+
+    @abstractmethod
+    def transaction(self) -> AbstractAsyncContextManager[None]:
+        pass
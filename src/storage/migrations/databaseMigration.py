@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from frozenlist import FrozenList
+
+from ..databaseType import DatabaseType
+
+
+@dataclass(frozen = True)
+class DatabaseMigration:
+    version: int
+    name: str
+    psqlStatements: FrozenList[str]
+    sqliteStatements: FrozenList[str]
+
+    def getStatements(self, databaseType: DatabaseType) -> FrozenList[str]:
+        if not isinstance(databaseType, DatabaseType):
+            raise TypeError(f'databaseType argument is malformed: \"{databaseType}\"')
+
+        match databaseType:
+            case DatabaseType.POSTGRESQL: return self.psqlStatements
+            case DatabaseType.SQLITE: return self.sqliteStatements
+            case _: raise RuntimeError(f'Encountered unexpected DatabaseType when trying to get migration statements: \"{databaseType}\"')
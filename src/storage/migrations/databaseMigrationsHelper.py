@@ -0,0 +1,99 @@
+from datetime import datetime
+
+from .databaseMigrationsHelperInterface import DatabaseMigrationsHelperInterface
+from .databaseMigrationsRegistryInterface import DatabaseMigrationsRegistryInterface
+from ..backingDatabase import BackingDatabase
+from ..databaseConnection import DatabaseConnection
+from ..databaseType import DatabaseType
+from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from ...timber.timberInterface import TimberInterface
+
+
+class DatabaseMigrationsHelper(DatabaseMigrationsHelperInterface):
+
+    def __init__(
+        self,
+        backingDatabase: BackingDatabase,
+        databaseMigrationsRegistry: DatabaseMigrationsRegistryInterface,
+        timber: TimberInterface,
+        timeZoneRepository: TimeZoneRepositoryInterface
+    ):
+        if not isinstance(backingDatabase, BackingDatabase):
+            raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
+        elif not isinstance(databaseMigrationsRegistry, DatabaseMigrationsRegistryInterface):
+            raise TypeError(f'databaseMigrationsRegistry argument is malformed: \"{databaseMigrationsRegistry}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
+            raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
+
+        self.__backingDatabase: BackingDatabase = backingDatabase
+        self.__databaseMigrationsRegistry: DatabaseMigrationsRegistryInterface = databaseMigrationsRegistry
+        self.__timber: TimberInterface = timber
+        self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
+
+    async def __createMigrationsTable(self, connection: DatabaseConnection):
+        match connection.databaseType:
+            case DatabaseType.POSTGRESQL:
+                await connection.execute(
+                    '''
+                        CREATE TABLE IF NOT EXISTS databasemigrations (
+                            version integer NOT NULL PRIMARY KEY,
+                            name text NOT NULL,
+                            migratedat text NOT NULL
+                        )
+                    '''
+                )
+
+            case DatabaseType.SQLITE:
+                await connection.execute(
+                    '''
+                        CREATE TABLE IF NOT EXISTS databasemigrations (
+                            version INTEGER NOT NULL PRIMARY KEY,
+                            name TEXT NOT NULL,
+                            migratedat TEXT NOT NULL
+                        )
+                    '''
+                )
+
+            case _:
+                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
+
+    async def migrate(self):
+        migrations = self.__databaseMigrationsRegistry.getMigrations()
+        connection = await self.__backingDatabase.getConnection()
+        appliedVersions: list[int] = list()
+
+        try:
+            async with connection.transaction():
+                await self.__createMigrationsTable(connection)
+
+                record = await connection.fetchRow('SELECT MAX(version) FROM databasemigrations')
+                currentVersion = 0
+
+                if record is not None and len(record) >= 1 and record[0] is not None:
+                    currentVersion = int(record[0])
+
+                for migration in migrations:
+                    if migration.version <= currentVersion:
+                        continue
+
+                    for statement in migration.getStatements(connection.databaseType):
+                        await connection.execute(statement)
+
+                    await connection.execute(
+                        '''
+                            INSERT INTO databasemigrations (version, name, migratedat)
+                            VALUES ($1, $2, $3)
+                        ''',
+                        migration.version, migration.name, datetime.now(self.__timeZoneRepository.getDefault()).isoformat()
+                    )
+
+                    appliedVersions.append(migration.version)
+        finally:
+            await connection.close()
+
+        if len(appliedVersions) == 0:
+            self.__timber.log('DatabaseMigrationsHelper', f'Database schema is already up to date ({connection.databaseType=})')
+        else:
+            self.__timber.log('DatabaseMigrationsHelper', f'Applied database migrations ({connection.databaseType=}) ({appliedVersions=})')
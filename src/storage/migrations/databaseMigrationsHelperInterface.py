@@ -0,0 +1,8 @@
+from abc import ABC, abstractmethod
+
+
+class DatabaseMigrationsHelperInterface(ABC):
+
+    @abstractmethod
+    async def migrate(self):
+        pass
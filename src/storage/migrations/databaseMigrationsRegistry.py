@@ -0,0 +1,547 @@
+from frozenlist import FrozenList
+
+from .databaseMigration import DatabaseMigration
+from .databaseMigrationsRegistryInterface import DatabaseMigrationsRegistryInterface
+from ...misc import utils as utils
+
+
+class DatabaseMigrationsRegistry(DatabaseMigrationsRegistryInterface):
+
+    # Every schema change for the bot's database belongs in here. Migrations are applied in
+    # version order, and each version is only ever applied once. Never modify a migration that
+    # has already shipped: instead, add a new one with the next version number.
+
+    def __init__(self):
+        self.__migrations: FrozenList[DatabaseMigration] | None = None
+
+    def __createMigration(
+        self,
+        version: int,
+        name: str,
+        psqlStatements: list[str],
+        sqliteStatements: list[str]
+    ) -> DatabaseMigration:
+        if not utils.isValidInt(version):
+            raise TypeError(f'version argument is malformed: \"{version}\"')
+        elif version < 1 or version > utils.getIntMaxSafeSize():
+            raise ValueError(f'version argument is out of bounds: {version}')
+        elif not utils.isValidStr(name):
+            raise TypeError(f'name argument is malformed: \"{name}\"')
+        elif not isinstance(psqlStatements, list) or len(psqlStatements) == 0:
+            raise TypeError(f'psqlStatements argument is malformed: \"{psqlStatements}\"')
+        elif not isinstance(sqliteStatements, list) or len(sqliteStatements) == 0:
+            raise TypeError(f'sqliteStatements argument is malformed: \"{sqliteStatements}\"')
+
+        frozenPsqlStatements: FrozenList[str] = FrozenList(psqlStatements)
+        frozenPsqlStatements.freeze()
+
+        frozenSqliteStatements: FrozenList[str] = FrozenList(sqliteStatements)
+        frozenSqliteStatements.freeze()
+
+        return DatabaseMigration(
+            version = version,
+            name = name,
+            psqlStatements = frozenPsqlStatements,
+            sqliteStatements = frozenSqliteStatements
+        )
+
+    def __createInitialTablesMigration(self) -> DatabaseMigration:
+        return self.__createMigration(
+            version = 1,
+            name = 'create initial tables',
+            psqlStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
+                        additionalanswer public.citext NOT NULL,
+                        triviaid text NOT NULL,
+                        triviasource text NOT NULL,
+                        triviatype text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
+                        mostrecentdodge text DEFAULT NULL,
+                        mostrecenttimeout text DEFAULT NULL,
+                        dodgescore int DEFAULT 0 NOT NULL,
+                        timeoutscore int DEFAULT 0 NOT NULL,
+                        chatteruserid text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
+                        userid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS bannedtriviaids (
+                        triviaid public.citext NOT NULL,
+                        triviasource public.citext NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (triviaid, triviasource)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS beanstats (
+                        fails int DEFAULT 0 NOT NULL,
+                        successes int DEFAULT 0 NOT NULL,
+                        mostrecentfail text DEFAULT NULL,
+                        mostrecentsuccess text DEFAULT NULL,
+                        twitchchannelid text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS cheeractions (
+                        bits integer NOT NULL,
+                        isenabled smallint DEFAULT 1 NOT NULL,
+                        actiontype text NOT NULL,
+                        configurationjson text DEFAULT NULL,
+                        streamstatusrequirement text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        PRIMARY KEY (bits, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS cuteness (
+                        cuteness bigint DEFAULT 0 NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        userid text NOT NULL,
+                        utcyearandmonth text NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS funtoontokens (
+                        token text DEFAULT NULL,
+                        twitchchannelid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS mostrecentanivmessages (
+                        datetime text NOT NULL,
+                        message public.citext DEFAULT NULL,
+                        twitchchannelid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS mostrecentchats (
+                        chatteruserid text NOT NULL,
+                        mostrecentchat text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
+                        actiontype text NOT NULL,
+                        datetime text NOT NULL,
+                        twitchchannelid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
+                        sessiontoken text DEFAULT NULL,
+                        twitchchannelid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS recurringactions (
+                        actiontype text NOT NULL,
+                        configurationjson text DEFAULT NULL,
+                        isenabled smallint DEFAULT 1 NOT NULL,
+                        minutesbetween integer DEFAULT NULL,
+                        twitchchannelid text NOT NULL,
+                        PRIMARY KEY (actiontype, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
+                        count integer DEFAULT 0 NOT NULL,
+                        mostrecent text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS streamelementsuserkeys (
+                        userkey text NOT NULL,
+                        twitchchannelid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS supstreamerchatters (
+                        chatteruserid text NOT NULL,
+                        mostrecentsup text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS timeoutactionhistory (
+                        totaltimeouts int DEFAULT 0 NOT NULL,
+                        chatteruserid text NOT NULL,
+                        entries text DEFAULT NULL,
+                        twitchchannelid text NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
+                        count integer DEFAULT 0 NOT NULL,
+                        mostrecent text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviaemotes (
+                        emoteindex smallint DEFAULT 0 NOT NULL,
+                        twitchchannelid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviagamecontrollers (
+                        twitchchannelid text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
+                        userid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviahistory (
+                        datetime text NOT NULL,
+                        emote text NOT NULL,
+                        triviaid text NOT NULL,
+                        triviasource text NOT NULL,
+                        triviatype text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviascores (
+                        streak integer DEFAULT 0 NOT NULL,
+                        supertriviawins integer DEFAULT 0 NOT NULL,
+                        trivialosses integer DEFAULT 0 NOT NULL,
+                        triviawins integer DEFAULT 0 NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS ttsmonsterapitokens (
+                        apitoken text NOT NULL,
+                        twitchchannelid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
+                        datetime text NOT NULL,
+                        twitchchannelid text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
+                        broadcasteruserid text NOT NULL,
+                        remoddatetime text NOT NULL,
+                        userid text NOT NULL,
+                        PRIMARY KEY (broadcasteruserid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS twitchtokens (
+                        expirationtime text DEFAULT NULL,
+                        accesstoken text NOT NULL,
+                        refreshtoken text NOT NULL,
+                        twitchchannelid text NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS userids (
+                        userid text NOT NULL PRIMARY KEY,
+                        username public.citext NOT NULL
+                    )
+                '''
+            ],
+            sqliteStatements = [
+                '''
+                    CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
+                        additionalanswer TEXT NOT NULL COLLATE NOCASE,
+                        triviaid TEXT NOT NULL,
+                        triviasource TEXT NOT NULL,
+                        triviatype TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS anivcopymessagetimeoutscores (
+                        mostrecentdodge TEXT DEFAULT NULL,
+                        mostrecenttimeout TEXT DEFAULT NULL,
+                        dodgescore INTEGER NOT NULL DEFAULT 0,
+                        timeoutscore INTEGER NOT NULL DEFAULT 0,
+                        chatteruserid TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
+                        userid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS bannedtriviaids (
+                        triviaid TEXT NOT NULL COLLATE NOCASE,
+                        triviasource TEXT NOT NULL COLLATE NOCASE,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (triviaid, triviasource)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS beanstats (
+                        fails INTEGER NOT NULL DEFAULT 0,
+                        successes INTEGER NOT NULL DEFAULT 0,
+                        mostrecentfail TEXT DEFAULT NULL,
+                        mostrecentsuccess TEXT DEFAULT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS cheeractions (
+                        bits INTEGER NOT NULL,
+                        isenabled INTEGER DEFAULT 1 NOT NULL,
+                        actiontype TEXT NOT NULL,
+                        configurationjson TEXT DEFAULT NULL,
+                        streamstatusrequirement TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        PRIMARY KEY (bits, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS cuteness (
+                        cuteness INTEGER NOT NULL DEFAULT 0,
+                        twitchchannelid TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        utcyearandmonth TEXT NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid, utcyearandmonth)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS funtoontokens (
+                        token TEXT DEFAULT NULL,
+                        twitchchannelid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS mostrecentanivmessages (
+                        datetime TEXT NOT NULL,
+                        message TEXT DEFAULT NULL COLLATE NOCASE,
+                        twitchchannelid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS mostrecentchats (
+                        chatteruserid TEXT NOT NULL,
+                        mostrecentchat TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS mostrecentrecurringaction (
+                        actiontype TEXT NOT NULL,
+                        datetime TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
+                        sessiontoken TEXT DEFAULT NULL,
+                        twitchchannelid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS recurringactions (
+                        actiontype TEXT NOT NULL,
+                        configurationjson TEXT DEFAULT NULL,
+                        isenabled INTEGER DEFAULT 1 NOT NULL,
+                        minutesbetween INTEGER DEFAULT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        PRIMARY KEY (actiontype, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
+                        count INTEGER NOT NULL DEFAULT 0,
+                        mostrecent TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS streamelementsuserkeys (
+                        userkey TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS supstreamerchatters (
+                        chatteruserid TEXT NOT NULL,
+                        mostrecentsup TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS timeoutactionhistory (
+                        totaltimeouts INTEGER NOT NULL DEFAULT 0,
+                        chatteruserid TEXT NOT NULL,
+                        entries TEXT DEFAULT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        PRIMARY KEY (chatteruserid, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
+                        count INTEGER NOT NULL DEFAULT 0,
+                        mostrecent TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviaemotes (
+                        emoteindex INTEGER NOT NULL DEFAULT 0,
+                        twitchchannelid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviagamecontrollers (
+                        twitchchannelid TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviagameglobalcontrollers (
+                        userid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviahistory (
+                        datetime TEXT NOT NULL,
+                        emote TEXT NOT NULL,
+                        triviaid TEXT NOT NULL,
+                        triviasource TEXT NOT NULL,
+                        triviatype TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS triviascores (
+                        streak INTEGER NOT NULL DEFAULT 0,
+                        supertriviawins INTEGER NOT NULL DEFAULT 0,
+                        trivialosses INTEGER NOT NULL DEFAULT 0,
+                        triviawins INTEGER NOT NULL DEFAULT 0,
+                        twitchchannelid TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS ttsmonsterapitokens (
+                        apitoken TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS twitchfollowingstatus (
+                        datetime TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (twitchchannelid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
+                        broadcasteruserid TEXT NOT NULL,
+                        remoddatetime TEXT NOT NULL,
+                        userid TEXT NOT NULL,
+                        PRIMARY KEY (broadcasteruserid, userid)
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS twitchtokens (
+                        expirationtime TEXT DEFAULT NULL,
+                        accesstoken TEXT NOT NULL,
+                        refreshtoken TEXT NOT NULL,
+                        twitchchannelid TEXT NOT NULL PRIMARY KEY
+                    )
+                ''',
+                '''
+                    CREATE TABLE IF NOT EXISTS userids (
+                        userid TEXT NOT NULL PRIMARY KEY,
+                        username TEXT NOT NULL COLLATE NOCASE
+                    )
+                '''
+            ]
+        )
+
+    def __createMissingIndexesMigration(self) -> DatabaseMigration:
+        indexStatements: list[str] = [
+            'CREATE INDEX IF NOT EXISTS additionaltriviaanswers_trivia_index ON additionaltriviaanswers (triviaid, triviasource, triviatype)',
+            'CREATE INDEX IF NOT EXISTS cuteness_twitchchannelid_utcyearandmonth_index ON cuteness (twitchchannelid, utcyearandmonth, cuteness)',
+            'CREATE INDEX IF NOT EXISTS triviahistory_twitchchannelid_emote_index ON triviahistory (twitchchannelid, emote, datetime)',
+            'CREATE INDEX IF NOT EXISTS twitchtimeoutremodactions_remoddatetime_index ON twitchtimeoutremodactions (remoddatetime)',
+            'CREATE INDEX IF NOT EXISTS userids_username_index ON userids (username)'
+        ]
+
+        return self.__createMigration(
+            version = 2,
+            name = 'create missing lookup indexes',
+            psqlStatements = indexStatements,
+            sqliteStatements = indexStatements
+        )
+
+    def getMigrations(self) -> FrozenList[DatabaseMigration]:
+        migrations = self.__migrations
+
+        if migrations is not None:
+            return migrations
+
+        migrations = FrozenList([
+            self.__createInitialTablesMigration(),
+            self.__createMissingIndexesMigration()
+        ])
+
+        previousVersion = 0
+
+        for migration in migrations:
+            if migration.version <= previousVersion:
+                raise RuntimeError(f'Database migrations must have unique and ascending versions ({migration.version=}) ({previousVersion=})')
+
+            previousVersion = migration.version
+
+        migrations.freeze()
+        self.__migrations = migrations
+        return migrations
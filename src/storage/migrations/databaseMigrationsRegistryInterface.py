@@ -0,0 +1,12 @@
+from abc import ABC, abstractmethod
+
+from frozenlist import FrozenList
+
+from .databaseMigration import DatabaseMigration
+
+
+class DatabaseMigrationsRegistryInterface(ABC):
+
+    @abstractmethod
+    def getMigrations(self) -> FrozenList[DatabaseMigration]:
+        pass
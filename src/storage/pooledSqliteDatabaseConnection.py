@@ -0,0 +1,124 @@
+from asyncio import Lock, Queue
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
+
+from .databaseConnection import DatabaseConnection
+from .databaseType import DatabaseType
+from .exceptions import DatabaseConnectionIsClosedException
+from .sqliteDatabaseConnection import SqliteDatabaseConnection
+from ..misc import utils as utils
+
+
+class PooledSqliteDatabaseConnection(DatabaseConnection):
+
+    # This class is a lease on the long-lived connections owned by BackingPooledSqliteDatabase.
+    # Each read checks a reader connection out of the pool just for the duration of that one
+    # query, so a lease that is never closed can't starve the pool. Writes are funneled through
+    # the single shared writer connection, which is guarded by a lock, as SQLite only ever allows
+    # one writer at a time anyway.
+
+    def __init__(
+        self,
+        readerConnections: Queue[SqliteDatabaseConnection],
+        writerConnection: SqliteDatabaseConnection,
+        writerLock: Lock
+    ):
+        if not isinstance(readerConnections, Queue):
+            raise TypeError(f'readerConnections argument is malformed: \"{readerConnections}\"')
+        elif not isinstance(writerConnection, SqliteDatabaseConnection):
+            raise TypeError(f'writerConnection argument is malformed: \"{writerConnection}\"')
+        elif not isinstance(writerLock, Lock):
+            raise TypeError(f'writerLock argument is malformed: \"{writerLock}\"')
+
+        self.__readerConnections: Queue[SqliteDatabaseConnection] = readerConnections
+        self.__writerConnection: SqliteDatabaseConnection = writerConnection
+        self.__writerLock: Lock = writerLock
+
+        self.__isClosed: bool = False
+        self.__isInTransaction: bool = False
+
+    async def close(self):
+        self.__isClosed = True
+
+    async def createTableIfNotExists(self, query: str, *args: Any | None):
+        if not utils.isValidStr(query):
+            raise TypeError(f'query argument is malformed: \"{query}\"')
+
+        if args is not None and len(args) >= 1:
+            await self.execute(query, args)
+        else:
+            await self.execute(query)
+
+    @property
+    def databaseType(self) -> DatabaseType:
+        return DatabaseType.SQLITE
+
+    async def execute(self, query: str, *args: Any | None):
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            await self.__writerConnection.execute(query, *args)
+        else:
+            async with self.__writerLock:
+                await self.__writerConnection.execute(query, *args)
+
+    async def executeMany(self, query: str, records: list[tuple[Any, ...]]):
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            await self.__writerConnection.executeMany(query, records)
+        else:
+            async with self.__writerLock:
+                await self.__writerConnection.executeMany(query, records)
+
+    async def fetchRow(self, query: str, *args: Any | None) -> list[Any] | None:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            # read our own uncommitted writes
+            return await self.__writerConnection.fetchRow(query, *args)
+
+        readerConnection = await self.__readerConnections.get()
+
+        try:
+            return await readerConnection.fetchRow(query, *args)
+        finally:
+            self.__readerConnections.put_nowait(readerConnection)
+
+    async def fetchRows(self, query: str, *args: Any | None) -> list[list[Any]] | None:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            # read our own uncommitted writes
+            return await self.__writerConnection.fetchRows(query, *args)
+
+        readerConnection = await self.__readerConnections.get()
+
+        try:
+            return await readerConnection.fetchRows(query, *args)
+        finally:
+            self.__readerConnections.put_nowait(readerConnection)
+
+    def isClosed(self) -> bool:
+        return self.__isClosed
+
+    def __requireNotClosed(self):
+        if self.__isClosed:
+            raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.databaseType})')
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            yield
+            return
+
+        async with self.__writerLock:
+            async with self.__writerConnection.transaction():
+                self.__isInTransaction = True
+
+                try:
+                    yield
+                finally:
+                    self.__isInTransaction = False
@@ -1,4 +1,5 @@
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
 import asyncpg
 
@@ -20,6 +21,7 @@ class PsqlDatabaseConnection(DatabaseConnection):
         self.__pool: asyncpg.Pool = pool
 
         self.__isClosed: bool = False
+        self.__transactionDepth: int = 0
 
     async def close(self):
         if self.isClosed():
@@ -49,8 +51,27 @@ class PsqlDatabaseConnection(DatabaseConnection):
 
         self.__requireNotClosed()
 
-        async with self.__connection.transaction():
+        if self.__transactionDepth >= 1:
+            # we're already inside of an explicit transaction, so don't pay for a savepoint here
             await self.__connection.execute(query, *args)
+        else:
+            async with self.__connection.transaction():
+                await self.__connection.execute(query, *args)
+
+    async def executeMany(self, query: str, records: list[tuple[Any, ...]]):
+        if not utils.isValidStr(query):
+            raise TypeError(f'query argument is malformed: \"{query}\"')
+        elif not isinstance(records, list):
+            raise TypeError(f'records argument is malformed: \"{records}\"')
+
+        self.__requireNotClosed()
+
+        if len(records) == 0:
+            return
+
+        # asyncpg's executemany() pipelines all of the records in a single round trip, and is
+        # already atomic, so there's no need to wrap this in a transaction of our own
+        await self.__connection.executemany(query, records)
 
     async def fetchRow(self, query: str, *args: Any | None) -> list[Any] | None:
         if not utils.isValidStr(query):
@@ -87,3 +108,15 @@ class PsqlDatabaseConnection(DatabaseConnection):
     def __requireNotClosed(self):
         if self.isClosed():
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.databaseType})')
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        async with self.__connection.transaction():
+            self.__transactionDepth += 1
+
+            try:
+                yield
+            finally:
+                self.__transactionDepth -= 1
@@ -1,5 +1,6 @@
 import sqlite3
-from typing import Any
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator
 
 import aiosqlite
 
@@ -18,6 +19,7 @@ class SqliteDatabaseConnection(DatabaseConnection):
 
         self.__connection: aiosqlite.Connection = connection
         self.__isClosed: bool = False
+        self.__isInTransaction: bool = False
 
     async def close(self):
         if self.__isClosed:
@@ -45,9 +47,29 @@ class SqliteDatabaseConnection(DatabaseConnection):
 
         self.__requireNotClosed()
         cursor = await self.__connection.execute(query, args)
-        await self.__connection.commit()
+
+        if not self.__isInTransaction:
+            await self.__connection.commit()
+
         await cursor.close()
 
+    async def executeMany(self, query: str, records: list[tuple[Any, ...]]):
+        if not utils.isValidStr(query):
+            raise TypeError(f'query argument is malformed: \"{query}\"')
+        elif not isinstance(records, list):
+            raise TypeError(f'records argument is malformed: \"{records}\"')
+
+        self.__requireNotClosed()
+
+        if len(records) == 0:
+            return
+
+        if self.__isInTransaction:
+            await self.__connection.executemany(query, records)
+        else:
+            async with self.transaction():
+                await self.__connection.executemany(query, records)
+
     async def fetchRow(self, query: str, *args: Any | None) -> list[Any] | None:
         if not utils.isValidStr(query):
             raise TypeError(f'query argument is malformed: \"{query}\"')
@@ -102,3 +124,25 @@ class SqliteDatabaseConnection(DatabaseConnection):
     def __requireNotClosed(self):
         if self.__isClosed:
             raise DatabaseConnectionIsClosedException(f'This database connection has already been closed! ({self.databaseType})')
+
+    @asynccontextmanager
+    async def transaction(self) -> AsyncIterator[None]:
+        self.__requireNotClosed()
+
+        if self.__isInTransaction:
+            # SQLite doesn't support nested transactions, so just join the outer one
+            yield
+            return
+
+        await self.__connection.execute('BEGIN')
+        self.__isInTransaction = True
+
+        try:
+            yield
+        except BaseException:
+            self.__isInTransaction = False
+            await self.__connection.rollback()
+            raise
+
+        self.__isInTransaction = False
+        await self.__connection.commit()
@@ -1,7 +1,4 @@
 import asyncio
-import queue
-import traceback
-from queue import SimpleQueue
 
 from .currentStreamAlert import CurrentStreamAlert
 from .streamAlert import StreamAlert
@@ -10,6 +7,7 @@ from .streamAlertsManagerInterface import StreamAlertsManagerInterface
 from .streamAlertsSettingsRepositoryInterface import StreamAlertsSettingsRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.batchingQueue import BatchingQueue
 from ..soundPlayerManager.soundPlayerManagerInterface import SoundPlayerManagerInterface
 from ..timber.timberInterface import TimberInterface
 from ..tts.ttsManagerInterface import TtsManagerInterface
@@ -25,7 +23,7 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
         timber: TimberInterface,
         ttsManager: TtsManagerInterface,
         queueSleepTimeSeconds: float = 0.25,
-        queueTimeoutSeconds: float = 3
+        maxQueueSize: int = 100
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -41,10 +39,10 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
             raise TypeError(f'queueSleepTimeSeconds argument is malformed: \"{queueSleepTimeSeconds}\"')
         elif queueSleepTimeSeconds < 0.10 or queueSleepTimeSeconds > 8:
             raise ValueError(f'queueSleepTimeSeconds argument is out of bounds: {queueSleepTimeSeconds}')
-        elif not utils.isValidNum(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 3:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
+        elif not utils.isValidInt(maxQueueSize):
+            raise TypeError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
 
         self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__soundPlayerManager: SoundPlayerManagerInterface = soundPlayerManager
@@ -52,11 +50,13 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
         self.__timber: TimberInterface = timber
         self.__ttsManager: TtsManagerInterface = ttsManager
         self.__queueSleepTimeSeconds: float = queueSleepTimeSeconds
-        self.__queueTimeoutSeconds: float = queueTimeoutSeconds
 
         self.__isStarted: bool = False
         self.__currentAlert: CurrentStreamAlert | None = None
-        self.__alertQueue: SimpleQueue[StreamAlert] = SimpleQueue()
+        self.__alertQueue: BatchingQueue[StreamAlert] = BatchingQueue(
+            maxBatchSize = 1,
+            maxSize = maxQueueSize
+        )
 
     async def __processCurrentAlert(self) -> bool:
         currentAlert = self.__currentAlert
@@ -103,28 +103,19 @@ class StreamAlertsManager(StreamAlertsManagerInterface):
 
     async def __startAlertLoop(self):
         while True:
-            if await self.__processCurrentAlert():
-                await asyncio.sleep(self.__queueSleepTimeSeconds)
-                continue
+            newAlerts = await self.__alertQueue.getBatch()
 
-            newAlert: StreamAlert | None = None
-
-            if not self.__alertQueue.empty():
-                try:
-                    newAlert = self.__alertQueue.get_nowait()
-                except queue.Empty as e:
-                    self.__timber.log('StreamAlertsManager', f'Encountered queue.Empty when grabbing alert from queue (queue size: {self.__alertQueue.qsize()}): {e}', e, traceback.format_exc())
-
-            if newAlert is not None:
+            for newAlert in newAlerts:
                 self.__currentAlert = CurrentStreamAlert(newAlert)
 
-            await asyncio.sleep(await self.__streamAlertsSettingsRepository.getAlertsDelayBetweenSeconds())
+                while await self.__processCurrentAlert():
+                    await asyncio.sleep(self.__queueSleepTimeSeconds)
+
+                await asyncio.sleep(await self.__streamAlertsSettingsRepository.getAlertsDelayBetweenSeconds())
 
     def submitAlert(self, alert: StreamAlert):
         if not isinstance(alert, StreamAlert):
             raise TypeError(f'alert argument is malformed: \"{alert}\"')
 
-        try:
-            self.__alertQueue.put(alert, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('StreamAlertsManager', f'Encountered queue.Full when submitting a new alert ({alert}) into the alert queue (queue size: {self.__alertQueue.qsize()}): {e}', e, traceback.format_exc())
+        if not self.__alertQueue.put(alert):
+            self.__timber.log('StreamAlertsManager', f'Dropped alert ({alert}) as the alert queue is full ({self.__alertQueue.getMetrics()=})')
@@ -1,17 +1,19 @@
 import asyncio
 import queue
+import threading
+import traceback
 from collections import defaultdict
 from queue import SimpleQueue
-
-import aiofiles
-import aiofiles.os
-import aiofiles.ospath
+from typing import Any, Callable
 
 from .timberEntry import TimberEntry
+from .timberFileSink import TimberFileSink
 from .timberInterface import TimberInterface
+from .timberLevel import TimberLevel
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.batchingQueue import BatchingQueue
 from ..misc.simpleDateTime import SimpleDateTime
 
 
@@ -21,27 +23,101 @@ class Timber(TimberInterface):
         self,
         backgroundTaskHelper: BackgroundTaskHelperInterface,
         timeZoneRepository: TimeZoneRepositoryInterface,
-        sleepTimeSeconds: float = 15,
+        maxLatencySeconds: float = 15,
+        maxBatchSize: int = 1000,
+        maxQueueSize: int = 100000,
+        defaultLevel: TimberLevel = TimberLevel.INFO,
+        compressClosedLogFiles: bool = False,
+        maxLogFileSizeBytes: int = 67108864,
         timberRootDirectory: str = 'logs/timber'
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
         elif not isinstance(timeZoneRepository, TimeZoneRepositoryInterface):
             raise TypeError(f'timeZoneRepository argument is malformed: \"{timeZoneRepository}\"')
-        elif not utils.isValidNum(sleepTimeSeconds):
-            raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
-        elif sleepTimeSeconds < 1 or sleepTimeSeconds > 60:
-            raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
+        elif not utils.isValidNum(maxLatencySeconds):
+            raise TypeError(f'maxLatencySeconds argument is malformed: \"{maxLatencySeconds}\"')
+        elif maxLatencySeconds < 0 or maxLatencySeconds > 60:
+            raise ValueError(f'maxLatencySeconds argument is out of bounds: {maxLatencySeconds}')
+        elif not utils.isValidInt(maxBatchSize):
+            raise TypeError(f'maxBatchSize argument is malformed: \"{maxBatchSize}\"')
+        elif maxBatchSize < 1 or maxBatchSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxBatchSize argument is out of bounds: {maxBatchSize}')
+        elif not utils.isValidInt(maxQueueSize):
+            raise TypeError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
+        elif not isinstance(defaultLevel, TimberLevel):
+            raise TypeError(f'defaultLevel argument is malformed: \"{defaultLevel}\"')
+        elif not utils.isValidBool(compressClosedLogFiles):
+            raise TypeError(f'compressClosedLogFiles argument is malformed: \"{compressClosedLogFiles}\"')
+        elif not utils.isValidInt(maxLogFileSizeBytes):
+            raise TypeError(f'maxLogFileSizeBytes argument is malformed: \"{maxLogFileSizeBytes}\"')
         elif not utils.isValidStr(timberRootDirectory):
             raise TypeError(f'timberRootDirectory argument is malformed: \"{timberRootDirectory}\"')
 
         self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
-        self.__sleepTimeSeconds: float = sleepTimeSeconds
         self.__timberRootDirectory: str = timberRootDirectory
 
         self.__isStarted: bool = False
-        self.__entryQueue: SimpleQueue[TimberEntry] = SimpleQueue()
+        self.__defaultLevel: TimberLevel = defaultLevel
+        self.__tagLevels: dict[str, TimberLevel] = dict()
+
+        self.__logFileSink: TimberFileSink = TimberFileSink(
+            compressClosedFiles = compressClosedLogFiles,
+            maxFileSizeBytes = maxLogFileSizeBytes
+        )
+
+        self.__errorFileSink: TimberFileSink = TimberFileSink(
+            compressClosedFiles = compressClosedLogFiles,
+            maxFileSizeBytes = maxLogFileSizeBytes
+        )
+
+        # the file sinks are shared by the event loop and close(), so only one may use them at a time
+        self.__fileSinksLock: asyncio.Lock = asyncio.Lock()
+
+        # Console output is handed off to a dedicated thread, as print() is a blocking write that
+        # can stall the event loop whenever stdout is slow (e.g. a busy terminal or a pipe).
+        self.__consoleQueue: SimpleQueue[TimberEntry] = SimpleQueue()
+        self.__consoleThread: threading.Thread | None = None
+        self.__consoleThreadLock: threading.Lock = threading.Lock()
+
+        # log files are written in batches, so lingering for a while after the first entry
+        # arrives lets us open each file just once for many entries
+        self.__entryQueue: BatchingQueue[TimberEntry] = BatchingQueue(
+            maxBatchSize = maxBatchSize,
+            maxLatencySeconds = maxLatencySeconds,
+            maxSize = maxQueueSize
+        )
+
+    async def close(self):
+        # write out whatever is still queued up, rather than waiting on the next batch
+        await self.__writeEntries(self.__entryQueue.drain())
+
+        async with self.__fileSinksLock:
+            await self.__logFileSink.close()
+            await self.__errorFileSink.close()
+
+    def debug(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        exception: Exception | None = None,
+        traceback: str | None = None
+    ):
+        self.__logAt(TimberLevel.DEBUG, tag, msg, args, exception, traceback)
+
+    def error(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        exception: Exception | None = None,
+        traceback: str | None = None
+    ):
+        self.__logAt(TimberLevel.ERROR, tag, msg, args, exception, traceback)
 
     def __getErrorStatement(self, ensureNewLine: bool, timberEntry: TimberEntry) -> str | None:
         if not utils.isValidBool(ensureNewLine):
@@ -78,28 +154,74 @@ class Timber(TimberInterface):
 
         return logStatement
 
-    def log(
+    def info(
         self,
         tag: str,
-        msg: str,
+        msg: str | Callable[[], str],
+        *args: Any,
         exception: Exception | None = None,
         traceback: str | None = None
     ):
-        if not utils.isValidStr(tag):
+        self.__logAt(TimberLevel.INFO, tag, msg, args, exception, traceback)
+
+    def isEnabledFor(self, tag: str, level: TimberLevel) -> bool:
+        return level.isAtLeast(self.__tagLevels.get(tag, self.__defaultLevel))
+
+    def log(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        exception: Exception | None = None,
+        traceback: str | None = None,
+        level: TimberLevel | None = None
+    ):
+        if level is None:
+            if exception is None:
+                level = TimberLevel.INFO
+            else:
+                level = TimberLevel.ERROR
+
+        self.__logAt(level, tag, msg, tuple(), exception, traceback)
+
+    def __logAt(
+        self,
+        level: TimberLevel,
+        tag: str,
+        msg: str | Callable[[], str],
+        args: tuple[Any, ...],
+        exception: Exception | None,
+        traceback: str | None
+    ):
+        if not isinstance(level, TimberLevel):
+            raise TypeError(f'level argument is malformed: \"{level}\"')
+        elif not utils.isValidStr(tag):
             raise TypeError(f'tag argument is malformed: \"{tag}\"')
-        elif not utils.isValidStr(msg):
+        elif not isinstance(msg, str) and not callable(msg):
             raise TypeError(f'msg argument is malformed: \"{msg}\"')
         elif exception is not None and not isinstance(exception, Exception):
             raise TypeError(f'exception argument is malformed: \"{exception}\"')
         elif traceback is not None and not isinstance(traceback, str):
             raise TypeError(f'traceback argument is malformed: \"{traceback}\"')
 
+        if not level.isAtLeast(self.__tagLevels.get(tag, self.__defaultLevel)):
+            return
+
+        if callable(msg):
+            msg = msg()
+
+        if len(args) >= 1:
+            msg = msg % args
+
+        if not utils.isValidStr(msg):
+            raise TypeError(f'msg argument is malformed: \"{msg}\"')
+
         logTime = SimpleDateTime(
             timeZone = self.__timeZoneRepository.getDefault()
         )
 
         timberEntry = TimberEntry(
             exception = exception,
+            level = level,
             logTime = logTime,
             msg = msg,
             tag = tag,
@@ -107,7 +229,46 @@ class Timber(TimberInterface):
         )
 
         self.__entryQueue.put(timberEntry)
-        print(self.__getLogStatement(False, timberEntry))
+        self.__printToConsole(timberEntry)
+
+    def __printToConsole(self, timberEntry: TimberEntry):
+        if self.__consoleThread is None:
+            with self.__consoleThreadLock:
+                if self.__consoleThread is None:
+                    consoleThread = threading.Thread(
+                        target = self.__startConsoleLoop,
+                        name = 'TimberConsole',
+                        daemon = True
+                    )
+
+                    consoleThread.start()
+                    self.__consoleThread = consoleThread
+
+        self.__consoleQueue.put(timberEntry)
+
+    def setLevels(
+        self,
+        defaultLevel: TimberLevel,
+        tagLevels: dict[str, TimberLevel] | None = None
+    ):
+        if not isinstance(defaultLevel, TimberLevel):
+            raise TypeError(f'defaultLevel argument is malformed: \"{defaultLevel}\"')
+        elif tagLevels is not None and not isinstance(tagLevels, dict):
+            raise TypeError(f'tagLevels argument is malformed: \"{tagLevels}\"')
+
+        newTagLevels: dict[str, TimberLevel] = dict()
+
+        if tagLevels is not None:
+            for tag, tagLevel in tagLevels.items():
+                if not utils.isValidStr(tag):
+                    raise TypeError(f'tag argument is malformed: \"{tag}\"')
+                elif not isinstance(tagLevel, TimberLevel):
+                    raise TypeError(f'tagLevel argument for \"{tag}\" is malformed: \"{tagLevel}\"')
+
+                newTagLevels[tag] = tagLevel
+
+        self.__defaultLevel = defaultLevel
+        self.__tagLevels = newTagLevels
 
     def start(self):
         if self.__isStarted:
@@ -117,67 +278,77 @@ class Timber(TimberInterface):
         self.__isStarted = True
         self.__backgroundTaskHelper.createTask(self.__startEventLoop())
 
-    async def __startEventLoop(self):
+    def __startConsoleLoop(self):
+        # this runs on its own thread, not on the event loop
         while True:
-            entries: list[TimberEntry] = list()
+            logStatements: list[str] = [ self.__getLogStatement(False, self.__consoleQueue.get()) ]
 
             try:
-                while not self.__entryQueue.empty():
-                    entry = self.__entryQueue.get_nowait()
-                    entries.append(entry)
+                while not self.__consoleQueue.empty():
+                    logStatements.append(self.__getLogStatement(False, self.__consoleQueue.get_nowait()))
             except queue.Empty:
                 pass
 
-            await self.__writeToLogFiles(entries)
-            await asyncio.sleep(self.__sleepTimeSeconds)
+            print('\n'.join(logStatements), flush = True)
 
-    async def __writeToLogFiles(self, entries: list[TimberEntry]):
+    async def __startEventLoop(self):
+        while True:
+            entries = await self.__entryQueue.getBatch()
+            await self.__writeEntries(entries)
+
+    def warn(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        exception: Exception | None = None,
+        traceback: str | None = None
+    ):
+        self.__logAt(TimberLevel.WARN, tag, msg, args, exception, traceback)
+
+    async def __writeEntries(self, entries: list[TimberEntry]):
         if len(entries) == 0:
             return
 
-        # The logic below is kind of intense, but we do this in order to favor logical complexity
-        # in exchange for I/O simplicity. By doing things this way, we only need to attempt to
-        # create folders once, files once, and we also just open a file handle one time too.
+        try:
+            async with self.__fileSinksLock:
+                await self.__writeToLogFiles(entries)
+        except Exception as e:
+            # this goes straight to the console, as logging it normally would just feed the
+            # failure right back into the log files
+            self.__printToConsole(TimberEntry(
+                exception = e,
+                level = TimberLevel.ERROR,
+                logTime = SimpleDateTime(timeZone = self.__timeZoneRepository.getDefault()),
+                msg = f'Failed to write {len(entries)} entries to log files: {e}',
+                tag = 'Timber',
+                traceback = traceback.format_exc()
+            ))
 
-        # This dictionary stores a directory, and then a list of files, and then the contents to
-        # write into the files themselves. This dictionary does not make any attempt at handling
-        # error logging.
-        structure: dict[str, dict[str, list[TimberEntry]]] = defaultdict(lambda: defaultdict(lambda: list()))
+    async def __writeToLogFiles(self, entries: list[TimberEntry]):
+        if len(entries) == 0:
+            return
 
-        # This dictionary is used for error logging, and just like the dictionary above, stores
-        # a directory, and then a list of files, and then the contents to write into the files
-        # themselves.
-        errorStructure: dict[str, dict[str, list[TimberEntry]]] = defaultdict(lambda: defaultdict(lambda: list()))
+        # Entries are grouped by their destination file, so that each file only receives a single
+        # buffered write per flush. The file sinks keep the current files open between flushes.
+        logFileContents: dict[str, list[str]] = defaultdict(lambda: list())
+        errorFileContents: dict[str, list[str]] = defaultdict(lambda: list())
 
         for entry in entries:
             logTime = entry.logTime
             timberDirectory = f'{self.__timberRootDirectory}/{logTime.getYearStr()}/{logTime.getMonthStr()}'
             timberFile = f'{timberDirectory}/{logTime.getDayStr()}.log'
-            structure[timberDirectory][timberFile].append(entry)
+            logFileContents[timberFile].append(self.__getLogStatement(True, entry))
 
             if entry.exception is not None:
-                timberErrorDirectory = f'{timberDirectory}/errors'
-                timberErrorFile = f'{timberErrorDirectory}/{logTime.getDayStr()}.log'
-                errorStructure[timberErrorDirectory][timberErrorFile].append(entry)
-
-        for timberDirectory, timberFileToEntriesDict in structure.items():
-            if not await aiofiles.ospath.exists(timberDirectory):
-                await aiofiles.os.makedirs(timberDirectory)
-
-            for timberFile, entriesList in timberFileToEntriesDict.items():
-                async with aiofiles.open(timberFile, mode = 'a', encoding = 'utf-8') as file:
-                    for entry in entriesList:
-                        logStatement = self.__getLogStatement(True, entry)
-                        await file.write(logStatement)
-
-        for timberErrorDirectory, timberErrorFileToEntriesDict in errorStructure.items():
-            if not await aiofiles.ospath.exists(timberErrorDirectory):
-                await aiofiles.os.makedirs(timberErrorDirectory)
-
-            for timberErrorFile, entriesList in timberErrorFileToEntriesDict.items():
-                async with aiofiles.open(timberErrorFile, mode = 'a', encoding = 'utf-8') as file:
-                    for entry in entriesList:
-                        errorStatement = self.__getErrorStatement(True, entry)
-
-                        if utils.isValidStr(errorStatement):
-                            await file.write(errorStatement)
+                errorStatement = self.__getErrorStatement(True, entry)
+
+                if utils.isValidStr(errorStatement):
+                    timberErrorFile = f'{timberDirectory}/errors/{logTime.getDayStr()}.log'
+                    errorFileContents[timberErrorFile].append(errorStatement)
+
+        for timberFile, logStatements in logFileContents.items():
+            await self.__logFileSink.write(timberFile, ''.join(logStatements))
+
+        for timberErrorFile, errorStatements in errorFileContents.items():
+            await self.__errorFileSink.write(timberErrorFile, ''.join(errorStatements))
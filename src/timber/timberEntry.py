@@ -1,11 +1,13 @@
 from dataclasses import dataclass
 
+from .timberLevel import TimberLevel
 from ..misc.simpleDateTime import SimpleDateTime
 
 
 @dataclass(frozen = True)
 class TimberEntry:
     exception: Exception | None
+    level: TimberLevel
     logTime: SimpleDateTime
     msg: str
     tag: str
@@ -0,0 +1,172 @@
+import asyncio
+import gzip
+import os
+import shutil
+
+import aiofiles
+import aiofiles.os
+import aiofiles.ospath
+from aiofiles.threadpool.text import AsyncTextIOWrapper
+
+from ..misc import utils as utils
+
+
+class TimberFileSink:
+
+    # Keeps a single log file open across flushes, rather than re-opening it every time. Each call
+    # to write() is one buffered write plus one flush. A new file is started whenever the target
+    # file path changes (as Timber puts the date into the path, this is our daily rotation), or
+    # once the current file grows beyond maxFileSizeBytes. In that case the full file is renamed to
+    # "<name>.<n>.log" and a fresh "<name>.log" is started in its place. Closed files can
+    # optionally be gzipped. A late entry for a file that has already been gzipped goes into the
+    # next free "<name>.<n>.log" segment, rather than re-creating a plain "<name>.log".
+
+    def __init__(
+        self,
+        compressClosedFiles: bool = False,
+        maxFileSizeBytes: int = 67108864
+    ):
+        if not utils.isValidBool(compressClosedFiles):
+            raise TypeError(f'compressClosedFiles argument is malformed: \"{compressClosedFiles}\"')
+        elif not utils.isValidInt(maxFileSizeBytes):
+            raise TypeError(f'maxFileSizeBytes argument is malformed: \"{maxFileSizeBytes}\"')
+        elif maxFileSizeBytes < 1024 or maxFileSizeBytes > utils.getLongMaxSafeSize():
+            raise ValueError(f'maxFileSizeBytes argument is out of bounds: {maxFileSizeBytes}')
+
+        self.__compressClosedFiles: bool = compressClosedFiles
+        self.__maxFileSizeBytes: int = maxFileSizeBytes
+
+        self.__file: AsyncTextIOWrapper | None = None
+        self.__filePath: str | None = None
+        self.__fileSizeBytes: int = 0
+
+    async def close(self):
+        await self.__closeCurrentFile(compress = False)
+
+    async def __closeCurrentFile(self, compress: bool):
+        file = self.__file
+        filePath = self.__filePath
+
+        self.__file = None
+        self.__filePath = None
+        self.__fileSizeBytes = 0
+
+        if file is None or filePath is None:
+            return
+
+        await file.close()
+
+        if compress and self.__compressClosedFiles:
+            await asyncio.to_thread(self.__compressFile, filePath)
+
+    def __compressFile(self, filePath: str):
+        # this runs on a worker thread, not on the event loop
+        with open(filePath, mode = 'rb') as source, gzip.open(f'{filePath}.gz', mode = 'wb') as destination:
+            shutil.copyfileobj(source, destination)
+
+        os.remove(filePath)
+
+    async def __getNextSegmentFilePath(self, filePath: str) -> str:
+        root, extension = os.path.splitext(filePath)
+        segment = 1
+
+        while await aiofiles.ospath.exists(f'{root}.{segment}{extension}') or await aiofiles.ospath.exists(f'{root}.{segment}{extension}.gz'):
+            segment += 1
+
+        return f'{root}.{segment}{extension}'
+
+    def __isOlderFilePath(self, filePath: str, currentFilePath: str) -> bool:
+        # Paths such as "2024/1/9.log" and "2024/1/10.log" don't sort by their dates as plain
+        # strings, so their numeric parts are compared as numbers instead. Paths that don't
+        # otherwise match up (i.e. that aren't the same series of log files) are never older.
+        fileShape, fileNumbers = self.__parseFilePath(filePath)
+        currentFileShape, currentFileNumbers = self.__parseFilePath(currentFilePath)
+        return fileShape == currentFileShape and fileNumbers < currentFileNumbers
+
+    async def __openFile(self, filePath: str):
+        directory = os.path.dirname(filePath)
+
+        if utils.isValidStr(directory) and not await aiofiles.ospath.exists(directory):
+            await aiofiles.os.makedirs(directory, exist_ok = True)
+
+        fileSizeBytes = 0
+
+        if await aiofiles.ospath.exists(filePath):
+            fileSizeBytes = await aiofiles.ospath.getsize(filePath)
+
+        self.__file = await aiofiles.open(filePath, mode = 'a', encoding = 'utf-8')
+        self.__filePath = filePath
+        self.__fileSizeBytes = fileSizeBytes
+
+    def __parseFilePath(self, filePath: str) -> tuple[tuple[str, ...], tuple[int, ...]]:
+        root, extension = os.path.splitext(os.path.normpath(filePath))
+        parts = root.split(os.sep)
+        shape = tuple('#' if part.isdigit() else part for part in parts) + (extension, )
+        numbers = tuple(int(part) for part in parts if part.isdigit())
+        return shape, numbers
+
+    async def __rotateCurrentFile(self):
+        filePath = self.__filePath
+
+        if filePath is None:
+            return
+
+        await self.__closeCurrentFile(compress = False)
+
+        segmentFilePath = await self.__getNextSegmentFilePath(filePath)
+        await aiofiles.os.rename(filePath, segmentFilePath)
+
+        if self.__compressClosedFiles:
+            await asyncio.to_thread(self.__compressFile, segmentFilePath)
+
+    async def write(self, filePath: str, contents: str):
+        if not utils.isValidStr(filePath):
+            raise TypeError(f'filePath argument is malformed: \"{filePath}\"')
+        elif not isinstance(contents, str):
+            raise TypeError(f'contents argument is malformed: \"{contents}\"')
+
+        if len(contents) == 0:
+            return
+
+        currentFilePath = self.__filePath
+
+        if currentFilePath is not None and self.__isOlderFilePath(filePath, currentFilePath):
+            # A straggler for a file that we've already moved on from (e.g. an entry logged just
+            # before midnight that was flushed just after). Append it without disturbing the
+            # current file.
+            await self.__writeStraggler(filePath, contents)
+            return
+
+        if currentFilePath != filePath:
+            await self.__closeCurrentFile(compress = True)
+            await self.__openFile(filePath)
+
+        file = self.__file
+
+        if file is None:
+            raise RuntimeError(f'Failed to open log file ({filePath=})')
+
+        await file.write(contents)
+        await file.flush()
+        self.__fileSizeBytes += len(contents.encode('utf-8'))
+
+        if self.__fileSizeBytes >= self.__maxFileSizeBytes:
+            await self.__rotateCurrentFile()
+
+    async def __writeStraggler(self, filePath: str, contents: str):
+        if not await aiofiles.ospath.exists(f'{filePath}.gz'):
+            async with aiofiles.open(filePath, mode = 'a', encoding = 'utf-8') as file:
+                await file.write(contents)
+
+            return
+
+        # That file has already been closed and gzipped, so appending to it would leave a plain
+        # "<name>.log" sitting next to its "<name>.log.gz". Instead, the straggler gets a segment
+        # of its own, named just like the ones that __rotateCurrentFile() creates.
+        segmentFilePath = await self.__getNextSegmentFilePath(filePath)
+
+        async with aiofiles.open(segmentFilePath, mode = 'w', encoding = 'utf-8') as file:
+            await file.write(contents)
+
+        if self.__compressClosedFiles:
+            await asyncio.to_thread(self.__compressFile, segmentFilePath)
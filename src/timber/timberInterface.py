@@ -1,18 +1,86 @@
 from abc import ABC, abstractmethod
+from typing import Any, Callable
+
+from .timberLevel import TimberLevel
 
 
 class TimberInterface(ABC):
 
+    # Messages may be given either as a plain string, as a callable that returns the string, or
+    # (for debug(), info(), warn() and error()) as a %-style format string plus its arguments. The
+    # latter two forms are only rendered if the message's level is enabled for its tag.
+
     @abstractmethod
-    def log(
+    async def close(self):
+        pass
+
+    @abstractmethod
+    def debug(
         self,
         tag: str,
-        msg: str,
+        msg: str | Callable[[], str],
+        *args: Any,
         exception: Exception | None = None,
         traceback: str | None = None
     ):
         pass
 
+    @abstractmethod
+    def error(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        exception: Exception | None = None,
+        traceback: str | None = None
+    ):
+        pass
+
+    @abstractmethod
+    def info(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        exception: Exception | None = None,
+        traceback: str | None = None
+    ):
+        pass
+
+    @abstractmethod
+    def isEnabledFor(self, tag: str, level: TimberLevel) -> bool:
+        pass
+
+    @abstractmethod
+    def log(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        exception: Exception | None = None,
+        traceback: str | None = None,
+        level: TimberLevel | None = None
+    ):
+        pass
+
+    @abstractmethod
+    def setLevels(
+        self,
+        defaultLevel: TimberLevel,
+        tagLevels: dict[str, TimberLevel] | None = None
+    ):
+        pass
+
     @abstractmethod
     def start(self):
         pass
+
+    @abstractmethod
+    def warn(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        exception: Exception | None = None,
+        traceback: str | None = None
+    ):
+        pass
@@ -0,0 +1,18 @@
+from enum import auto
+
+from ..misc.enumWithToFromStr import EnumWithToFromStr
+
+
+class TimberLevel(EnumWithToFromStr):
+
+    # these are declared in order of increasing severity, as isAtLeast() relies on that
+    DEBUG = auto()
+    INFO = auto()
+    WARN = auto()
+    ERROR = auto()
+
+    def isAtLeast(self, level: 'TimberLevel') -> bool:
+        if not isinstance(level, TimberLevel):
+            raise TypeError(f'level argument is malformed: \"{level}\"')
+
+        return self.value >= level.value
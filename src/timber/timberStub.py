@@ -1,4 +1,7 @@
+from typing import Any, Callable
+
 from .timberInterface import TimberInterface
+from .timberLevel import TimberLevel
 
 
 class TimberStub(TimberInterface):
@@ -6,17 +9,86 @@ class TimberStub(TimberInterface):
     def __init__(self):
         pass
 
-    def log(
+    async def close(self):
+        pass
+
+    def debug(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        exception: Exception | None = None,
+        traceback: str | None = None
+    ):
+        self.__logAt(tag, msg, args, exception)
+
+    def error(
         self,
         tag: str,
-        msg: str,
+        msg: str | Callable[[], str],
+        *args: Any,
         exception: Exception | None = None,
         traceback: str | None = None
     ):
+        self.__logAt(tag, msg, args, exception)
+
+    def info(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        exception: Exception | None = None,
+        traceback: str | None = None
+    ):
+        self.__logAt(tag, msg, args, exception)
+
+    def isEnabledFor(self, tag: str, level: TimberLevel) -> bool:
+        return True
+
+    def log(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        exception: Exception | None = None,
+        traceback: str | None = None,
+        level: TimberLevel | None = None
+    ):
+        self.__logAt(tag, msg, tuple(), exception)
+
+    def __logAt(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        args: tuple[Any, ...],
+        exception: Exception | None
+    ):
+        if callable(msg):
+            msg = msg()
+
+        if len(args) >= 1:
+            msg = msg % args
+
         if exception is None:
             print(f'{tag} — {msg}')
         else:
             print(f'{tag} — {msg} — {exception}')
 
+    def setLevels(
+        self,
+        defaultLevel: TimberLevel,
+        tagLevels: dict[str, TimberLevel] | None = None
+    ):
+        pass
+
     def start(self):
         pass
+
+    def warn(
+        self,
+        tag: str,
+        msg: str | Callable[[], str],
+        *args: Any,
+        exception: Exception | None = None,
+        traceback: str | None = None
+    ):
+        self.__logAt(tag, msg, args, exception)
@@ -14,7 +14,6 @@ from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..timber.timberInterface import TimberInterface
 
 
@@ -52,7 +51,6 @@ class TimeoutActionHistoryRepository(TimeoutActionHistoryRepositoryInterface):
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__maximumHistoryEntriesSize: int = maximumHistoryEntriesSize
 
-        self.__isDatabaseReady: bool = False
         self.__caches: dict[str, LRU[str, TimeoutActionHistory | None]] = defaultdict(lambda: LRU(cacheSize))
 
     async def add(
@@ -192,44 +190,5 @@ class TimeoutActionHistoryRepository(TimeoutActionHistoryRepositoryInterface):
         return timeoutActionHistory
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS timeoutactionhistory (
-                            totaltimeouts int DEFAULT 0 NOT NULL,
-                            chatteruserid text NOT NULL,
-                            entries text DEFAULT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS timeoutactionhistory (
-                            totaltimeouts INTEGER NOT NULL DEFAULT 0,
-                            chatteruserid TEXT NOT NULL,
-                            entries TEXT DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (chatteruserid, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
@@ -17,7 +17,6 @@ from ..triviaSettingsRepositoryInterface import \
 from ...misc import utils as utils
 from ...storage.backingDatabase import BackingDatabase
 from ...storage.databaseConnection import DatabaseConnection
-from ...storage.databaseType import DatabaseType
 from ...storage.exceptions import DatabaseOperationalError
 from ...timber.timberInterface import TimberInterface
 from ...twitch.twitchHandleProviderInterface import TwitchHandleProviderInterface
@@ -57,8 +56,6 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
-
     async def addAdditionalTriviaAnswer(
         self,
         additionalAnswer: str,
@@ -288,46 +285,5 @@ class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterfa
         )
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
-                            additionalanswer public.citext NOT NULL,
-                            triviaid text NOT NULL,
-                            triviasource text NOT NULL,
-                            triviatype text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS additionaltriviaanswers (
-                            additionalanswer TEXT NOT NULL COLLATE NOCASE,
-                            triviaid TEXT NOT NULL,
-                            triviasource TEXT NOT NULL,
-                            triviatype TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (additionalanswer, triviaid, triviasource, triviatype)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
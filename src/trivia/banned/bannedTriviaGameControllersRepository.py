@@ -11,7 +11,6 @@ from ...misc import utils as utils
 from ...misc.administratorProviderInterface import AdministratorProviderInterface
 from ...storage.backingDatabase import BackingDatabase
 from ...storage.databaseConnection import DatabaseConnection
-from ...storage.databaseType import DatabaseType
 from ...timber.timberInterface import TimberInterface
 from ...twitch.twitchTokensRepositoryInterface import \
     TwitchTokensRepositoryInterface
@@ -45,8 +44,6 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
 
-        self.__isDatabaseReady: bool = False
-
     async def addBannedController(self, userName: str) -> AddBannedTriviaGameControllerResult:
         if not utils.isValidStr(userName):
             raise TypeError(f'userName argument is malformed: \"{userName}\"')
@@ -123,40 +120,8 @@ class BannedTriviaGameControllersRepository(BannedTriviaGameControllersRepositor
         return controllers
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
-                            userid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS bannedtriviagamecontrollers (
-                            userid TEXT NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def removeBannedController(self, userName: str) -> RemoveBannedTriviaGameControllerResult:
         if not utils.isValidStr(userName):
             raise TypeError(f'userName argument is malformed: \"{userName}\"')
@@ -6,7 +6,6 @@ from ..questions.triviaSource import TriviaSource
 from ...misc import utils as utils
 from ...storage.backingDatabase import BackingDatabase
 from ...storage.databaseConnection import DatabaseConnection
-from ...storage.databaseType import DatabaseType
 from ...timber.timberInterface import TimberInterface
 
 
@@ -25,8 +24,6 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
 
-        self.__isDatabaseReady: bool = False
-
     async def ban(
         self,
         triviaId: str,
@@ -63,7 +60,6 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
         return BanTriviaQuestionResult.BANNED
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
     async def getInfo(
@@ -99,43 +95,6 @@ class BannedTriviaIdsRepository(BannedTriviaIdsRepositoryInterface):
             triviaSource = TriviaSource.fromStr(record[1])
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS bannedtriviaids (
-                            triviaid public.citext NOT NULL,
-                            triviasource public.citext NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS bannedtriviaids (
-                            triviaid TEXT NOT NULL COLLATE NOCASE,
-                            triviasource TEXT NOT NULL COLLATE NOCASE,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def isBanned(self, triviaId: str, triviaSource: TriviaSource) -> bool:
         if not utils.isValidStr(triviaId):
             raise TypeError(f'triviaId argument is malformed: \"{triviaId}\"')
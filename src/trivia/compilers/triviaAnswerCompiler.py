@@ -8,6 +8,7 @@ from num2words import num2words
 from roman import RomanError
 
 from .triviaAnswerCompilerInterface import TriviaAnswerCompilerInterface
+from .triviaCharacterTranslationTable import TriviaCharacterTranslationTable
 from ..triviaExceptions import BadTriviaAnswerException
 from ..triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
 from ...misc import utils as utils
@@ -108,6 +109,13 @@ class TriviaAnswerCompiler(TriviaAnswerCompilerInterface):
             re.VERBOSE | re.IGNORECASE
         )
 
+        # fancy characters are converted to latin via a translation table that's built up on
+        # demand, rather than running the special characters RegEx against each character of
+        # every answer
+        self.__fancyCharacterTranslations: TriviaCharacterTranslationTable = TriviaCharacterTranslationTable(
+            translation = self.__translateFancyCharacter
+        )
+
     async def compileBoolAnswer(self, answer: str | None) -> bool:
         if answer is not None and not isinstance(answer, str):
             raise BadTriviaAnswerException(f'answer can\'t be compiled to bool ({answer=})')
@@ -153,17 +161,24 @@ class TriviaAnswerCompiler(TriviaAnswerCompilerInterface):
 
         answer = answer.lower().strip()
 
+        # The RegEx passes below are each skipped when the answer doesn't contain the character
+        # that they require. Every pass strips the answer, so skipping one leaves it unchanged.
+
         # removes HTML tag-like junk
-        answer = self.__tagRemovalRegEx.sub('', answer).strip()
+        if '<' in answer or '[' in answer:
+            answer = self.__tagRemovalRegEx.sub('', answer).strip()
 
         # removes odd unicode characters
-        answer = self.__oddUnicodeRemovalRegEx.sub('', answer).strip()
+        if '\U000e0000' in answer:
+            answer = self.__oddUnicodeRemovalRegEx.sub('', answer).strip()
 
         # replaces all new line characters with just a space
-        answer = self.__newLineRegEx.sub(' ', answer).strip()
+        if '\n' in answer:
+            answer = self.__newLineRegEx.sub(' ', answer).strip()
 
         # replaces the '&' character, when used like the word "and", with the word "and"
-        answer = self.__ampersandRegEx.sub(' and ', answer).strip()
+        if '&' in answer:
+            answer = self.__ampersandRegEx.sub(' and ', answer).strip()
 
         # convert special characters to latin where possible
         answer = await self.__fancyToLatin(answer)
@@ -413,15 +428,7 @@ class TriviaAnswerCompiler(TriviaAnswerCompilerInterface):
             raise TypeError(f'text argument is malformed: \"{text}\"')
 
         text = unicodedata.normalize("NFKD", text)
-
-        text = ''.join(
-            self.__specialCharsRegEx.sub(
-                lambda m: {k: v for k, v in m.groupdict().items() if v}.popitem()[0],
-                char,
-            ) for char in text
-        )
-
-        return self.__combiningDiacriticsRegEx.sub('', text).strip()
+        return text.translate(self.__fancyCharacterTranslations).strip()
 
     async def __getArabicNumeralSubstitutes(self, arabicNumerals: str) -> list[str]:
         individualDigits = ' '.join([num2words(int(digit)) for digit in arabicNumerals])
@@ -585,3 +592,9 @@ class TriviaAnswerCompiler(TriviaAnswerCompilerInterface):
             return answer
 
         return f'{match.group(1)} ({match.group(2)}) {match.group(3)}'
+
+    # Converts a single (already NFKD normalized) character into its latin equivalent, if it has
+    # one, or removes it if it's a combining diacritic. Results are cached by the translation table.
+    def __translateFancyCharacter(self, char: str) -> str:
+        char = self.__specialCharsRegEx.sub(lambda match: match.lastgroup or match.group(), char)
+        return self.__combiningDiacriticsRegEx.sub('', char)
@@ -0,0 +1,36 @@
+from typing import Callable
+
+from ...misc import utils as utils
+
+
+class TriviaCharacterTranslationTable(dict[int, str]):
+
+    # A str.translate() table that fills itself in as it encounters new characters. Looking up a
+    # character that hasn't been seen before runs the given translation function on it once, and
+    # from then on, that character is translated entirely within str.translate()'s C code.
+
+    def __init__(
+        self,
+        translation: Callable[[str], str],
+        maxSize: int = 65536
+    ):
+        super().__init__()
+
+        if not callable(translation):
+            raise TypeError(f'translation argument is malformed: \"{translation}\"')
+        elif not utils.isValidInt(maxSize):
+            raise TypeError(f'maxSize argument is malformed: \"{maxSize}\"')
+        elif maxSize < 1 or maxSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxSize argument is out of bounds: {maxSize}')
+
+        self.__translation: Callable[[str], str] = translation
+        self.__maxSize: int = maxSize
+
+    def __missing__(self, codePoint: int) -> str:
+        translated = self.__translation(chr(codePoint))
+
+        # prevents a flood of unusual characters from growing this table forever
+        if len(self) < self.__maxSize:
+            self[codePoint] = translated
+
+        return translated
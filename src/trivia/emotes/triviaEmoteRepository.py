@@ -2,7 +2,6 @@ from .triviaEmoteRepositoryInterface import TriviaEmoteRepositoryInterface
 from ...misc import utils as utils
 from ...storage.backingDatabase import BackingDatabase
 from ...storage.databaseConnection import DatabaseConnection
-from ...storage.databaseType import DatabaseType
 
 
 class TriviaEmoteRepository(TriviaEmoteRepositoryInterface):
@@ -12,10 +11,8 @@ class TriviaEmoteRepository(TriviaEmoteRepositoryInterface):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
-        self.__isDatabaseReady: bool = False
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
     async def getEmoteIndexFor(self, twitchChannelId: str) -> int | None:
@@ -40,39 +37,6 @@ class TriviaEmoteRepository(TriviaEmoteRepositoryInterface):
         await connection.close()
         return emoteIndex
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviaemotes (
-                            emoteindex smallint DEFAULT 0 NOT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviaemotes (
-                            emoteindex INTEGER NOT NULL DEFAULT 0,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def setEmoteIndexFor(self, emoteIndex: int, twitchChannelId: str):
         if not utils.isValidInt(emoteIndex):
             raise TypeError(f'emoteIndex argument is malformed: \"{emoteIndex}\"')
@@ -1,4 +1,3 @@
-import queue
 import random
 from collections import defaultdict
 
@@ -145,18 +144,13 @@ class QueuedTriviaGameStore(QueuedTriviaGameStoreInterface):
         else:
             return 0
 
-    async def popQueuedSuperGames(self, activeChannelIds: set[str]) -> list[StartNewSuperTriviaGameAction]:
-        superGames: list[StartNewSuperTriviaGameAction] = list()
+    async def popQueuedSuperGame(self, twitchChannelId: str) -> StartNewSuperTriviaGameAction | None:
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        for twitchChannelId, queuedSuperGames in self.__queuedSuperGames.items():
-            if twitchChannelId in activeChannelIds:
-                continue
-            elif len(queuedSuperGames) == 0:
-                continue
+        queuedSuperGames = self.__queuedSuperGames.get(twitchChannelId, None)
 
-            try:
-                superGames.append(queuedSuperGames.pop(0))
-            except queue.Empty as e:
-                self.__timber.log('QueuedTriviaGameStore', f'Unable to get queued super game for \"{twitchChannelId}\" (queue size: {len(queuedSuperGames)}): {e}', e)
+        if queuedSuperGames is None or len(queuedSuperGames) == 0:
+            return None
 
-        return superGames
+        return queuedSuperGames.pop(0)
@@ -24,5 +24,5 @@ class QueuedTriviaGameStoreInterface(ABC):
         pass
 
     @abstractmethod
-    async def popQueuedSuperGames(self, activeChannelIds: set[str]) -> list[StartNewSuperTriviaGameAction]:
+    async def popQueuedSuperGame(self, twitchChannelId: str) -> StartNewSuperTriviaGameAction | None:
         pass
@@ -5,6 +5,7 @@ from .absTriviaGameState import AbsTriviaGameState
 from .triviaGameType import TriviaGameType
 from ..questions.absTriviaQuestion import AbsTriviaQuestion
 from ..specialStatus.specialTriviaStatus import SpecialTriviaStatus
+from ..triviaAnswerCheckResult import TriviaAnswerCheckResult
 from ...misc import utils as utils
 
 
@@ -56,9 +57,34 @@ class SuperTriviaGameState(AbsTriviaGameState):
 
         self.__answeredUserIds: dict[str, int] = defaultdict(lambda: 0)
 
+        # Lots of chatters tend to send in the very same guess, so each answer's check result is
+        # remembered for the lifetime of this game, keyed by its compiled form.
+        self.__checkedAnswers: dict[str, TriviaAnswerCheckResult] = dict()
+        self.__checkedAnswerHits: int = 0
+        self.__checkedAnswerMisses: int = 0
+
     def getAnsweredUserIds(self) -> dict[str, int]:
         return dict(self.__answeredUserIds)
 
+    def getCheckedAnswer(self, answerMemoKey: str) -> TriviaAnswerCheckResult | None:
+        if not utils.isValidStr(answerMemoKey):
+            raise TypeError(f'answerMemoKey argument is malformed: \"{answerMemoKey}\"')
+
+        checkResult = self.__checkedAnswers.get(answerMemoKey, None)
+
+        if checkResult is None:
+            self.__checkedAnswerMisses += 1
+        else:
+            self.__checkedAnswerHits += 1
+
+        return checkResult
+
+    def getCheckedAnswerHits(self) -> int:
+        return self.__checkedAnswerHits
+
+    def getCheckedAnswerMisses(self) -> int:
+        return self.__checkedAnswerMisses
+
     def getPerUserAttempts(self) -> int:
         return self.__perUserAttempts
 
@@ -82,3 +108,11 @@ class SuperTriviaGameState(AbsTriviaGameState):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
         return self.__answeredUserIds[userId] < self.__perUserAttempts
+
+    def setCheckedAnswer(self, answerMemoKey: str, checkResult: TriviaAnswerCheckResult):
+        if not utils.isValidStr(answerMemoKey):
+            raise TypeError(f'answerMemoKey argument is malformed: \"{answerMemoKey}\"')
+        elif not isinstance(checkResult, TriviaAnswerCheckResult):
+            raise TypeError(f'checkResult argument is malformed: \"{checkResult}\"')
+
+        self.__checkedAnswers[answerMemoKey] = checkResult
@@ -1,3 +1,6 @@
+import heapq
+from datetime import datetime
+
 from .absTriviaGameState import AbsTriviaGameState
 from .superTriviaGameState import SuperTriviaGameState
 from .triviaGameState import TriviaGameState
@@ -8,9 +11,15 @@ from ...misc import utils as utils
 
 class TriviaGameStore(TriviaGameStoreInterface):
 
+    # Normal games are indexed by their Twitch channel ID and user ID, and super games by just
+    # their Twitch channel ID, so every lookup and removal is a single dictionary operation. Each
+    # Twitch channel also gets its own min-heap of game end times. Removing a game doesn't touch
+    # that heap, instead its entry is recognized as stale and thrown away once it reaches the top.
+
     def __init__(self):
-        self.__normalGameStates: list[TriviaGameState] = list()
-        self.__superGameStates: list[SuperTriviaGameState] = list()
+        self.__normalGameStates: dict[tuple[str, str], TriviaGameState] = dict()
+        self.__superGameStates: dict[str, SuperTriviaGameState] = dict()
+        self.__gameExpirations: dict[str, list[tuple[datetime, str, AbsTriviaGameState]]] = dict()
 
     async def add(self, state: AbsTriviaGameState):
         if not isinstance(state, AbsTriviaGameState):
@@ -23,17 +32,25 @@ class TriviaGameStore(TriviaGameStoreInterface):
         else:
             raise UnknownTriviaGameTypeException(f'Unknown TriviaGameType: \"{state.getTriviaGameType()}\"')
 
+        gameExpirations = self.__gameExpirations.get(state.getTwitchChannelId(), None)
+
+        if gameExpirations is None:
+            gameExpirations = list()
+            self.__gameExpirations[state.getTwitchChannelId()] = gameExpirations
+
+        heapq.heappush(gameExpirations, (state.endTime, state.getGameId(), state))
+
     async def __addNormalGame(self, state: TriviaGameState):
         if not isinstance(state, TriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        self.__normalGameStates.append(state)
+        self.__normalGameStates[(state.getTwitchChannelId(), state.getUserId())] = state
 
     async def __addSuperGame(self, state: SuperTriviaGameState):
         if not isinstance(state, SuperTriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        self.__superGameStates.append(state)
+        self.__superGameStates[state.getTwitchChannelId()] = state
 
     async def getAll(self) -> list[AbsTriviaGameState]:
         normalGames = await self.getNormalGames()
@@ -45,6 +62,17 @@ class TriviaGameStore(TriviaGameStoreInterface):
 
         return allGames
 
+    async def getNextEndTime(self, twitchChannelId: str) -> datetime | None:
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+
+        gameExpirations = self.__pruneGameExpirations(twitchChannelId)
+
+        if gameExpirations is None:
+            return None
+
+        return gameExpirations[0][0]
+
     async def getNormalGame(
         self,
         twitchChannelId: str,
@@ -55,40 +83,73 @@ class TriviaGameStore(TriviaGameStoreInterface):
         elif not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        normalGames = await self.getNormalGames()
-
-        for state in normalGames:
-            if twitchChannelId == state.getTwitchChannelId() and userId == state.getUserId():
-                return state
-
-        return None
+        return self.__normalGameStates.get((twitchChannelId, userId), None)
 
     async def getNormalGames(self) -> list[TriviaGameState]:
-        return utils.copyList(self.__normalGameStates)
+        return list(self.__normalGameStates.values())
 
     async def getSuperGame(self, twitchChannelId: str) -> SuperTriviaGameState | None:
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        superGames = await self.getSuperGames()
-
-        for state in superGames:
-            if twitchChannelId == state.getTwitchChannelId():
-                return state
-
-        return None
+        return self.__superGameStates.get(twitchChannelId, None)
 
     async def getSuperGames(self) -> list[SuperTriviaGameState]:
-        return utils.copyList(self.__superGameStates)
+        return list(self.__superGameStates.values())
 
     async def getTwitchChannelIdsWithActiveSuperGames(self) -> list[str]:
-        superGames = await self.getSuperGames()
-        twitchChannelIds: set[str] = set()
+        return list(self.__superGameStates.keys())
+
+    def __isCurrentGame(self, state: AbsTriviaGameState) -> bool:
+        currentState: AbsTriviaGameState | None
+
+        if isinstance(state, TriviaGameState):
+            currentState = self.__normalGameStates.get((state.getTwitchChannelId(), state.getUserId()), None)
+        else:
+            currentState = self.__superGameStates.get(state.getTwitchChannelId(), None)
+
+        return currentState is not None and currentState.getGameId() == state.getGameId()
+
+    def __pruneGameExpirations(self, twitchChannelId: str) -> list[tuple[datetime, str, AbsTriviaGameState]] | None:
+        gameExpirations = self.__gameExpirations.get(twitchChannelId, None)
+
+        if gameExpirations is None:
+            return None
+
+        while len(gameExpirations) >= 1 and not self.__isCurrentGame(gameExpirations[0][2]):
+            heapq.heappop(gameExpirations)
+
+        if len(gameExpirations) == 0:
+            del self.__gameExpirations[twitchChannelId]
+            return None
 
-        for state in superGames:
-            twitchChannelIds.add(state.getTwitchChannelId())
+        return gameExpirations
+
+    async def removeExpiredGames(
+        self,
+        twitchChannelId: str,
+        now: datetime
+    ) -> list[AbsTriviaGameState]:
+        if not utils.isValidStr(twitchChannelId):
+            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
+        elif not isinstance(now, datetime):
+            raise TypeError(f'now argument is malformed: \"{now}\"')
 
-        return list(twitchChannelIds)
+        expiredGames: list[AbsTriviaGameState] = list()
+        gameExpirations = self.__pruneGameExpirations(twitchChannelId)
+
+        while gameExpirations is not None and gameExpirations[0][0] <= now:
+            _, _, state = heapq.heappop(gameExpirations)
+
+            if isinstance(state, TriviaGameState):
+                del self.__normalGameStates[(state.getTwitchChannelId(), state.getUserId())]
+            else:
+                del self.__superGameStates[state.getTwitchChannelId()]
+
+            expiredGames.append(state)
+            gameExpirations = self.__pruneGameExpirations(twitchChannelId)
+
+        return expiredGames
 
     async def removeNormalGame(
         self,
@@ -100,24 +161,10 @@ class TriviaGameStore(TriviaGameStoreInterface):
         elif not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        normalGames = await self.getNormalGames()
-
-        for index, state in enumerate(normalGames):
-            if twitchChannelId == state.getTwitchChannelId() and userId == state.getUserId():
-                del self.__normalGameStates[index]
-                return True
-
-        return False
+        return self.__normalGameStates.pop((twitchChannelId, userId), None) is not None
 
     async def removeSuperGame(self, twitchChannelId: str) -> bool:
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
 
-        superGames = await self.getSuperGames()
-
-        for index, state in enumerate(superGames):
-            if twitchChannelId == state.getTwitchChannelId():
-                del self.__superGameStates[index]
-                return True
-
-        return False
+        return self.__superGameStates.pop(twitchChannelId, None) is not None
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from datetime import datetime
 
 from .absTriviaGameState import AbsTriviaGameState
 from .superTriviaGameState import SuperTriviaGameState
@@ -15,6 +16,10 @@ class TriviaGameStoreInterface(ABC):
     async def getAll(self) -> list[AbsTriviaGameState]:
         pass
 
+    @abstractmethod
+    async def getNextEndTime(self, twitchChannelId: str) -> datetime | None:
+        pass
+
     @abstractmethod
     async def getNormalGame(
         self,
@@ -39,6 +44,14 @@ class TriviaGameStoreInterface(ABC):
     async def getTwitchChannelIdsWithActiveSuperGames(self) -> list[str]:
         pass
 
+    @abstractmethod
+    async def removeExpiredGames(
+        self,
+        twitchChannelId: str,
+        now: datetime
+    ) -> list[AbsTriviaGameState]:
+        pass
+
     @abstractmethod
     async def removeNormalGame(
         self,
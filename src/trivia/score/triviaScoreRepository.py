@@ -1,21 +1,25 @@
+from typing import Collection
+
 from .triviaScoreRepositoryInterface import TriviaScoreRepositoryInterface
 from .triviaScoreResult import TriviaScoreResult
 from ...misc import utils as utils
 from ...storage.backingDatabase import BackingDatabase
 from ...storage.databaseConnection import DatabaseConnection
-from ...storage.databaseType import DatabaseType
 
 
 class TriviaScoreRepository(TriviaScoreRepositoryInterface):
 
+    # Every increment is a single upsert that does its own arithmetic and hands back the updated
+    # row via RETURNING, so two concurrent increments for the same user can no longer read the
+    # same old score and have one of them overwrite the other. The "ForUsers" variants apply one
+    # increment to each of many users, all within a single transaction.
+
     def __init__(self, backingDatabase: BackingDatabase):
         if not isinstance(backingDatabase, BackingDatabase):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
 
-        self.__isDatabaseReady: bool = False
-
     async def fetchTriviaScore(
         self,
         twitchChannel: str,
@@ -74,234 +78,156 @@ class TriviaScoreRepository(TriviaScoreRepositoryInterface):
         )
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
-    async def incrementSuperTriviaWins(
+    async def __incrementTriviaScores(
         self,
+        query: str,
         twitchChannel: str,
         twitchChannelId: str,
-        userId: str
-    ) -> TriviaScoreResult:
+        userIds: Collection[str]
+    ) -> list[TriviaScoreResult]:
         if not utils.isValidStr(twitchChannel):
             raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userId):
-            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+        elif not isinstance(userIds, Collection) or isinstance(userIds, str):
+            raise TypeError(f'userIds argument is malformed: \"{userIds}\"')
 
-        result = await self.fetchTriviaScore(
-            twitchChannel = twitchChannel,
-            twitchChannelId = twitchChannelId,
-            userId = userId
-        )
+        for userId in userIds:
+            if not utils.isValidStr(userId):
+                raise TypeError(f'userIds argument contains a malformed entry: \"{userId}\"')
 
-        newSuperTriviaWins = result.getSuperTriviaWins() + 1
+        results: list[TriviaScoreResult] = list()
 
-        newResult = TriviaScoreResult(
-            streak = result.getStreak(),
-            superTriviaWins = newSuperTriviaWins,
-            triviaLosses = result.getTriviaLosses(),
-            triviaWins = result.getTriviaWins(),
-            twitchChannel = result.getTwitchChannel(),
-            twitchChannelId = result.getTwitchChannelId(),
-            userId = result.getUserId()
-        )
+        if len(userIds) == 0:
+            return results
 
-        await self.__updateTriviaScore(
-            newStreak = newResult.getStreak(),
-            newSuperTriviaWins = newResult.getSuperTriviaWins(),
-            newTriviaLosses = newResult.getTriviaLosses(),
-            newTriviaWins = newResult.getTriviaWins(),
-            twitchChannel = newResult.getTwitchChannel(),
-            twitchChannelId = newResult.getTwitchChannelId(),
-            userId = newResult.getUserId()
-        )
+        connection = await self.__getDatabaseConnection()
 
-        return newResult
+        try:
+            async with connection.transaction():
+                for userId in userIds:
+                    record = await connection.fetchRow(query, twitchChannelId, userId)
+
+                    if record is None or len(record) < 4:
+                        raise RuntimeError(f'Failed to increment trivia score ({twitchChannel=}) ({twitchChannelId=}) ({userId=}) ({record=})')
+
+                    results.append(TriviaScoreResult(
+                        streak = record[0],
+                        superTriviaWins = record[1],
+                        triviaLosses = record[2],
+                        triviaWins = record[3],
+                        twitchChannel = twitchChannel,
+                        twitchChannelId = twitchChannelId,
+                        userId = userId
+                    ))
+        finally:
+            await connection.close()
 
-    async def incrementTriviaLosses(
+        return results
+
+    async def incrementSuperTriviaWins(
         self,
         twitchChannel: str,
         twitchChannelId: str,
         userId: str
     ) -> TriviaScoreResult:
-        if not utils.isValidStr(twitchChannel):
-            raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
-        elif not utils.isValidStr(twitchChannelId):
-            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userId):
+        if not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        result = await self.fetchTriviaScore(
+        results = await self.incrementSuperTriviaWinsForUsers(
             twitchChannel = twitchChannel,
             twitchChannelId = twitchChannelId,
-            userId = userId
+            userIds = [ userId ]
         )
 
-        newStreak: int
-        if result.getStreak() <= -1:
-            newStreak = result.getStreak() - 1
-        else:
-            newStreak = -1
-
-        newTriviaLosses: int = result.getTriviaLosses() + 1
-
-        newResult = TriviaScoreResult(
-            streak = newStreak,
-            superTriviaWins = result.getSuperTriviaWins(),
-            triviaLosses = newTriviaLosses,
-            triviaWins = result.getTriviaWins(),
-            twitchChannel = result.getTwitchChannel(),
-            twitchChannelId = result.getTwitchChannelId(),
-            userId = result.getUserId()
-        )
+        return results[0]
 
-        await self.__updateTriviaScore(
-            newStreak = newResult.getStreak(),
-            newSuperTriviaWins = newResult.getSuperTriviaWins(),
-            newTriviaLosses = newResult.getTriviaLosses(),
-            newTriviaWins = newResult.getTriviaWins(),
-            twitchChannel = newResult.getTwitchChannel(),
-            twitchChannelId = newResult.getTwitchChannelId(),
-            userId = newResult.getUserId()
+    async def incrementSuperTriviaWinsForUsers(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        userIds: Collection[str]
+    ) -> list[TriviaScoreResult]:
+        return await self.__incrementTriviaScores(
+            query = '''
+                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid)
+                VALUES (0, 1, 0, 0, $1, $2)
+                ON CONFLICT (twitchchannelid, userid) DO UPDATE SET supertriviawins = triviascores.supertriviawins + 1
+                RETURNING streak, supertriviawins, trivialosses, triviawins
+            ''',
+            twitchChannel = twitchChannel,
+            twitchChannelId = twitchChannelId,
+            userIds = userIds
         )
 
-        return newResult
-
-    async def incrementTriviaWins(
+    async def incrementTriviaLosses(
         self,
         twitchChannel: str,
         twitchChannelId: str,
         userId: str
     ) -> TriviaScoreResult:
-        if not utils.isValidStr(twitchChannel):
-            raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
-        elif not utils.isValidStr(twitchChannelId):
-            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userId):
+        if not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        result = await self.fetchTriviaScore(
+        results = await self.incrementTriviaLossesForUsers(
             twitchChannel = twitchChannel,
             twitchChannelId = twitchChannelId,
-            userId = userId
+            userIds = [ userId ]
         )
 
-        newStreak: int
-        if result.getStreak() >= 1:
-            newStreak = result.getStreak() + 1
-        else:
-            newStreak = 1
-
-        newTriviaWins = result.getTriviaWins() + 1
-
-        newResult = TriviaScoreResult(
-            streak = newStreak,
-            superTriviaWins = result.getSuperTriviaWins(),
-            triviaLosses = result.getTriviaLosses(),
-            triviaWins = newTriviaWins,
-            twitchChannel = result.getTwitchChannel(),
-            twitchChannelId = result.getTwitchChannelId(),
-            userId = result.getUserId()
-        )
+        return results[0]
 
-        await self.__updateTriviaScore(
-            newStreak = newResult.getStreak(),
-            newSuperTriviaWins = newResult.getSuperTriviaWins(),
-            newTriviaLosses = newResult.getTriviaLosses(),
-            newTriviaWins = newResult.getTriviaWins(),
-            twitchChannel = newResult.getTwitchChannel(),
-            twitchChannelId = newResult.getTwitchChannelId(),
-            userId = newResult.getUserId()
+    async def incrementTriviaLossesForUsers(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        userIds: Collection[str]
+    ) -> list[TriviaScoreResult]:
+        return await self.__incrementTriviaScores(
+            query = '''
+                INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid)
+                VALUES (-1, 0, 1, 0, $1, $2)
+                ON CONFLICT (twitchchannelid, userid) DO UPDATE SET streak = CASE WHEN triviascores.streak <= -1 THEN triviascores.streak - 1 ELSE -1 END, trivialosses = triviascores.trivialosses + 1
+                RETURNING streak, supertriviawins, trivialosses, triviawins
+            ''',
+            twitchChannel = twitchChannel,
+            twitchChannelId = twitchChannelId,
+            userIds = userIds
         )
 
-        return newResult
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviascores (
-                            streak integer DEFAULT 0 NOT NULL,
-                            supertriviawins integer DEFAULT 0 NOT NULL,
-                            trivialosses integer DEFAULT 0 NOT NULL,
-                            triviawins integer DEFAULT 0 NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviascores (
-                            streak INTEGER NOT NULL DEFAULT 0,
-                            supertriviawins INTEGER NOT NULL DEFAULT 0,
-                            trivialosses INTEGER NOT NULL DEFAULT 0,
-                            triviawins INTEGER NOT NULL DEFAULT 0,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
-    async def __updateTriviaScore(
+    async def incrementTriviaWins(
         self,
-        newStreak: int,
-        newSuperTriviaWins: int,
-        newTriviaLosses: int,
-        newTriviaWins: int,
         twitchChannel: str,
         twitchChannelId: str,
         userId: str
-    ):
-        if not utils.isValidInt(newStreak):
-            raise TypeError(f'newStreak argument is malformed: \"{newStreak}\"')
-        elif newStreak < utils.getIntMinSafeSize() or newStreak > utils.getIntMaxSafeSize():
-            raise ValueError(f'newStreak argument is out of boudns: {newStreak}')
-        elif not utils.isValidInt(newSuperTriviaWins):
-            raise TypeError(f'newSuperTriviaWins argument is malformed: \"{newSuperTriviaWins}\"')
-        elif newSuperTriviaWins < 0 or newSuperTriviaWins > utils.getIntMaxSafeSize():
-            raise ValueError(f'newSuperTriviaWins argument is out of bounds: {newSuperTriviaWins}')
-        elif not utils.isValidInt(newTriviaLosses):
-            raise TypeError(f'newTriviaLosses argument is malformed: \"{newTriviaLosses}\"')
-        elif newTriviaLosses < 0 or newTriviaLosses > utils.getIntMaxSafeSize():
-            raise ValueError(f'newTriviaLosses argument is out of bounds: {newTriviaLosses}')
-        elif not utils.isValidInt(newTriviaWins):
-            raise TypeError(f'newTriviaWins argument is malformed: \"{newTriviaWins}\"')
-        elif newTriviaWins < 0 or newTriviaLosses > utils.getIntMaxSafeSize():
-            raise ValueError(f'newTriviaWins argument is out of bounds: {newTriviaWins}')
-        elif not utils.isValidStr(twitchChannel):
-            raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
-        elif not utils.isValidStr(twitchChannelId):
-            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userId):
+    ) -> TriviaScoreResult:
+        if not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        connection = await self.__backingDatabase.getConnection()
-        await connection.execute(
-            '''
+        results = await self.incrementTriviaWinsForUsers(
+            twitchChannel = twitchChannel,
+            twitchChannelId = twitchChannelId,
+            userIds = [ userId ]
+        )
+
+        return results[0]
+
+    async def incrementTriviaWinsForUsers(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        userIds: Collection[str]
+    ) -> list[TriviaScoreResult]:
+        return await self.__incrementTriviaScores(
+            query = '''
                 INSERT INTO triviascores (streak, supertriviawins, trivialosses, triviawins, twitchchannelid, userid)
-                VALUES ($1, $2, $3, $4, $5, $6)
-                ON CONFLICT (twitchchannelid, userid) DO UPDATE SET streak = EXCLUDED.streak, supertriviawins = EXCLUDED.supertriviawins, triviaLosses = EXCLUDED.trivialosses, triviawins = EXCLUDED.triviawins
+                VALUES (1, 0, 0, 1, $1, $2)
+                ON CONFLICT (twitchchannelid, userid) DO UPDATE SET streak = CASE WHEN triviascores.streak >= 1 THEN triviascores.streak + 1 ELSE 1 END, triviawins = triviascores.triviawins + 1
+                RETURNING streak, supertriviawins, trivialosses, triviawins
             ''',
-            newStreak, newSuperTriviaWins, newTriviaLosses, newTriviaWins, twitchChannelId, userId
+            twitchChannel = twitchChannel,
+            twitchChannelId = twitchChannelId,
+            userIds = userIds
         )
-
-        await connection.close()
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Collection
 
 from .triviaScoreResult import TriviaScoreResult
 
@@ -23,6 +24,15 @@ class TriviaScoreRepositoryInterface(ABC):
     ) -> TriviaScoreResult:
         pass
 
+    @abstractmethod
+    async def incrementSuperTriviaWinsForUsers(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        userIds: Collection[str]
+    ) -> list[TriviaScoreResult]:
+        pass
+
     @abstractmethod
     async def incrementTriviaLosses(
         self,
@@ -32,6 +42,15 @@ class TriviaScoreRepositoryInterface(ABC):
     ) -> TriviaScoreResult:
         pass
 
+    @abstractmethod
+    async def incrementTriviaLossesForUsers(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        userIds: Collection[str]
+    ) -> list[TriviaScoreResult]:
+        pass
+
     @abstractmethod
     async def incrementTriviaWins(
         self,
@@ -40,3 +59,12 @@ class TriviaScoreRepositoryInterface(ABC):
         userId: str
     ) -> TriviaScoreResult:
         pass
+
+    @abstractmethod
+    async def incrementTriviaWinsForUsers(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        userIds: Collection[str]
+    ) -> list[TriviaScoreResult]:
+        pass
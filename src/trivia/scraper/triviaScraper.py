@@ -1,8 +1,12 @@
+import asyncio
+import traceback
+
 from .triviaScraperInterface import TriviaScraperInterface
 from ..questions.absTriviaQuestion import AbsTriviaQuestion
 from ..questions.triviaSource import TriviaSource
 from ..triviaRepositories.glacialTriviaQuestionRepositoryInterface import GlacialTriviaQuestionRepositoryInterface
 from ..triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
+from ...misc import utils as utils
 from ...timber.timberInterface import TimberInterface
 
 
@@ -12,7 +16,8 @@ class TriviaScraper(TriviaScraperInterface):
         self,
         glacialTriviaQuestionRepository: GlacialTriviaQuestionRepositoryInterface,
         timber: TimberInterface,
-        triviaSettingsRepository: TriviaSettingsRepositoryInterface
+        triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        bufferSize: int = 16
     ):
         if not isinstance(glacialTriviaQuestionRepository, GlacialTriviaQuestionRepositoryInterface):
             raise TypeError(f'glacialTriviaQuestionRepository argument is malformed: \"{glacialTriviaQuestionRepository}\"')
@@ -20,10 +25,41 @@ class TriviaScraper(TriviaScraperInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(triviaSettingsRepository, TriviaSettingsRepositoryInterface):
             raise TypeError(f'triviaSettingsRepository argument is malformed: \"{triviaSettingsRepository}\"')
+        elif not utils.isValidInt(bufferSize):
+            raise TypeError(f'bufferSize argument is malformed: \"{bufferSize}\"')
+        elif bufferSize < 1 or bufferSize > 256:
+            raise ValueError(f'bufferSize argument is out of bounds: {bufferSize}')
 
         self.__glacialTriviaQuestionRepository: GlacialTriviaQuestionRepositoryInterface = glacialTriviaQuestionRepository
         self.__timber: TimberInterface = timber
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
+        self.__bufferSize: int = bufferSize
+
+        # Scraped questions are held here until either the buffer fills up or flush() is called,
+        # and are then all stored in a single storeAll() call (and so a single transaction). This
+        # is keyed by (originalTriviaSource, triviaId), so the same question is only buffered once.
+        self.__bufferedQuestions: dict[tuple[str, str], AbsTriviaQuestion] = dict()
+        self.__flushLock: asyncio.Lock = asyncio.Lock()
+
+    async def flush(self):
+        if len(self.__bufferedQuestions) == 0:
+            return
+
+        async with self.__flushLock:
+            questions = list(self.__bufferedQuestions.values())
+            self.__bufferedQuestions.clear()
+
+            if len(questions) == 0:
+                return
+
+            try:
+                storedQuestionsCount = await self.__glacialTriviaQuestionRepository.storeAll(questions)
+            except Exception as e:
+                self.__timber.log('TriviaScraper', f'Encountered unknown Exception when storing trivia questions into glacial storage ({len(questions)=}): {e}', e, traceback.format_exc())
+                return
+
+            if storedQuestionsCount >= 1:
+                self.__timber.log('TriviaScraper', f'Stored {storedQuestionsCount} trivia question(s) into glacial storage ({len(questions)=})')
 
     async def store(self, question: AbsTriviaQuestion):
         if not isinstance(question, AbsTriviaQuestion):
@@ -34,5 +70,7 @@ class TriviaScraper(TriviaScraperInterface):
         elif question.triviaSource is TriviaSource.GLACIAL:
             return
 
-        if await self.__glacialTriviaQuestionRepository.store(question):
-            self.__timber.log('TriviaScraper', f'Stored a trivia question from {question.triviaSource} into glacial storage')
+        self.__bufferedQuestions[(question.triviaSource.toStr(), question.triviaId)] = question
+
+        if len(self.__bufferedQuestions) >= self.__bufferSize:
+            await self.flush()
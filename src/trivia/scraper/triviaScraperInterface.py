@@ -5,6 +5,10 @@ from ..questions.absTriviaQuestion import AbsTriviaQuestion
 
 class TriviaScraperInterface(ABC):
 
+    @abstractmethod
+    async def flush(self):
+        pass
+
     @abstractmethod
     async def store(self, question: AbsTriviaQuestion):
         pass
@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Collection
 
 from .shinyTriviaOccurencesRepositoryInterface import ShinyTriviaOccurencesRepositoryInterface
 from .shinyTriviaResult import ShinyTriviaResult
@@ -6,11 +7,14 @@ from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ...misc import utils as utils
 from ...storage.backingDatabase import BackingDatabase
 from ...storage.databaseConnection import DatabaseConnection
-from ...storage.databaseType import DatabaseType
 
 
 class ShinyTriviaOccurencesRepository(ShinyTriviaOccurencesRepositoryInterface):
 
+    # Incrementing is a single upsert that hands back the new count via RETURNING, so concurrent
+    # increments for the same user can't lose one another's update. incrementShinyCountForUsers()
+    # applies one increment to each of many users, all within a single transaction.
+
     def __init__(
         self,
         backingDatabase: BackingDatabase,
@@ -24,8 +28,6 @@ class ShinyTriviaOccurencesRepository(ShinyTriviaOccurencesRepositoryInterface):
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
 
-        self.__isDatabaseReady: bool = False
-
     async def fetchDetails(
         self,
         twitchChannel: str,
@@ -68,7 +70,6 @@ class ShinyTriviaOccurencesRepository(ShinyTriviaOccurencesRepositoryInterface):
         )
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
     async def incrementShinyCount(
@@ -77,106 +78,69 @@ class ShinyTriviaOccurencesRepository(ShinyTriviaOccurencesRepositoryInterface):
         twitchChannelId: str,
         userId: str
     ) -> ShinyTriviaResult:
-        if not utils.isValidStr(twitchChannel):
-            raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
-        elif not utils.isValidStr(twitchChannelId):
-            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userId):
+        if not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        result = await self.fetchDetails(
+        results = await self.incrementShinyCountForUsers(
             twitchChannel = twitchChannel,
             twitchChannelId = twitchChannelId,
-            userId = userId
-        )
-
-        newShinyCount = result.oldShinyCount + 1
-
-        newResult = ShinyTriviaResult(
-            mostRecent = datetime.now(self.__timeZoneRepository.getDefault()),
-            newShinyCount = newShinyCount,
-            oldShinyCount = result.oldShinyCount,
-            twitchChannel = result.twitchChannel,
-            twitchChannelId = result.twitchChannelId,
-            userId = result.userId
+            userIds = [ userId ]
         )
 
-        await self.__updateShinyCount(
-            newShinyCount = newResult.newShinyCount,
-            twitchChannel = newResult.twitchChannel,
-            twitchChannelId = newResult.twitchChannelId,
-            userId = newResult.userId
-        )
-
-        return newResult
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
-                            count integer DEFAULT 0 NOT NULL,
-                            mostrecent text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS shinytriviaoccurences (
-                            count INTEGER NOT NULL DEFAULT 0,
-                            mostrecent TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        return results[0]
 
-    async def __updateShinyCount(
+    async def incrementShinyCountForUsers(
         self,
-        newShinyCount: int,
         twitchChannel: str,
         twitchChannelId: str,
-        userId: str
-    ):
-        if not utils.isValidInt(newShinyCount):
-            raise TypeError(f'newShinyCount argument is malformed: \"{newShinyCount}\"')
-        elif newShinyCount < 0 or newShinyCount > utils.getIntMaxSafeSize():
-            raise ValueError(f'newShinyCount argument is out of bounds: {newShinyCount}')
-        elif not utils.isValidStr(twitchChannel):
+        userIds: Collection[str]
+    ) -> list[ShinyTriviaResult]:
+        if not utils.isValidStr(twitchChannel):
             raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userId):
-            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+        elif not isinstance(userIds, Collection) or isinstance(userIds, str):
+            raise TypeError(f'userIds argument is malformed: \"{userIds}\"')
 
-        nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
+        for userId in userIds:
+            if not utils.isValidStr(userId):
+                raise TypeError(f'userIds argument contains a malformed entry: \"{userId}\"')
 
+        results: list[ShinyTriviaResult] = list()
+
+        if len(userIds) == 0:
+            return results
+
+        nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                INSERT INTO shinytriviaoccurences (count, mostrecent, twitchchannelid, userid)
-                VALUES ($1, $2, $3, $4)
-                ON CONFLICT (twitchchannelid, userid) DO UPDATE SET count = EXCLUDED.count, mostrecent = EXCLUDED.mostrecent
-            ''',
-            newShinyCount, nowDateTime.isoformat(), twitchChannelId, userId
-        )
 
-        await connection.close()
+        try:
+            async with connection.transaction():
+                for userId in userIds:
+                    record = await connection.fetchRow(
+                        '''
+                            INSERT INTO shinytriviaoccurences (count, mostrecent, twitchchannelid, userid)
+                            VALUES (1, $1, $2, $3)
+                            ON CONFLICT (twitchchannelid, userid) DO UPDATE SET count = shinytriviaoccurences.count + 1, mostrecent = EXCLUDED.mostrecent
+                            RETURNING count
+                        ''',
+                        nowDateTime.isoformat(), twitchChannelId, userId
+                    )
+
+                    if record is None or len(record) == 0:
+                        raise RuntimeError(f'Failed to increment shiny count ({twitchChannel=}) ({twitchChannelId=}) ({userId=})')
+
+                    newShinyCount: int = record[0]
+
+                    results.append(ShinyTriviaResult(
+                        mostRecent = nowDateTime,
+                        newShinyCount = newShinyCount,
+                        oldShinyCount = newShinyCount - 1,
+                        twitchChannel = twitchChannel,
+                        twitchChannelId = twitchChannelId,
+                        userId = userId
+                    ))
+        finally:
+            await connection.close()
+
+        return results
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Collection
 
 from .shinyTriviaResult import ShinyTriviaResult
 
@@ -22,3 +23,12 @@ class ShinyTriviaOccurencesRepositoryInterface(ABC):
         userId: str
     ) -> ShinyTriviaResult:
         pass
+
+    @abstractmethod
+    async def incrementShinyCountForUsers(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        userIds: Collection[str]
+    ) -> list[ShinyTriviaResult]:
+        pass
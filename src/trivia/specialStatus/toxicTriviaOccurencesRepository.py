@@ -1,4 +1,5 @@
 from datetime import datetime
+from typing import Collection
 
 from .toxicTriviaOccurencesRepositoryInterface import ToxicTriviaOccurencesRepositoryInterface
 from .toxicTriviaResult import ToxicTriviaResult
@@ -6,11 +7,14 @@ from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ...misc import utils as utils
 from ...storage.backingDatabase import BackingDatabase
 from ...storage.databaseConnection import DatabaseConnection
-from ...storage.databaseType import DatabaseType
 
 
 class ToxicTriviaOccurencesRepository(ToxicTriviaOccurencesRepositoryInterface):
 
+    # Incrementing is a single upsert that hands back the new count via RETURNING, so concurrent
+    # increments for the same user can't lose one another's update. incrementToxicCountForUsers()
+    # applies one increment to each of many users, all within a single transaction.
+
     def __init__(
         self,
         backingDatabase: BackingDatabase,
@@ -24,8 +28,6 @@ class ToxicTriviaOccurencesRepository(ToxicTriviaOccurencesRepositoryInterface):
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
 
-        self.__isDatabaseReady: bool = False
-
     async def fetchDetails(
         self,
         twitchChannel: str,
@@ -68,7 +70,6 @@ class ToxicTriviaOccurencesRepository(ToxicTriviaOccurencesRepositoryInterface):
         )
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
     async def incrementToxicCount(
@@ -77,106 +78,69 @@ class ToxicTriviaOccurencesRepository(ToxicTriviaOccurencesRepositoryInterface):
         twitchChannelId: str,
         userId: str
     ) -> ToxicTriviaResult:
-        if not utils.isValidStr(twitchChannel):
-            raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
-        elif not utils.isValidStr(twitchChannelId):
-            raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userId):
+        if not utils.isValidStr(userId):
             raise TypeError(f'userId argument is malformed: \"{userId}\"')
 
-        result = await self.fetchDetails(
+        results = await self.incrementToxicCountForUsers(
             twitchChannel = twitchChannel,
             twitchChannelId = twitchChannelId,
-            userId = userId
-        )
-
-        newToxicCount = result.oldToxicCount + 1
-
-        newResult = ToxicTriviaResult(
-            mostRecent = datetime.now(self.__timeZoneRepository.getDefault()),
-            newToxicCount = newToxicCount,
-            oldToxicCount = result.oldToxicCount,
-            twitchChannel = result.twitchChannel,
-            twitchChannelId = result.twitchChannelId,
-            userId = result.userId
+            userIds = [ userId ]
         )
 
-        await self.__updateToxicCount(
-            newToxicCount = newResult.newToxicCount,
-            twitchChannel = newResult.twitchChannel,
-            twitchChannelId = newResult.twitchChannelId,
-            userId = newResult.userId
-        )
-
-        return newResult
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
-                            count integer DEFAULT 0 NOT NULL,
-                            mostrecent text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS toxictriviaoccurences (
-                            count INTEGER NOT NULL DEFAULT 0,
-                            mostrecent TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (twitchchannelid, userid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
+        return results[0]
 
-    async def __updateToxicCount(
+    async def incrementToxicCountForUsers(
         self,
-        newToxicCount: int,
         twitchChannel: str,
         twitchChannelId: str,
-        userId: str
-    ):
-        if not utils.isValidInt(newToxicCount):
-            raise TypeError(f'newToxicCount argument is malformed: \"{newToxicCount}\"')
-        elif newToxicCount < 0 or newToxicCount > utils.getIntMaxSafeSize():
-            raise ValueError(f'newToxicCount argument is out of bounds: {newToxicCount}')
-        elif not utils.isValidStr(twitchChannel):
+        userIds: Collection[str]
+    ) -> list[ToxicTriviaResult]:
+        if not utils.isValidStr(twitchChannel):
             raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
         elif not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
-        elif not utils.isValidStr(userId):
-            raise TypeError(f'userId argument is malformed: \"{userId}\"')
+        elif not isinstance(userIds, Collection) or isinstance(userIds, str):
+            raise TypeError(f'userIds argument is malformed: \"{userIds}\"')
 
-        nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
+        for userId in userIds:
+            if not utils.isValidStr(userId):
+                raise TypeError(f'userIds argument contains a malformed entry: \"{userId}\"')
 
+        results: list[ToxicTriviaResult] = list()
+
+        if len(userIds) == 0:
+            return results
+
+        nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
         connection = await self.__getDatabaseConnection()
-        await connection.execute(
-            '''
-                    INSERT INTO toxictriviaoccurences (count, mostrecent, twitchchannelid, userid)
-                    VALUES ($1, $2, $3, $4)
-                    ON CONFLICT (twitchchannelid, userid) DO UPDATE SET count = EXCLUDED.count, mostrecent = EXCLUDED.mostrecent
-            ''',
-            newToxicCount, nowDateTime.isoformat(), twitchChannelId, userId
-        )
 
-        await connection.close()
+        try:
+            async with connection.transaction():
+                for userId in userIds:
+                    record = await connection.fetchRow(
+                        '''
+                            INSERT INTO toxictriviaoccurences (count, mostrecent, twitchchannelid, userid)
+                            VALUES (1, $1, $2, $3)
+                            ON CONFLICT (twitchchannelid, userid) DO UPDATE SET count = toxictriviaoccurences.count + 1, mostrecent = EXCLUDED.mostrecent
+                            RETURNING count
+                        ''',
+                        nowDateTime.isoformat(), twitchChannelId, userId
+                    )
+
+                    if record is None or len(record) == 0:
+                        raise RuntimeError(f'Failed to increment toxic count ({twitchChannel=}) ({twitchChannelId=}) ({userId=})')
+
+                    newToxicCount: int = record[0]
+
+                    results.append(ToxicTriviaResult(
+                        mostRecent = nowDateTime,
+                        newToxicCount = newToxicCount,
+                        oldToxicCount = newToxicCount - 1,
+                        twitchChannel = twitchChannel,
+                        twitchChannelId = twitchChannelId,
+                        userId = userId
+                    ))
+        finally:
+            await connection.close()
+
+        return results
@@ -1,4 +1,5 @@
 from abc import ABC, abstractmethod
+from typing import Collection
 
 from .toxicTriviaResult import ToxicTriviaResult
 
@@ -22,3 +23,12 @@ class ToxicTriviaOccurencesRepositoryInterface(ABC):
         userId: str
     ) -> ToxicTriviaResult:
         pass
+
+    @abstractmethod
+    async def incrementToxicCountForUsers(
+        self,
+        twitchChannel: str,
+        twitchChannelId: str,
+        userIds: Collection[str]
+    ) -> list[ToxicTriviaResult]:
+        pass
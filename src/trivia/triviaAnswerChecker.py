@@ -1,10 +1,7 @@
-import math
 import re
 import traceback
 from typing import Any, Generator, Pattern
 
-import polyleven
-
 from .compilers.triviaAnswerCompilerInterface import TriviaAnswerCompilerInterface
 from .questions.absTriviaQuestion import AbsTriviaQuestion
 from .questions.multipleChoiceTriviaQuestion import MultipleChoiceTriviaQuestion
@@ -13,6 +10,7 @@ from .questions.triviaQuestionType import TriviaQuestionType
 from .questions.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
 from .triviaAnswerCheckResult import TriviaAnswerCheckResult
 from .triviaAnswerCheckerInterface import TriviaAnswerCheckerInterface
+from .triviaAnswerMatcher import TriviaAnswerMatcher
 from .triviaExceptions import BadTriviaAnswerException, UnsupportedTriviaTypeException
 from .triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
 from ..misc import utils as utils
@@ -26,6 +24,7 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
         timber: TimberInterface,
         triviaAnswerCompiler: TriviaAnswerCompilerInterface,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        maxAnswerMatchers: int = 64
     ):
         if not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
@@ -33,10 +32,17 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
             raise TypeError(f'triviaAnswerCompiler argument is malformed: \"{triviaAnswerCompiler}\"')
         elif not isinstance(triviaSettingsRepository, TriviaSettingsRepositoryInterface):
             raise TypeError(f'triviaSettingsRepository argument is malformed: \"{triviaSettingsRepository}\"')
+        elif not utils.isValidInt(maxAnswerMatchers):
+            raise TypeError(f'maxAnswerMatchers argument is malformed: \"{maxAnswerMatchers}\"')
+        elif maxAnswerMatchers < 1 or maxAnswerMatchers > 1024:
+            raise ValueError(f'maxAnswerMatchers argument is out of bounds: {maxAnswerMatchers}')
 
         self.__timber: TimberInterface = timber
         self.__triviaAnswerCompiler: TriviaAnswerCompilerInterface = triviaAnswerCompiler
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
+        self.__maxAnswerMatchers: int = maxAnswerMatchers
+
+        self.__answerMatchers: dict[str, TriviaAnswerMatcher] = dict()
 
         self.__whitespacePattern: Pattern = re.compile(r'\s\s+', re.IGNORECASE)
 
@@ -158,34 +164,21 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
         if not all(utils.isValidStr(cleanedAnswer) for cleanedAnswer in compiledUserAnswers):
             return TriviaAnswerCheckResult.INCORRECT
 
-        compiledCorrectAnswers = triviaQuestion.compiledCorrectAnswers
-        self.__timber.log('TriviaAnswerChecker', f'In depth question/answer debug information — ({answer=}) ({compiledUserAnswers=}) ({triviaQuestion.correctAnswers=}) ({compiledCorrectAnswers=}) ({extras=})')
-
-        for compiledCorrectAnswer in compiledCorrectAnswers:
-            for compiledUserAnswer in compiledUserAnswers:
-                expandedUserAnswers = await self.__triviaAnswerCompiler.expandNumerals(compiledUserAnswer)
-
-                for expandedUserAnswer in expandedUserAnswers:
-                    if expandedUserAnswer == compiledCorrectAnswer:
-                        return TriviaAnswerCheckResult.CORRECT
-
-                    guessWords = self.__whitespacePattern.sub(' ', expandedUserAnswer).split(' ')
-                    answerWords = self.__whitespacePattern.sub(' ', compiledCorrectAnswer).split(' ')
-                    minWords = min(len(guessWords), len(answerWords))
-
-                    for gWords in self.__mergeWords(guessWords, minWords):
-                        for aWords in self.__mergeWords(answerWords, minWords):
-                            # This expansion of all() is required because you can't perform list comprehension on async
-                            #   generators yet. :(
-                            valid = True
-                            for i in range(len(gWords)):
-                                if not await self.__compareWords(gWords[i], aWords[i]):
-                                    valid = False
-                                    break
-                            if valid:
-                                return TriviaAnswerCheckResult.CORRECT
-
-        return TriviaAnswerCheckResult.INCORRECT
+        answerMatcher = self.__getAnswerMatcher(triviaQuestion)
+        self.__timber.debug('TriviaAnswerChecker', lambda: f'In depth question/answer debug information — ({answer=}) ({compiledUserAnswers=}) ({triviaQuestion.correctAnswers=}) ({answerMatcher.compiledCorrectAnswers=}) ({extras=})')
+
+        expandedUserAnswers: list[str] = list()
+
+        for compiledUserAnswer in compiledUserAnswers:
+            expandedUserAnswers.extend(await self.__triviaAnswerCompiler.expandNumerals(compiledUserAnswer))
+
+        if answerMatcher.isMatch(
+            expandedUserAnswers = expandedUserAnswers,
+            thresholdGrowthRate = await self.__triviaSettingsRepository.getLevenshteinThresholdGrowthRate()
+        ):
+            return TriviaAnswerCheckResult.CORRECT
+        else:
+            return TriviaAnswerCheckResult.INCORRECT
 
     async def __checkAnswerTrueFalse(
         self,
@@ -210,36 +203,81 @@ class TriviaAnswerChecker(TriviaAnswerCheckerInterface):
         else:
             return TriviaAnswerCheckResult.INCORRECT
 
-    # generates all possible groupings of the given words such that the resulting word count is target_length
-    # example: words = ["a", "b", "c", "d"], target_length = 2
-    #          generates ["abc", "d"], ["ab", "cd"], ["a", "bcd"]
-    def __mergeWords(
+    async def compileAnswerMemoKey(
         self,
-        wordList: list[str],
-        target_length: int
-    ) -> Generator[list[str], None, None]:
-        if target_length == 1:
-            yield [''.join(wordList)]
-        elif len(wordList) <= target_length:
-            yield wordList
+        answer: str | None,
+        triviaQuestion: AbsTriviaQuestion
+    ) -> str | None:
+        if not isinstance(triviaQuestion, AbsTriviaQuestion):
+            raise TypeError(f'triviaQuestion argument is malformed: \"{triviaQuestion}\"')
+
+        # Returns a key that any two answers will share only if checkAnswer() is guaranteed to
+        # give them the same result for this question, or None if the answer can't be keyed.
+
+        if not utils.isValidStr(answer):
+            return None
+
+        if isinstance(triviaQuestion, MultipleChoiceTriviaQuestion):
+            try:
+                return str(await self.__triviaAnswerCompiler.compileMultipleChoiceAnswer(answer))
+            except BadTriviaAnswerException:
+                return None
+        elif isinstance(triviaQuestion, QuestionAnswerTriviaQuestion):
+            maxPhraseGuessLength = await self.__triviaSettingsRepository.getMaxPhraseGuessLength()
+            if len(answer) > maxPhraseGuessLength:
+                answer = answer[0:maxPhraseGuessLength]
+
+            # This is usually just the single compileTextAnswer() result, but special cases (e.g.
+            # "1/2") can compile to multiple answers that would collide with some other plain
+            # answer (e.g. "12") if only compileTextAnswer() were used here.
+            compiledUserAnswers = await self.__triviaAnswerCompiler.compileTextAnswersList(
+                answers = [ answer ],
+                expandParentheses = False
+            )
+
+            if len(compiledUserAnswers) == 0:
+                return None
+
+            # compiled answers never contain a new line character
+            return '\n'.join(sorted(compiledUserAnswers))
+        elif isinstance(triviaQuestion, TrueFalseTriviaQuestion):
+            try:
+                return str(await self.__triviaAnswerCompiler.compileBoolAnswer(answer))
+            except BadTriviaAnswerException:
+                return None
         else:
-            for i in range(len(wordList) - target_length + 1):
-                for w in self.__mergeWords(wordList[i + 1:], target_length - 1):
-                    yield [''.join(wordList[0:i + 1])] + w
-
-    # compare two individual words, returns true if any valid variants match between the two words
-    async def __compareWords(self, word1: str, word2: str) -> bool:
-        thresholdGrowthRate = await self.__triviaSettingsRepository.getLevenshteinThresholdGrowthRate()
-
-        for w1 in self.__genVariantPossibilities(word1):
-            for w2 in self.__genVariantPossibilities(word2):
-                # calculate threshold based on shorter word length
-                threshold = math.floor(min(len(w1), len(w2)) / thresholdGrowthRate)
-                dist = polyleven.levenshtein(w1, w2, threshold + 1)
-                if dist <= threshold:
-                    return True
-
-        return False
+            return None
+
+    def __getAnswerMatcher(self, triviaQuestion: QuestionAnswerTriviaQuestion) -> TriviaAnswerMatcher:
+        compiledCorrectAnswers = triviaQuestion.compiledCorrectAnswers
+        answerMatcher = self.__answerMatchers.get(triviaQuestion.triviaId, None)
+
+        # trivia IDs are derived from the question text, so a question could come back around
+        # with a different set of correct answers (e.g. after an additional answer was added)
+        if answerMatcher is not None and answerMatcher.compiledCorrectAnswers == compiledCorrectAnswers:
+            return answerMatcher
+
+        answerMatcher = TriviaAnswerMatcher(
+            compiledCorrectAnswers = compiledCorrectAnswers,
+            variantGenerator = self.__genVariantPossibilities,
+            whitespacePattern = self.__whitespacePattern
+        )
+
+        self.__answerMatchers.pop(triviaQuestion.triviaId, None)
+        self.__answerMatchers[triviaQuestion.triviaId] = answerMatcher
+
+        while len(self.__answerMatchers) > self.__maxAnswerMatchers:
+            # dicts retain their insertion order, so this evicts the least recently built matcher
+            del self.__answerMatchers[next(iter(self.__answerMatchers))]
+
+        return answerMatcher
+
+    def prepareAnswerMatcher(self, triviaQuestion: AbsTriviaQuestion):
+        if not isinstance(triviaQuestion, AbsTriviaQuestion):
+            raise TypeError(f'triviaQuestion argument is malformed: \"{triviaQuestion}\"')
+
+        if isinstance(triviaQuestion, QuestionAnswerTriviaQuestion):
+            self.__getAnswerMatcher(triviaQuestion)
 
     def __genVariantPossibilities(self, word: str) -> Generator[str, None, None]:
         yield word
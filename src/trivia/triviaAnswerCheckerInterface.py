@@ -15,3 +15,15 @@ class TriviaAnswerCheckerInterface(ABC):
         extras: dict[str, Any] | None = None
     ) -> TriviaAnswerCheckResult:
         pass
+
+    @abstractmethod
+    async def compileAnswerMemoKey(
+        self,
+        answer: str | None,
+        triviaQuestion: AbsTriviaQuestion
+    ) -> str | None:
+        pass
+
+    @abstractmethod
+    def prepareAnswerMatcher(self, triviaQuestion: AbsTriviaQuestion):
+        pass
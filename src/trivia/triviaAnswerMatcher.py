@@ -0,0 +1,227 @@
+import math
+from typing import Callable, Iterable, Pattern
+
+import polyleven
+
+from ..misc import utils as utils
+
+
+class TriviaAnswerMatcher:
+
+    # Holds all of the work for a question/answer trivia question's correct answers that doesn't
+    # depend on the user's guess: the split up answer words, and every variant of each of those
+    # words (sorted into ascending length order). This is built once per question, so that checking
+    # a guess only has to pay for normalizing the guess itself, plus the actual comparisons.
+
+    def __init__(
+        self,
+        compiledCorrectAnswers: list[str],
+        variantGenerator: Callable[[str], Iterable[str]],
+        whitespacePattern: Pattern
+    ):
+        if not isinstance(compiledCorrectAnswers, list) or len(compiledCorrectAnswers) == 0:
+            raise TypeError(f'compiledCorrectAnswers argument is malformed: \"{compiledCorrectAnswers}\"')
+        elif not callable(variantGenerator):
+            raise TypeError(f'variantGenerator argument is malformed: \"{variantGenerator}\"')
+        elif not isinstance(whitespacePattern, Pattern):
+            raise TypeError(f'whitespacePattern argument is malformed: \"{whitespacePattern}\"')
+
+        self.__compiledCorrectAnswers: tuple[str, ...] = tuple(compiledCorrectAnswers)
+        self.__variantGenerator: Callable[[str], Iterable[str]] = variantGenerator
+        self.__whitespacePattern: Pattern = whitespacePattern
+
+        self.__compiledCorrectAnswersSet: frozenset[str] = frozenset(compiledCorrectAnswers)
+        self.__answerWordsList: list[list[str]] = list()
+        self.__answerWordVariants: dict[str, tuple[tuple[str, int], ...]] = dict()
+
+        for compiledCorrectAnswer in self.__compiledCorrectAnswers:
+            answerWords = self.splitWords(compiledCorrectAnswer)
+            self.__answerWordsList.append(answerWords)
+
+            for answerWord in answerWords:
+                self.__getAnswerWordVariants(answerWord)
+
+    def __buildWordVariants(self, word: str) -> tuple[tuple[str, int], ...]:
+        variants = dict.fromkeys(self.__variantGenerator(word))
+        return tuple(sorted(((variant, len(variant)) for variant in variants), key = lambda variant: variant[1]))
+
+    def __compareWords(
+        self,
+        guessWord: str,
+        answerWord: str,
+        thresholdGrowthRate: int,
+        guessWordVariantsCache: dict[str, tuple[tuple[str, int], ...]],
+        comparisonsCache: dict[tuple[str, str], bool]
+    ) -> bool:
+        comparisonKey = (guessWord, answerWord)
+        isMatch = comparisonsCache.get(comparisonKey, None)
+
+        if isMatch is not None:
+            return isMatch
+
+        guessWordVariants = guessWordVariantsCache.get(guessWord, None)
+
+        if guessWordVariants is None:
+            guessWordVariants = self.__buildWordVariants(guessWord)
+            guessWordVariantsCache[guessWord] = guessWordVariants
+
+        isMatch = self.__compareWordVariants(
+            guessWordVariants = guessWordVariants,
+            answerWordVariants = self.__getAnswerWordVariants(answerWord),
+            thresholdGrowthRate = thresholdGrowthRate
+        )
+
+        comparisonsCache[comparisonKey] = isMatch
+        return isMatch
+
+    def __compareWordVariants(
+        self,
+        guessWordVariants: tuple[tuple[str, int], ...],
+        answerWordVariants: tuple[tuple[str, int], ...],
+        thresholdGrowthRate: int
+    ) -> bool:
+        for guessVariant, guessVariantLength in guessWordVariants:
+            # the threshold is based on the shorter word's length, so once the answer variants
+            # (which are in ascending length order) are longer than the guess variant by more
+            # than the threshold, no further answer variant can possibly match
+            maxLongerLength = guessVariantLength + math.floor(guessVariantLength / thresholdGrowthRate)
+
+            for answerVariant, answerVariantLength in answerWordVariants:
+                if answerVariantLength > maxLongerLength:
+                    break
+
+                threshold = math.floor(min(guessVariantLength, answerVariantLength) / thresholdGrowthRate)
+
+                if guessVariantLength - answerVariantLength > threshold:
+                    # the Levenshtein distance can never be smaller than the length difference
+                    continue
+                elif polyleven.levenshtein(guessVariant, answerVariant, threshold + 1) <= threshold:
+                    return True
+
+        return False
+
+    @property
+    def compiledCorrectAnswers(self) -> list[str]:
+        return list(self.__compiledCorrectAnswers)
+
+    def __getAnswerWordVariants(self, answerWord: str) -> tuple[tuple[str, int], ...]:
+        answerWordVariants = self.__answerWordVariants.get(answerWord, None)
+
+        if answerWordVariants is None:
+            answerWordVariants = self.__buildWordVariants(answerWord)
+            self.__answerWordVariants[answerWord] = answerWordVariants
+
+        return answerWordVariants
+
+    def isMatch(
+        self,
+        expandedUserAnswers: list[str],
+        thresholdGrowthRate: int
+    ) -> bool:
+        if not isinstance(expandedUserAnswers, list):
+            raise TypeError(f'expandedUserAnswers argument is malformed: \"{expandedUserAnswers}\"')
+        elif not utils.isValidInt(thresholdGrowthRate):
+            raise TypeError(f'thresholdGrowthRate argument is malformed: \"{thresholdGrowthRate}\"')
+        elif thresholdGrowthRate < 1 or thresholdGrowthRate > utils.getIntMaxSafeSize():
+            raise ValueError(f'thresholdGrowthRate argument is out of bounds: {thresholdGrowthRate}')
+
+        for expandedUserAnswer in expandedUserAnswers:
+            if expandedUserAnswer in self.__compiledCorrectAnswersSet:
+                return True
+
+        guessWordVariantsCache: dict[str, tuple[tuple[str, int], ...]] = dict()
+        comparisonsCache: dict[tuple[str, str], bool] = dict()
+
+        for expandedUserAnswer in expandedUserAnswers:
+            guessWords = self.splitWords(expandedUserAnswer)
+
+            for answerWords in self.__answerWordsList:
+                if self.__isAlignmentMatch(
+                    guessWords = guessWords,
+                    answerWords = answerWords,
+                    thresholdGrowthRate = thresholdGrowthRate,
+                    guessWordVariantsCache = guessWordVariantsCache,
+                    comparisonsCache = comparisonsCache
+                ):
+                    return True
+
+        return False
+
+    # Checks if the longer of the two word lists can be split up into consecutive groups of words,
+    # one group for each word of the shorter list, such that each group (with its words merged
+    # together) matches its corresponding word from the shorter list. For example, the guess
+    # ["wal", "mart"] and the answer ["walmart"] can be aligned as ["walmart"] and ["walmart"].
+    #
+    # Rather than trying every possible grouping (of which there are exponentially many), this
+    # walks through the shorter list one word at a time, tracking the set of positions in the
+    # longer list that the groups so far can end at. This means that each possible group is only
+    # ever compared against each word once, for a total of O(longer² × shorter) comparisons.
+    def __isAlignmentMatch(
+        self,
+        guessWords: list[str],
+        answerWords: list[str],
+        thresholdGrowthRate: int,
+        guessWordVariantsCache: dict[str, tuple[tuple[str, int], ...]],
+        comparisonsCache: dict[tuple[str, str], bool]
+    ) -> bool:
+        isGuessLonger = len(guessWords) >= len(answerWords)
+
+        if isGuessLonger:
+            longerWords = guessWords
+            shorterWords = answerWords
+        else:
+            longerWords = answerWords
+            shorterWords = guessWords
+
+        longerLength = len(longerWords)
+        shorterLength = len(shorterWords)
+        alignedEnds: set[int] = { 0 }
+
+        for shorterIndex, shorterWord in enumerate(shorterWords):
+            # every word of the shorter list that comes after this one needs at least one word
+            remainingShorterWords = shorterLength - shorterIndex - 1
+            nextAlignedEnds: set[int] = set()
+
+            for start in alignedEnds:
+                if remainingShorterWords == 0:
+                    # the final group has to take all of the remaining words
+                    ends = range(longerLength, longerLength + 1)
+                else:
+                    ends = range(start + 1, longerLength - remainingShorterWords + 1)
+
+                for end in ends:
+                    if end in nextAlignedEnds:
+                        continue
+
+                    mergedWord = ''.join(longerWords[start:end])
+
+                    if isGuessLonger:
+                        isMatch = self.__compareWords(
+                            guessWord = mergedWord,
+                            answerWord = shorterWord,
+                            thresholdGrowthRate = thresholdGrowthRate,
+                            guessWordVariantsCache = guessWordVariantsCache,
+                            comparisonsCache = comparisonsCache
+                        )
+                    else:
+                        isMatch = self.__compareWords(
+                            guessWord = shorterWord,
+                            answerWord = mergedWord,
+                            thresholdGrowthRate = thresholdGrowthRate,
+                            guessWordVariantsCache = guessWordVariantsCache,
+                            comparisonsCache = comparisonsCache
+                        )
+
+                    if isMatch:
+                        nextAlignedEnds.add(end)
+
+            if len(nextAlignedEnds) == 0:
+                return False
+
+            alignedEnds = nextAlignedEnds
+
+        return longerLength in alignedEnds
+
+    def splitWords(self, answer: str) -> list[str]:
+        return self.__whitespacePattern.sub(' ', answer).split(' ')
+
@@ -1,9 +1,8 @@
 import asyncio
-import queue
 import traceback
+from collections import defaultdict
 from datetime import datetime, timedelta
-from queue import SimpleQueue
-from typing import Any
+from typing import Any, Callable
 
 from .actions.absTriviaAction import AbsTriviaAction
 from .actions.checkAnswerTriviaAction import CheckAnswerTriviaAction
@@ -32,7 +31,6 @@ from .events.outOfTimeSuperTriviaEvent import OutOfTimeSuperTriviaEvent
 from .events.outOfTimeTriviaEvent import OutOfTimeTriviaEvent
 from .events.superGameNotReadyCheckAnswerTriviaEvent import SuperGameNotReadyCheckAnswerTriviaEvent
 from .events.wrongUserCheckAnswerTriviaEvent import WrongUserCheckAnswerTriviaEvent
-from .games.absTriviaGameState import AbsTriviaGameState
 from .games.queuedTriviaGameStoreInterface import QueuedTriviaGameStoreInterface
 from .games.superTriviaGameState import SuperTriviaGameState
 from .games.triviaGameState import TriviaGameState
@@ -59,6 +57,7 @@ from ..cuteness.cutenessRepositoryInterface import CutenessRepositoryInterface
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.batchingQueue import BatchingQueue
 from ..timber.timberInterface import TimberInterface
 from ..twitch.twitchTokensRepositoryInterface import TwitchTokensRepositoryInterface
 from ..users.userIdsRepositoryInterface import UserIdsRepositoryInterface
@@ -66,6 +65,15 @@ from ..users.userIdsRepositoryInterface import UserIdsRepositoryInterface
 
 class TriviaGameMachine(TriviaGameMachineInterface):
 
+    # Every Twitch channel gets its own actor: an ordered action queue, plus a background task that
+    # works through it. Actions for a single channel are still handled strictly one at a time and in
+    # the order they were submitted, but a slow answer check or question fetch in one channel no
+    # longer holds up any other channel. Rather than scanning every trivia game on a fixed interval,
+    # each actor asks the trivia game store when its soonest game runs out of time, and sleeps until
+    # either then or until a new action arrives. Only deferred actions and queued super trivia
+    # games, which wait on a delay or a cooldown, still make an actor check back every
+    # sleepTimeSeconds.
+
     def __init__(
         self,
         backgroundTaskHelper: BackgroundTaskHelperInterface,
@@ -86,8 +94,9 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         triviaTwitchEmoteHelper: TriviaTwitchEmoteHelperInterface,
         twitchTokensRepository: TwitchTokensRepositoryInterface,
         userIdsRepository: UserIdsRepositoryInterface,
+        clock: Callable[[], datetime] | None = None,
         sleepTimeSeconds: float = 0.5,
-        queueTimeoutSeconds: int = 3
+        maxQueueSize: int = 1000
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -125,14 +134,16 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             raise TypeError(f'twitchTokensRepositoryInterface argument is malformed: \"{twitchTokensRepository}\"')
         elif not isinstance(userIdsRepository, UserIdsRepositoryInterface):
             raise TypeError(f'userIdsRepository argument is malformed: \"{userIdsRepository}\"')
+        elif clock is not None and not callable(clock):
+            raise TypeError(f'clock argument is malformed: \"{clock}\"')
         elif not utils.isValidNum(sleepTimeSeconds):
             raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
         elif sleepTimeSeconds < 0.25 or sleepTimeSeconds > 3:
             raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
-        elif not utils.isValidInt(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
+        elif not utils.isValidInt(maxQueueSize):
+            raise TypeError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
 
         self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__cutenessRepository: CutenessRepositoryInterface = cutenessRepository
@@ -152,13 +163,15 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         self.__triviaTwitchEmoteHelper: TriviaTwitchEmoteHelperInterface = triviaTwitchEmoteHelper
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
+        self.__clock: Callable[[], datetime] | None = clock
         self.__sleepTimeSeconds: float = sleepTimeSeconds
-        self.__queueTimeoutSeconds: int = queueTimeoutSeconds
+        self.__maxQueueSize: int = maxQueueSize
 
         self.__isStarted: bool = False
         self.__eventListener: TriviaEventListener | None = None
-        self.__actionQueue: SimpleQueue[AbsTriviaAction] = SimpleQueue()
-        self.__eventQueue: SimpleQueue[AbsTriviaEvent] = SimpleQueue()
+        self.__channelActionQueues: dict[str, BatchingQueue[AbsTriviaAction]] = dict()
+        self.__channelDeferredActions: dict[str, list[AbsTriviaAction]] = defaultdict(lambda: list())
+        self.__eventQueue: BatchingQueue[AbsTriviaEvent] = BatchingQueue(maxSize = maxQueueSize)
 
     async def __applyToxicSuperTriviaPunishment(
         self,
@@ -226,20 +239,23 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             toxicTriviaPunishments = toxicTriviaPunishments,
         )
 
-    async def __beginQueuedTriviaGames(self):
-        activeChannelIdsSet: set[str] = set()
-        activeChannelIdsSet.update(await self.__triviaGameStore.getTwitchChannelIdsWithActiveSuperGames())
-        activeChannelIdsSet.update(await self.__superTriviaCooldownHelper.getTwitchChannelIdsInCooldown())
+    async def __beginQueuedTriviaGame(self, twitchChannelId: str):
+        if await self.__triviaGameStore.getSuperGame(twitchChannelId) is not None:
+            return
+        elif self.__superTriviaCooldownHelper.isTwitchChannelInCooldown(twitchChannelId):
+            return
 
-        queuedSuperGames = await self.__queuedTriviaGameStore.popQueuedSuperGames(activeChannelIdsSet)
+        queuedSuperGame = await self.__queuedTriviaGameStore.popQueuedSuperGame(twitchChannelId)
 
-        for queuedSuperGame in queuedSuperGames:
-            remainingQueueSize = await self.__queuedTriviaGameStore.getQueuedSuperGamesSize(
-                twitchChannelId = queuedSuperGame.getTwitchChannelId()
-            )
+        if queuedSuperGame is None:
+            return
+
+        remainingQueueSize = await self.__queuedTriviaGameStore.getQueuedSuperGamesSize(
+            twitchChannelId = twitchChannelId
+        )
 
-            self.__timber.log('TriviaGameMachine', f'Starting new queued super trivia game for \"{queuedSuperGame.getTwitchChannel()}\", with {remainingQueueSize} game(s) remaining in their queue ({queuedSuperGame.actionId=})')
-            await self.__handleActionStartNewSuperTriviaGame(queuedSuperGame)
+        self.__timber.log('TriviaGameMachine', f'Starting new queued super trivia game for \"{queuedSuperGame.getTwitchChannel()}\", with {remainingQueueSize} game(s) remaining in their queue ({queuedSuperGame.actionId=})')
+        await self.__handleActionStartNewSuperTriviaGame(queuedSuperGame)
 
     async def __checkAnswer(
         self,
@@ -256,6 +272,62 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             extras = extras
         )
 
+    def __getChannelActionQueue(self, twitchChannelId: str) -> BatchingQueue[AbsTriviaAction]:
+        actionQueue = self.__channelActionQueues.get(twitchChannelId, None)
+
+        if actionQueue is None:
+            actionQueue = BatchingQueue(maxSize = self.__maxQueueSize)
+            self.__channelActionQueues[twitchChannelId] = actionQueue
+
+            if self.__isStarted:
+                self.__backgroundTaskHelper.createTask(self.__startChannelActionLoop(twitchChannelId, actionQueue))
+
+        return actionQueue
+
+    async def __getChannelSleepTimeSeconds(self, twitchChannelId: str) -> float | None:
+        sleepTimeSeconds: float | None = None
+        nextEndTime = await self.__triviaGameStore.getNextEndTime(twitchChannelId)
+
+        if nextEndTime is not None:
+            now = self.__now()
+            sleepTimeSeconds = max(0, (nextEndTime - now).total_seconds())
+
+        deferredActions = self.__channelDeferredActions.get(twitchChannelId, None)
+
+        if (deferredActions is not None and len(deferredActions) >= 1) or await self.__queuedTriviaGameStore.getQueuedSuperGamesSize(twitchChannelId) >= 1:
+            if sleepTimeSeconds is None or sleepTimeSeconds > self.__sleepTimeSeconds:
+                sleepTimeSeconds = self.__sleepTimeSeconds
+
+        return sleepTimeSeconds
+
+    def __getTwitchChannelId(self, action: AbsTriviaAction) -> str:
+        if isinstance(action, CheckAnswerTriviaAction):
+            return action.getTwitchChannelId()
+        elif isinstance(action, CheckSuperAnswerTriviaAction):
+            return action.getTwitchChannelId()
+        elif isinstance(action, ClearSuperTriviaQueueTriviaAction):
+            return action.twitchChannelId
+        elif isinstance(action, StartNewTriviaGameAction):
+            return action.getTwitchChannelId()
+        elif isinstance(action, StartNewSuperTriviaGameAction):
+            return action.getTwitchChannelId()
+        else:
+            raise UnknownTriviaActionTypeException(f'Unknown TriviaActionType: \"{type(action)=}\"')
+
+    async def __handleAction(self, action: AbsTriviaAction):
+        if isinstance(action, CheckAnswerTriviaAction):
+            await self.__handleActionCheckAnswer(action)
+        elif isinstance(action, CheckSuperAnswerTriviaAction):
+            await self.__handleActionCheckSuperAnswer(action)
+        elif isinstance(action, ClearSuperTriviaQueueTriviaAction):
+            await self.__handleActionClearSuperTriviaQueue(action)
+        elif isinstance(action, StartNewTriviaGameAction):
+            await self.__handleActionStartNewTriviaGame(action)
+        elif isinstance(action, StartNewSuperTriviaGameAction):
+            await self.__handleActionStartNewSuperTriviaGame(action)
+        else:
+            raise UnknownTriviaActionTypeException(f'Unknown TriviaActionType: \"{type(action)=}\"')
+
     async def __handleActionCheckAnswer(self, action: CheckAnswerTriviaAction):
         if not isinstance(action, CheckAnswerTriviaAction):
             raise TypeError(f'action argument is malformed: \"{action}\"')
@@ -432,18 +504,32 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
         state.incrementAnswerCount(action.getUserId())
 
-        checkResult = await self.__checkAnswer(
+        answerMemoKey = await self.__triviaAnswerChecker.compileAnswerMemoKey(
             answer = action.answer,
-            triviaQuestion = state.getTriviaQuestion(),
-            extras = {
-                'actionId': action.actionId,
-                'twitchChannel': action.getTwitchChannel(),
-                'twitchChannelId': action.getTwitchChannelId(),
-                'userId': action.getUserId(),
-                'userName': action.getUserName()
-            }
+            triviaQuestion = state.getTriviaQuestion()
         )
 
+        checkResult: TriviaAnswerCheckResult | None = None
+
+        if answerMemoKey is not None:
+            checkResult = state.getCheckedAnswer(answerMemoKey)
+
+        if checkResult is None:
+            checkResult = await self.__checkAnswer(
+                answer = action.answer,
+                triviaQuestion = state.getTriviaQuestion(),
+                extras = {
+                    'actionId': action.actionId,
+                    'twitchChannel': action.getTwitchChannel(),
+                    'twitchChannelId': action.getTwitchChannelId(),
+                    'userId': action.getUserId(),
+                    'userName': action.getUserName()
+                }
+            )
+
+            if answerMemoKey is not None:
+                state.setCheckedAnswer(answerMemoKey, checkResult)
+
         # we're intentionally ONLY checking for TriviaAnswerCheckResult.CORRECT
         if checkResult is not TriviaAnswerCheckResult.CORRECT:
             await self.__submitEvent(IncorrectSuperAnswerTriviaEvent(
@@ -465,6 +551,8 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             twitchChannelId = action.getTwitchChannelId()
         )
 
+        self.__logCheckedAnswerStats(state)
+
         toxicTriviaPunishmentResult: ToxicTriviaPunishmentResult | None = None
         pointsForWinning = state.getPointsForWinning()
 
@@ -560,7 +648,7 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         elif action.triviaActionType is not TriviaActionType.START_NEW_GAME:
             raise RuntimeError(f'TriviaActionType is not {TriviaActionType.START_NEW_GAME}: \"{action.triviaActionType}\"')
 
-        now = datetime.now(self.__timeZoneRepository.getDefault())
+        now = self.__now()
         state = await self.__triviaGameStore.getNormalGame(
             twitchChannelId = action.getTwitchChannelId(),
             userId = action.getUserId()
@@ -614,7 +702,9 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             specialTriviaStatus = SpecialTriviaStatus.SHINY
             pointsForWinning = pointsForWinning * action.getShinyMultiplier()
 
-        endTime = datetime.now(self.__timeZoneRepository.getDefault()) + timedelta(seconds = action.getSecondsToLive())
+        endTime = self.__now() + timedelta(seconds = action.getSecondsToLive())
+
+        self.__triviaAnswerChecker.prepareAnswerMatcher(triviaQuestion)
 
         state = TriviaGameState(
             triviaQuestion = triviaQuestion,
@@ -655,17 +745,17 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         elif action.triviaActionType is not TriviaActionType.START_NEW_SUPER_GAME:
             raise RuntimeError(f'TriviaActionType is not {TriviaActionType.START_NEW_SUPER_GAME}: \"{action.triviaActionType}\"')
 
-        now = datetime.now(self.__timeZoneRepository.getDefault())
+        now = self.__now()
         superTriviaFirstQuestionDelay = timedelta(
             seconds = await self.__triviaSettingsRepository.getSuperTriviaFirstQuestionDelaySeconds()
         )
 
         if action.creationTime + superTriviaFirstQuestionDelay >= now:
-            # Let's re-add this action back into the queue to try processing again later, as this action
+            # Let's defer this action to try processing it again later, as this action
             # was created too recently. We don't want super trivia questions to start instantaneously, as
             # it could mean that some people in chat are not ready to answer at first. So this minor delay
             # helps prevent such a situation.
-            self.submitAction(action)
+            self.__channelDeferredActions[action.getTwitchChannelId()].append(action)
             return
 
         state = await self.__triviaGameStore.getSuperGame(
@@ -695,12 +785,12 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
         if isSuperTriviaGameCurrentlyInProgress:
             return
-        elif self.__superTriviaCooldownHelper.isTwitchChannelInCooldown(action.getTwitchChannel()):
-            # Let's re-add this action back into the queue to try processing again later, as this Twitch
+        elif self.__superTriviaCooldownHelper.isTwitchChannelInCooldown(action.getTwitchChannelId()):
+            # Let's defer this action to try processing it again later, as this Twitch
             # channel is on cooldown. This situation occurs if this Twitch channel just finished answering
             # a super trivia question, and prevents us from just immediately jumping into the next super
             # trivia question.
-            self.submitAction(action)
+            self.__channelDeferredActions[action.getTwitchChannelId()].append(action)
             return
 
         emote = await self.__triviaEmoteGenerator.getNextEmoteFor(
@@ -739,7 +829,9 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             specialTriviaStatus = SpecialTriviaStatus.TOXIC
             pointsForWinning = pointsForWinning * action.getToxicMultiplier()
 
-        endTime = datetime.now(self.__timeZoneRepository.getDefault()) + timedelta(seconds = action.getSecondsToLive())
+        endTime = self.__now() + timedelta(seconds = action.getSecondsToLive())
+
+        self.__triviaAnswerChecker.prepareAnswerMatcher(triviaQuestion)
 
         state = SuperTriviaGameState(
             triviaQuestion = triviaQuestion,
@@ -773,36 +865,50 @@ class TriviaGameMachine(TriviaGameMachineInterface):
             twitchChannelId = action.getTwitchChannelId()
         ))
 
-    async def __refreshStatusOfTriviaGames(self):
-        await self.__removeDeadTriviaGames()
-        await self.__beginQueuedTriviaGames()
+    def __logCheckedAnswerStats(self, state: SuperTriviaGameState):
+        checkedAnswerHits = state.getCheckedAnswerHits()
+        checkedAnswerMisses = state.getCheckedAnswerMisses()
+
+        if checkedAnswerHits + checkedAnswerMisses == 0:
+            return
 
-    async def __removeDeadTriviaGames(self):
-        now = datetime.now(self.__timeZoneRepository.getDefault())
-        gameStates = await self.__triviaGameStore.getAll()
-        gameStatesToRemove: list[AbsTriviaGameState] = list()
+        self.__timber.log('TriviaGameMachine', f'Super trivia game answer memo stats for \"{state.getTwitchChannel()}\" ({state.getGameId()=}) ({checkedAnswerHits=}) ({checkedAnswerMisses=})')
 
-        for state in gameStates:
-            if state.endTime < now:
-                gameStatesToRemove.append(state)
+    def __now(self) -> datetime:
+        clock = self.__clock
 
-        for state in gameStatesToRemove:
-            if isinstance(state, TriviaGameState):
-                await self.__removeDeadNormalTriviaGame(state)
-            elif isinstance(state, SuperTriviaGameState):
-                await self.__removeDeadSuperTriviaGame(state)
-            else:
-                raise UnknownTriviaGameTypeException(f'Unknown TriviaGameType ({state.getGameId()=}) ({state.getTwitchChannel()=}) ({state.actionId=}): \"{state.getTriviaGameType()}\"')
+        if clock is None:
+            return datetime.now(self.__timeZoneRepository.getDefault())
+        else:
+            return clock()
+
+    async def __refreshStatusOfTriviaGames(self, twitchChannelId: str):
+        await self.__removeDeadTriviaGames(twitchChannelId)
+        await self.__beginQueuedTriviaGame(twitchChannelId)
+
+    async def __removeDeadTriviaGames(self, twitchChannelId: str):
+        expiredGames = await self.__triviaGameStore.removeExpiredGames(
+            twitchChannelId = twitchChannelId,
+            now = self.__now()
+        )
+
+        for state in expiredGames:
+            # these games have already been taken out of the store, so one failing here mustn't
+            # stop the rest from getting their out of time events (and scores) handled
+            try:
+                if isinstance(state, TriviaGameState):
+                    await self.__removeDeadNormalTriviaGame(state)
+                elif isinstance(state, SuperTriviaGameState):
+                    await self.__removeDeadSuperTriviaGame(state)
+                else:
+                    raise UnknownTriviaGameTypeException(f'Unknown TriviaGameType ({state.getGameId()=}) ({state.getTwitchChannel()=}) ({state.actionId=}): \"{state.getTriviaGameType()}\"')
+            except Exception as e:
+                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when removing dead trivia game ({twitchChannelId=}) ({state.getGameId()=}) ({state.getTriviaGameType()=}): {e}', e, traceback.format_exc())
 
     async def __removeDeadNormalTriviaGame(self, state: TriviaGameState):
         if not isinstance(state, TriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        await self.__removeNormalTriviaGame(
-            twitchChannelId = state.getTwitchChannelId(),
-            userId = state.getUserId()
-        )
-
         outOfTimeEmote = await self.__triviaTwitchEmoteHelper.getOutOfTimeEmote()
 
         triviaScoreResult = await self.__triviaScoreRepository.incrementTriviaLosses(
@@ -831,9 +937,8 @@ class TriviaGameMachine(TriviaGameMachineInterface):
         if not isinstance(state, SuperTriviaGameState):
             raise TypeError(f'state argument is malformed: \"{state}\"')
 
-        await self.__removeSuperTriviaGame(
-            twitchChannelId = state.getTwitchChannelId()
-        )
+        await self.__superTriviaCooldownHelper.update(state.getTwitchChannelId())
+        self.__logCheckedAnswerStats(state)
 
         toxicTriviaPunishmentResult: ToxicTriviaPunishmentResult | None = None
         pointsForWinning = state.getPointsForWinning()
@@ -892,61 +997,46 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
         self.__eventListener = listener
 
-    async def __startActionLoop(self):
+    async def __startChannelActionLoop(
+        self,
+        twitchChannelId: str,
+        actionQueue: BatchingQueue[AbsTriviaAction]
+    ):
         while True:
-            actions: list[AbsTriviaAction] = list()
+            sleepTimeSeconds = await self.__getChannelSleepTimeSeconds(twitchChannelId)
+            newActions = await actionQueue.getBatch(sleepTimeSeconds)
 
-            try:
-                while not self.__actionQueue.empty():
-                    actions.append(self.__actionQueue.get_nowait())
-            except queue.Empty as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up actions list (queue size: {self.__actionQueue.qsize()}) (actions size: {len(actions)}): {e}', e)
+            # deferred actions were submitted before anything new, so they go first
+            actions = self.__channelDeferredActions.pop(twitchChannelId, list())
+            actions.extend(newActions)
 
-            try:
-                for action in actions:
-
-                    if isinstance(action, CheckAnswerTriviaAction):
-                        await self.__handleActionCheckAnswer(action)
-                    elif isinstance(action, CheckSuperAnswerTriviaAction):
-                        await self.__handleActionCheckSuperAnswer(action)
-                    elif isinstance(action, ClearSuperTriviaQueueTriviaAction):
-                        await self.__handleActionClearSuperTriviaQueue(action)
-                    elif isinstance(action, StartNewTriviaGameAction):
-                        await self.__handleActionStartNewTriviaGame(action)
-                    elif isinstance(action, StartNewSuperTriviaGameAction):
-                        await self.__handleActionStartNewSuperTriviaGame(action)
-                    else:
-                        raise UnknownTriviaActionTypeException(f'Unknown TriviaActionType: \"{type(action)=}\"')
-            except Exception as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through actions (queue size: {self.__actionQueue.qsize()}) (actions size: {len(actions)}): {e}', e, traceback.format_exc())
+            for action in actions:
+                try:
+                    await self.__handleAction(action)
+                except Exception as e:
+                    self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when handling action ({twitchChannelId=}) (queue size: {actionQueue.qsize()}) ({action=}): {e}', e, traceback.format_exc())
 
             try:
-                await self.__refreshStatusOfTriviaGames()
+                await self.__refreshStatusOfTriviaGames(twitchChannelId)
             except Exception as e:
-                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when refreshing status of trivia games: {e}', e, traceback.format_exc())
-
-            await asyncio.sleep(self.__sleepTimeSeconds)
+                self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when refreshing status of trivia games ({twitchChannelId=}): {e}', e, traceback.format_exc())
 
     async def __startEventLoop(self):
         while True:
             eventListener = self.__eventListener
 
-            if eventListener is not None:
-                events: list[AbsTriviaEvent] = list()
+            if eventListener is None:
+                # leave any events in the queue until there is someone around to hear them
+                await asyncio.sleep(self.__sleepTimeSeconds)
+                continue
 
-                try:
-                    while not self.__eventQueue.empty():
-                        events.append(self.__eventQueue.get_nowait())
-                except queue.Empty as e:
-                    self.__timber.log('TriviaGameMachine', f'Encountered queue.Empty when building up events list (queue size: {self.__eventQueue.qsize()}) ({events=}): {e}', e, traceback.format_exc())
-
-                for event in events:
-                    try:
-                        await eventListener.onNewTriviaEvent(event)
-                    except Exception as e:
-                        self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through events (queue size: {self.__eventQueue.qsize()}) ({event=}): {e}', e, traceback.format_exc())
+            events = await self.__eventQueue.getBatch(self.__sleepTimeSeconds)
 
-            await asyncio.sleep(self.__sleepTimeSeconds)
+            for event in events:
+                try:
+                    await eventListener.onNewTriviaEvent(event)
+                except Exception as e:
+                    self.__timber.log('TriviaGameMachine', f'Encountered unknown Exception when looping through events (queue size: {self.__eventQueue.qsize()}) ({event=}): {e}', e, traceback.format_exc())
 
     def startMachine(self):
         if self.__isStarted:
@@ -955,23 +1045,24 @@ class TriviaGameMachine(TriviaGameMachineInterface):
 
         self.__isStarted = True
         self.__timber.log('TriviaGameMachine', 'Starting TriviaGameMachine...')
-        self.__backgroundTaskHelper.createTask(self.__startActionLoop())
         self.__backgroundTaskHelper.createTask(self.__startEventLoop())
 
+        for twitchChannelId, actionQueue in self.__channelActionQueues.items():
+            self.__backgroundTaskHelper.createTask(self.__startChannelActionLoop(twitchChannelId, actionQueue))
+
     def submitAction(self, action: AbsTriviaAction):
         if not isinstance(action, AbsTriviaAction):
             raise TypeError(f'action argument is malformed: \"{action}\"')
 
-        try:
-            self.__actionQueue.put(action, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new action ({action}) into the action queue (queue size: {self.__actionQueue.qsize()}): {e}', e, traceback.format_exc())
+        twitchChannelId = self.__getTwitchChannelId(action)
+        actionQueue = self.__getChannelActionQueue(twitchChannelId)
+
+        if not actionQueue.put(action):
+            self.__timber.log('TriviaGameMachine', f'Dropped action ({action}) as the action queue for this channel is full ({twitchChannelId=}) ({actionQueue.getMetrics()=})')
 
     async def __submitEvent(self, event: AbsTriviaEvent):
         if not isinstance(event, AbsTriviaEvent):
             raise TypeError(f'event argument is malformed: \"{event}\"')
 
-        try:
-            self.__eventQueue.put(event, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TriviaGameMachine', f'Encountered queue.Full when submitting a new event ({event}) into the event queue (queue size: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+        if not self.__eventQueue.put(event):
+            self.__timber.log('TriviaGameMachine', f'Dropped event ({event}) as the event queue is full ({self.__eventQueue.getMetrics()=})')
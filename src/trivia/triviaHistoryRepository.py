@@ -1,3 +1,4 @@
+import asyncio
 from datetime import datetime, timedelta
 
 from .content.triviaContentCode import TriviaContentCode
@@ -9,21 +10,30 @@ from .triviaHistoryRepositoryInterface import TriviaHistoryRepositoryInterface
 from .triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
+from ..misc.bloomFilter import BloomFilter
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..timber.timberInterface import TimberInterface
 
 
 class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
 
+    # Most trivia questions that get verified have never been asked in that channel before. To
+    # avoid a database round trip for every one of those, each channel gets a Bloom filter of all
+    # the questions it has ever been asked. It's seeded from the database on first use, and then
+    # kept in sync as new history is written. A question that the filter says is definitely new
+    # is inserted straight away, and only probable repeats go through the full lookup. This
+    # relies on this process being the only writer of the triviahistory table.
+
     def __init__(
         self,
         backingDatabase: BackingDatabase,
         timber: TimberInterface,
         timeZoneRepository: TimeZoneRepositoryInterface,
         triviaQuestionTypeParser: TriviaQuestionTypeParserInterface,
-        triviaSettingsRepository: TriviaSettingsRepositoryInterface
+        triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        historyFilterFalsePositiveRate: float = 0.01,
+        minHistoryFilterCapacity: int = 4096
     ):
         if not isinstance(backingDatabase, BackingDatabase):
             raise TypeError(f'backingDatabase argument is malformed: \"{backingDatabase}\"')
@@ -35,19 +45,92 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
             raise TypeError(f'triviaQuestionTypeParser argument is malformed: \"{triviaQuestionTypeParser}\"')
         elif not isinstance(triviaSettingsRepository, TriviaSettingsRepositoryInterface):
             raise TypeError(f'triviaSettingsRepository argument is malformed: \"{triviaSettingsRepository}\"')
+        elif not utils.isValidNum(historyFilterFalsePositiveRate):
+            raise TypeError(f'historyFilterFalsePositiveRate argument is malformed: \"{historyFilterFalsePositiveRate}\"')
+        elif historyFilterFalsePositiveRate <= 0 or historyFilterFalsePositiveRate >= 1:
+            raise ValueError(f'historyFilterFalsePositiveRate argument is out of bounds: {historyFilterFalsePositiveRate}')
+        elif not utils.isValidInt(minHistoryFilterCapacity):
+            raise TypeError(f'minHistoryFilterCapacity argument is malformed: \"{minHistoryFilterCapacity}\"')
+        elif minHistoryFilterCapacity < 16 or minHistoryFilterCapacity > utils.getIntMaxSafeSize():
+            raise ValueError(f'minHistoryFilterCapacity argument is out of bounds: {minHistoryFilterCapacity}')
 
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__triviaQuestionTypeParser: TriviaQuestionTypeParserInterface = triviaQuestionTypeParser
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
+        self.__historyFilterFalsePositiveRate: float = historyFilterFalsePositiveRate
+        self.__minHistoryFilterCapacity: int = minHistoryFilterCapacity
+
+        self.__historyFilters: dict[str, BloomFilter] = dict()
+        self.__historyFiltersLock: asyncio.Lock = asyncio.Lock()
+
+    async def __createHistoryFilter(
+        self,
+        connection: DatabaseConnection,
+        twitchChannelId: str
+    ) -> BloomFilter:
+        records = await connection.fetchRows(
+            '''
+                SELECT triviaid, triviasource, triviatype FROM triviahistory
+                WHERE twitchchannelid = $1
+            ''',
+            twitchChannelId
+        )
+
+        if records is None:
+            records = list()
+
+        # leave plenty of headroom, so that the filter isn't immediately rebuilt as new questions are asked
+        historyFilter = BloomFilter(
+            capacity = max(self.__minHistoryFilterCapacity, len(records) * 2),
+            falsePositiveRate = self.__historyFilterFalsePositiveRate
+        )
+
+        for record in records:
+            historyFilter.add(self.__createHistoryKey(
+                triviaId = record[0],
+                triviaSource = record[1],
+                triviaType = record[2]
+            ))
+
+        self.__timber.log('TriviaHistoryRepository', f'Seeded trivia history filter ({twitchChannelId=}) (entries: {len(records)}) (capacity: {historyFilter.capacity})')
+        return historyFilter
 
-        self.__isDatabaseReady: bool = False
+    def __createHistoryKey(
+        self,
+        triviaId: str,
+        triviaSource: str,
+        triviaType: str
+    ) -> str:
+        return f'{triviaSource}\x1f{triviaType}\x1f{triviaId}'
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
+    async def __getHistoryFilter(
+        self,
+        connection: DatabaseConnection,
+        twitchChannelId: str
+    ) -> BloomFilter:
+        historyFilter = self.__historyFilters.get(twitchChannelId, None)
+
+        if historyFilter is not None and not historyFilter.isSaturated:
+            return historyFilter
+
+        async with self.__historyFiltersLock:
+            historyFilter = self.__historyFilters.get(twitchChannelId, None)
+
+            if historyFilter is None or historyFilter.isSaturated:
+                historyFilter = await self.__createHistoryFilter(
+                    connection = connection,
+                    twitchChannelId = twitchChannelId
+                )
+
+                self.__historyFilters[twitchChannelId] = historyFilter
+
+        return historyFilter
+
     async def getMostRecentTriviaQuestionDetails(
         self,
         emote: str,
@@ -86,49 +169,6 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
             triviaType = await self.__triviaQuestionTypeParser.parse(record[3])
         )
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviahistory (
-                            datetime text NOT NULL,
-                            emote text NOT NULL,
-                            triviaid text NOT NULL,
-                            triviasource text NOT NULL,
-                            triviatype text NOT NULL,
-                            twitchchannelid text NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS triviahistory (
-                            datetime TEXT NOT NULL,
-                            emote TEXT NOT NULL,
-                            triviaid TEXT NOT NULL,
-                            triviasource TEXT NOT NULL,
-                            triviatype TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL,
-                            PRIMARY KEY (triviaid, triviasource, triviatype, twitchchannelid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def verify(
         self,
         question: AbsTriviaQuestion,
@@ -151,7 +191,36 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
 
         triviaType = await self.__triviaQuestionTypeParser.serialize(question.triviaType)
 
+        historyKey = self.__createHistoryKey(
+            triviaId = question.triviaId,
+            triviaSource = workingTriviaSource.toStr(),
+            triviaType = triviaType
+        )
+
         connection = await self.__getDatabaseConnection()
+        historyFilter = await self.__getHistoryFilter(
+            connection = connection,
+            twitchChannelId = twitchChannelId
+        )
+
+        nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
+        nowDateTimeStr = nowDateTime.isoformat()
+
+        if historyKey not in historyFilter:
+            # this question has definitely never been asked in this channel before
+            await connection.execute(
+                '''
+                    INSERT INTO triviahistory (datetime, emote, triviaid, triviasource, triviatype, twitchchannelid)
+                    VALUES ($1, $2, $3, $4, $5, $6)
+                    ON CONFLICT (triviaid, triviasource, triviatype, twitchchannelid) DO NOTHING
+                ''',
+                nowDateTimeStr, emote, question.triviaId, workingTriviaSource.toStr(), triviaType, twitchChannelId
+            )
+
+            await connection.close()
+            historyFilter.add(historyKey)
+            return TriviaContentCode.OK
+
         record = await connection.fetchRow(
             '''
                 SELECT datetime FROM triviahistory
@@ -161,10 +230,8 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
             question.triviaId, workingTriviaSource.toStr(), triviaType, twitchChannelId
         )
 
-        nowDateTime = datetime.now(self.__timeZoneRepository.getDefault())
-        nowDateTimeStr = nowDateTime.isoformat()
-
         if record is None or len(record) == 0:
+            # the history filter gave a false positive
             await connection.execute(
                 '''
                     INSERT INTO triviahistory (datetime, emote, triviaid, triviasource, triviatype, twitchchannelid)
@@ -174,6 +241,7 @@ class TriviaHistoryRepository(TriviaHistoryRepositoryInterface):
             )
 
             await connection.close()
+            historyFilter.add(historyKey)
             return TriviaContentCode.OK
 
         questionDateTimeStr: str = record[0]
@@ -1,4 +1,5 @@
 import traceback
+from typing import Any
 
 import aiofiles
 import aiofiles.ospath
@@ -7,6 +8,7 @@ from aiosqlite import Connection
 
 from .absTriviaQuestionRepository import AbsTriviaQuestionRepository
 from .glacialTriviaQuestionRepositoryInterface import GlacialTriviaQuestionRepositoryInterface
+from .sqliteRowIdSampler import SqliteRowIdSampler
 from ..additionalAnswers.additionalTriviaAnswersRepositoryInterface import AdditionalTriviaAnswersRepositoryInterface
 from ..compilers.triviaAnswerCompilerInterface import TriviaAnswerCompilerInterface
 from ..compilers.triviaQuestionCompilerInterface import TriviaQuestionCompilerInterface
@@ -45,7 +47,8 @@ class GlacialTriviaQuestionRepository(
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
         twitchHandleProvider: TwitchHandleProviderInterface,
         userIdsRepository: UserIdsRepositoryInterface,
-        triviaDatabaseFile: str = 'glacialTriviaQuestionsDatabase.sqlite'
+        triviaDatabaseFile: str = 'glacialTriviaQuestionsDatabase.sqlite',
+        maxCompiledCorrectAnswers: int = 256
     ):
         super().__init__(triviaSettingsRepository)
 
@@ -63,6 +66,10 @@ class GlacialTriviaQuestionRepository(
             raise TypeError(f'userIdsRepository argument is malformed: \"{userIdsRepository}\"')
         elif not utils.isValidStr(triviaDatabaseFile):
             raise TypeError(f'triviaDatabaseFile argument is malformed: \"{triviaDatabaseFile}\"')
+        elif not utils.isValidInt(maxCompiledCorrectAnswers):
+            raise TypeError(f'maxCompiledCorrectAnswers argument is malformed: \"{maxCompiledCorrectAnswers}\"')
+        elif maxCompiledCorrectAnswers < 1 or maxCompiledCorrectAnswers > 4096:
+            raise ValueError(f'maxCompiledCorrectAnswers argument is out of bounds: {maxCompiledCorrectAnswers}')
 
         self.__additionalTriviaAnswersRepository: AdditionalTriviaAnswersRepositoryInterface = additionalTriviaAnswersRepository
         self.__timber: TimberInterface = timber
@@ -71,10 +78,28 @@ class GlacialTriviaQuestionRepository(
         self.__twitchHandleProvider: TwitchHandleProviderInterface = twitchHandleProvider
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
         self.__triviaDatabaseFile: str = triviaDatabaseFile
+        self.__maxCompiledCorrectAnswers: int = maxCompiledCorrectAnswers
+        self.__rowIdSampler: SqliteRowIdSampler = SqliteRowIdSampler(triviaDatabaseFile)
 
         self.__areTablesCreated: bool = False
         self.__hasQuestionSetAvailable: bool | None = None
         self.__twitchChannelId: str | None = None
+        self.__compiledCorrectAnswersCache: dict[tuple[str, str], tuple[tuple[str, ...], list[str], list[str]]] = dict()
+
+    async def __addAdditionalTriviaAnswers(
+        self,
+        correctAnswers: list[str],
+        triviaId: str,
+        triviaType: TriviaQuestionType,
+        originalTriviaSource: TriviaSource
+    ):
+        if await self.__additionalTriviaAnswersRepository.addAdditionalTriviaAnswers(
+            currentAnswers = correctAnswers,
+            triviaId = triviaId,
+            triviaQuestionType = triviaType,
+            triviaSource = originalTriviaSource
+        ):
+            self.__timber.log('GlacialTriviaQuestionRepository', f'Added additional answers to question ({triviaId=})')
 
     async def __buildCompiledCorrectAnswersForQuestionAnswerTrivia(
         self,
@@ -88,26 +113,31 @@ class GlacialTriviaQuestionRepository(
 
         return list(expandedCompiledCorrectAnswers)
 
-    async def __checkIfQuestionIsAlreadyStored(
+    async def __compileQuestionAnswerCorrectAnswers(
         self,
-        question: AbsTriviaQuestion,
-        connection: Connection
-    ) -> bool:
-        cursor = await connection.execute(
-            '''
-                SELECT EXISTS(
-                    SELECT 1 FROM glacialQuestions
-                    WHERE originalTriviaSource = $1 AND triviaId = $2
-                    LIMIT 1
-                )
-            ''',
-            (question.triviaSource.toStr(), question.triviaId, )
-        )
+        originalCorrectAnswers: list[str],
+        originalTriviaSource: TriviaSource,
+        triviaId: str
+    ) -> tuple[list[str], list[str]]:
+        # Compiling a question's answers is by far the most expensive part of loading it, so the
+        # results are kept around for as long as the question's answers remain the same. Note that
+        # the answers can change without the question itself changing, via additional answers.
+        cacheKey = (originalTriviaSource.toStr(), triviaId)
+        answersKey = tuple(originalCorrectAnswers)
+        cachedAnswers = self.__compiledCorrectAnswersCache.get(cacheKey, None)
+
+        if cachedAnswers is None or cachedAnswers[0] != answersKey:
+            correctAnswers = await self.__triviaQuestionCompiler.compileResponses(originalCorrectAnswers)
+            compiledCorrectAnswers = await self.__buildCompiledCorrectAnswersForQuestionAnswerTrivia(originalCorrectAnswers)
+            cachedAnswers = (answersKey, correctAnswers, compiledCorrectAnswers)
+            self.__compiledCorrectAnswersCache.pop(cacheKey, None)
+            self.__compiledCorrectAnswersCache[cacheKey] = cachedAnswers
 
-        row = await cursor.fetchone()
-        await cursor.close()
+            while len(self.__compiledCorrectAnswersCache) > self.__maxCompiledCorrectAnswers:
+                # dicts retain their insertion order, so this evicts the least recently compiled answers
+                del self.__compiledCorrectAnswersCache[next(iter(self.__compiledCorrectAnswersCache))]
 
-        return row is not None and len(row) >= 1 and utils.isValidInt(row[0]) and row[0] == 1
+        return list(cachedAnswers[1]), list(cachedAnswers[2])
 
     async def __createTablesIfNotExists(self, connection: Connection):
         if self.__areTablesCreated:
@@ -142,6 +172,14 @@ class GlacialTriviaQuestionRepository(
         )
         await cursor.close()
 
+        cursor = await connection.execute(
+            '''
+                CREATE INDEX IF NOT EXISTS glacialAnswersQuestionIndex
+                ON glacialAnswers (originalTriviaSource, triviaId)
+            '''
+        )
+        await cursor.close()
+
         cursor = await connection.execute(
             '''
                 CREATE TABLE IF NOT EXISTS glacialResponses (
@@ -153,6 +191,14 @@ class GlacialTriviaQuestionRepository(
         )
         await cursor.close()
 
+        cursor = await connection.execute(
+            '''
+                CREATE INDEX IF NOT EXISTS glacialResponsesQuestionIndex
+                ON glacialResponses (originalTriviaSource, triviaId)
+            '''
+        )
+        await cursor.close()
+
     async def __triviaDatabaseFileExists(self) -> bool:
         return await aiofiles.ospath.exists(self.__triviaDatabaseFile)
 
@@ -163,26 +209,44 @@ class GlacialTriviaQuestionRepository(
         if not isinstance(fetchOptions, TriviaFetchOptions):
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
+        # every question is loaded together with its answers in a single query, rather than
+        # running a separate answers query for each and every question
         connection = await aiosqlite.connect(self.__triviaDatabaseFile)
         cursor = await connection.execute(
             '''
-                SELECT category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId FROM glacialQuestions
-                WHERE triviaType = $1
+                SELECT glacialQuestions.category, glacialQuestions.categoryId, glacialQuestions.originalTriviaSource, glacialQuestions.question, glacialQuestions.triviaDifficulty, glacialQuestions.triviaId, glacialAnswers.answer FROM glacialQuestions
+                LEFT OUTER JOIN glacialAnswers ON glacialQuestions.originalTriviaSource = glacialAnswers.originalTriviaSource AND glacialQuestions.triviaId = glacialAnswers.triviaId
+                WHERE glacialQuestions.triviaType = $1
             ''',
             (TriviaQuestionType.QUESTION_ANSWER.toStr(), )
         )
 
         rows = await cursor.fetchall()
         await cursor.close()
+        await connection.close()
 
-        if rows is None or sum(1 for _ in rows) == 0:
-            await connection.close()
+        if rows is None or len(rows) == 0:
             self.__timber.log('GlacialTriviaQuestionRepository', f'Unable to find any {TriviaQuestionType.QUESTION_ANSWER} questions in the database! ({fetchOptions=})')
             return None
 
-        questions = []
+        questionRows: dict[tuple[str, str], Any] = dict()
+        questionAnswers: dict[tuple[str, str], dict[str, None]] = dict()
 
         for row in rows:
+            questionKey = (row[2], row[5])
+            answers = questionAnswers.get(questionKey, None)
+
+            if answers is None:
+                questionRows[questionKey] = row
+                answers = dict()
+                questionAnswers[questionKey] = answers
+
+            if row[6] is not None:
+                answers[row[6]] = None
+
+        questions: list[QuestionAnswerTriviaQuestion] = list()
+
+        for questionKey, row in questionRows.items():
             category = await self.__triviaQuestionCompiler.compileCategory(row[0])
             categoryId: str | None = row[1]
             originalTriviaSource = TriviaSource.fromStr(row[2])
@@ -190,15 +254,25 @@ class GlacialTriviaQuestionRepository(
             triviaDifficulty = TriviaDifficulty.fromStr(row[4])
             triviaId: str = row[5]
 
-            originalCorrectAnswers = await self.__fetchTriviaQuestionCorrectAnswers(
-                connection = connection,
+            originalCorrectAnswers = list(questionAnswers[questionKey])
+
+            if len(originalCorrectAnswers) == 0:
+                exception = NoTriviaCorrectAnswersException(f'No trivia answers found! ({triviaId=}) ({originalTriviaSource=})')
+                self.__timber.log('GlacialTriviaQuestionRepository', f'Unable to find any trivia answers for {triviaId=} and {originalTriviaSource=}: {exception}', exception, traceback.format_exc())
+                raise exception
+
+            await self.__addAdditionalTriviaAnswers(
+                correctAnswers = originalCorrectAnswers,
                 triviaId = triviaId,
                 triviaType = TriviaQuestionType.QUESTION_ANSWER,
                 originalTriviaSource = originalTriviaSource
             )
 
-            correctAnswers = await self.__triviaQuestionCompiler.compileResponses(originalCorrectAnswers)
-            compiledCorrectAnswers = await self.__buildCompiledCorrectAnswersForQuestionAnswerTrivia(originalCorrectAnswers)
+            correctAnswers, compiledCorrectAnswers = await self.__compileQuestionAnswerCorrectAnswers(
+                originalCorrectAnswers = originalCorrectAnswers,
+                originalTriviaSource = originalTriviaSource,
+                triviaId = triviaId
+            )
 
             questions.append(QuestionAnswerTriviaQuestion(
                 allWords = None,
@@ -214,8 +288,6 @@ class GlacialTriviaQuestionRepository(
                 triviaSource = self.triviaSource
             ))
 
-        await connection.close()
-
         return questions
 
     async def __fetchAnyTriviaQuestion(
@@ -226,16 +298,12 @@ class GlacialTriviaQuestionRepository(
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
         connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId, triviaType FROM glacialQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
 
-        row = await cursor.fetchone()
-        await cursor.close()
+        row = await self.__fetchRandomQuestionRow(
+            connection = connection,
+            columns = 'category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId, triviaType',
+            rowIdsQuery = 'SELECT rowid FROM glacialQuestions'
+        )
 
         if row is None or len(row) == 0:
             await connection.close()
@@ -257,8 +325,6 @@ class GlacialTriviaQuestionRepository(
             originalTriviaSource = originalTriviaSource,
         )
 
-        correctAnswers = await self.__triviaQuestionCompiler.compileResponses(originalCorrectAnswers)
-
         match triviaType:
             case TriviaQuestionType.MULTIPLE_CHOICE:
                 multipleChoiceResponses = await self.__fetchTriviaQuestionMultipleChoiceResponses(
@@ -270,7 +336,7 @@ class GlacialTriviaQuestionRepository(
                 await connection.close()
 
                 return MultipleChoiceTriviaQuestion(
-                    correctAnswers = correctAnswers,
+                    correctAnswers = await self.__triviaQuestionCompiler.compileResponses(originalCorrectAnswers),
                     multipleChoiceResponses = multipleChoiceResponses,
                     category = category,
                     categoryId = categoryId,
@@ -283,7 +349,12 @@ class GlacialTriviaQuestionRepository(
 
             case TriviaQuestionType.QUESTION_ANSWER:
                 await connection.close()
-                compiledCorrectAnswers = await self.__buildCompiledCorrectAnswersForQuestionAnswerTrivia(originalCorrectAnswers)
+
+                correctAnswers, compiledCorrectAnswers = await self.__compileQuestionAnswerCorrectAnswers(
+                    originalCorrectAnswers = originalCorrectAnswers,
+                    originalTriviaSource = originalTriviaSource,
+                    triviaId = triviaId
+                )
 
                 return QuestionAnswerTriviaQuestion(
                     allWords = None,
@@ -326,18 +397,13 @@ class GlacialTriviaQuestionRepository(
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
         connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId, triviaType FROM glacialQuestions
-                WHERE triviaType = $1 OR triviaType = $2
-                ORDER BY RANDOM()
-                LIMIT 1
-            ''',
-            (TriviaQuestionType.MULTIPLE_CHOICE.toStr(), TriviaQuestionType.TRUE_FALSE.toStr(), )
-        )
 
-        row = await cursor.fetchone()
-        await cursor.close()
+        row = await self.__fetchRandomQuestionRow(
+            connection = connection,
+            columns = 'category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId, triviaType',
+            rowIdsQuery = 'SELECT rowid FROM glacialQuestions WHERE triviaType = $1 OR triviaType = $2',
+            parameters = (TriviaQuestionType.MULTIPLE_CHOICE.toStr(), TriviaQuestionType.TRUE_FALSE.toStr(), )
+        )
 
         if row is None or len(row) == 0:
             await connection.close()
@@ -409,18 +475,13 @@ class GlacialTriviaQuestionRepository(
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
 
         connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId FROM glacialQuestions
-                WHERE triviaType = $1
-                ORDER BY RANDOM()
-                LIMIT 1
-            ''',
-            (TriviaQuestionType.QUESTION_ANSWER.toStr(), )
-        )
 
-        row = await cursor.fetchone()
-        await cursor.close()
+        row = await self.__fetchRandomQuestionRow(
+            connection = connection,
+            columns = 'category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId',
+            rowIdsQuery = 'SELECT rowid FROM glacialQuestions WHERE triviaType = $1',
+            parameters = (TriviaQuestionType.QUESTION_ANSWER.toStr(), )
+        )
 
         if row is None or len(row) == 0:
             await connection.close()
@@ -443,8 +504,11 @@ class GlacialTriviaQuestionRepository(
 
         await connection.close()
 
-        correctAnswers = await self.__triviaQuestionCompiler.compileResponses(originalCorrectAnswers)
-        compiledCorrectAnswers = await self.__buildCompiledCorrectAnswersForQuestionAnswerTrivia(originalCorrectAnswers)
+        correctAnswers, compiledCorrectAnswers = await self.__compileQuestionAnswerCorrectAnswers(
+            originalCorrectAnswers = originalCorrectAnswers,
+            originalTriviaSource = originalTriviaSource,
+            triviaId = triviaId
+        )
 
         return QuestionAnswerTriviaQuestion(
             allWords = None,
@@ -460,6 +524,40 @@ class GlacialTriviaQuestionRepository(
             triviaSource = self.triviaSource
         )
 
+    async def __fetchRandomQuestionRow(
+        self,
+        connection: Connection,
+        columns: str,
+        rowIdsQuery: str,
+        parameters: tuple[Any, ...] = ()
+    ) -> Any | None:
+        rowId = await self.__rowIdSampler.sampleRowId(
+            connection = connection,
+            rowIdsQuery = rowIdsQuery,
+            parameters = parameters
+        )
+
+        if rowId is None:
+            return None
+
+        cursor = await connection.execute(
+            f'''
+                SELECT {columns} FROM glacialQuestions
+                WHERE rowid = $1
+                LIMIT 1
+            ''',
+            (rowId, )
+        )
+
+        row = await cursor.fetchone()
+        await cursor.close()
+
+        if row is None:
+            # the question was removed since the rowids were last cached
+            self.__rowIdSampler.invalidate()
+
+        return row
+
     async def fetchAllQuestionAnswerTriviaQuestions(self, fetchOptions: TriviaFetchOptions) -> list[QuestionAnswerTriviaQuestion]:
         if not isinstance(fetchOptions, TriviaFetchOptions):
             raise TypeError(f'fetchOptions argument is malformed: \"{fetchOptions}\"')
@@ -512,27 +610,26 @@ class GlacialTriviaQuestionRepository(
 
         rows = await cursor.fetchall()
         await cursor.close()
-        correctAnswersSet: set[str] = set()
+        correctAnswersDict: dict[str, None] = dict()
 
         if rows is not None:
             for row in rows:
-                correctAnswersSet.add(row[0])
+                correctAnswersDict[row[0]] = None
 
-        if len(correctAnswersSet) == 0:
+        if len(correctAnswersDict) == 0:
             await connection.close()
             exception = NoTriviaCorrectAnswersException(f'No trivia answers found! ({triviaId=}) ({originalTriviaSource=})')
             self.__timber.log('GlacialTriviaQuestionRepository', f'Unable to find any trivia answers for {triviaId=} and {originalTriviaSource=}: {exception}', exception, traceback.format_exc())
             raise exception
 
-        correctAnswers = list(correctAnswersSet)
+        correctAnswers = list(correctAnswersDict)
 
-        if await self.__additionalTriviaAnswersRepository.addAdditionalTriviaAnswers(
-            currentAnswers = correctAnswers,
+        await self.__addAdditionalTriviaAnswers(
+            correctAnswers = correctAnswers,
             triviaId = triviaId,
-            triviaQuestionType = triviaType,
-            triviaSource = originalTriviaSource
-        ):
-            self.__timber.log('GlacialTriviaQuestionRepository', f'Added additional answers to question ({triviaId=})')
+            triviaType = triviaType,
+            originalTriviaSource = originalTriviaSource
+        )
 
         return correctAnswers
 
@@ -644,150 +741,129 @@ class GlacialTriviaQuestionRepository(
 
         await connection.commit()
         await connection.close()
+        self.__rowIdSampler.invalidate()
+        self.__compiledCorrectAnswersCache.pop((originalTriviaSource.toStr(), triviaId), None)
         self.__timber.log('GlacialTriviaQuestionRepository', f'Removed trivia question ({triviaId=}) ({originalTriviaSource=})')
 
     async def store(self, question: AbsTriviaQuestion) -> bool:
         if not isinstance(question, AbsTriviaQuestion):
             raise TypeError(f'question argument is malformed: \"{question}\"')
 
+        return await self.storeAll([ question ]) >= 1
+
+    async def storeAll(self, questions: list[AbsTriviaQuestion]) -> int:
+        if not isinstance(questions, list):
+            raise TypeError(f'questions argument is malformed: \"{questions}\"')
+
+        for question in questions:
+            if not isinstance(question, AbsTriviaQuestion):
+                raise TypeError(f'questions argument contains a malformed question: \"{question}\"')
+
         if not await self._triviaSettingsRepository.isScraperEnabled():
-            return False
-        elif question.triviaSource is TriviaSource.GLACIAL:
-            return False
+            return 0
+
+        questions = [ question for question in questions if question.triviaSource is not TriviaSource.GLACIAL ]
+
+        if len(questions) == 0:
+            return 0
+
+        # every question's rows are built up front, so that a malformed question is skipped
+        # before anything at all is written into the database, without losing the rest of them
+        questionsRows: list[tuple[AbsTriviaQuestion, list[tuple[str, str, str]], list[tuple[str, str, str]]]] = list()
+
+        for question in questions:
+            try:
+                answerRows, responseRows = self.__buildAnswerAndResponseRows(question)
+            except BadTriviaTypeException as e:
+                self.__timber.log('GlacialTriviaQuestionRepository', f'Attempted to store a trivia question, but it seems to be a broken trivia type ({question=}): {e}', e, traceback.format_exc())
+                continue
+
+            questionsRows.append((question, answerRows, responseRows))
+
+        if len(questionsRows) == 0:
+            return 0
 
         connection = await aiosqlite.connect(self.__triviaDatabaseFile)
         await self.__createTablesIfNotExists(connection)
 
-        if await self.__checkIfQuestionIsAlreadyStored(
-            question = question,
-            connection = connection
-        ):
-            await connection.close()
-            self.__timber.log('GlacialTriviaQuestionRepository', f'The given question already exists in the glacial trivia question database ({question=})')
-            return False
+        # An already stored question is simply skipped by the ON CONFLICT clause, so there's no need
+        # for a separate existence check. The answers and responses of all of the newly stored
+        # questions are then inserted in one batch per table, all within a single transaction.
+        storedAnswerRows: list[tuple[str, str, str]] = list()
+        storedResponseRows: list[tuple[str, str, str]] = list()
+        storedQuestionsCount = 0
 
-        await self.__storeBaseTriviaQuestionData(
-            question = question,
-            connection = connection
-        )
-
-        if question.triviaType is TriviaQuestionType.MULTIPLE_CHOICE and isinstance(question, MultipleChoiceTriviaQuestion):
-            await self.__storeMultipleChoiceTriviaQuestion(
-                connection = connection,
-                question = question
-            )
-        elif question.triviaType is TriviaQuestionType.QUESTION_ANSWER and isinstance(question, QuestionAnswerTriviaQuestion):
-            await self.__storeQuestionAnswerTriviaQuestion(
-                connection = connection,
-                question = question
-            )
-        elif question.triviaType is TriviaQuestionType.TRUE_FALSE and isinstance(question, TrueFalseTriviaQuestion):
-            await self.__storeTrueFalseTriviaQuestion(
-                connection = connection,
-                question = question
+        for question, answerRows, responseRows in questionsRows:
+            cursor = await connection.execute(
+                '''
+                    INSERT INTO glacialQuestions (category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId, triviaType)
+                    VALUES ($1, $2, $3, $4, $5, $6, $7)
+                    ON CONFLICT (originalTriviaSource, triviaId) DO NOTHING
+                ''',
+                (question.category, question.categoryId, question.triviaSource.toStr(), question.question, question.triviaDifficulty.toStr(), question.triviaId, question.triviaType.toStr(), )
             )
-        else:
-            await connection.close()
-            exception = BadTriviaTypeException(f'The given question is a confusing/malformed/misconstrued trivia type ({question=})')
-            self.__timber.log('GlacialTriviaQuestionRepository', f'Attempted to store a trivia question, but it seems to be a broken trivia type ({question=}): {exception}', exception, traceback.format_exc())
-            raise exception
-
-        await connection.commit()
-        await connection.close()
-        self.__hasQuestionSetAvailable = None
-        self.__timber.log('GlacialTriviaQuestionRepository', f'Added a new question into the glacial trivia question database ({question=})')
-        return True
 
-    async def __storeBaseTriviaQuestionData(
-        self,
-        question: AbsTriviaQuestion,
-        connection: Connection
-    ):
-        if not isinstance(question, AbsTriviaQuestion):
-            raise TypeError(f'question argument is malformed: \"{question}\"')
-        elif not isinstance(connection, Connection):
-            raise TypeError(f'connection argument is malformed: \"{connection}\"')
+            wasStored = cursor.rowcount >= 1
+            await cursor.close()
 
-        await connection.execute_insert(
-            '''
-                INSERT INTO glacialQuestions (category, categoryId, originalTriviaSource, question, triviaDifficulty, triviaId, triviaType)
-                VALUES ($1, $2, $3, $4, $5, $6, $7)
-            ''',
-            (question.category, question.categoryId, question.triviaSource.toStr(), question.question, question.triviaDifficulty.toStr(), question.triviaId, question.triviaType.toStr(), )
-        )
+            if not wasStored:
+                self.__timber.log('GlacialTriviaQuestionRepository', f'The given question already exists in the glacial trivia question database ({question=})')
+                continue
 
-    async def __storeMultipleChoiceTriviaQuestion(
-        self,
-        connection: Connection,
-        question: MultipleChoiceTriviaQuestion
-    ):
-        if not isinstance(connection, Connection):
-            raise TypeError(f'connection argument is malformed: \"{connection}\"')
-        elif not isinstance(question, MultipleChoiceTriviaQuestion):
-            raise TypeError(f'question argument is malformed: \"{question}\"')
-        elif question.triviaType is not TriviaQuestionType.MULTIPLE_CHOICE:
-            raise ValueError(f'question class and TriviaQuestionType do not match ({question=}) ({question.triviaType=})')
+            storedAnswerRows.extend(answerRows)
+            storedResponseRows.extend(responseRows)
+            storedQuestionsCount += 1
 
-        for correctAnswer in question.correctAnswers:
-            await connection.execute_insert(
+        if len(storedAnswerRows) >= 1:
+            await connection.executemany(
                 '''
                     INSERT INTO glacialAnswers (answer, originalTriviaSource, triviaId)
                     VALUES ($1, $2, $3)
                 ''',
-                (correctAnswer, question.triviaSource.toStr(), question.triviaId, )
+                storedAnswerRows
             )
 
-        for response in question.responses:
-            await connection.execute_insert(
+        if len(storedResponseRows) >= 1:
+            await connection.executemany(
                 '''
                     INSERT INTO glacialResponses (response, originalTriviaSource, triviaId)
                     VALUES ($1, $2, $3)
                 ''',
-                (response, question.triviaSource.toStr(), question.triviaId, )
+                storedResponseRows
             )
 
-    async def __storeQuestionAnswerTriviaQuestion(
-        self,
-        connection: Connection,
-        question: QuestionAnswerTriviaQuestion
-    ):
-        if not isinstance(connection, Connection):
-            raise TypeError(f'connection argument is malformed: \"{connection}\"')
-        elif not isinstance(question, QuestionAnswerTriviaQuestion):
-            raise TypeError(f'question argument is malformed: \"{question}\"')
-        elif question.triviaType is not TriviaQuestionType.QUESTION_ANSWER:
-            raise ValueError(f'question class and TriviaQuestionType do not match ({question=}) ({question.triviaType=})')
+        await connection.commit()
+        await connection.close()
 
-        for answer in question.originalCorrectAnswers:
-            await connection.execute_insert(
-                '''
-                    INSERT INTO glacialAnswers (answer, originalTriviaSource, triviaId)
-                    VALUES ($1, $2, $3)
-                ''',
-                (answer, question.triviaSource.toStr(), question.triviaId, )
-            )
+        if storedQuestionsCount >= 1:
+            self.__hasQuestionSetAvailable = None
+            self.__rowIdSampler.invalidate()
+            self.__timber.log('GlacialTriviaQuestionRepository', f'Added {storedQuestionsCount} new question(s) into the glacial trivia question database ({len(questions)=})')
 
-    async def __storeTrueFalseTriviaQuestion(
+        return storedQuestionsCount
+
+    def __buildAnswerAndResponseRows(
         self,
-        connection: Connection,
-        question: TrueFalseTriviaQuestion
-    ):
-        if not isinstance(connection, Connection):
-            raise TypeError(f'connection argument is malformed: \"{connection}\"')
-        elif not isinstance(question, TrueFalseTriviaQuestion):
+        question: AbsTriviaQuestion
+    ) -> tuple[list[tuple[str, str, str]], list[tuple[str, str, str]]]:
+        if not isinstance(question, AbsTriviaQuestion):
             raise TypeError(f'question argument is malformed: \"{question}\"')
-        elif question.triviaType is not TriviaQuestionType.TRUE_FALSE:
-            raise ValueError(f'question class and TriviaQuestionType do not match ({question=}) ({question.triviaType=})')
 
-        correctAnswer = str(question.correctAnswer).lower()
+        originalTriviaSource = question.triviaSource.toStr()
+        triviaId = question.triviaId
 
-        await connection.execute_insert(
-            '''
-                INSERT INTO glacialAnswers (answer, originalTriviaSource, triviaId)
-                VALUES ($1, $2, $3)
-            ''',
-            (correctAnswer, question.triviaSource.toStr(), question.triviaId, )
-        )
+        if question.triviaType is TriviaQuestionType.MULTIPLE_CHOICE and isinstance(question, MultipleChoiceTriviaQuestion):
+            answerRows = [ (correctAnswer, originalTriviaSource, triviaId) for correctAnswer in question.correctAnswers ]
+            responseRows = [ (response, originalTriviaSource, triviaId) for response in question.responses ]
+            return answerRows, responseRows
+        elif question.triviaType is TriviaQuestionType.QUESTION_ANSWER and isinstance(question, QuestionAnswerTriviaQuestion):
+            answerRows = [ (answer, originalTriviaSource, triviaId) for answer in question.originalCorrectAnswers ]
+            return answerRows, list()
+        elif question.triviaType is TriviaQuestionType.TRUE_FALSE and isinstance(question, TrueFalseTriviaQuestion):
+            correctAnswer = str(question.correctAnswer).lower()
+            return [ (correctAnswer, originalTriviaSource, triviaId) ], list()
+        else:
+            raise BadTriviaTypeException(f'The given question is a confusing/malformed/misconstrued trivia type ({question=})')
 
     @property
     def supportedTriviaTypes(self) -> set[TriviaQuestionType]:
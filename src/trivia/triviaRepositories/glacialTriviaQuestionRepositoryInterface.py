@@ -14,3 +14,7 @@ class GlacialTriviaQuestionRepositoryInterface(TriviaQuestionRepositoryInterface
     @abstractmethod
     async def store(self, question: AbsTriviaQuestion) -> bool:
         pass
+
+    @abstractmethod
+    async def storeAll(self, questions: list[AbsTriviaQuestion]) -> int:
+        pass
@@ -1,9 +1,9 @@
 import traceback
+from typing import Any
 
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import aiosqlite
 from frozenlist import FrozenList
 
 from .exceptions import (NoTriviaAnswersException,
@@ -11,6 +11,8 @@ from .exceptions import (NoTriviaAnswersException,
                          TriviaDatabaseFileDoesNotExistException)
 from .lotrDatabaseQuestionStorageInterface import LotrDatabaseQuestionStorageInterface
 from .lotrTriviaQuestion import LotrTriviaQuestion
+from ..readOnlySqliteConnectionManagerInterface import ReadOnlySqliteConnectionManagerInterface
+from ..sqliteRowIdSampler import SqliteRowIdSampler
 from ....misc import utils as utils
 from ....timber.timberInterface import TimberInterface
 
@@ -19,16 +21,21 @@ class LotrDatabaseQuestionStorage(LotrDatabaseQuestionStorageInterface):
 
     def __init__(
         self,
+        readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface,
         timber: TimberInterface,
         databaseFile: str = 'lotrTriviaQuestionsDatabase.sqlite'
     ):
-        if not isinstance(timber, TimberInterface):
+        if not isinstance(readOnlySqliteConnectionManager, ReadOnlySqliteConnectionManagerInterface):
+            raise TypeError(f'readOnlySqliteConnectionManager argument is malformed: \"{readOnlySqliteConnectionManager}\"')
+        elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not utils.isValidStr(databaseFile):
             raise TypeError(f'databaseFile argument is malformed: \"{databaseFile}\"')
 
+        self.__readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface = readOnlySqliteConnectionManager
         self.__timber: TimberInterface = timber
         self.__databaseFile: str = databaseFile
+        self.__rowIdSampler: SqliteRowIdSampler = SqliteRowIdSampler()
 
         self.__hasQuestionSetAvailable: bool | None = None
 
@@ -72,18 +79,30 @@ class LotrDatabaseQuestionStorage(LotrDatabaseQuestionStorageInterface):
 
         self.__timber.log('LotrDatabaseQuestionStorage', f'Fetching trivia question...')
 
-        connection = await aiosqlite.connect(self.__databaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT answerA, answerB, answerC, answerD, question, triviaId FROM lotrQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
+        row: Any | None = None
+
+        async with self.__readOnlySqliteConnectionManager.useConnection(self.__databaseFile) as connection:
+            rowId = await self.__rowIdSampler.sampleRowId(
+                connection = connection,
+                rowIdsQuery = 'SELECT rowid FROM lotrQuestions'
+            )
 
-        row = await cursor.fetchone()
+            if rowId is not None:
+                cursor = await connection.execute(
+                    '''
+                        SELECT answerA, answerB, answerC, answerD, question, triviaId FROM lotrQuestions
+                        WHERE rowid = $1
+                        LIMIT 1
+                    ''',
+                    (rowId, )
+                )
+
+                row = await cursor.fetchone()
+                await cursor.close()
 
         if row is None or len(row) != 6:
+            await self.__readOnlySqliteConnectionManager.closeConnection(self.__databaseFile)
+            self.__rowIdSampler.invalidate()
             raise NoTriviaQuestionsAvailableException(f'Unable to fetch trivia question data from LOTR! ({self.__databaseFile=}) ({row=})')
 
         answerA: str | None = row[0]
@@ -93,9 +112,6 @@ class LotrDatabaseQuestionStorage(LotrDatabaseQuestionStorageInterface):
         question: str = row[4]
         triviaId: str = row[5]
 
-        await cursor.close()
-        await connection.close()
-
         answers = await self.__buildAnswersList(
             answerA = answerA,
             answerB = answerB,
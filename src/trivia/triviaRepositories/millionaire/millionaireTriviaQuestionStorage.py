@@ -1,15 +1,17 @@
 import traceback
+from typing import Any
 
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import aiosqlite
 from frozenlist import FrozenList
 
 from .exceptions import NoTriviaIncorrectAnswersException, NoTriviaQuestionsAvailableException, \
     TriviaDatabaseFileDoesNotExistException
 from .millionaireTriviaQuestion import MillionaireTriviaQuestion
 from .millionaireTriviaQuestionStorageInterface import MillionaireTriviaQuestionStorageInterface
+from ..readOnlySqliteConnectionManagerInterface import ReadOnlySqliteConnectionManagerInterface
+from ..sqliteRowIdSampler import SqliteRowIdSampler
 from ....misc import utils as utils
 from ....timber.timberInterface import TimberInterface
 
@@ -18,16 +20,21 @@ class MillionaireTriviaQuestionStorage(MillionaireTriviaQuestionStorageInterface
 
     def __init__(
         self,
+        readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface,
         timber: TimberInterface,
         databaseFile: str = 'millionaireTriviaQuestionsDatabase.sqlite'
     ):
-        if not isinstance(timber, TimberInterface):
+        if not isinstance(readOnlySqliteConnectionManager, ReadOnlySqliteConnectionManagerInterface):
+            raise TypeError(f'readOnlySqliteConnectionManager argument is malformed: \"{readOnlySqliteConnectionManager}\"')
+        elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not utils.isValidStr(databaseFile):
             raise TypeError(f'databaseFile argument is malformed: \"{databaseFile}\"')
 
+        self.__readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface = readOnlySqliteConnectionManager
         self.__timber: TimberInterface = timber
         self.__databaseFile: str = databaseFile
+        self.__rowIdSampler: SqliteRowIdSampler = SqliteRowIdSampler()
 
         self.__hasQuestionSetAvailable: bool | None = None
 
@@ -68,23 +75,32 @@ class MillionaireTriviaQuestionStorage(MillionaireTriviaQuestionStorageInterface
 
         self.__timber.log('MillionaireQuestionStorage', f'Fetching trivia question...')
 
-        connection = await aiosqlite.connect(self.__databaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT answer, question, responseA, responseB, responseC, responseD, triviaId FROM millionaireQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
+        row: Any | None = None
+
+        async with self.__readOnlySqliteConnectionManager.useConnection(self.__databaseFile) as connection:
+            rowId = await self.__rowIdSampler.sampleRowId(
+                connection = connection,
+                rowIdsQuery = 'SELECT rowid FROM millionaireQuestions'
+            )
 
-        row = await cursor.fetchone()
+            if rowId is not None:
+                cursor = await connection.execute(
+                    '''
+                        SELECT answer, question, responseA, responseB, responseC, responseD, triviaId FROM millionaireQuestions
+                        WHERE rowid = $1
+                        LIMIT 1
+                    ''',
+                    (rowId, )
+                )
+
+                row = await cursor.fetchone()
+                await cursor.close()
 
         if row is None or len(row) == 0:
+            await self.__readOnlySqliteConnectionManager.closeConnection(self.__databaseFile)
+            self.__rowIdSampler.invalidate()
             raise NoTriviaQuestionsAvailableException(f'Unable to fetch trivia question data from Millionaire! ({self.__databaseFile=}) ({row=})')
 
-        await cursor.close()
-        await connection.close()
-
         correctAnswer: str = row[0]
         question: str = row[1]
         incorrectAnswer0: str | None = row[2]
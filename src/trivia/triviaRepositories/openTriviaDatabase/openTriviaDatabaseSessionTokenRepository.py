@@ -2,7 +2,6 @@ from .openTriviaDatabaseSessionTokenRepositoryInterface import OpenTriviaDatabas
 from ....misc import utils as utils
 from ....storage.backingDatabase import BackingDatabase
 from ....storage.databaseConnection import DatabaseConnection
-from ....storage.databaseType import DatabaseType
 from ....timber.timberInterface import TimberInterface
 
 
@@ -21,7 +20,6 @@ class OpenTriviaDatabaseSessionTokenRepository(OpenTriviaDatabaseSessionTokenRep
         self.__backingDatabase: BackingDatabase = backingDatabase
         self.__timber: TimberInterface = timber
 
-        self.__isDatabaseReady: bool = False
         self.__cache: dict[str, str | None] = dict()
 
     async def clearCaches(self):
@@ -55,42 +53,8 @@ class OpenTriviaDatabaseSessionTokenRepository(OpenTriviaDatabaseSessionTokenRep
         return sessionToken
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
-                            sessiontoken text DEFAULT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS opentriviadatabasesessiontokens (
-                            sessiontoken TEXT DEFAULT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def remove(self, twitchChannelId: str):
         if not utils.isValidStr(twitchChannelId):
             raise TypeError(f'twitchChannelId argument is malformed: \"{twitchChannelId}\"')
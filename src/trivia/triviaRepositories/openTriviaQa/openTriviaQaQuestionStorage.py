@@ -1,9 +1,9 @@
 import traceback
+from typing import Any
 
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import aiosqlite
 from frozenlist import FrozenList
 
 from .booleanOpenTriviaQaTriviaQuestion import BooleanOpenTriviaQaTriviaQuestion
@@ -14,6 +14,8 @@ from .openTriviaQaQuestionStorageInterface import OpenTriviaQaQuestionStorageInt
 from .openTriviaQaQuestionType import OpenTriviaQaQuestionType
 from .openTriviaQaQuestionTypeParserInterface import OpenTriviaQaQuestionTypeParserInterface
 from .openTriviaQaTriviaQuestion import OpenTriviaQaTriviaQuestion
+from ..readOnlySqliteConnectionManagerInterface import ReadOnlySqliteConnectionManagerInterface
+from ..sqliteRowIdSampler import SqliteRowIdSampler
 from ...triviaExceptions import UnsupportedTriviaTypeException
 from ....misc import utils as utils
 from ....timber.timberInterface import TimberInterface
@@ -24,19 +26,24 @@ class OpenTriviaQaQuestionStorage(OpenTriviaQaQuestionStorageInterface):
     def __init__(
         self,
         questionTypeParser: OpenTriviaQaQuestionTypeParserInterface,
+        readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface,
         timber: TimberInterface,
         databaseFile: str = 'openTriviaQaTriviaQuestionDatabase.sqlite'
     ):
         if not isinstance(questionTypeParser, OpenTriviaQaQuestionTypeParserInterface):
             raise TypeError(f'questionTypeParser argument is malformed: \"{questionTypeParser}\"')
+        elif not isinstance(readOnlySqliteConnectionManager, ReadOnlySqliteConnectionManagerInterface):
+            raise TypeError(f'readOnlySqliteConnectionManager argument is malformed: \"{readOnlySqliteConnectionManager}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not utils.isValidStr(databaseFile):
             raise TypeError(f'databaseFile argument is malformed: \"{databaseFile}\"')
 
+        self.__readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface = readOnlySqliteConnectionManager
         self.__timber: TimberInterface = timber
         self.__questionTypeParser: OpenTriviaQaQuestionTypeParserInterface = questionTypeParser
         self.__databaseFile: str = databaseFile
+        self.__rowIdSampler: SqliteRowIdSampler = SqliteRowIdSampler()
 
         self.__hasQuestionSetAvailable: bool | None = None
 
@@ -76,18 +83,30 @@ class OpenTriviaQaQuestionStorage(OpenTriviaQaQuestionStorageInterface):
 
         self.__timber.log('OpenTriviaQaQuestionStorage', f'Fetching trivia question...')
 
-        connection = await aiosqlite.connect(self.__databaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT correctAnswer, newCategory, question, questionId, questionType, response1, response2, response3, response4 FROM triviaQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
+        row: Any | None = None
+
+        async with self.__readOnlySqliteConnectionManager.useConnection(self.__databaseFile) as connection:
+            rowId = await self.__rowIdSampler.sampleRowId(
+                connection = connection,
+                rowIdsQuery = 'SELECT rowid FROM triviaQuestions'
+            )
+
+            if rowId is not None:
+                cursor = await connection.execute(
+                    '''
+                        SELECT correctAnswer, newCategory, question, questionId, questionType, response1, response2, response3, response4 FROM triviaQuestions
+                        WHERE rowid = $1
+                        LIMIT 1
+                    ''',
+                    (rowId, )
+                )
 
-        row = await cursor.fetchone()
+                row = await cursor.fetchone()
+                await cursor.close()
 
         if row is None or len(row) == 0:
+            await self.__readOnlySqliteConnectionManager.closeConnection(self.__databaseFile)
+            self.__rowIdSampler.invalidate()
             raise NoTriviaQuestionsAvailableException(f'Unable to fetch trivia question data from Open Trivia QA! ({self.__databaseFile=}) ({row=})')
 
         correctAnswer: str = row[0]
@@ -99,9 +118,6 @@ class OpenTriviaQaQuestionStorage(OpenTriviaQaQuestionStorageInterface):
         incorrectAnswer1: str | None = row[6]
         incorrectAnswer2: str | None = row[7]
 
-        await cursor.close()
-        await connection.close()
-
         match questionType:
             case OpenTriviaQaQuestionType.BOOLEAN:
                 return BooleanOpenTriviaQaTriviaQuestion(
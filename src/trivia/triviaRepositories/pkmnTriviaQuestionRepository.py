@@ -11,6 +11,7 @@ from ..questions.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
 from ..triviaDifficulty import TriviaDifficulty
 from ..triviaExceptions import (GenericTriviaNetworkException,
                                 MalformedTriviaJsonException,
+                                UnavailableTriviaSourceException,
                                 UnsupportedTriviaTypeException)
 from ..triviaFetchOptions import TriviaFetchOptions
 from ..triviaIdGeneratorInterface import TriviaIdGeneratorInterface
@@ -34,7 +35,7 @@ class PkmnTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     def __init__(
         self,
-        pokepediaRepository: PokepediaRepositoryInterface,
+        pokepediaRepository: PokepediaRepositoryInterface | None,
         timber: TimberInterface,
         triviaIdGenerator: TriviaIdGeneratorInterface,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
@@ -42,7 +43,7 @@ class PkmnTriviaQuestionRepository(AbsTriviaQuestionRepository):
     ):
         super().__init__(triviaSettingsRepository)
 
-        if not isinstance(pokepediaRepository, PokepediaRepositoryInterface):
+        if pokepediaRepository is not None and not isinstance(pokepediaRepository, PokepediaRepositoryInterface):
             raise TypeError(f'pokepediaRepository argument is malformed: \"{pokepediaRepository}\"')
         elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
@@ -51,7 +52,7 @@ class PkmnTriviaQuestionRepository(AbsTriviaQuestionRepository):
         elif not isinstance(maxGeneration, PokepediaGeneration):
             raise TypeError(f'maxGeneration argument is malformed: \"{maxGeneration}\"')
 
-        self.__pokepediaRepository: PokepediaRepositoryInterface = pokepediaRepository
+        self.__pokepediaRepository: PokepediaRepositoryInterface | None = pokepediaRepository
         self.__timber: TimberInterface = timber
         self.__triviaIdGenerator: TriviaIdGeneratorInterface = triviaIdGenerator
         self.__maxGeneration: PokepediaGeneration = maxGeneration
@@ -144,7 +145,7 @@ class PkmnTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     async def __createMoveQuestion(self) -> dict[str, Any]:
         try:
-            move = await self.__pokepediaRepository.fetchRandomMove(maxGeneration = self.__maxGeneration)
+            move = await self.__requirePokepediaRepository().fetchRandomMove(maxGeneration = self.__maxGeneration)
         except GenericNetworkException as e:
             self.__timber.log('PkmnTriviaQuestionRepository', f'Encountered network error when fetching trivia question: {e}', e, traceback.format_exc())
             raise GenericTriviaNetworkException(self.triviaSource, e)
@@ -169,7 +170,7 @@ class PkmnTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     async def __createNatureQuestion(self) -> dict[str, Any]:
         try:
-            nature = await self.__pokepediaRepository.fetchRandomNature()
+            nature = await self.__requirePokepediaRepository().fetchRandomNature()
         except GenericNetworkException as e:
             self.__timber.log('PkmnTriviaQuestionRepository', f'Encountered network error when fetching trivia question: {e}', e, traceback.format_exc())
             raise GenericTriviaNetworkException(self.triviaSource, e)
@@ -281,7 +282,7 @@ class PkmnTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     async def __createPokemonQuestion(self) -> dict[str, Any]:
         try:
-            pokemon = await self.__pokepediaRepository.fetchRandomPokemon(maxGeneration = self.__maxGeneration)
+            pokemon = await self.__requirePokepediaRepository().fetchRandomPokemon(maxGeneration = self.__maxGeneration)
         except GenericNetworkException as e:
             self.__timber.log('PkmnTriviaQuestionRepository', f'Encountered network error when fetching trivia question: {e}', e, traceback.format_exc())
             raise GenericTriviaNetworkException(self.triviaSource, e)
@@ -315,7 +316,7 @@ class PkmnTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     async def __createStatQuestion(self) -> dict[str, Any]:
         try:
-            stat = await self.__pokepediaRepository.fetchRandomStat()
+            stat = await self.__requirePokepediaRepository().fetchRandomStat()
         except GenericNetworkException as e:
             self.__timber.log('PkmnTriviaQuestionRepository', f'Encountered network error when fetching trivia question: {e}', e, traceback.format_exc())
             raise GenericTriviaNetworkException(self.triviaSource, e)
@@ -432,7 +433,15 @@ class PkmnTriviaQuestionRepository(AbsTriviaQuestionRepository):
         raise UnsupportedTriviaTypeException(f'triviaType \"{triviaType}\" is not supported for Pkmn Trivia: {triviaDict}')
 
     async def hasQuestionSetAvailable(self) -> bool:
-        return True
+        return self.__pokepediaRepository is not None
+
+    def __requirePokepediaRepository(self) -> PokepediaRepositoryInterface:
+        pokepediaRepository = self.__pokepediaRepository
+
+        if pokepediaRepository is None:
+            raise UnavailableTriviaSourceException('PkmnTriviaQuestionRepository can\'t fetch a trivia question, as Pokepedia is disabled')
+
+        return pokepediaRepository
 
     async def __selectRandomFalseBerryFlavors(
         self,
@@ -0,0 +1,141 @@
+from asyncio import Lock
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator
+
+import aiofiles.ospath
+import aiosqlite
+from aiosqlite import Connection
+
+from .readOnlySqliteConnectionManagerInterface import ReadOnlySqliteConnectionManagerInterface
+from .readOnlySqliteConnectionStats import ReadOnlySqliteConnectionStats
+from ...misc import utils as utils
+from ...timber.timberInterface import TimberInterface
+
+
+class ReadOnlySqliteConnectionManager(ReadOnlySqliteConnectionManagerInterface):
+
+    # Shares a single long-lived connection to each of the bundled trivia question databases.
+    # These databases are never written to while the bot is running, so each one is opened just
+    # once, as read-only and immutable (which lets SQLite skip all of its file locking and change
+    # detection). Keeping the connection open also means that SQLite's page cache, memory map, and
+    # the connection's prepared statement cache all carry over from one trivia question to the next.
+    #
+    # As SQLite is told that these databases are immutable, it never checks them for changes. So a
+    # database file that gets replaced while the bot is running isn't picked up until the bot is
+    # restarted, and nothing here (or in the storages) watches these files for changes either.
+    #
+    # Callers must not close the connections handed out here, and must only use them from within
+    # their useConnection() block. If a caller gets back a row that it can't make sense of,
+    # closeConnection() throws that connection away, and the next call to useConnection() will open
+    # a fresh one. As other coroutines may still be in the middle of a query on the old connection,
+    # it's only actually closed once the last of those useConnection() blocks has been exited.
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        mmapSizeBytes: int = 268435456,
+        statementCacheSize: int = 32
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidInt(mmapSizeBytes):
+            raise TypeError(f'mmapSizeBytes argument is malformed: \"{mmapSizeBytes}\"')
+        elif mmapSizeBytes < 0 or mmapSizeBytes > utils.getLongMaxSafeSize():
+            raise ValueError(f'mmapSizeBytes argument is out of bounds: {mmapSizeBytes}')
+        elif not utils.isValidInt(statementCacheSize):
+            raise TypeError(f'statementCacheSize argument is malformed: \"{statementCacheSize}\"')
+        elif statementCacheSize < 1 or statementCacheSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'statementCacheSize argument is out of bounds: {statementCacheSize}')
+
+        self.__timber: TimberInterface = timber
+        self.__mmapSizeBytes: int = mmapSizeBytes
+        self.__statementCacheSize: int = statementCacheSize
+
+        self.__connectLock: Lock = Lock()
+        self.__connections: dict[str, Connection] = dict()
+        self.__connectionOpens: dict[str, int] = dict()
+        self.__connectionUses: dict[str, int] = dict()
+        self.__inFlightUses: dict[Connection, int] = dict()
+        self.__retiredConnections: set[Connection] = set()
+
+    async def closeConnection(self, databaseFile: str):
+        if not utils.isValidStr(databaseFile):
+            raise TypeError(f'databaseFile argument is malformed: \"{databaseFile}\"')
+
+        async with self.__connectLock:
+            connection = self.__connections.pop(databaseFile, None)
+
+        if connection is None:
+            return
+        elif self.__inFlightUses.get(connection, 0) >= 1:
+            self.__retiredConnections.add(connection)
+            self.__timber.log('ReadOnlySqliteConnectionManager', f'Retired read-only SQLite connection, it will be closed once it is no longer in use ({databaseFile=}) ({self.__inFlightUses[connection]=})')
+            return
+
+        await connection.close()
+        self.__timber.log('ReadOnlySqliteConnectionManager', f'Closed read-only SQLite connection ({databaseFile=})')
+
+    async def __connect(self, databaseFile: str) -> Connection:
+        # checked up front, as aiosqlite doesn't wait for its worker thread to stop when connecting fails
+        if not await aiofiles.ospath.exists(databaseFile):
+            raise FileNotFoundError(f'Read-only SQLite database file not found: \"{databaseFile}\"')
+
+        databaseUri = f'{Path(databaseFile).resolve().as_uri()}?mode=ro&immutable=1'
+
+        connection = await aiosqlite.connect(
+            database = databaseUri,
+            cached_statements = self.__statementCacheSize,
+            uri = True
+        )
+
+        await connection.execute(f'PRAGMA mmap_size = {self.__mmapSizeBytes}')
+        await connection.execute('PRAGMA query_only = ON')
+
+        return connection
+
+    async def getStats(self) -> list[ReadOnlySqliteConnectionStats]:
+        stats: list[ReadOnlySqliteConnectionStats] = list()
+
+        for databaseFile, connectionOpens in self.__connectionOpens.items():
+            stats.append(ReadOnlySqliteConnectionStats(
+                isOpen = databaseFile in self.__connections,
+                connectionOpens = connectionOpens,
+                connectionUses = self.__connectionUses.get(databaseFile, 0),
+                databaseFile = databaseFile
+            ))
+
+        stats.sort(key = lambda stat: stat.databaseFile.casefold())
+        return stats
+
+    @asynccontextmanager
+    async def useConnection(self, databaseFile: str) -> AsyncIterator[Connection]:
+        if not utils.isValidStr(databaseFile):
+            raise TypeError(f'databaseFile argument is malformed: \"{databaseFile}\"')
+
+        connection = self.__connections.get(databaseFile, None)
+
+        if connection is None:
+            async with self.__connectLock:
+                connection = self.__connections.get(databaseFile, None)
+
+                if connection is None:
+                    connection = await self.__connect(databaseFile)
+                    self.__connections[databaseFile] = connection
+                    self.__connectionOpens[databaseFile] = self.__connectionOpens.get(databaseFile, 0) + 1
+                    self.__timber.log('ReadOnlySqliteConnectionManager', f'Opened read-only SQLite connection ({databaseFile=}) ({self.__mmapSizeBytes=}) ({self.__statementCacheSize=})')
+
+        self.__connectionUses[databaseFile] = self.__connectionUses.get(databaseFile, 0) + 1
+        self.__inFlightUses[connection] = self.__inFlightUses.get(connection, 0) + 1
+
+        try:
+            yield connection
+        finally:
+            inFlightUses = self.__inFlightUses.pop(connection) - 1
+
+            if inFlightUses >= 1:
+                self.__inFlightUses[connection] = inFlightUses
+            elif connection in self.__retiredConnections:
+                self.__retiredConnections.remove(connection)
+                await connection.close()
+                self.__timber.log('ReadOnlySqliteConnectionManager', f'Closed retired read-only SQLite connection ({databaseFile=})')
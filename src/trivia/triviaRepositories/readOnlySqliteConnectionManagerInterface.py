@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from contextlib import AbstractAsyncContextManager
+
+from aiosqlite import Connection
+
+from .readOnlySqliteConnectionStats import ReadOnlySqliteConnectionStats
+
+
+class ReadOnlySqliteConnectionManagerInterface(ABC):
+
+    @abstractmethod
+    async def closeConnection(self, databaseFile: str):
+        pass
+
+    @abstractmethod
+    async def getStats(self) -> list[ReadOnlySqliteConnectionStats]:
+        pass
+
+    @abstractmethod
+    def useConnection(self, databaseFile: str) -> AbstractAsyncContextManager[Connection]:
+        pass
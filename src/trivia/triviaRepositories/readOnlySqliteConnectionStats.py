@@ -0,0 +1,9 @@
+from dataclasses import dataclass
+
+
+@dataclass(frozen = True)
+class ReadOnlySqliteConnectionStats:
+    isOpen: bool
+    connectionOpens: int
+    connectionUses: int
+    databaseFile: str
@@ -0,0 +1,76 @@
+import random
+from array import array
+from typing import Any
+
+import aiofiles.os
+from aiosqlite import Connection
+
+from ...misc import utils as utils
+
+
+class SqliteRowIdSampler:
+
+    # Picks random rows out of a SQLite table without resorting to "ORDER BY RANDOM() LIMIT 1",
+    # which makes SQLite scan and sort the entire table for every single pick. Instead, the rowids
+    # matching each distinct query are loaded once and cached, so a pick is just a random index
+    # into that cache. All cached rowids are thrown away whenever invalidate() is called.
+    #
+    # If a databaseFile is given, then the cached rowids are also thrown away whenever that file's
+    # modification time or size changes, at the cost of a stat() call for every pick. Databases that
+    # can't change while the bot is running (such as those opened through the
+    # ReadOnlySqliteConnectionManager) don't need this, and so shouldn't pass a databaseFile.
+
+    def __init__(self, databaseFile: str | None = None):
+        if databaseFile is not None and not utils.isValidStr(databaseFile):
+            raise TypeError(f'databaseFile argument is malformed: \"{databaseFile}\"')
+
+        self.__databaseFile: str | None = databaseFile
+
+        self.__fileSignature: tuple[int, int] | None = None
+        self.__rowIds: dict[tuple[str, tuple[Any, ...]], array] = dict()
+
+    async def __fetchFileSignature(self, databaseFile: str) -> tuple[int, int]:
+        stat = await aiofiles.os.stat(databaseFile)
+        return stat.st_mtime_ns, stat.st_size
+
+    def invalidate(self):
+        self.__fileSignature = None
+        self.__rowIds.clear()
+
+    async def sampleRowId(
+        self,
+        connection: Connection,
+        rowIdsQuery: str,
+        parameters: tuple[Any, ...] = ()
+    ) -> int | None:
+        if not isinstance(connection, Connection):
+            raise TypeError(f'connection argument is malformed: \"{connection}\"')
+        elif not utils.isValidStr(rowIdsQuery):
+            raise TypeError(f'rowIdsQuery argument is malformed: \"{rowIdsQuery}\"')
+        elif not isinstance(parameters, tuple):
+            raise TypeError(f'parameters argument is malformed: \"{parameters}\"')
+
+        databaseFile = self.__databaseFile
+
+        if databaseFile is not None:
+            fileSignature = await self.__fetchFileSignature(databaseFile)
+
+            if fileSignature != self.__fileSignature:
+                self.invalidate()
+                self.__fileSignature = fileSignature
+
+        cacheKey = (rowIdsQuery, parameters)
+        rowIds = self.__rowIds.get(cacheKey, None)
+
+        if rowIds is None:
+            cursor = await connection.execute(rowIdsQuery, parameters)
+            rows = await cursor.fetchall()
+            await cursor.close()
+
+            rowIds = array('q', (row[0] for row in rows))
+            self.__rowIds[cacheKey] = rowIds
+
+        if len(rowIds) == 0:
+            return None
+
+        return rowIds[random.randrange(len(rowIds))]
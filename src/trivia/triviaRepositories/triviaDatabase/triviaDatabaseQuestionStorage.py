@@ -1,9 +1,9 @@
 import traceback
+from typing import Any
 
 import aiofiles
 import aiofiles.os
 import aiofiles.ospath
-import aiosqlite
 from frozenlist import FrozenList
 
 from .booleanTriviaDatabaseTriviaQuestion import BooleanTriviaDatabaseTriviaQuestion
@@ -13,6 +13,8 @@ from .exceptions import (NoTriviaQuestionsAvailableException,
 from .multipleChoiceTriviaDatabaseTriviaQuestion import MultipleChoiceTriviaDatabaseTriviaQuestion
 from .triviaDatabaseQuestionStorageInterface import TriviaDatabaseQuestionStorageInterface
 from .triviaDatabaseTriviaQuestion import TriviaDatabaseTriviaQuestion
+from ..readOnlySqliteConnectionManagerInterface import ReadOnlySqliteConnectionManagerInterface
+from ..sqliteRowIdSampler import SqliteRowIdSampler
 from ...misc.triviaDifficultyParserInterface import TriviaDifficultyParserInterface
 from ...misc.triviaQuestionTypeParserInterface import TriviaQuestionTypeParserInterface
 from ...questions.triviaQuestionType import TriviaQuestionType
@@ -25,12 +27,15 @@ class TriviaDatabaseQuestionStorage(TriviaDatabaseQuestionStorageInterface):
 
     def __init__(
         self,
+        readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface,
         timber: TimberInterface,
         triviaDifficultyParser: TriviaDifficultyParserInterface,
         triviaQuestionTypeParser: TriviaQuestionTypeParserInterface,
         databaseFile: str = 'triviaDatabaseTriviaQuestionRepository.sqlite'
     ):
-        if not isinstance(timber, TimberInterface):
+        if not isinstance(readOnlySqliteConnectionManager, ReadOnlySqliteConnectionManagerInterface):
+            raise TypeError(f'readOnlySqliteConnectionManager argument is malformed: \"{readOnlySqliteConnectionManager}\"')
+        elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(triviaDifficultyParser, TriviaDifficultyParserInterface):
             raise TypeError(f'triviaDifficultyParser argument is malformed: \"{triviaDifficultyParser}\"')
@@ -39,10 +44,12 @@ class TriviaDatabaseQuestionStorage(TriviaDatabaseQuestionStorageInterface):
         elif not utils.isValidStr(databaseFile):
             raise TypeError(f'databaseFile argument is malformed: \"{databaseFile}\"')
 
+        self.__readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface = readOnlySqliteConnectionManager
         self.__timber: TimberInterface = timber
         self.__triviaDifficultyParser: TriviaDifficultyParserInterface = triviaDifficultyParser
         self.__triviaQuestionTypeParser: TriviaQuestionTypeParserInterface = triviaQuestionTypeParser
         self.__databaseFile: str = databaseFile
+        self.__rowIdSampler: SqliteRowIdSampler = SqliteRowIdSampler()
 
         self.__hasQuestionSetAvailable: bool | None = None
 
@@ -82,18 +89,30 @@ class TriviaDatabaseQuestionStorage(TriviaDatabaseQuestionStorageInterface):
 
         self.__timber.log('TriviaDatabaseQuestionStorage', f'Fetching trivia question...')
 
-        connection = await aiosqlite.connect(self.__databaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, correctAnswer, difficulty, question, questionId, triviaType, wrongAnswer1, wrongAnswer2, wrongAnswer3 FROM tdQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
+        row: Any | None = None
+
+        async with self.__readOnlySqliteConnectionManager.useConnection(self.__databaseFile) as connection:
+            rowId = await self.__rowIdSampler.sampleRowId(
+                connection = connection,
+                rowIdsQuery = 'SELECT rowid FROM tdQuestions'
+            )
+
+            if rowId is not None:
+                cursor = await connection.execute(
+                    '''
+                        SELECT category, correctAnswer, difficulty, question, questionId, triviaType, wrongAnswer1, wrongAnswer2, wrongAnswer3 FROM tdQuestions
+                        WHERE rowid = $1
+                        LIMIT 1
+                    ''',
+                    (rowId, )
+                )
 
-        row = await cursor.fetchone()
+                row = await cursor.fetchone()
+                await cursor.close()
 
         if row is None or len(row) != 9:
+            await self.__readOnlySqliteConnectionManager.closeConnection(self.__databaseFile)
+            self.__rowIdSampler.invalidate()
             raise NoTriviaQuestionsAvailableException(f'Unable to fetch trivia question data from Trivia Database! ({self.__databaseFile=}) ({row=})')
 
         category: str | None = row[0]
@@ -106,9 +125,6 @@ class TriviaDatabaseQuestionStorage(TriviaDatabaseQuestionStorageInterface):
         incorrectAnswer1: str | None = row[7]
         incorrectAnswer2: str | None = row[8]
 
-        await cursor.close()
-        await connection.close()
-
         match triviaType:
             case TriviaQuestionType.MULTIPLE_CHOICE:
                 incorrectAnswers = await self.__buildIncorrectAnswersList(
@@ -2,9 +2,10 @@ from typing import Any
 
 import aiofiles
 import aiofiles.ospath
-import aiosqlite
 
 from .absTriviaQuestionRepository import AbsTriviaQuestionRepository
+from .readOnlySqliteConnectionManagerInterface import ReadOnlySqliteConnectionManagerInterface
+from .sqliteRowIdSampler import SqliteRowIdSampler
 from ..compilers.triviaQuestionCompilerInterface import TriviaQuestionCompilerInterface
 from ..questions.absTriviaQuestion import AbsTriviaQuestion
 from ..questions.multipleChoiceTriviaQuestion import MultipleChoiceTriviaQuestion
@@ -22,6 +23,7 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
 
     def __init__(
         self,
+        readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface,
         timber: TimberInterface,
         triviaQuestionCompiler: TriviaQuestionCompilerInterface,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
@@ -29,16 +31,20 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
     ):
         super().__init__(triviaSettingsRepository)
 
-        if not isinstance(timber, TimberInterface):
+        if not isinstance(readOnlySqliteConnectionManager, ReadOnlySqliteConnectionManagerInterface):
+            raise TypeError(f'readOnlySqliteConnectionManager argument is malformed: \"{readOnlySqliteConnectionManager}\"')
+        elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(triviaQuestionCompiler, TriviaQuestionCompilerInterface):
             raise TypeError(f'triviaQuestionCompiler argument is malformed: \"{triviaQuestionCompiler}\"')
         elif not utils.isValidStr(triviaDatabaseFile):
             raise TypeError(f'triviaDatabaseFile argument is malformed: \"{triviaDatabaseFile}\"')
 
+        self.__readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface = readOnlySqliteConnectionManager
         self.__timber: TimberInterface = timber
         self.__triviaQuestionCompiler: TriviaQuestionCompilerInterface = triviaQuestionCompiler
         self.__triviaDatabaseFile: str = triviaDatabaseFile
+        self.__rowIdSampler: SqliteRowIdSampler = SqliteRowIdSampler()
 
         self.__hasQuestionSetAvailable: bool | None = None
 
@@ -92,17 +98,30 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
         if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
             raise FileNotFoundError(f'Trivia Question Company trivia database file not found: \"{self.__triviaDatabaseFile}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT category, correctAnswerIndex, difficulty, question, questionId, questionType, response0, response1, response2, response3 FROM tqcQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
+        row: Any | None = None
+
+        async with self.__readOnlySqliteConnectionManager.useConnection(self.__triviaDatabaseFile) as connection:
+            rowId = await self.__rowIdSampler.sampleRowId(
+                connection = connection,
+                rowIdsQuery = 'SELECT rowid FROM tqcQuestions'
+            )
+
+            if rowId is not None:
+                cursor = await connection.execute(
+                    '''
+                        SELECT category, correctAnswerIndex, difficulty, question, questionId, questionType, response0, response1, response2, response3 FROM tqcQuestions
+                        WHERE rowid = $1
+                        LIMIT 1
+                    ''',
+                    (rowId, )
+                )
+
+                row = await cursor.fetchone()
+                await cursor.close()
 
-        row = await cursor.fetchone()
         if not utils.hasItems(row) or len(row) != 10:
+            await self.__readOnlySqliteConnectionManager.closeConnection(self.__triviaDatabaseFile)
+            self.__rowIdSampler.invalidate()
             raise RuntimeError(f'Received malformed data from {self.triviaSource} database: {row}')
 
         questionDict: dict[str, Any] = {
@@ -115,8 +134,6 @@ class TriviaQuestionCompanyTriviaQuestionRepository(AbsTriviaQuestionRepository)
             'responses': [ row[6], row[7], row[8], row[9] ]
         }
 
-        await cursor.close()
-        await connection.close()
         return questionDict
 
     async def hasQuestionSetAvailable(self) -> bool:
@@ -0,0 +1,101 @@
+from collections import deque
+
+from .triviaQuestionSpoolStats import TriviaQuestionSpoolStats
+from ..questions.absTriviaQuestion import AbsTriviaQuestion
+from ..questions.triviaSource import TriviaSource
+from ..triviaFetchOptions import TriviaFetchOptions
+
+
+class TriviaQuestionSpool:
+
+    # Holds a handful of trivia questions that have already been fetched and had their content
+    # verified, all ready to be handed out to one specific Twitch channel. The trivia history is
+    # tracked per channel, so a spool that's shared between channels ends up handing out a lot of
+    # questions that just get rejected as repeats.
+    #
+    # A question that's retrieved from this spool only counts as a hit once it's actually been
+    # handed out. If it's rejected instead (e.g. because the channel has already seen it), then
+    # it counts as a rejection, so that repeats can't make the spool look better than it is.
+
+    def __init__(self, triviaFetchOptions: TriviaFetchOptions):
+        if not isinstance(triviaFetchOptions, TriviaFetchOptions):
+            raise TypeError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+        elif triviaFetchOptions.requiredTriviaSource is not None:
+            raise ValueError(f'triviaFetchOptions argument can\'t have a requiredTriviaSource: \"{triviaFetchOptions}\"')
+
+        self.__triviaFetchOptions: TriviaFetchOptions = triviaFetchOptions
+
+        self.__isRefilling: bool = False
+        self.__hits: int = 0
+        self.__misses: int = 0
+        self.__rejections: int = 0
+        self.__questions: deque[AbsTriviaQuestion] = deque()
+        self.__questionKeys: set[tuple[TriviaSource, str]] = set()
+
+    def beginRefill(self) -> bool:
+        if self.__isRefilling:
+            return False
+
+        self.__isRefilling = True
+        return True
+
+    def endRefill(self):
+        self.__isRefilling = False
+
+    def get(self) -> AbsTriviaQuestion | None:
+        if len(self.__questions) == 0:
+            self.__misses += 1
+            return None
+
+        question = self.__questions.popleft()
+        self.__questionKeys.discard(self.__getQuestionKey(question))
+        return question
+
+    def __getQuestionKey(self, question: AbsTriviaQuestion) -> tuple[TriviaSource, str]:
+        triviaSource = question.triviaSource
+
+        if question.originalTriviaSource is not None:
+            triviaSource = question.originalTriviaSource
+
+        return triviaSource, question.triviaId
+
+    @property
+    def isRefilling(self) -> bool:
+        return self.__isRefilling
+
+    def put(self, question: AbsTriviaQuestion) -> bool:
+        if not isinstance(question, AbsTriviaQuestion):
+            raise TypeError(f'question argument is malformed: \"{question}\"')
+
+        questionKey = self.__getQuestionKey(question)
+
+        if questionKey in self.__questionKeys:
+            return False
+
+        self.__questions.append(question)
+        self.__questionKeys.add(questionKey)
+        return True
+
+    def qsize(self) -> int:
+        return len(self.__questions)
+
+    def recordHit(self):
+        self.__hits += 1
+
+    def recordRejection(self):
+        self.__rejections += 1
+
+    def toStats(self) -> TriviaQuestionSpoolStats:
+        return TriviaQuestionSpoolStats(
+            hits = self.__hits,
+            misses = self.__misses,
+            rejections = self.__rejections,
+            size = len(self.__questions),
+            questionAnswerTriviaConditions = self.__triviaFetchOptions.questionAnswerTriviaConditions,
+            twitchChannel = self.__triviaFetchOptions.twitchChannel,
+            twitchChannelId = self.__triviaFetchOptions.twitchChannelId
+        )
+
+    @property
+    def triviaFetchOptions(self) -> TriviaFetchOptions:
+        return self.__triviaFetchOptions
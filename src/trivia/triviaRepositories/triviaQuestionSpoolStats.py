@@ -0,0 +1,22 @@
+from dataclasses import dataclass
+
+from ..questionAnswerTriviaConditions import QuestionAnswerTriviaConditions
+
+
+@dataclass(frozen = True)
+class TriviaQuestionSpoolStats:
+    hits: int
+    misses: int
+    rejections: int
+    size: int
+    questionAnswerTriviaConditions: QuestionAnswerTriviaConditions
+    twitchChannel: str
+    twitchChannelId: str
+
+    def getHitRate(self) -> float:
+        requests = self.hits + self.misses + self.rejections
+
+        if requests == 0:
+            return 0
+
+        return self.hits / requests
@@ -1,8 +1,7 @@
 import asyncio
-import queue
 import random
+import time
 import traceback
-from queue import SimpleQueue
 
 from .bongoTriviaQuestionRepository import BongoTriviaQuestionRepository
 from .funtoonTriviaQuestionRepository import FuntoonTriviaQuestionRepository
@@ -17,7 +16,11 @@ from .quizApiTriviaQuestionRepository import QuizApiTriviaQuestionRepository
 from .triviaDatabaseTriviaQuestionRepository import TriviaDatabaseTriviaQuestionRepository
 from .triviaQuestionCompanyTriviaQuestionRepository import TriviaQuestionCompanyTriviaQuestionRepository
 from .triviaQuestionRepositoryInterface import TriviaQuestionRepositoryInterface
+from .triviaQuestionSpool import TriviaQuestionSpool
+from .triviaQuestionSpoolStats import TriviaQuestionSpoolStats
 from .triviaRepositoryInterface import TriviaRepositoryInterface
+from .triviaSourceAvailabilityCacheInterface import TriviaSourceAvailabilityCacheInterface
+from .triviaSourceAvailabilityListener import TriviaSourceAvailabilityListener
 from .willFryTriviaQuestionRepository import WillFryTriviaQuestionRepository
 from .wwtbamTriviaQuestionRepository import WwtbamTriviaQuestionRepository
 from ..content.triviaContentCode import TriviaContentCode
@@ -36,6 +39,7 @@ from ..triviaExceptions import (GenericTriviaNetworkException,
                                 UnavailableTriviaSourceException)
 from ..triviaFetchOptions import TriviaFetchOptions
 from ..triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
+from ..triviaSourceCircuitBreakerInterface import TriviaSourceCircuitBreakerInterface
 from ..triviaSourceInstabilityHelper import TriviaSourceInstabilityHelper
 from ..triviaVerifierInterface import TriviaVerifierInterface
 from ...misc import utils as utils
@@ -45,7 +49,7 @@ from ...twitch.twitchHandleProviderInterface import TwitchHandleProviderInterfac
 from ...users.userIdsRepositoryInterface import UserIdsRepositoryInterface
 
 
-class TriviaRepository(TriviaRepositoryInterface):
+class TriviaRepository(TriviaRepositoryInterface, TriviaSourceAvailabilityListener):
 
     def __init__(
         self,
@@ -65,12 +69,15 @@ class TriviaRepository(TriviaRepositoryInterface):
         triviaQuestionCompanyTriviaQuestionRepository: TriviaQuestionCompanyTriviaQuestionRepository,
         triviaScraper: TriviaScraperInterface | None,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
+        triviaSourceAvailabilityCache: TriviaSourceAvailabilityCacheInterface,
+        triviaSourceCircuitBreaker: TriviaSourceCircuitBreakerInterface,
         triviaSourceInstabilityHelper: TriviaSourceInstabilityHelper,
         triviaVerifier: TriviaVerifierInterface,
         twitchHandleProvider: TwitchHandleProviderInterface,
         userIdsRepository: UserIdsRepositoryInterface,
         willFryTriviaQuestionRepository: WillFryTriviaQuestionRepository,
         wwtbamTriviaQuestionRepository: WwtbamTriviaQuestionRepository,
+        maxConcurrentSpoolFetches: int = 4,
         spoolerLoopSleepTimeSeconds: float = 120,
         triviaRetrySleepTimeSeconds: float = 0.25
     ):
@@ -106,6 +113,10 @@ class TriviaRepository(TriviaRepositoryInterface):
             raise TypeError(f'triviaScraper argument is malformed: \"{triviaScraper}\"')
         elif not isinstance(triviaSettingsRepository, TriviaSettingsRepositoryInterface):
             raise TypeError(f'triviaSettingsRepository argument is malformed: \"{triviaSettingsRepository}\"')
+        elif not isinstance(triviaSourceAvailabilityCache, TriviaSourceAvailabilityCacheInterface):
+            raise TypeError(f'triviaSourceAvailabilityCache argument is malformed: \"{triviaSourceAvailabilityCache}\"')
+        elif not isinstance(triviaSourceCircuitBreaker, TriviaSourceCircuitBreakerInterface):
+            raise TypeError(f'triviaSourceCircuitBreaker argument is malformed: \"{triviaSourceCircuitBreaker}\"')
         elif not isinstance(triviaSourceInstabilityHelper, TriviaSourceInstabilityHelper):
             raise TypeError(f'triviaSourceInstabilityHelper argument is malformed: \"{triviaSourceInstabilityHelper}\"')
         elif not isinstance(triviaVerifier, TriviaVerifierInterface):
@@ -118,6 +129,10 @@ class TriviaRepository(TriviaRepositoryInterface):
             raise TypeError(f'willFryTriviaQuestionRepository argument is malformed: \"{willFryTriviaQuestionRepository}\"')
         elif not isinstance(wwtbamTriviaQuestionRepository, WwtbamTriviaQuestionRepository):
             raise TypeError(f'wwtbamTriviaQuestionRepository argument is malformed: \"{wwtbamTriviaQuestionRepository}\"')
+        elif not utils.isValidInt(maxConcurrentSpoolFetches):
+            raise TypeError(f'maxConcurrentSpoolFetches argument is malformed: \"{maxConcurrentSpoolFetches}\"')
+        elif maxConcurrentSpoolFetches < 1 or maxConcurrentSpoolFetches > 16:
+            raise ValueError(f'maxConcurrentSpoolFetches argument is out of bounds: {maxConcurrentSpoolFetches}')
         elif not utils.isValidNum(spoolerLoopSleepTimeSeconds):
             raise TypeError(f'spoolerLoopSleepTimeSeconds argument is malformed: \"{spoolerLoopSleepTimeSeconds}\"')
         elif spoolerLoopSleepTimeSeconds < 15 or spoolerLoopSleepTimeSeconds > 300:
@@ -143,6 +158,8 @@ class TriviaRepository(TriviaRepositoryInterface):
         self.__triviaQuestionCompanyTriviaQuestionRepository: TriviaQuestionRepositoryInterface = triviaQuestionCompanyTriviaQuestionRepository
         self.__triviaScraper: TriviaScraperInterface | None = triviaScraper
         self.__triviaSettingsRepository: TriviaSettingsRepositoryInterface = triviaSettingsRepository
+        self.__triviaSourceAvailabilityCache: TriviaSourceAvailabilityCacheInterface = triviaSourceAvailabilityCache
+        self.__triviaSourceCircuitBreaker: TriviaSourceCircuitBreakerInterface = triviaSourceCircuitBreaker
         self.__triviaSourceInstabilityHelper: TriviaSourceInstabilityHelper = triviaSourceInstabilityHelper
         self.__triviaVerifier: TriviaVerifierInterface = triviaVerifier
         self.__twitchHandleProvider: TwitchHandleProviderInterface = twitchHandleProvider
@@ -153,18 +170,27 @@ class TriviaRepository(TriviaRepositoryInterface):
         self.__triviaRetrySleepTimeSeconds: float = triviaRetrySleepTimeSeconds
 
         self.__isSpoolerStarted: bool = False
+        self.__spoolFetchSemaphore: asyncio.Semaphore = asyncio.Semaphore(maxConcurrentSpoolFetches)
         self.__triviaSourceToRepositoryMap: dict[TriviaSource, TriviaQuestionRepositoryInterface | None] = self.__createTriviaSourceToRepositoryMap()
-        self.__superTriviaQuestionSpool: SimpleQueue[QuestionAnswerTriviaQuestion] = SimpleQueue()
-        self.__triviaQuestionSpool: SimpleQueue[AbsTriviaQuestion] = SimpleQueue()
+        self.__triviaQuestionSpools: dict[tuple[str, bool], TriviaQuestionSpool] = dict()
         self.__twitchChannelId: str | None = None
 
-    async def __chooseRandomTriviaSource(self, triviaFetchOptions: TriviaFetchOptions) -> TriviaQuestionRepositoryInterface:
+    async def __chooseRandomTriviaSource(
+        self,
+        triviaFetchOptions: TriviaFetchOptions,
+        excludedTriviaSources: set[TriviaSource] | None = None
+    ) -> TriviaQuestionRepositoryInterface:
         if not isinstance(triviaFetchOptions, TriviaFetchOptions):
             raise TypeError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
+        elif excludedTriviaSources is not None and not isinstance(excludedTriviaSources, set):
+            raise TypeError(f'excludedTriviaSources argument is malformed: \"{excludedTriviaSources}\"')
 
         triviaSourcesAndWeights: dict[TriviaSource, int] = await self.__triviaSettingsRepository.getAvailableTriviaSourcesAndWeights()
         triviaSourcesToRemove: set[TriviaSource] = await self.__getCurrentlyInvalidTriviaSources(triviaFetchOptions)
 
+        if excludedTriviaSources is not None:
+            triviaSourcesToRemove.update(excludedTriviaSources)
+
         for triviaSourceToRemove in triviaSourcesToRemove:
             if triviaSourceToRemove in triviaSourcesAndWeights:
                 del triviaSourcesAndWeights[triviaSourceToRemove]
@@ -173,11 +199,14 @@ class TriviaRepository(TriviaRepositoryInterface):
             raise RuntimeError(f'There are no trivia sources available to be fetched from! ({triviaFetchOptions=})')
 
         triviaSources: list[TriviaSource] = list()
-        triviaWeights: list[int] = list()
+        triviaWeights: list[float] = list()
 
         for triviaSource in triviaSourcesAndWeights:
+            # sources that have recently been slow to respond are picked less often
+            weightMultiplier = self.__triviaSourceCircuitBreaker.getWeightMultiplier(triviaSource)
+
             triviaSources.append(triviaSource)
-            triviaWeights.append(triviaSourcesAndWeights[triviaSource])
+            triviaWeights.append(triviaSourcesAndWeights[triviaSource] * weightMultiplier)
 
         randomChoices = random.choices(
             population = triviaSources,
@@ -250,10 +279,13 @@ class TriviaRepository(TriviaRepositoryInterface):
         attemptedTriviaSources: list[TriviaSource] = list()
 
         while retryCount < maxRetryCount:
+            isSpooledQuestion = False
+
             if triviaFetchOptions.requiredTriviaSource is not None:
                 question = None
             else:
                 question = await self.__retrieveSpooledTriviaQuestion(triviaFetchOptions)
+                isSpooledQuestion = question is not None
 
             if question is None:
                 try:
@@ -262,22 +294,11 @@ class TriviaRepository(TriviaRepositoryInterface):
                     self.__timber.log('TriviaRepository', f'Failed to get trivia source (required trivia source was \"{triviaFetchOptions.requiredTriviaSource}\"): {e}', e, traceback.format_exc())
                     return
 
-                triviaSource = triviaQuestionRepository.triviaSource
-                attemptedTriviaSources.append(triviaSource)
-
-                try:
-                    question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
-                except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
-                    self.__timber.log('TriviaRepository', f'Failed to fetch trivia question due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
-                except GenericTriviaNetworkException as e:
-                    errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-                    self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
-                except MalformedTriviaJsonException as e:
-                    errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-                    self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
-                except Exception as e:
-                    errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-                    self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+                question = await self.__fetchTriviaQuestionWithHedging(
+                    attemptedTriviaSources = attemptedTriviaSources,
+                    triviaFetchOptions = triviaFetchOptions,
+                    triviaQuestionRepository = triviaQuestionRepository
+                )
 
             if question is not None and await self.__verifyTriviaQuestionContent(
                 question = question,
@@ -290,24 +311,141 @@ class TriviaRepository(TriviaRepositoryInterface):
                     emote = emote,
                     triviaFetchOptions = triviaFetchOptions
                 ):
+                    if isSpooledQuestion:
+                        self.__getTriviaQuestionSpool(triviaFetchOptions).recordHit()
+
                     return question
 
+            if isSpooledQuestion:
+                self.__getTriviaQuestionSpool(triviaFetchOptions).recordRejection()
+
             question = None
             retryCount = retryCount + 1
             await asyncio.sleep(self.__triviaRetrySleepTimeSeconds * float(retryCount))
 
         raise TooManyTriviaFetchAttemptsException(f'Unable to fetch trivia from {attemptedTriviaSources} after {retryCount} attempts (max attempts is {maxRetryCount})')
 
+    async def __fetchTriviaQuestion(
+        self,
+        triviaFetchOptions: TriviaFetchOptions,
+        triviaQuestionRepository: TriviaQuestionRepositoryInterface
+    ) -> AbsTriviaQuestion | None:
+        triviaSource = triviaQuestionRepository.triviaSource
+
+        if not self.__triviaSourceCircuitBreaker.tryAcquire(triviaSource):
+            self.__timber.log('TriviaRepository', f'Skipped fetching trivia question as this trivia source\'s circuit is open ({triviaSource=})')
+            return None
+
+        startTime = time.perf_counter()
+
+        try:
+            question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
+        except asyncio.CancelledError:
+            self.__triviaSourceCircuitBreaker.recordCancellation(triviaSource, time.perf_counter() - startTime)
+            raise
+        except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
+            # the trivia source itself responded just fine here, it was only the question that was bad
+            self.__triviaSourceCircuitBreaker.recordSuccess(triviaSource, time.perf_counter() - startTime)
+            self.__timber.log('TriviaRepository', f'Failed to fetch trivia question due to malformed data (trivia source was \"{triviaSource}\"): {e}', e, traceback.format_exc())
+            return None
+        except GenericTriviaNetworkException as e:
+            self.__triviaSourceCircuitBreaker.recordFailure(triviaSource, time.perf_counter() - startTime)
+            errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
+            self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+            return None
+        except MalformedTriviaJsonException as e:
+            self.__triviaSourceCircuitBreaker.recordFailure(triviaSource, time.perf_counter() - startTime)
+            errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
+            self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+            return None
+        except Exception as e:
+            self.__triviaSourceCircuitBreaker.recordFailure(triviaSource, time.perf_counter() - startTime)
+            errorCount = self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
+            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question (trivia source was \"{triviaSource}\") (new error count is {errorCount}): {e}', e, traceback.format_exc())
+            return None
+
+        self.__triviaSourceCircuitBreaker.recordSuccess(triviaSource, time.perf_counter() - startTime)
+        return question
+
+    # Fetches a trivia question from the given trivia source, but if that source takes longer than
+    # its own recent p95 latency to respond, a second (different) trivia source is raced against
+    # it. Whichever of the two comes back with a question first wins, and the other is cancelled.
+    async def __fetchTriviaQuestionWithHedging(
+        self,
+        attemptedTriviaSources: list[TriviaSource],
+        triviaFetchOptions: TriviaFetchOptions,
+        triviaQuestionRepository: TriviaQuestionRepositoryInterface
+    ) -> AbsTriviaQuestion | None:
+        triviaSource = triviaQuestionRepository.triviaSource
+        attemptedTriviaSources.append(triviaSource)
+        hedgeDelaySeconds: float | None = None
+
+        if triviaFetchOptions.requiredTriviaSource is None and await self.__triviaSettingsRepository.isTriviaSourceHedgingEnabled():
+            hedgeDelaySeconds = self.__triviaSourceCircuitBreaker.getHedgeDelaySeconds(triviaSource)
+
+        if hedgeDelaySeconds is None:
+            return await self.__fetchTriviaQuestion(
+                triviaFetchOptions = triviaFetchOptions,
+                triviaQuestionRepository = triviaQuestionRepository
+            )
+
+        pendingTasks: set[asyncio.Task[AbsTriviaQuestion | None]] = { asyncio.create_task(self.__fetchTriviaQuestion(
+            triviaFetchOptions = triviaFetchOptions,
+            triviaQuestionRepository = triviaQuestionRepository
+        )) }
+
+        try:
+            doneTasks, pendingTasks = await asyncio.wait(pendingTasks, timeout = hedgeDelaySeconds)
+
+            if len(doneTasks) >= 1:
+                return doneTasks.pop().result()
+
+            try:
+                hedgeTriviaQuestionRepository = await self.__chooseRandomTriviaSource(
+                    triviaFetchOptions = triviaFetchOptions,
+                    excludedTriviaSources = { triviaSource }
+                )
+            except RuntimeError as e:
+                self.__timber.log('TriviaRepository', f'Unable to choose a trivia source to hedge with ({triviaSource=}) ({hedgeDelaySeconds=}): {e}', e, traceback.format_exc())
+                return await pendingTasks.pop()
+
+            hedgeTriviaSource = hedgeTriviaQuestionRepository.triviaSource
+            attemptedTriviaSources.append(hedgeTriviaSource)
+            self.__timber.log('TriviaRepository', f'Hedging slow trivia question fetch with another trivia source ({triviaSource=}) ({hedgeTriviaSource=}) ({hedgeDelaySeconds=})')
+
+            pendingTasks.add(asyncio.create_task(self.__fetchTriviaQuestion(
+                triviaFetchOptions = triviaFetchOptions,
+                triviaQuestionRepository = hedgeTriviaQuestionRepository
+            )))
+
+            while len(pendingTasks) >= 1:
+                doneTasks, pendingTasks = await asyncio.wait(pendingTasks, return_when = asyncio.FIRST_COMPLETED)
+
+                for doneTask in doneTasks:
+                    question = doneTask.result()
+
+                    if question is not None:
+                        return question
+
+            return None
+        finally:
+            for pendingTask in pendingTasks:
+                pendingTask.cancel()
+
     async def __getCurrentlyInvalidTriviaSources(self, triviaFetchOptions: TriviaFetchOptions) -> set[TriviaSource]:
         if not isinstance(triviaFetchOptions, TriviaFetchOptions):
             raise TypeError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
 
         availableTriviaSourcesMap: dict[TriviaSource, TriviaQuestionRepositoryInterface] = dict()
+        currentlyInvalidTriviaSources: set[TriviaSource] = set()
+
         for triviaSource, triviaQuestionRepository in self.__triviaSourceToRepositoryMap.items():
-            if triviaQuestionRepository is not None and await triviaQuestionRepository.hasQuestionSetAvailable():
+            if triviaQuestionRepository is None:
+                continue
+            elif await self.__triviaSourceAvailabilityCache.isAvailable(triviaQuestionRepository):
                 availableTriviaSourcesMap[triviaSource] = triviaQuestionRepository
-
-        currentlyInvalidTriviaSources: set[TriviaSource] = set()
+            else:
+                currentlyInvalidTriviaSources.add(triviaSource)
 
         if not triviaFetchOptions.areQuestionAnswerTriviaQuestionsEnabled():
             for triviaSource, triviaQuestionRepository in availableTriviaSourcesMap.items():
@@ -343,6 +481,8 @@ class TriviaRepository(TriviaRepositoryInterface):
         for triviaSource in TriviaSource:
             if self.__triviaSourceInstabilityHelper[triviaSource] >= instabilityThreshold:
                 unstableTriviaSources.add(triviaSource)
+            elif not self.__triviaSourceCircuitBreaker.isAvailable(triviaSource):
+                unstableTriviaSources.add(triviaSource)
 
         return unstableTriviaSources
 
@@ -370,6 +510,69 @@ class TriviaRepository(TriviaRepositoryInterface):
     async def __isQuizApiTriviaQuestionRepositoryAvailable(self) -> bool:
         return self.__quizApiTriviaQuestionRepository is not None
 
+    async def __getSpoolMaxSize(self, spool: TriviaQuestionSpool) -> int:
+        if spool.triviaFetchOptions.requireQuestionAnswerTriviaQuestion():
+            return await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize()
+        else:
+            return await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize()
+
+    async def getSpoolStats(self) -> list[TriviaQuestionSpoolStats]:
+        stats = [ spool.toStats() for spool in self.__triviaQuestionSpools.values() ]
+        stats.sort(key = lambda stat: (stat.twitchChannel.casefold(), stat.questionAnswerTriviaConditions.name))
+        return stats
+
+    def __getTriviaQuestionSpool(self, triviaFetchOptions: TriviaFetchOptions) -> TriviaQuestionSpool:
+        isSuperTrivia = triviaFetchOptions.requireQuestionAnswerTriviaQuestion()
+        spoolKey = (triviaFetchOptions.twitchChannelId, isSuperTrivia)
+        spool = self.__triviaQuestionSpools.get(spoolKey, None)
+
+        if spool is None:
+            if isSuperTrivia:
+                questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
+            else:
+                questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED
+
+            spool = TriviaQuestionSpool(TriviaFetchOptions(
+                twitchChannel = triviaFetchOptions.twitchChannel,
+                twitchChannelId = triviaFetchOptions.twitchChannelId,
+                questionAnswerTriviaConditions = questionAnswerTriviaConditions
+            ))
+
+            self.__triviaQuestionSpools[spoolKey] = spool
+
+        return spool
+
+    async def onTriviaSourceAvailabilityChanged(
+        self,
+        isAvailable: bool,
+        triviaSource: TriviaSource
+    ):
+        self.__timber.log('TriviaRepository', f'Trivia source availability changed ({isAvailable=}) ({triviaSource=})')
+
+        if not isAvailable or not self.__isSpoolerStarted:
+            return
+
+        # a newly available trivia source could be just what an undersized spool was missing
+        for spool in list(self.__triviaQuestionSpools.values()):
+            if not spool.isRefilling:
+                self.__backgroundTaskHelper.createTask(self.__refillTriviaQuestionSpool(spool))
+
+    async def __refillTriviaQuestionSpool(self, spool: TriviaQuestionSpool):
+        if not spool.beginRefill():
+            return
+
+        try:
+            missingQuestions = await self.__getSpoolMaxSize(spool) - spool.qsize()
+
+            if missingQuestions >= 1:
+                self.__timber.log('TriviaRepository', f'Spooling up {missingQuestions} trivia question(s) ({spool.triviaFetchOptions=}) (current qsize: {spool.qsize()})')
+                await asyncio.gather(*[ self.__spoolNewTriviaQuestion(spool) for _ in range(missingQuestions) ])
+                self.__timber.log('TriviaRepository', f'Finished spooling up trivia questions ({spool.triviaFetchOptions=}) (new qsize: {spool.qsize()})')
+        except Exception as e:
+            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refilling trivia question spool ({spool.triviaFetchOptions=})', e, traceback.format_exc())
+        finally:
+            spool.endRefill()
+
     async def __retrieveSpooledTriviaQuestion(
         self,
         triviaFetchOptions: TriviaFetchOptions
@@ -377,22 +580,17 @@ class TriviaRepository(TriviaRepositoryInterface):
         if not isinstance(triviaFetchOptions, TriviaFetchOptions):
             raise TypeError(f'triviaFetchOptions argument is malformed: \"{triviaFetchOptions}\"')
 
-        if triviaFetchOptions.requireQuestionAnswerTriviaQuestion():
-            if not self.__superTriviaQuestionSpool.empty():
-                try:
-                    self.__timber.log('TriviaRepository', f'Retrieving spooled super trivia question (current qsize: {self.__superTriviaQuestionSpool.qsize()})')
-                    return self.__superTriviaQuestionSpool.get_nowait()
-                except queue.Empty as e:
-                    self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled super trivia question', e, traceback.format_exc())
-        else:
-            if not self.__triviaQuestionSpool.empty():
-                try:
-                    self.__timber.log('TriviaRepository', f'Retrieving spooled trivia question (current qsize: {self.__triviaQuestionSpool.qsize()})')
-                    return self.__triviaQuestionSpool.get_nowait()
-                except queue.Empty as e:
-                    self.__timber.log('TriviaRepository', f'Encountered queue.Empty when trying to retrieve a spooled trivia question', e, traceback.format_exc())
+        spool = self.__getTriviaQuestionSpool(triviaFetchOptions)
+        question = spool.get()
 
-        return None
+        if question is not None:
+            self.__timber.log('TriviaRepository', f'Retrieving spooled trivia question ({triviaFetchOptions=}) (current qsize: {spool.qsize()})')
+        elif self.__isSpoolerStarted and not spool.isRefilling:
+            # this spool has run dry (or has only just been created), so rather than waiting on
+            # the spooler loop, immediately start refilling it for the next time around
+            self.__backgroundTaskHelper.createTask(self.__refillTriviaQuestionSpool(spool))
+
+        return question
 
     async def __scrapeAndStore(self, question: AbsTriviaQuestion | None):
         if question is None:
@@ -408,96 +606,47 @@ class TriviaRepository(TriviaRepositoryInterface):
         if triviaScraper is not None:
             await triviaScraper.store(question)
 
-    async def __spoolNewSuperTriviaQuestion(self):
-        if self.__superTriviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxSuperTriviaQuestionSpoolSize():
-            return
-
-        triviaFetchOptions = TriviaFetchOptions(
-            twitchChannel = await self.__twitchHandleProvider.getTwitchHandle(),
-            twitchChannelId = await self.__getTwitchChannelId(),
-            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
-        )
-
-        self.__timber.log('TriviaRepository', f'Spooling up a super trivia question (current qsize: {self.__superTriviaQuestionSpool.qsize()})')
-        triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
-        triviaSource = triviaQuestionRepository.triviaSource
-        question: AbsTriviaQuestion | None = None
-
+    async def __spoolNewTriviaQuestion(self, spool: TriviaQuestionSpool):
         try:
-            question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
-        except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
-            self.__timber.log('TriviaRepository', f'Failed to fetch trivia question for spool due to malformed data ({triviaSource=}): {e}', e, traceback.format_exc())
-        except GenericTriviaNetworkException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching super trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
-        except MalformedTriviaJsonException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching super trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
+            async with self.__spoolFetchSemaphore:
+                await self.__spoolNewTriviaQuestionWithoutLimit(spool)
         except Exception as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching super trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
-
-        if question is None:
-            return
-        elif question.triviaType is not TriviaQuestionType.QUESTION_ANSWER or not isinstance(question, QuestionAnswerTriviaQuestion):
-            self.__timber.log('TriviaRepository', f'Encountered unexpected super trivia question type ({question}) when spooling a super trivia question')
-            return
-
-        if not await self.__verifyTriviaQuestionContent(
-            question = question,
-            triviaFetchOptions = triviaFetchOptions
-        ):
-            self.__timber.log('TriviaRepository', f'Encountered bad trivia question content when spooling a super trivia question')
-            return
+            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing trivia question spool ({spool.triviaFetchOptions=})', e, traceback.format_exc())
 
-        self.__superTriviaQuestionSpool.put(question)
-        self.__timber.log('TriviaRepository', f'Finished spooling up a super trivia question (new qsize: {self.__superTriviaQuestionSpool.qsize()})')
-        await self.__scrapeAndStore(question)
-
-    async def __spoolNewTriviaQuestion(self):
-        if self.__triviaQuestionSpool.qsize() >= await self.__triviaSettingsRepository.getMaxTriviaQuestionSpoolSize():
+    async def __spoolNewTriviaQuestionWithoutLimit(self, spool: TriviaQuestionSpool):
+        if spool.qsize() >= await self.__getSpoolMaxSize(spool):
             return
 
-        triviaFetchOptions = TriviaFetchOptions(
-            twitchChannel = await self.__twitchHandleProvider.getTwitchHandle(),
-            twitchChannelId = await self.__getTwitchChannelId(),
-            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED
-        )
-
-        self.__timber.log('TriviaRepository', f'Spooling up a trivia question (current qsize: {self.__triviaQuestionSpool.qsize()})')
+        triviaFetchOptions = spool.triviaFetchOptions
+        isSuperTrivia = triviaFetchOptions.requireQuestionAnswerTriviaQuestion()
         triviaQuestionRepository = await self.__chooseRandomTriviaSource(triviaFetchOptions)
         triviaSource = triviaQuestionRepository.triviaSource
-        question: AbsTriviaQuestion | None = None
 
-        try:
-            question = await triviaQuestionRepository.fetchTriviaQuestion(triviaFetchOptions)
-        except (NoTriviaCorrectAnswersException, NoTriviaMultipleChoiceResponsesException, NoTriviaQuestionException) as e:
-            self.__timber.log('TriviaRepository', f'Failed to fetch trivia question for spool due to malformed data ({triviaSource=}): {e}', e, traceback.format_exc())
-        except GenericTriviaNetworkException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered network Exception when fetching trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
-        except MalformedTriviaJsonException as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered malformed JSON Exception when fetching trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
-        except Exception as e:
-            self.__triviaSourceInstabilityHelper.incrementErrorCount(triviaSource)
-            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when fetching trivia question for spool ({triviaSource=}): {e}', e, traceback.format_exc())
+        question = await self.__fetchTriviaQuestion(
+            triviaFetchOptions = triviaFetchOptions,
+            triviaQuestionRepository = triviaQuestionRepository
+        )
 
         if question is None:
             return
-        elif question.triviaType is TriviaQuestionType.QUESTION_ANSWER or isinstance(question, QuestionAnswerTriviaQuestion):
-            self.__timber.log('TriviaRepository', f'Encountered unexpected trivia question type ({question}) when spooling a trivia question')
+
+        isQuestionAnswer = question.triviaType is TriviaQuestionType.QUESTION_ANSWER or isinstance(question, QuestionAnswerTriviaQuestion)
+
+        if isSuperTrivia != isQuestionAnswer:
+            self.__timber.log('TriviaRepository', f'Encountered unexpected trivia question type ({question}) when spooling a trivia question ({isSuperTrivia=})')
             return
 
         if not await self.__verifyTriviaQuestionContent(
             question = question,
             triviaFetchOptions = triviaFetchOptions
         ):
-            self.__timber.log('TriviaRepository', f'Encountered bad trivia question content when spooling a trivia question')
+            self.__timber.log('TriviaRepository', f'Encountered bad trivia question content when spooling a trivia question ({isSuperTrivia=})')
+            return
+
+        if not spool.put(question):
+            self.__timber.log('TriviaRepository', f'Discarded a trivia question that was already spooled ({question.triviaId=}) ({triviaSource=})')
             return
 
-        self.__triviaQuestionSpool.put(question)
-        self.__timber.log('TriviaRepository', f'Finished spooling up a trivia question (new qsize: {self.__triviaQuestionSpool.qsize()})')
         await self.__scrapeAndStore(question)
 
     def startSpooler(self):
@@ -507,19 +656,41 @@ class TriviaRepository(TriviaRepositoryInterface):
 
         self.__isSpoolerStarted = True
         self.__timber.log('TriviaRepository', 'Starting spooler...')
+
+        triviaQuestionRepositories = [ triviaQuestionRepository for triviaQuestionRepository in self.__triviaSourceToRepositoryMap.values() if triviaQuestionRepository is not None ]
+        self.__triviaSourceAvailabilityCache.setEventListener(self)
+        self.__triviaSourceAvailabilityCache.start(triviaQuestionRepositories)
+
         self.__backgroundTaskHelper.createTask(self.__startTriviaQuestionSpooler())
 
     async def __startTriviaQuestionSpooler(self):
+        # the bot's own channel is always spooled for, and every other channel's spools are
+        # created the first time that channel asks for a trivia question
+        try:
+            twitchChannel = await self.__twitchHandleProvider.getTwitchHandle()
+            twitchChannelId = await self.__getTwitchChannelId()
+
+            for questionAnswerTriviaConditions in (QuestionAnswerTriviaConditions.NOT_ALLOWED, QuestionAnswerTriviaConditions.REQUIRED):
+                self.__getTriviaQuestionSpool(TriviaFetchOptions(
+                    twitchChannel = twitchChannel,
+                    twitchChannelId = twitchChannelId,
+                    questionAnswerTriviaConditions = questionAnswerTriviaConditions
+                ))
+        except Exception as e:
+            self.__timber.log('TriviaRepository', f'Encountered unknown Exception when creating the trivia question spools for our own channel', e, traceback.format_exc())
+
         while True:
-            try:
-                await self.__spoolNewTriviaQuestion()
-            except Exception as e:
-                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing trivia question spool', e, traceback.format_exc())
+            spools = list(self.__triviaQuestionSpools.values())
+            await asyncio.gather(*[ self.__refillTriviaQuestionSpool(spool) for spool in spools ])
 
-            try:
-                await self.__spoolNewSuperTriviaQuestion()
-            except Exception as e:
-                self.__timber.log('TriviaRepository', f'Encountered unknown Exception when refreshing super trivia question spool', e, traceback.format_exc())
+            # everything scraped by this round of refills goes into glacial storage in one batch
+            triviaScraper = self.__triviaScraper
+
+            if triviaScraper is not None:
+                await triviaScraper.flush()
+
+            for stats in await self.getSpoolStats():
+                self.__timber.log('TriviaRepository', f'Trivia question spool stats ({stats.twitchChannel=}) ({stats.questionAnswerTriviaConditions=}) ({stats.size=}) ({stats.hits=}) ({stats.misses=}) ({stats.rejections=}) (hitRate={stats.getHitRate():.2f})')
 
             await asyncio.sleep(self.__spoolerLoopSleepTimeSeconds)
 
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
 
 from ..questions.absTriviaQuestion import AbsTriviaQuestion
+from .triviaQuestionSpoolStats import TriviaQuestionSpoolStats
 from ..triviaFetchOptions import TriviaFetchOptions
 
 
@@ -14,6 +15,10 @@ class TriviaRepositoryInterface(ABC):
     ) -> AbsTriviaQuestion | None:
         pass
 
+    @abstractmethod
+    async def getSpoolStats(self) -> list[TriviaQuestionSpoolStats]:
+        pass
+
     @abstractmethod
     def startSpooler(self):
         pass
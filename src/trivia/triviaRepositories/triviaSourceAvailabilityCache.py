@@ -0,0 +1,190 @@
+import asyncio
+import time
+import traceback
+from typing import Callable, Collection
+
+from .triviaQuestionRepositoryInterface import TriviaQuestionRepositoryInterface
+from .triviaSourceAvailabilityCacheInterface import TriviaSourceAvailabilityCacheInterface
+from .triviaSourceAvailabilityListener import TriviaSourceAvailabilityListener
+from ..questions.triviaSource import TriviaSource
+from ...misc import utils as utils
+from ...misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ...timber.timberInterface import TimberInterface
+
+
+class TriviaSourceAvailabilityCache(TriviaSourceAvailabilityCacheInterface):
+
+    # Some trivia question repositories have to touch the disk (or even the network) in order to
+    # answer hasQuestionSetAvailable(), and choosing a trivia source used to ask every single one
+    # of them, every single time. This caches each trivia source's answer for its own time to live.
+    # Once started, a background loop re-probes expired entries, so that choosing a trivia source
+    # only ever reads from memory. The one exception is the very first probe of a repository that
+    # was never handed to start(), which has to happen inline.
+
+    def __init__(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
+        timber: TimberInterface,
+        clock: Callable[[], float] = time.monotonic,
+        defaultTimeToLiveSeconds: float = 300,
+        refreshLoopSleepTimeSeconds: float = 15,
+        triviaSourceTimeToLiveSeconds: dict[TriviaSource, float] | None = None
+    ):
+        if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
+            raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
+        elif not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not callable(clock):
+            raise TypeError(f'clock argument is malformed: \"{clock}\"')
+        elif not utils.isValidNum(defaultTimeToLiveSeconds):
+            raise TypeError(f'defaultTimeToLiveSeconds argument is malformed: \"{defaultTimeToLiveSeconds}\"')
+        elif defaultTimeToLiveSeconds < 1 or defaultTimeToLiveSeconds > 86400:
+            raise ValueError(f'defaultTimeToLiveSeconds argument is out of bounds: {defaultTimeToLiveSeconds}')
+        elif not utils.isValidNum(refreshLoopSleepTimeSeconds):
+            raise TypeError(f'refreshLoopSleepTimeSeconds argument is malformed: \"{refreshLoopSleepTimeSeconds}\"')
+        elif refreshLoopSleepTimeSeconds < 1 or refreshLoopSleepTimeSeconds > 3600:
+            raise ValueError(f'refreshLoopSleepTimeSeconds argument is out of bounds: {refreshLoopSleepTimeSeconds}')
+        elif triviaSourceTimeToLiveSeconds is not None and not isinstance(triviaSourceTimeToLiveSeconds, dict):
+            raise TypeError(f'triviaSourceTimeToLiveSeconds argument is malformed: \"{triviaSourceTimeToLiveSeconds}\"')
+
+        self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
+        self.__timber: TimberInterface = timber
+        self.__clock: Callable[[], float] = clock
+        self.__defaultTimeToLiveSeconds: float = defaultTimeToLiveSeconds
+        self.__refreshLoopSleepTimeSeconds: float = refreshLoopSleepTimeSeconds
+
+        self.__triviaSourceTimeToLiveSeconds: dict[TriviaSource, float] = dict()
+
+        if triviaSourceTimeToLiveSeconds is not None:
+            for triviaSource, timeToLiveSeconds in triviaSourceTimeToLiveSeconds.items():
+                if not isinstance(triviaSource, TriviaSource):
+                    raise TypeError(f'triviaSourceTimeToLiveSeconds contains a malformed key: \"{triviaSource}\"')
+                elif not utils.isValidNum(timeToLiveSeconds) or timeToLiveSeconds < 1 or timeToLiveSeconds > 86400:
+                    raise ValueError(f'triviaSourceTimeToLiveSeconds contains an out of bounds value ({triviaSource=}) ({timeToLiveSeconds=})')
+
+                self.__triviaSourceTimeToLiveSeconds[triviaSource] = timeToLiveSeconds
+
+        self.__isStarted: bool = False
+        self.__availabilities: dict[TriviaSource, bool] = dict()
+        self.__eventListener: TriviaSourceAvailabilityListener | None = None
+        self.__expirationTimes: dict[TriviaSource, float] = dict()
+        self.__probeTasks: dict[TriviaSource, asyncio.Task[bool]] = dict()
+        self.__triviaQuestionRepositories: dict[TriviaSource, TriviaQuestionRepositoryInterface] = dict()
+
+    async def clearCaches(self):
+        self.__availabilities.clear()
+        self.__expirationTimes.clear()
+        self.__timber.log('TriviaSourceAvailabilityCache', 'Caches cleared')
+
+    async def isAvailable(self, triviaQuestionRepository: TriviaQuestionRepositoryInterface) -> bool:
+        if not isinstance(triviaQuestionRepository, TriviaQuestionRepositoryInterface):
+            raise TypeError(f'triviaQuestionRepository argument is malformed: \"{triviaQuestionRepository}\"')
+
+        triviaSource = triviaQuestionRepository.triviaSource
+        self.__triviaQuestionRepositories[triviaSource] = triviaQuestionRepository
+        isAvailable = self.__availabilities.get(triviaSource, None)
+
+        if isAvailable is None:
+            return await self.__probe(triviaSource)
+        elif not self.__isStarted and self.__isExpired(triviaSource):
+            # without the refresh loop running, nothing else would ever re-probe this entry
+            return await self.__probe(triviaSource)
+        else:
+            # an expired entry is still handed out here, the refresh loop will pick it up shortly
+            return isAvailable
+
+    def __isExpired(self, triviaSource: TriviaSource) -> bool:
+        expirationTime = self.__expirationTimes.get(triviaSource, None)
+        return expirationTime is None or self.__clock() >= expirationTime
+
+    async def __notifyListener(self, isAvailable: bool, triviaSource: TriviaSource):
+        eventListener = self.__eventListener
+
+        if eventListener is None:
+            return
+
+        try:
+            await eventListener.onTriviaSourceAvailabilityChanged(
+                isAvailable = isAvailable,
+                triviaSource = triviaSource
+            )
+        except Exception as e:
+            self.__timber.log('TriviaSourceAvailabilityCache', f'Encountered unknown Exception when notifying listener of a trivia source availability change ({isAvailable=}) ({triviaSource=}): {e}', e, traceback.format_exc())
+
+    async def __probe(self, triviaSource: TriviaSource) -> bool:
+        # concurrent probes of the same trivia source all share a single call to the repository
+        probeTask = self.__probeTasks.get(triviaSource, None)
+
+        if probeTask is None:
+            probeTask = asyncio.create_task(self.__probeTriviaQuestionRepository(triviaSource))
+            probeTask.add_done_callback(lambda _: self.__probeTasks.pop(triviaSource, None))
+            self.__probeTasks[triviaSource] = probeTask
+
+        return await asyncio.shield(probeTask)
+
+    async def __probeTriviaQuestionRepository(self, triviaSource: TriviaSource) -> bool:
+        triviaQuestionRepository = self.__triviaQuestionRepositories[triviaSource]
+
+        try:
+            isAvailable = await triviaQuestionRepository.hasQuestionSetAvailable()
+        except Exception as e:
+            self.__timber.log('TriviaSourceAvailabilityCache', f'Encountered unknown Exception when probing trivia source availability ({triviaSource=}): {e}', e, traceback.format_exc())
+            isAvailable = False
+
+        previousIsAvailable = self.__availabilities.get(triviaSource, None)
+        timeToLiveSeconds = self.__triviaSourceTimeToLiveSeconds.get(triviaSource, self.__defaultTimeToLiveSeconds)
+
+        self.__availabilities[triviaSource] = isAvailable
+        self.__expirationTimes[triviaSource] = self.__clock() + timeToLiveSeconds
+
+        if previousIsAvailable is not None and previousIsAvailable != isAvailable:
+            self.__timber.log('TriviaSourceAvailabilityCache', f'Trivia source availability changed ({triviaSource=}) ({previousIsAvailable=}) ({isAvailable=})')
+            await self.__notifyListener(isAvailable, triviaSource)
+
+        return isAvailable
+
+    async def refresh(self, triviaSource: TriviaSource):
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        if triviaSource in self.__triviaQuestionRepositories:
+            await self.__probe(triviaSource)
+
+    async def __refreshExpiredEntries(self):
+        expiredTriviaSources = [ triviaSource for triviaSource in self.__triviaQuestionRepositories if self.__isExpired(triviaSource) ]
+
+        if len(expiredTriviaSources) >= 1:
+            await asyncio.gather(*[ self.__probe(triviaSource) for triviaSource in expiredTriviaSources ])
+
+    def setEventListener(self, listener: TriviaSourceAvailabilityListener | None):
+        if listener is not None and not isinstance(listener, TriviaSourceAvailabilityListener):
+            raise TypeError(f'listener argument is malformed: \"{listener}\"')
+
+        self.__eventListener = listener
+
+    def start(self, triviaQuestionRepositories: Collection[TriviaQuestionRepositoryInterface]):
+        if not isinstance(triviaQuestionRepositories, Collection):
+            raise TypeError(f'triviaQuestionRepositories argument is malformed: \"{triviaQuestionRepositories}\"')
+
+        for triviaQuestionRepository in triviaQuestionRepositories:
+            if not isinstance(triviaQuestionRepository, TriviaQuestionRepositoryInterface):
+                raise TypeError(f'triviaQuestionRepositories contains a malformed entry: \"{triviaQuestionRepository}\"')
+
+            self.__triviaQuestionRepositories[triviaQuestionRepository.triviaSource] = triviaQuestionRepository
+
+        if self.__isStarted:
+            self.__timber.log('TriviaSourceAvailabilityCache', 'Not starting TriviaSourceAvailabilityCache as it has already been started')
+            return
+
+        self.__isStarted = True
+        self.__timber.log('TriviaSourceAvailabilityCache', 'Starting TriviaSourceAvailabilityCache...')
+        self.__backgroundTaskHelper.createTask(self.__startRefreshLoop())
+
+    async def __startRefreshLoop(self):
+        while True:
+            try:
+                await self.__refreshExpiredEntries()
+            except Exception as e:
+                self.__timber.log('TriviaSourceAvailabilityCache', f'Encountered unknown Exception when refreshing trivia source availabilities: {e}', e, traceback.format_exc())
+
+            await asyncio.sleep(self.__refreshLoopSleepTimeSeconds)
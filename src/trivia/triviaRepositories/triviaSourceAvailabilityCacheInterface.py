@@ -0,0 +1,26 @@
+from abc import abstractmethod
+from typing import Collection
+
+from .triviaQuestionRepositoryInterface import TriviaQuestionRepositoryInterface
+from .triviaSourceAvailabilityListener import TriviaSourceAvailabilityListener
+from ..questions.triviaSource import TriviaSource
+from ...misc.clearable import Clearable
+
+
+class TriviaSourceAvailabilityCacheInterface(Clearable):
+
+    @abstractmethod
+    async def isAvailable(self, triviaQuestionRepository: TriviaQuestionRepositoryInterface) -> bool:
+        pass
+
+    @abstractmethod
+    async def refresh(self, triviaSource: TriviaSource):
+        pass
+
+    @abstractmethod
+    def setEventListener(self, listener: TriviaSourceAvailabilityListener | None):
+        pass
+
+    @abstractmethod
+    def start(self, triviaQuestionRepositories: Collection[TriviaQuestionRepositoryInterface]):
+        pass
@@ -0,0 +1,14 @@
+from abc import ABC, abstractmethod
+
+from ..questions.triviaSource import TriviaSource
+
+
+class TriviaSourceAvailabilityListener(ABC):
+
+    @abstractmethod
+    async def onTriviaSourceAvailabilityChanged(
+        self,
+        isAvailable: bool,
+        triviaSource: TriviaSource
+    ):
+        pass
@@ -2,9 +2,10 @@ from typing import Any
 
 import aiofiles
 import aiofiles.ospath
-import aiosqlite
 
 from .absTriviaQuestionRepository import AbsTriviaQuestionRepository
+from .readOnlySqliteConnectionManagerInterface import ReadOnlySqliteConnectionManagerInterface
+from .sqliteRowIdSampler import SqliteRowIdSampler
 from ..compilers.triviaQuestionCompilerInterface import TriviaQuestionCompilerInterface
 from ..questions.absTriviaQuestion import AbsTriviaQuestion
 from ..questions.multipleChoiceTriviaQuestion import MultipleChoiceTriviaQuestion
@@ -21,6 +22,7 @@ class WwtbamTriviaQuestionRepository(AbsTriviaQuestionRepository):
 
     def __init__(
         self,
+        readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface,
         timber: TimberInterface,
         triviaQuestionCompiler: TriviaQuestionCompilerInterface,
         triviaSettingsRepository: TriviaSettingsRepositoryInterface,
@@ -28,16 +30,20 @@ class WwtbamTriviaQuestionRepository(AbsTriviaQuestionRepository):
     ):
         super().__init__(triviaSettingsRepository)
 
-        if not isinstance(timber, TimberInterface):
+        if not isinstance(readOnlySqliteConnectionManager, ReadOnlySqliteConnectionManagerInterface):
+            raise TypeError(f'readOnlySqliteConnectionManager argument is malformed: \"{readOnlySqliteConnectionManager}\"')
+        elif not isinstance(timber, TimberInterface):
             raise TypeError(f'timber argument is malformed: \"{timber}\"')
         elif not isinstance(triviaQuestionCompiler, TriviaQuestionCompilerInterface):
             raise TypeError(f'triviaQuestionCompiler argument is malformed: \"{triviaQuestionCompiler}\"')
         elif not utils.isValidStr(triviaDatabaseFile):
             raise TypeError(f'triviaDatabaseFile argument is malformed: \"{triviaDatabaseFile}\"')
 
+        self.__readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface = readOnlySqliteConnectionManager
         self.__timber: TimberInterface = timber
         self.__triviaQuestionCompiler: TriviaQuestionCompilerInterface = triviaQuestionCompiler
         self.__triviaDatabaseFile: str = triviaDatabaseFile
+        self.__rowIdSampler: SqliteRowIdSampler = SqliteRowIdSampler()
 
         self.__hasQuestionSetAvailable: bool | None = None
 
@@ -105,17 +111,30 @@ class WwtbamTriviaQuestionRepository(AbsTriviaQuestionRepository):
         if not await aiofiles.ospath.exists(self.__triviaDatabaseFile):
             raise FileNotFoundError(f'WWTBAM trivia database file not found: \"{self.__triviaDatabaseFile}\"')
 
-        connection = await aiosqlite.connect(self.__triviaDatabaseFile)
-        cursor = await connection.execute(
-            '''
-                SELECT correctAnswer, question, responseA, responseB, responseC, responseD, triviaId FROM wwtbamTriviaQuestions
-                ORDER BY RANDOM()
-                LIMIT 1
-            '''
-        )
+        row: Any | None = None
+
+        async with self.__readOnlySqliteConnectionManager.useConnection(self.__triviaDatabaseFile) as connection:
+            rowId = await self.__rowIdSampler.sampleRowId(
+                connection = connection,
+                rowIdsQuery = 'SELECT rowid FROM wwtbamTriviaQuestions'
+            )
+
+            if rowId is not None:
+                cursor = await connection.execute(
+                    '''
+                        SELECT correctAnswer, question, responseA, responseB, responseC, responseD, triviaId FROM wwtbamTriviaQuestions
+                        WHERE rowid = $1
+                        LIMIT 1
+                    ''',
+                    (rowId, )
+                )
+
+                row = await cursor.fetchone()
+                await cursor.close()
 
-        row = await cursor.fetchone()
         if not utils.hasItems(row) or len(row) != 7:
+            await self.__readOnlySqliteConnectionManager.closeConnection(self.__triviaDatabaseFile)
+            self.__rowIdSampler.invalidate()
             raise RuntimeError(f'Received malformed data from WWTBAM database: {row}')
 
         triviaQuestionDict: dict[str, Any] = {
@@ -128,8 +147,6 @@ class WwtbamTriviaQuestionRepository(AbsTriviaQuestionRepository):
             'triviaId': row[6]
         }
 
-        await cursor.close()
-        await connection.close()
         return triviaQuestionDict
 
     async def hasQuestionSetAvailable(self) -> bool:
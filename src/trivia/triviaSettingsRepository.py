@@ -172,6 +172,10 @@ class TriviaSettingsRepository(TriviaSettingsRepositoryInterface):
         jsonContents = await self.__readJson()
         return utils.getBoolFromDict(jsonContents, 'scraper_enabled', False)
 
+    async def isTriviaSourceHedgingEnabled(self) -> bool:
+        jsonContents = await self.__readJson()
+        return utils.getBoolFromDict(jsonContents, 'trivia_source_hedging_enabled', True)
+
     async def __readJson(self) -> dict[str, Any]:
         if self.__cache is not None:
             return self.__cache
@@ -109,3 +109,7 @@ class TriviaSettingsRepositoryInterface(Clearable):
     @abstractmethod
     async def isScraperEnabled(self) -> bool:
         pass
+
+    @abstractmethod
+    async def isTriviaSourceHedgingEnabled(self) -> bool:
+        pass
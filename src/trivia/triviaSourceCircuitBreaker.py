@@ -0,0 +1,309 @@
+import math
+import time
+from collections import deque
+from typing import Callable
+
+from .questions.triviaSource import TriviaSource
+from .triviaSourceCircuitBreakerInterface import TriviaSourceCircuitBreakerInterface
+from .triviaSourceCircuitSnapshot import TriviaSourceCircuitSnapshot
+from .triviaSourceCircuitState import TriviaSourceCircuitState
+from ..misc import utils as utils
+from ..timber.timberInterface import TimberInterface
+
+
+class TriviaSourceCircuitBreaker(TriviaSourceCircuitBreakerInterface):
+
+    # Keeps a rolling window of recent fetches for each trivia source: how long each one took,
+    # and whether or not it failed. A fetch that takes longer than slowFetchSeconds counts as a
+    # bad fetch even when it succeeds, as a source that takes that long to answer stalls a game
+    # start nearly as badly as one that errors out. Once enough of a source's recent fetches are
+    # bad, its circuit opens and the source is skipped entirely for openDurationSeconds. After
+    # that, the circuit is half-open: exactly one probe fetch is let through, and the outcome of
+    # that probe decides whether the circuit closes again, or re-opens.
+    #
+    # The same latency samples are used to scale down the weight of sluggish sources, and to
+    # decide how long a fetch is given before it gets hedged with a second source.
+
+    def __init__(
+        self,
+        timber: TimberInterface,
+        badFetchRateThreshold: float = 0.5,
+        clock: Callable[[], float] = time.monotonic,
+        maxSamples: int = 20,
+        minHedgeDelaySeconds: float = 0.25,
+        minSamples: int = 5,
+        minWeightMultiplier: float = 0.1,
+        openDurationSeconds: float = 60,
+        sampleWindowSeconds: float = 600,
+        slowFetchSeconds: float = 5,
+        targetLatencySeconds: float = 1
+    ):
+        if not isinstance(timber, TimberInterface):
+            raise TypeError(f'timber argument is malformed: \"{timber}\"')
+        elif not utils.isValidNum(badFetchRateThreshold):
+            raise TypeError(f'badFetchRateThreshold argument is malformed: \"{badFetchRateThreshold}\"')
+        elif badFetchRateThreshold <= 0 or badFetchRateThreshold > 1:
+            raise ValueError(f'badFetchRateThreshold argument is out of bounds: {badFetchRateThreshold}')
+        elif not callable(clock):
+            raise TypeError(f'clock argument is malformed: \"{clock}\"')
+        elif not utils.isValidInt(maxSamples):
+            raise TypeError(f'maxSamples argument is malformed: \"{maxSamples}\"')
+        elif maxSamples < 1 or maxSamples > 1024:
+            raise ValueError(f'maxSamples argument is out of bounds: {maxSamples}')
+        elif not utils.isValidNum(minHedgeDelaySeconds):
+            raise TypeError(f'minHedgeDelaySeconds argument is malformed: \"{minHedgeDelaySeconds}\"')
+        elif minHedgeDelaySeconds < 0 or minHedgeDelaySeconds > 60:
+            raise ValueError(f'minHedgeDelaySeconds argument is out of bounds: {minHedgeDelaySeconds}')
+        elif not utils.isValidInt(minSamples):
+            raise TypeError(f'minSamples argument is malformed: \"{minSamples}\"')
+        elif minSamples < 1 or minSamples > maxSamples:
+            raise ValueError(f'minSamples argument is out of bounds: {minSamples}')
+        elif not utils.isValidNum(minWeightMultiplier):
+            raise TypeError(f'minWeightMultiplier argument is malformed: \"{minWeightMultiplier}\"')
+        elif minWeightMultiplier <= 0 or minWeightMultiplier > 1:
+            raise ValueError(f'minWeightMultiplier argument is out of bounds: {minWeightMultiplier}')
+        elif not utils.isValidNum(openDurationSeconds):
+            raise TypeError(f'openDurationSeconds argument is malformed: \"{openDurationSeconds}\"')
+        elif openDurationSeconds < 1 or openDurationSeconds > 3600:
+            raise ValueError(f'openDurationSeconds argument is out of bounds: {openDurationSeconds}')
+        elif not utils.isValidNum(sampleWindowSeconds):
+            raise TypeError(f'sampleWindowSeconds argument is malformed: \"{sampleWindowSeconds}\"')
+        elif sampleWindowSeconds < 1 or sampleWindowSeconds > 86400:
+            raise ValueError(f'sampleWindowSeconds argument is out of bounds: {sampleWindowSeconds}')
+        elif not utils.isValidNum(slowFetchSeconds):
+            raise TypeError(f'slowFetchSeconds argument is malformed: \"{slowFetchSeconds}\"')
+        elif slowFetchSeconds <= 0 or slowFetchSeconds > 300:
+            raise ValueError(f'slowFetchSeconds argument is out of bounds: {slowFetchSeconds}')
+        elif not utils.isValidNum(targetLatencySeconds):
+            raise TypeError(f'targetLatencySeconds argument is malformed: \"{targetLatencySeconds}\"')
+        elif targetLatencySeconds <= 0 or targetLatencySeconds > slowFetchSeconds:
+            raise ValueError(f'targetLatencySeconds argument is out of bounds: {targetLatencySeconds}')
+
+        self.__timber: TimberInterface = timber
+        self.__badFetchRateThreshold: float = badFetchRateThreshold
+        self.__clock: Callable[[], float] = clock
+        self.__maxSamples: int = maxSamples
+        self.__minHedgeDelaySeconds: float = minHedgeDelaySeconds
+        self.__minSamples: int = minSamples
+        self.__minWeightMultiplier: float = minWeightMultiplier
+        self.__openDurationSeconds: float = openDurationSeconds
+        self.__sampleWindowSeconds: float = sampleWindowSeconds
+        self.__slowFetchSeconds: float = slowFetchSeconds
+        self.__targetLatencySeconds: float = targetLatencySeconds
+
+        self.__openedAtTimes: dict[TriviaSource, float] = dict()
+        self.__probesInFlight: set[TriviaSource] = set()
+        self.__samples: dict[TriviaSource, deque[tuple[float, float, bool]]] = dict()
+        self.__states: dict[TriviaSource, TriviaSourceCircuitState] = dict()
+
+    def __close(self, triviaSource: TriviaSource):
+        self.__states[triviaSource] = TriviaSourceCircuitState.CLOSED
+        self.__openedAtTimes.pop(triviaSource, None)
+        self.__probesInFlight.discard(triviaSource)
+
+        # the samples that opened the circuit in the first place would otherwise immediately
+        # open it right back up again
+        self.__getSamples(triviaSource).clear()
+
+        self.__timber.log('TriviaSourceCircuitBreaker', f'Closed circuit ({triviaSource=})')
+
+    def __evaluate(self, triviaSource: TriviaSource):
+        if self.getState(triviaSource) is not TriviaSourceCircuitState.CLOSED:
+            return
+
+        samples = self.__getPrunedSamples(triviaSource)
+
+        if len(samples) >= self.__minSamples and self.__getBadFetchRate(samples) >= self.__badFetchRateThreshold:
+            self.__open(triviaSource)
+
+    def __getBadFetchRate(self, samples: deque[tuple[float, float, bool]]) -> float:
+        if len(samples) == 0:
+            return 0
+
+        badFetches = 0
+
+        for _, _, isBadFetch in samples:
+            if isBadFetch:
+                badFetches += 1
+
+        return badFetches / len(samples)
+
+    def getHedgeDelaySeconds(self, triviaSource: TriviaSource) -> float | None:
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        if self.getState(triviaSource) is not TriviaSourceCircuitState.CLOSED:
+            return None
+
+        samples = self.__getPrunedSamples(triviaSource)
+
+        if len(samples) < self.__minSamples:
+            return None
+
+        p95LatencySeconds = self.__percentile(self.__getSortedLatencies(samples), 95)
+        return min(max(p95LatencySeconds, self.__minHedgeDelaySeconds), self.__slowFetchSeconds)
+
+    def __getPrunedSamples(self, triviaSource: TriviaSource) -> deque[tuple[float, float, bool]]:
+        samples = self.__getSamples(triviaSource)
+        oldestAllowedTime = self.__clock() - self.__sampleWindowSeconds
+
+        while len(samples) >= 1 and samples[0][0] < oldestAllowedTime:
+            samples.popleft()
+
+        return samples
+
+    def __getSamples(self, triviaSource: TriviaSource) -> deque[tuple[float, float, bool]]:
+        samples = self.__samples.get(triviaSource, None)
+
+        if samples is None:
+            samples = deque(maxlen = self.__maxSamples)
+            self.__samples[triviaSource] = samples
+
+        return samples
+
+    def getSnapshot(self, triviaSource: TriviaSource) -> TriviaSourceCircuitSnapshot:
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        samples = self.__getPrunedSamples(triviaSource)
+        p50LatencySeconds: float | None = None
+        p95LatencySeconds: float | None = None
+
+        if len(samples) >= 1:
+            sortedLatencies = self.__getSortedLatencies(samples)
+            p50LatencySeconds = self.__percentile(sortedLatencies, 50)
+            p95LatencySeconds = self.__percentile(sortedLatencies, 95)
+
+        return TriviaSourceCircuitSnapshot(
+            badFetchRate = self.__getBadFetchRate(samples),
+            p50LatencySeconds = p50LatencySeconds,
+            p95LatencySeconds = p95LatencySeconds,
+            sampleCount = len(samples),
+            triviaSource = triviaSource,
+            state = self.getState(triviaSource)
+        )
+
+    def __getSortedLatencies(self, samples: deque[tuple[float, float, bool]]) -> list[float]:
+        return sorted(latencySeconds for _, latencySeconds, _ in samples)
+
+    def getState(self, triviaSource: TriviaSource) -> TriviaSourceCircuitState:
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        return self.__states.get(triviaSource, TriviaSourceCircuitState.CLOSED)
+
+    def getWeightMultiplier(self, triviaSource: TriviaSource) -> float:
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        samples = self.__getPrunedSamples(triviaSource)
+
+        if len(samples) < self.__minSamples:
+            return 1
+
+        p95LatencySeconds = self.__percentile(self.__getSortedLatencies(samples), 95)
+
+        if p95LatencySeconds <= self.__targetLatencySeconds:
+            return 1
+
+        return max(self.__targetLatencySeconds / p95LatencySeconds, self.__minWeightMultiplier)
+
+    def isAvailable(self, triviaSource: TriviaSource) -> bool:
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        match self.getState(triviaSource):
+            case TriviaSourceCircuitState.CLOSED:
+                return True
+
+            case TriviaSourceCircuitState.HALF_OPEN:
+                return triviaSource not in self.__probesInFlight
+
+            case TriviaSourceCircuitState.OPEN:
+                return self.__isOpenDurationElapsed(triviaSource)
+
+    def __isOpenDurationElapsed(self, triviaSource: TriviaSource) -> bool:
+        openedAtTime = self.__openedAtTimes.get(triviaSource, None)
+        return openedAtTime is None or self.__clock() - openedAtTime >= self.__openDurationSeconds
+
+    def __open(self, triviaSource: TriviaSource):
+        self.__states[triviaSource] = TriviaSourceCircuitState.OPEN
+        self.__openedAtTimes[triviaSource] = self.__clock()
+        self.__probesInFlight.discard(triviaSource)
+
+        snapshot = self.getSnapshot(triviaSource)
+        self.__timber.log('TriviaSourceCircuitBreaker', f'Opened circuit ({triviaSource=}) ({snapshot=})')
+
+    def __percentile(self, sortedLatencies: list[float], percentile: float) -> float:
+        # nearest-rank method
+        rank = math.ceil(percentile / 100 * len(sortedLatencies))
+        return sortedLatencies[max(0, rank - 1)]
+
+    def recordCancellation(self, triviaSource: TriviaSource, latencySeconds: float):
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+        elif not utils.isValidNum(latencySeconds):
+            raise TypeError(f'latencySeconds argument is malformed: \"{latencySeconds}\"')
+
+        # A cancelled fetch (e.g. the losing half of a hedged fetch) never got an answer, so its
+        # latency is only a lower bound. That's still worth keeping as a sample, as it was clearly
+        # slow. It gives no verdict for a half-open probe though, so the probe is simply released.
+        self.__record(triviaSource, latencySeconds, latencySeconds >= self.__slowFetchSeconds)
+        self.__probesInFlight.discard(triviaSource)
+
+    def recordFailure(self, triviaSource: TriviaSource, latencySeconds: float):
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+        elif not utils.isValidNum(latencySeconds):
+            raise TypeError(f'latencySeconds argument is malformed: \"{latencySeconds}\"')
+
+        self.__record(triviaSource, latencySeconds, True)
+
+        if self.getState(triviaSource) is TriviaSourceCircuitState.HALF_OPEN:
+            self.__open(triviaSource)
+        else:
+            self.__evaluate(triviaSource)
+
+    def recordSuccess(self, triviaSource: TriviaSource, latencySeconds: float):
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+        elif not utils.isValidNum(latencySeconds):
+            raise TypeError(f'latencySeconds argument is malformed: \"{latencySeconds}\"')
+
+        isSlowFetch = latencySeconds >= self.__slowFetchSeconds
+        self.__record(triviaSource, latencySeconds, isSlowFetch)
+
+        if self.getState(triviaSource) is TriviaSourceCircuitState.HALF_OPEN:
+            if isSlowFetch:
+                self.__open(triviaSource)
+            else:
+                self.__close(triviaSource)
+        else:
+            self.__evaluate(triviaSource)
+
+    def __record(self, triviaSource: TriviaSource, latencySeconds: float, isBadFetch: bool):
+        self.__getSamples(triviaSource).append((self.__clock(), max(0, latencySeconds), isBadFetch))
+
+    def tryAcquire(self, triviaSource: TriviaSource) -> bool:
+        if not isinstance(triviaSource, TriviaSource):
+            raise TypeError(f'triviaSource argument is malformed: \"{triviaSource}\"')
+
+        match self.getState(triviaSource):
+            case TriviaSourceCircuitState.CLOSED:
+                return True
+
+            case TriviaSourceCircuitState.HALF_OPEN:
+                if triviaSource in self.__probesInFlight:
+                    return False
+
+                self.__probesInFlight.add(triviaSource)
+                return True
+
+            case TriviaSourceCircuitState.OPEN:
+                if not self.__isOpenDurationElapsed(triviaSource):
+                    return False
+
+                self.__states[triviaSource] = TriviaSourceCircuitState.HALF_OPEN
+                self.__probesInFlight.add(triviaSource)
+                self.__timber.log('TriviaSourceCircuitBreaker', f'Half-opened circuit, letting a probe fetch through ({triviaSource=})')
+                return True
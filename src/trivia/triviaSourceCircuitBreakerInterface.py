@@ -0,0 +1,44 @@
+from abc import ABC, abstractmethod
+
+from .questions.triviaSource import TriviaSource
+from .triviaSourceCircuitSnapshot import TriviaSourceCircuitSnapshot
+from .triviaSourceCircuitState import TriviaSourceCircuitState
+
+
+class TriviaSourceCircuitBreakerInterface(ABC):
+
+    @abstractmethod
+    def getHedgeDelaySeconds(self, triviaSource: TriviaSource) -> float | None:
+        pass
+
+    @abstractmethod
+    def getSnapshot(self, triviaSource: TriviaSource) -> TriviaSourceCircuitSnapshot:
+        pass
+
+    @abstractmethod
+    def getState(self, triviaSource: TriviaSource) -> TriviaSourceCircuitState:
+        pass
+
+    @abstractmethod
+    def getWeightMultiplier(self, triviaSource: TriviaSource) -> float:
+        pass
+
+    @abstractmethod
+    def isAvailable(self, triviaSource: TriviaSource) -> bool:
+        pass
+
+    @abstractmethod
+    def recordCancellation(self, triviaSource: TriviaSource, latencySeconds: float):
+        pass
+
+    @abstractmethod
+    def recordFailure(self, triviaSource: TriviaSource, latencySeconds: float):
+        pass
+
+    @abstractmethod
+    def recordSuccess(self, triviaSource: TriviaSource, latencySeconds: float):
+        pass
+
+    @abstractmethod
+    def tryAcquire(self, triviaSource: TriviaSource) -> bool:
+        pass
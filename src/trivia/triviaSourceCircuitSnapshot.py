@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from .questions.triviaSource import TriviaSource
+from .triviaSourceCircuitState import TriviaSourceCircuitState
+
+
+@dataclass(frozen = True)
+class TriviaSourceCircuitSnapshot:
+    badFetchRate: float
+    p50LatencySeconds: float | None
+    p95LatencySeconds: float | None
+    sampleCount: int
+    triviaSource: TriviaSource
+    state: TriviaSourceCircuitState
@@ -0,0 +1,10 @@
+from enum import auto
+
+from ..misc.enumWithToFromStr import EnumWithToFromStr
+
+
+class TriviaSourceCircuitState(EnumWithToFromStr):
+
+    CLOSED = auto()
+    HALF_OPEN = auto()
+    OPEN = auto()
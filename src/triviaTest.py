@@ -77,14 +77,19 @@ from trivia.triviaRepositories.openTriviaDatabaseTriviaQuestionRepository import
     OpenTriviaDatabaseTriviaQuestionRepository
 from trivia.triviaRepositories.openTriviaQaTriviaQuestionRepository import OpenTriviaQaTriviaQuestionRepository
 from trivia.triviaRepositories.pkmnTriviaQuestionRepository import PkmnTriviaQuestionRepository
+from trivia.triviaRepositories.readOnlySqliteConnectionManager import ReadOnlySqliteConnectionManager
+from trivia.triviaRepositories.readOnlySqliteConnectionManagerInterface import \
+    ReadOnlySqliteConnectionManagerInterface
 from trivia.triviaRepositories.triviaDatabaseTriviaQuestionRepository import TriviaDatabaseTriviaQuestionRepository
 from trivia.triviaRepositories.triviaQuestionCompanyTriviaQuestionRepository import \
     TriviaQuestionCompanyTriviaQuestionRepository
 from trivia.triviaRepositories.triviaRepository import TriviaRepository
+from trivia.triviaRepositories.triviaSourceAvailabilityCache import TriviaSourceAvailabilityCache
 from trivia.triviaRepositories.willFryTriviaQuestionRepository import WillFryTriviaQuestionRepository
 from trivia.triviaRepositories.wwtbamTriviaQuestionRepository import WwtbamTriviaQuestionRepository
 from trivia.triviaSettingsRepository import TriviaSettingsRepository
 from trivia.triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
+from trivia.triviaSourceCircuitBreaker import TriviaSourceCircuitBreaker
 from trivia.triviaSourceInstabilityHelper import TriviaSourceInstabilityHelper
 from trivia.triviaVerifier import TriviaVerifier
 from twitch.api.twitchApiService import TwitchApiService
@@ -217,6 +222,9 @@ triviaQuestionCompiler: TriviaQuestionCompilerInterface = TriviaQuestionCompiler
     timber = timber
 )
 triviaIdGenerator: TriviaIdGeneratorInterface = TriviaIdGenerator()
+readOnlySqliteConnectionManager: ReadOnlySqliteConnectionManagerInterface = ReadOnlySqliteConnectionManager(
+    timber = timber
+)
 bannedTriviaIdsRepository: BannedTriviaIdsRepositoryInterface = BannedTriviaIdsRepository(
     backingDatabase = backingDatabase,
     timber = timber
@@ -345,12 +353,20 @@ triviaGameMachine = TriviaGameMachine(
             triviaSettingsRepository = triviaSettingsRepository
         ),
         triviaQuestionCompanyTriviaQuestionRepository = TriviaQuestionCompanyTriviaQuestionRepository(
+            readOnlySqliteConnectionManager = readOnlySqliteConnectionManager,
             timber = timber,
             triviaQuestionCompiler = triviaQuestionCompiler,
             triviaSettingsRepository = triviaSettingsRepository
         ),
         triviaScraper = triviaScraper,
         triviaSettingsRepository = triviaSettingsRepository,
+        triviaSourceAvailabilityCache = TriviaSourceAvailabilityCache(
+            backgroundTaskHelper = backgroundTaskHelper,
+            timber = timber
+        ),
+        triviaSourceCircuitBreaker = TriviaSourceCircuitBreaker(
+            timber = timber
+        ),
         triviaSourceInstabilityHelper = TriviaSourceInstabilityHelper(
             timber = timber
         ),
@@ -369,6 +385,7 @@ triviaGameMachine = TriviaGameMachine(
             triviaSettingsRepository = triviaSettingsRepository
         ),
         wwtbamTriviaQuestionRepository = WwtbamTriviaQuestionRepository(
+            readOnlySqliteConnectionManager = readOnlySqliteConnectionManager,
             timber = timber,
             triviaQuestionCompiler = triviaQuestionCompiler,
             triviaSettingsRepository = triviaSettingsRepository
@@ -4,7 +4,6 @@ from .ttsMonsterApiTokensRepositoryInterface import TtsMonsterApiTokensRepositor
 from ...misc import utils as utils
 from ...storage.backingDatabase import BackingDatabase
 from ...storage.databaseConnection import DatabaseConnection
-from ...storage.databaseType import DatabaseType
 from ...storage.jsonReaderInterface import JsonReaderInterface
 from ...timber.timberInterface import TimberInterface
 from ...users.userIdsRepositoryInterface import UserIdsRepositoryInterface
@@ -33,7 +32,6 @@ class TtsMonsterApiTokensRepository(TtsMonsterApiTokensRepositoryInterface):
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
         self.__seedFileReader: JsonReaderInterface | None = seedFileReader
 
-        self.__isDatabaseReady: bool = False
         self.__cache: dict[str, str | None] = dict()
 
     async def clearCaches(self):
@@ -87,42 +85,8 @@ class TtsMonsterApiTokensRepository(TtsMonsterApiTokensRepositoryInterface):
         return apiToken
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
-        return await self.__backingDatabase.getConnection()
-
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS ttsmonsterapitokens (
-                            apitoken text NOT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS ttsmonsterapitokens (
-                            apitoken TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
         await self.__consumeSeedFile()
+        return await self.__backingDatabase.getConnection()
 
     async def __readFromDatabase(self, twitchChannelId: str) -> str | None:
         if not utils.isValidStr(twitchChannelId):
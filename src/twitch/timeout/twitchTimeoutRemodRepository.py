@@ -9,7 +9,6 @@ from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ...misc import utils as utils
 from ...storage.backingDatabase import BackingDatabase
 from ...storage.databaseConnection import DatabaseConnection
-from ...storage.databaseType import DatabaseType
 from ...timber.timberInterface import TimberInterface
 
 
@@ -36,8 +35,6 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
         self.__timeZoneRepository: TimeZoneRepositoryInterface = timeZoneRepository
         self.__remodTimeBuffer: timedelta = remodTimeBuffer
 
-        self.__isDatabaseReady: bool = False
-
     async def add(self, data: TwitchTimeoutRemodData):
         if not isinstance(data, TwitchTimeoutRemodData):
             raise TypeError(f'data argument is malformed: \"{data}\"')
@@ -105,42 +102,5 @@ class TwitchTimeoutRemodRepository(TwitchTimeoutRemodRepositoryInterface):
         return data
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
-                            broadcasteruserid text NOT NULL,
-                            remoddatetime text NOT NULL,
-                            userid text NOT NULL,
-                            PRIMARY KEY (broadcasteruserid, userid)
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchtimeoutremodactions (
-                            broadcasteruserid TEXT NOT NULL,
-                            remoddatetime TEXT NOT NULL,
-                            userid TEXT NOT NULL,
-                            PRIMARY KEY (broadcasteruserid, userid)
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
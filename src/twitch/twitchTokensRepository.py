@@ -16,7 +16,6 @@ from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
 from ..network.exceptions import GenericNetworkException
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..storage.jsonReaderInterface import JsonReaderInterface
 from ..timber.timberInterface import TimberInterface
 from ..users.userIdsRepositoryInterface import UserIdsRepositoryInterface
@@ -71,7 +70,6 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         self.__tokensExpirationBuffer: timedelta = tokensExpirationBuffer
         self.__validationExpirationBuffer: timedelta = validationExpirationBuffer
 
-        self.__isDatabaseReady: bool = False
         self.__isStarted: bool = False
         self.__cache: dict[str, TwitchTokensDetails | None] = dict()
         self.__twitchChannelIdToValidationTime: dict[str, datetime | None] = dict()
@@ -271,7 +269,7 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         return tokensDetails.accessToken
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
+        await self.__consumeSeedFile()
         return await self.__backingDatabase.getConnection()
 
     async def getTokensDetails(self, twitchChannel: str) -> TwitchTokensDetails | None:
@@ -328,44 +326,6 @@ class TwitchTokensRepository(TwitchTokensRepositoryInterface):
         accessToken = await self.getAccessTokenById(twitchChannelId)
         return utils.isValidStr(accessToken)
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchtokens (
-                            expirationtime text DEFAULT NULL,
-                            accesstoken text NOT NULL,
-                            refreshtoken text NOT NULL,
-                            twitchchannelid text NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS twitchtokens (
-                            expirationtime TEXT DEFAULT NULL,
-                            accesstoken TEXT NOT NULL,
-                            refreshtoken TEXT NOT NULL,
-                            twitchchannelid TEXT NOT NULL PRIMARY KEY
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-        await self.__consumeSeedFile()
-
     async def removeUser(self, twitchChannel: str):
         if not utils.isValidStr(twitchChannel):
             raise TypeError(f'twitchChannel argument is malformed: \"{twitchChannel}\"')
@@ -1,8 +1,6 @@
 import asyncio
-import queue
 import traceback
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 
 from .api.twitchApiServiceInterface import TwitchApiServiceInterface
 from .api.twitchSendChatMessageRequest import \
@@ -18,6 +16,7 @@ from .twitchUtilsInterface import TwitchUtilsInterface
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.batchingQueue import BatchingQueue
 from ..misc.generalSettingsRepository import GeneralSettingsRepository
 from ..sentMessageLogger.messageMethod import MessageMethod
 from ..sentMessageLogger.sentMessageLoggerInterface import \
@@ -39,9 +38,7 @@ class TwitchUtils(TwitchUtilsInterface):
         twitchHandleProvider: TwitchHandleProviderInterface,
         twitchTokensRepository: TwitchTokensRepositoryInterface,
         userIdsRepository: UserIdsRepositoryInterface,
-        queueTimeoutSeconds: float = 3,
         sleepBeforeRetryTimeSeconds: float = 1,
-        sleepTimeSeconds: float = 0.5,
         maxRetries: int = 3
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
@@ -62,18 +59,10 @@ class TwitchUtils(TwitchUtilsInterface):
             raise TypeError(f'twitchTokensRepository argument is malformed: \"{twitchTokensRepository}\"')
         elif not isinstance(userIdsRepository, UserIdsRepositoryInterface):
             raise TypeError(f'userIdsRepository argument is malformed: \"{userIdsRepository}\"')
-        elif not utils.isValidNum(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
         elif not utils.isValidNum(sleepBeforeRetryTimeSeconds):
             raise TypeError(f'sleepBeforeRetryTimeSeconds argument is malformed: \"{sleepBeforeRetryTimeSeconds}\"')
         elif sleepBeforeRetryTimeSeconds < 0.25 or sleepBeforeRetryTimeSeconds > 3:
             raise ValueError(f'sleepBeforeRetryTimeSeconds argument is out of bounds: {sleepBeforeRetryTimeSeconds}')
-        elif not utils.isValidNum(sleepTimeSeconds):
-            raise TypeError(f'sleepTimeSeconds argument is malformed: \"{sleepTimeSeconds}\"')
-        elif sleepTimeSeconds < 0.25 or sleepTimeSeconds > 3:
-            raise ValueError(f'sleepTimeSeconds argument is out of bounds: {sleepTimeSeconds}')
         elif not utils.isValidInt(maxRetries):
             raise TypeError(f'maxRetries argument is malformed: \"{maxRetries}\"')
         elif maxRetries < 0 or maxRetries > utils.getIntMaxSafeSize():
@@ -88,13 +77,11 @@ class TwitchUtils(TwitchUtilsInterface):
         self.__twitchHandleProvider: TwitchHandleProviderInterface = twitchHandleProvider
         self.__twitchTokensRepository: TwitchTokensRepositoryInterface = twitchTokensRepository
         self.__userIdsRepository: UserIdsRepositoryInterface = userIdsRepository
-        self.__queueTimeoutSeconds: float = queueTimeoutSeconds
         self.__sleepBeforeRetryTimeSeconds: float = sleepBeforeRetryTimeSeconds
-        self.__sleepTimeSeconds: float = sleepTimeSeconds
         self.__maxRetries: int = maxRetries
 
         self.__isStarted: bool = False
-        self.__messageQueue: SimpleQueue[OutboundMessage] = SimpleQueue()
+        self.__messageQueue: BatchingQueue[OutboundMessage] = BatchingQueue()
         self.__senderId: str | None = None
 
     async def __getSenderId(self) -> str:
@@ -288,10 +275,8 @@ class TwitchUtils(TwitchUtilsInterface):
         if not isinstance(outboundMessage, OutboundMessage):
             raise TypeError(f'outboundMessage argument is malformed: \"{outboundMessage}\"')
 
-        try:
-            self.__messageQueue.put(outboundMessage, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TwitchUtils', f'Encountered queue.Full when submitting a new outbound message ({outboundMessage}) into the outbound message queue (queue size: {self.__messageQueue.qsize()}): {e}', e)
+        if not self.__messageQueue.put(outboundMessage):
+            self.__timber.log('TwitchUtils', f'Dropped outbound message ({outboundMessage}) as the outbound message queue is full ({self.__messageQueue.getMetrics()=})')
 
     def start(self):
         if self.__isStarted:
@@ -303,14 +288,21 @@ class TwitchUtils(TwitchUtilsInterface):
         self.__backgroundTaskHelper.createTask(self.__startOutboundMessageLoop())
 
     async def __startOutboundMessageLoop(self):
+        # messages that aren't due to be sent yet are held here rather than being put back into
+        # the queue, so that we can sleep until the earliest one of them becomes due
+        delayedMessages: list[OutboundMessage] = list()
+
         while True:
-            outboundMessages: list[OutboundMessage] = list()
+            timeoutSeconds: float | None = None
 
-            try:
-                while not self.__messageQueue.empty():
-                    outboundMessages.append(self.__messageQueue.get_nowait())
-            except queue.Empty as e:
-                self.__timber.log('TwitchUtils', f'Encountered queue.Empty when building up Twitch messages list (queue size: {self.__messageQueue.qsize()}) (actions size: {len(outboundMessages)}): {e}', e)
+            if len(delayedMessages) >= 1:
+                now = datetime.now(self.__timeZoneRepository.getDefault())
+                earliestDelayUntilTime = min(message.delayUntilTime for message in delayedMessages)
+                timeoutSeconds = max(0, (earliestDelayUntilTime - now).total_seconds())
+
+            outboundMessages = delayedMessages
+            outboundMessages.extend(await self.__messageQueue.getBatch(timeoutSeconds))
+            delayedMessages = list()
 
             now = datetime.now(self.__timeZoneRepository.getDefault())
 
@@ -321,9 +313,7 @@ class TwitchUtils(TwitchUtilsInterface):
                         message = outboundMessage.message
                     )
                 else:
-                    await self.__sendOutboundMessage(outboundMessage)
-
-            await asyncio.sleep(self.__sleepTimeSeconds)
+                    delayedMessages.append(outboundMessage)
 
     async def waitThenSend(
         self,
@@ -218,31 +218,19 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
         elif not isinstance(event, TwitchWebsocketEvent):
             raise TypeError(f'event argument is malformed: \"{event}\"')
 
-        await self.__userIdsRepository.optionallySetUser(
-            userId = event.broadcasterUserId,
-            userName = event.broadcasterUserLogin
-        )
-
-        await self.__userIdsRepository.optionallySetUser(
-            userId = event.fromBroadcasterUserId,
-            userName = event.fromBroadcasterUserLogin
-        )
-
-        await self.__userIdsRepository.optionallySetUser(
-            userId = event.toBroadcasterUserId,
-            userName = event.toBroadcasterUserLogin
-        )
-
-        await self.__userIdsRepository.optionallySetUser(
-            userId = event.userId,
-            userName = event.userLogin
-        )
+        userIdsToUserNames: dict[str, str] = dict()
+
+        def optionallyAddUser(userId: str | None, userName: str | None):
+            if utils.isValidStr(userId) and utils.isValidStr(userName):
+                userIdsToUserNames[userId] = userName
+
+        optionallyAddUser(event.broadcasterUserId, event.broadcasterUserLogin)
+        optionallyAddUser(event.fromBroadcasterUserId, event.fromBroadcasterUserLogin)
+        optionallyAddUser(event.toBroadcasterUserId, event.toBroadcasterUserLogin)
+        optionallyAddUser(event.userId, event.userLogin)
 
         if event.subGift is not None:
-            await self.__userIdsRepository.setUser(
-                userId = event.subGift.recipientUserId,
-                userName = event.subGift.recipientUserLogin
-            )
+            userIdsToUserNames[event.subGift.recipientUserId] = event.subGift.recipientUserLogin
 
         if event.outcomes is not None and len(event.outcomes) >= 1:
             for outcome in event.outcomes:
@@ -250,7 +238,6 @@ class TwitchWebsocketDataBundleHandler(TwitchWebsocketDataBundleListener):
 
                 if topPredictors is not None and len(topPredictors) >= 1:
                     for topPredictor in topPredictors:
-                        await self.__userIdsRepository.setUser(
-                            userId = topPredictor.userId,
-                            userName = topPredictor.userLogin
-                        )
+                        userIdsToUserNames[topPredictor.userId] = topPredictor.userLogin
+
+        await self.__userIdsRepository.setUsers(userIdsToUserNames)
@@ -1,19 +1,21 @@
 import asyncio
 import json
-import queue
+import random
 import traceback
 from collections import OrderedDict, defaultdict
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 from typing import Any
 
 import websockets
+from websockets.asyncio.client import ClientConnection
 
 from ..api.twitchApiServiceInterface import TwitchApiServiceInterface
 from ..api.twitchEventSubRequest import TwitchEventSubRequest
 from ..api.twitchEventSubResponse import TwitchEventSubResponse
 from ..api.websocket.twitchWebsocketCondition import TwitchWebsocketCondition
 from ..api.websocket.twitchWebsocketDataBundle import TwitchWebsocketDataBundle
+from ..api.websocket.twitchWebsocketMessageType import TwitchWebsocketMessageType
+from ..api.websocket.twitchWebsocketSession import TwitchWebsocketSession
 from ..api.websocket.twitchWebsocketSubscriptionType import TwitchWebsocketSubscriptionType
 from ..api.websocket.twitchWebsocketTransport import TwitchWebsocketTransport
 from ..api.websocket.twitchWebsocketTransportMethod import TwitchWebsocketTransportMethod
@@ -22,16 +24,31 @@ from ..websocket.twitchWebsocketAllowedUsersRepositoryInterface import TwitchWeb
 from ..websocket.twitchWebsocketClientInterface import TwitchWebsocketClientInterface
 from ..websocket.twitchWebsocketDataBundleListener import TwitchWebsocketDataBundleListener
 from ..websocket.twitchWebsocketJsonMapperInterface import TwitchWebsocketJsonMapperInterface
+from ..websocket.twitchWebsocketSessionGroup import TwitchWebsocketSessionGroup
 from ..websocket.twitchWebsocketUser import TwitchWebsocketUser
 from ...location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ...misc import utils as utils
 from ...misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ...misc.batchingQueue import BatchingQueue
 from ...misc.lruCache import LruCache
 from ...timber.timberInterface import TimberInterface
 
 
 class TwitchWebsocketClient(TwitchWebsocketClientInterface):
 
+    # Twitch ties each EventSub websocket session to the user access token that its subscriptions
+    # are created with, and caps each session at maxSubscriptionsPerSession enabled subscriptions
+    # and each user at maxSessionsPerUser sessions. So every user's subscription types are packed
+    # into as few session groups as those caps allow (which in practice is just the one), and each
+    # group gets one websocket connection.
+    #
+    # When Twitch sends a session_reconnect message, the new connection is opened while the old
+    # one is still being read from. The old connection is only closed once the new one has been
+    # welcomed, so no events are lost in between, and as the session carries over, no subscriptions
+    # need to be recreated. Any other disconnect backs off exponentially (with jitter) before
+    # reconnecting to the default URL, so that many sessions dropping at once don't all come back
+    # at the same moment.
+
     def __init__(
         self,
         backgroundTaskHelper: BackgroundTaskHelperInterface,
@@ -42,9 +59,13 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         twitchWebsocketAllowedUsersRepository: TwitchWebsocketAllowedUsersRepositoryInterface,
         twitchWebsocketJsonMapper: TwitchWebsocketJsonMapperInterface,
         queueSleepTimeSeconds: float = 1,
-        queueTimeoutSeconds: float = 3,
+        maxQueueSize: int = 1000,
         websocketCreationDelayTimeSeconds: float = 0.5,
         websocketSleepTimeSeconds: float = 3,
+        maxWebsocketSleepTimeSeconds: float = 120,
+        reconnectTimeoutSeconds: float = 30,
+        maxSessionsPerUser: int = 3,
+        maxSubscriptionsPerSession: int = 300,
         subscriptionTypes: frozenset[TwitchWebsocketSubscriptionType] = frozenset({
             TwitchWebsocketSubscriptionType.CHANNEL_POINTS_REDEMPTION,
             TwitchWebsocketSubscriptionType.CHANNEL_POLL_BEGIN,
@@ -82,10 +103,10 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
             raise TypeError(f'queueSleepTimeSeconds argument is malformed: \"{queueSleepTimeSeconds}\"')
         elif queueSleepTimeSeconds < 1 or queueSleepTimeSeconds > 15:
             raise ValueError(f'queueSleepTimeSeconds argument is out of bounds: {queueSleepTimeSeconds}')
-        elif not utils.isValidNum(queueTimeoutSeconds):
-            raise TypeError(f'queueTimeoutSeconds argument is malformed: \"{queueTimeoutSeconds}\"')
-        elif queueTimeoutSeconds < 1 or queueTimeoutSeconds > 5:
-            raise ValueError(f'queueTimeoutSeconds argument is out of bounds: {queueTimeoutSeconds}')
+        elif not utils.isValidInt(maxQueueSize):
+            raise TypeError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
         elif not utils.isValidNum(websocketCreationDelayTimeSeconds):
             raise TypeError(f'websocketCreationDelayTimeSeconds argument is malformed: \"{websocketCreationDelayTimeSeconds}\"')
         elif websocketCreationDelayTimeSeconds < 0.1 or websocketCreationDelayTimeSeconds > 8:
@@ -94,6 +115,22 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
             raise TypeError(f'websocketSleepTimeSeconds argument is malformed: \"{websocketSleepTimeSeconds}\"')
         elif websocketSleepTimeSeconds < 3 or websocketSleepTimeSeconds > 15:
             raise ValueError(f'websocketSleepTimeSeconds argument is out of bounds: {websocketSleepTimeSeconds}')
+        elif not utils.isValidNum(maxWebsocketSleepTimeSeconds):
+            raise TypeError(f'maxWebsocketSleepTimeSeconds argument is malformed: \"{maxWebsocketSleepTimeSeconds}\"')
+        elif maxWebsocketSleepTimeSeconds < websocketSleepTimeSeconds or maxWebsocketSleepTimeSeconds > 600:
+            raise ValueError(f'maxWebsocketSleepTimeSeconds argument is out of bounds: {maxWebsocketSleepTimeSeconds}')
+        elif not utils.isValidNum(reconnectTimeoutSeconds):
+            raise TypeError(f'reconnectTimeoutSeconds argument is malformed: \"{reconnectTimeoutSeconds}\"')
+        elif reconnectTimeoutSeconds < 1 or reconnectTimeoutSeconds > 60:
+            raise ValueError(f'reconnectTimeoutSeconds argument is out of bounds: {reconnectTimeoutSeconds}')
+        elif not utils.isValidInt(maxSessionsPerUser):
+            raise TypeError(f'maxSessionsPerUser argument is malformed: \"{maxSessionsPerUser}\"')
+        elif maxSessionsPerUser < 1 or maxSessionsPerUser > 3:
+            raise ValueError(f'maxSessionsPerUser argument is out of bounds: {maxSessionsPerUser}')
+        elif not utils.isValidInt(maxSubscriptionsPerSession):
+            raise TypeError(f'maxSubscriptionsPerSession argument is malformed: \"{maxSubscriptionsPerSession}\"')
+        elif maxSubscriptionsPerSession < 1 or maxSubscriptionsPerSession > 300:
+            raise ValueError(f'maxSubscriptionsPerSession argument is out of bounds: {maxSubscriptionsPerSession}')
         elif not isinstance(subscriptionTypes, frozenset):
             raise TypeError(f'subscriptionTypes argument is malformed: \"{subscriptionTypes}\"')
         elif not utils.isValidUrl(twitchWebsocketUrl):
@@ -109,25 +146,31 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         self.__twitchWebsocketAllowedUsersRepository: TwitchWebsocketAllowedUsersRepositoryInterface = twitchWebsocketAllowedUsersRepository
         self.__twitchWebsocketJsonMapper: TwitchWebsocketJsonMapperInterface = twitchWebsocketJsonMapper
         self.__queueSleepTimeSeconds: float = queueSleepTimeSeconds
-        self.__queueTimeoutSeconds: float = queueTimeoutSeconds
         self.__websocketCreationDelayTimeSeconds: float = websocketCreationDelayTimeSeconds
         self.__websocketSleepTimeSeconds: float = websocketSleepTimeSeconds
+        self.__maxWebsocketSleepTimeSeconds: float = maxWebsocketSleepTimeSeconds
+        self.__reconnectTimeoutSeconds: float = reconnectTimeoutSeconds
+        self.__maxSessionsPerUser: int = maxSessionsPerUser
+        self.__maxSubscriptionsPerSession: int = maxSubscriptionsPerSession
         self.__subscriptionTypes: frozenset[TwitchWebsocketSubscriptionType] = subscriptionTypes
+        self.__twitchWebsocketUrl: str = twitchWebsocketUrl
         self.__maxMessageAge: timedelta = maxMessageAge
 
         self.__isStarted: bool = False
         self.__badSubscriptionTypesFor: dict[TwitchWebsocketUser, set[TwitchWebsocketSubscriptionType]] = defaultdict(lambda: set())
-        self.__sessionIdFor: dict[TwitchWebsocketUser, str | None] = defaultdict(lambda: '')
-        self.__twitchWebsocketUrlFor: dict[TwitchWebsocketUser, str] = defaultdict(lambda: twitchWebsocketUrl)
+        self.__keepAliveTimeoutSecondsFor: dict[TwitchWebsocketSessionGroup, float | None] = dict()
+        self.__sessionIdFor: dict[TwitchWebsocketSessionGroup, str | None] = dict()
         self.__messageIdCache: LruCache = LruCache(128)
-        self.__dataBundleQueue: SimpleQueue[TwitchWebsocketDataBundle] = SimpleQueue()
+        self.__dataBundleQueue: BatchingQueue[TwitchWebsocketDataBundle] = BatchingQueue(maxSize = maxQueueSize)
         self.__dataBundleListener: TwitchWebsocketDataBundleListener | None = None
 
-    async def __createEventSubSubscription(self, sessionId: str, user: TwitchWebsocketUser):
-        if not utils.isValidStr(sessionId):
+    async def __createEventSubSubscription(self, sessionGroup: TwitchWebsocketSessionGroup, sessionId: str):
+        if not isinstance(sessionGroup, TwitchWebsocketSessionGroup):
+            raise TypeError(f'sessionGroup argument is malformed: \"{sessionGroup}\"')
+        elif not utils.isValidStr(sessionId):
             raise TypeError(f'sessionId argument is malformed: \"{sessionId}\"')
-        elif not isinstance(user, TwitchWebsocketUser):
-            raise TypeError(f'user argument is malformed: \"{user}\"')
+
+        user = sessionGroup.user
 
         transport = TwitchWebsocketTransport(
             sessionId = sessionId,
@@ -137,7 +180,7 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         twitchAccessToken = await self.__twitchTokensRepository.requireAccessTokenById(user.userId)
         results: dict[TwitchWebsocketSubscriptionType, Exception | None] = OrderedDict()
 
-        for subscriptionType in self.__subscriptionTypes:
+        for subscriptionType in sessionGroup.subscriptionTypes:
             if subscriptionType in self.__badSubscriptionTypesFor[user]:
                 self.__timber.log('TwitchWebsocketClient', f'Skipping {subscriptionType} for {user}')
                 continue
@@ -169,7 +212,7 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
             if response is None or exception is not None:
                 self.__badSubscriptionTypesFor[user].add(subscriptionType)
 
-        self.__timber.log('TwitchWebsocketClient', f'Finished creating EventSub subscription(s) for {user}: {results}')
+        self.__timber.log('TwitchWebsocketClient', f'Finished creating EventSub subscription(s) for {sessionGroup}: {results}')
 
     async def __createWebsocketCondition(
         self,
@@ -224,82 +267,69 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         else:
             raise RuntimeError(f'can\'t create a WebsocketCondition for the given unsupported WebsocketSubscriptionType: \"{subscriptionType}\"')
 
-    async def __handleConnectionRelatedMessageFor(
-        self,
-        user: TwitchWebsocketUser,
-        dataBundle: TwitchWebsocketDataBundle
-    ):
-        if not isinstance(user, TwitchWebsocketUser):
-            raise TypeError(f'user argument is malformed: \"{user}\"')
-        elif not isinstance(dataBundle, TwitchWebsocketDataBundle):
-            raise TypeError(f'dataBundle argument is malformed: \"{dataBundle}\"')
-
-        payload = dataBundle.payload
+    def __createSessionGroups(self, users: frozenset[TwitchWebsocketUser]) -> list[TwitchWebsocketSessionGroup]:
+        subscriptionTypes = sorted(self.__subscriptionTypes, key = lambda subscriptionType: subscriptionType.name)
+        sessionGroups: list[TwitchWebsocketSessionGroup] = list()
 
-        if payload is None:
-            return
+        for user in users:
+            for index, start in enumerate(range(0, len(subscriptionTypes), self.__maxSubscriptionsPerSession)):
+                if index >= self.__maxSessionsPerUser:
+                    self.__timber.log('TwitchWebsocketClient', f'Unable to fit all subscription types for \"{user}\" into {self.__maxSessionsPerUser} session(s), skipping {len(subscriptionTypes) - start} of them')
+                    break
 
-        session = payload.session
+                sessionGroups.append(TwitchWebsocketSessionGroup(
+                    index = index,
+                    subscriptionTypes = frozenset(subscriptionTypes[start:start + self.__maxSubscriptionsPerSession]),
+                    user = user
+                ))
 
-        if session is None:
-            return
+        return sessionGroups
 
-        oldTwitchWebsocketUrl = self.__twitchWebsocketUrlFor[user]
-        newTwitchWebsocketUrl = session.reconnectUrl
+    def __getWebsocketSleepTimeSeconds(self, failureCount: int) -> float:
+        sleepTimeSeconds = self.__websocketSleepTimeSeconds * (2 ** min(failureCount - 1, 10))
+        sleepTimeSeconds = min(sleepTimeSeconds, self.__maxWebsocketSleepTimeSeconds)
+        return sleepTimeSeconds * random.uniform(0.75, 1.25)
 
-        if utils.isValidUrl(newTwitchWebsocketUrl) and oldTwitchWebsocketUrl != newTwitchWebsocketUrl:
-            await self.__handleNewTwitchWebsocketUrlFor(
-                newTwitchWebsocketUrl = newTwitchWebsocketUrl,
-                oldTwitchWebsocketUrl = oldTwitchWebsocketUrl,
-                user = user
-            )
+    async def __handleDataBundle(
+        self,
+        sessionGroup: TwitchWebsocketSessionGroup,
+        dataBundle: TwitchWebsocketDataBundle
+    ):
+        if dataBundle.metadata.messageType is TwitchWebsocketMessageType.WELCOME:
+            payload = dataBundle.payload
+            session = None if payload is None else payload.session
 
-        oldSessionId = self.__sessionIdFor[user]
-        newSessionId = session.sessionId
+            if session is not None:
+                await self.__handleWelcome(sessionGroup, session)
 
-        if oldSessionId != newSessionId:
-            await self.__handleNewSessionIdFor(
-                newSessionId = newSessionId,
-                oldSessionId = oldSessionId,
-                user = user
-            )
+        await self.__submitDataBundle(dataBundle)
 
-    async def __handleNewSessionIdFor(
+    async def __handleWelcome(
         self,
-        newSessionId: str,
-        oldSessionId: str | None,
-        user: TwitchWebsocketUser
+        sessionGroup: TwitchWebsocketSessionGroup,
+        session: TwitchWebsocketSession
     ):
-        if not utils.isValidStr(newSessionId):
-            raise TypeError(f'newSessionId argument is malformed: \"{newSessionId}\"')
-        elif oldSessionId is not None and not isinstance(oldSessionId, str):
-            raise TypeError(f'oldSessionId argument is malformed: \"{oldSessionId}\"')
-        elif not isinstance(user, TwitchWebsocketUser):
-            raise TypeError(f'user argument is malformed: \"{user}\"')
+        # Twitch closes the connection if it hasn't heard a thing for this long, so give it a
+        # little more leeway than that before we decide the connection is dead on our end
+        keepAliveTimeoutSeconds = session.keepAliveTimeoutSeconds
 
-        self.__sessionIdFor[user] = newSessionId
-        self.__timber.log('TwitchWebsocketClient', f'Session ID for \"{user}\" has been changed to \"{newSessionId}\" from \"{oldSessionId}\". Creating EventSub subscription(s)...')
+        if utils.isValidInt(keepAliveTimeoutSeconds) and keepAliveTimeoutSeconds >= 1:
+            self.__keepAliveTimeoutSecondsFor[sessionGroup] = keepAliveTimeoutSeconds * 2
 
-        await self.__createEventSubSubscription(
-            sessionId = newSessionId,
-            user = user
-        )
+        oldSessionId = self.__sessionIdFor.get(sessionGroup, None)
+        newSessionId = session.sessionId
 
-    async def __handleNewTwitchWebsocketUrlFor(
-        self,
-        newTwitchWebsocketUrl: str,
-        oldTwitchWebsocketUrl: str,
-        user: TwitchWebsocketUser
-    ):
-        if not utils.isValidUrl(newTwitchWebsocketUrl):
-            raise TypeError(f'newTwitchWebsocketUrl argument is malformed: \"{newTwitchWebsocketUrl}\"')
-        elif not utils.isValidUrl(oldTwitchWebsocketUrl):
-            raise TypeError(f'oldTwitchWebsocketUrl argument is malformed: \"{oldTwitchWebsocketUrl}\"')
-        elif not isinstance(user, TwitchWebsocketUser):
-            raise TypeError(f'user argument is malformed: \"{user}\"')
+        if oldSessionId == newSessionId:
+            self.__timber.log('TwitchWebsocketClient', f'Session ID for \"{sessionGroup}\" carried over as \"{newSessionId}\"')
+            return
 
-        self.__twitchWebsocketUrlFor[user] = newTwitchWebsocketUrl
-        self.__timber.log('TwitchWebsocketClient', f'Twitch websocket URL for \"{user}\" has been changed to \"{newTwitchWebsocketUrl}\" from \"{oldTwitchWebsocketUrl}\"')
+        self.__sessionIdFor[sessionGroup] = newSessionId
+        self.__timber.log('TwitchWebsocketClient', f'Session ID for \"{sessionGroup}\" has been changed to \"{newSessionId}\" from \"{oldSessionId}\". Creating EventSub subscription(s)...')
+
+        await self.__createEventSubSubscription(
+            sessionGroup = sessionGroup,
+            sessionId = newSessionId
+        )
 
     async def __isValidMessage(self, dataBundle: TwitchWebsocketDataBundle) -> bool:
         if not isinstance(dataBundle, TwitchWebsocketDataBundle):
@@ -369,6 +399,60 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         else:
             return dataBundle
 
+    async def __receiveMessages(
+        self,
+        sessionGroup: TwitchWebsocketSessionGroup,
+        websocket: ClientConnection
+    ) -> str | None:
+        # Returns the URL that Twitch asked us to reconnect to, or None if the connection closed normally.
+
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    websocket.recv(),
+                    timeout = self.__keepAliveTimeoutSecondsFor.get(sessionGroup, None)
+                )
+            except websockets.ConnectionClosedOK:
+                return None
+
+            dataBundle = await self.__parseMessageToDataBundleFor(message, sessionGroup.user)
+
+            if dataBundle is None:
+                continue
+
+            await self.__handleDataBundle(sessionGroup, dataBundle)
+
+            if dataBundle.metadata.messageType is TwitchWebsocketMessageType.RECONNECT:
+                payload = dataBundle.payload
+                session = None if payload is None else payload.session
+
+                if session is not None and utils.isValidUrl(session.reconnectUrl):
+                    return session.reconnectUrl
+
+    async def __reconnect(
+        self,
+        sessionGroup: TwitchWebsocketSessionGroup,
+        oldWebsocket: ClientConnection,
+        reconnectUrl: str
+    ) -> ClientConnection:
+        self.__timber.log('TwitchWebsocketClient', f'Reconnecting \"{sessionGroup}\" to \"{reconnectUrl}\"...')
+
+        # keep reading from the old connection, as it can still deliver events until the new one is ready
+        drainTask = asyncio.create_task(self.__receiveMessages(sessionGroup, oldWebsocket))
+
+        try:
+            return await asyncio.wait_for(
+                self.__waitForWelcome(sessionGroup, reconnectUrl),
+                timeout = self.__reconnectTimeoutSeconds
+            )
+        finally:
+            await oldWebsocket.close()
+
+            try:
+                await drainTask
+            except Exception as e:
+                self.__timber.log('TwitchWebsocketClient', f'Encountered exception when draining the old websocket for \"{sessionGroup}\": {e}', e, traceback.format_exc())
+
     def setDataBundleListener(self, listener: TwitchWebsocketDataBundleListener | None):
         if listener is not None and not isinstance(listener, TwitchWebsocketDataBundleListener):
             raise TypeError(f'listener argument is malformed: \"{listener}\"')
@@ -389,65 +473,98 @@ class TwitchWebsocketClient(TwitchWebsocketClientInterface):
         while True:
             dataBundleListener = self.__dataBundleListener
 
-            if dataBundleListener is not None:
-                dataBundles: list[TwitchWebsocketDataBundle] = list()
+            if dataBundleListener is None:
+                # leave any data bundles in the queue until there is someone around to hear them
+                await asyncio.sleep(self.__queueSleepTimeSeconds)
+                continue
 
-                try:
-                    while not self.__dataBundleQueue.empty():
-                        dataBundles.append(self.__dataBundleQueue.get_nowait())
-                except queue.Empty as e:
-                    self.__timber.log('TwitchWebsocketClient', f'Encountered queue.Empty when building up dataBundles list (queue size: {self.__dataBundleQueue.qsize()}) (dataBundles size: {len(dataBundles)}): {e}', e, traceback.format_exc())
+            dataBundles = await self.__dataBundleQueue.getBatch(self.__queueSleepTimeSeconds)
 
-                for dataBundle in dataBundles:
-                    if not await self.__isValidMessage(dataBundle):
-                        continue
+            for dataBundle in dataBundles:
+                if not await self.__isValidMessage(dataBundle):
+                    continue
 
-                    try:
-                        await dataBundleListener.onNewWebsocketDataBundle(dataBundle)
-                    except Exception as e:
-                        self.__timber.log('RecurringActionsMachine', f'Encountered unknown Exception when looping through dataBundles (queue size: {self.__dataBundleQueue.qsize()}) ({dataBundle=}): {e}', e, traceback.format_exc())
+                try:
+                    await dataBundleListener.onNewWebsocketDataBundle(dataBundle)
+                except Exception as e:
+                    self.__timber.log('TwitchWebsocketClient', f'Encountered unknown Exception when looping through dataBundles (queue size: {self.__dataBundleQueue.qsize()}) ({dataBundle=}): {e}', e, traceback.format_exc())
 
-            await asyncio.sleep(self.__queueSleepTimeSeconds)
+    async def __startWebsocketConnectionFor(self, sessionGroup: TwitchWebsocketSessionGroup):
+        if not isinstance(sessionGroup, TwitchWebsocketSessionGroup):
+            raise TypeError(f'sessionGroup argument is malformed: \"{sessionGroup}\"')
 
-    async def __startWebsocketConnectionFor(self, user: TwitchWebsocketUser):
-        if not isinstance(user, TwitchWebsocketUser):
-            raise TypeError(f'user argument is malformed: \"{user}\"')
+        failureCount = 0
+        websocket: ClientConnection | None = None
 
         while True:
-            twitchWebsocketUrl = self.__twitchWebsocketUrlFor[user]
-            self.__timber.log('TwitchWebsocketClient', f'Connecting to websocket \"{twitchWebsocketUrl}\" for \"{user}\"...')
-
             try:
-                async with websockets.connect(twitchWebsocketUrl) as websocket:
-                    async for message in websocket:
-                        dataBundle = await self.__parseMessageToDataBundleFor(message, user)
+                if websocket is None:
+                    self.__timber.log('TwitchWebsocketClient', f'Connecting to websocket \"{self.__twitchWebsocketUrl}\" for \"{sessionGroup}\"...')
+                    websocket = await websockets.connect(self.__twitchWebsocketUrl)
+
+                reconnectUrl = await self.__receiveMessages(sessionGroup, websocket)
 
-                        if dataBundle is None:
-                            continue
+                if reconnectUrl is not None:
+                    websocket = await self.__reconnect(sessionGroup, websocket, reconnectUrl)
+                    continue
 
-                        await self.__handleConnectionRelatedMessageFor(user, dataBundle)
-                        await self.__submitDataBundle(dataBundle)
+                self.__timber.log('TwitchWebsocketClient', f'Websocket for \"{sessionGroup}\" was closed')
             except Exception as e:
-                self.__timber.log('TwitchWebsocketClient', f'Encountered websocket exception for \"{user}\" when connected to \"{twitchWebsocketUrl}\": {e}', e, traceback.format_exc())
-                self.__sessionIdFor[user] = ''
+                self.__timber.log('TwitchWebsocketClient', f'Encountered websocket exception for \"{sessionGroup}\": {e}', e, traceback.format_exc())
+
+            if websocket is not None:
+                try:
+                    await websocket.close()
+                except Exception:
+                    pass
 
-            await asyncio.sleep(self.__websocketSleepTimeSeconds)
+                websocket = None
+
+            # a session that was up and running resets the backoff, otherwise it keeps growing
+            if self.__sessionIdFor.pop(sessionGroup, None) is not None:
+                failureCount = 1
+            else:
+                failureCount += 1
+
+            self.__keepAliveTimeoutSecondsFor.pop(sessionGroup, None)
+            await asyncio.sleep(self.__getWebsocketSleepTimeSeconds(failureCount))
 
     async def __startWebsocketConnections(self):
         users = await self.__twitchWebsocketAllowedUsersRepository.getUsers()
-        self.__timber.log('TwitchWebsocketClient', f'Retrieved {len(users)} websocket user(s): ({users=})')
+        sessionGroups = self.__createSessionGroups(users)
+        self.__timber.log('TwitchWebsocketClient', f'Retrieved {len(users)} websocket user(s), requiring {len(sessionGroups)} session(s): ({users=})')
 
-        for user in users:
-            self.__backgroundTaskHelper.createTask(self.__startWebsocketConnectionFor(user))
+        for sessionGroup in sessionGroups:
+            self.__backgroundTaskHelper.createTask(self.__startWebsocketConnectionFor(sessionGroup))
             await asyncio.sleep(self.__websocketCreationDelayTimeSeconds)
 
-        self.__timber.log('TwitchWebsocketClient', f'Finished establishing websocket connections for {len(users)} user(s)')
+        self.__timber.log('TwitchWebsocketClient', f'Finished establishing websocket connections for {len(sessionGroups)} session(s)')
 
     async def __submitDataBundle(self, dataBundle: TwitchWebsocketDataBundle):
         if not isinstance(dataBundle, TwitchWebsocketDataBundle):
             raise TypeError(f'dataBundle argument is malformed: \"{dataBundle}\"')
 
+        if not self.__dataBundleQueue.put(dataBundle):
+            self.__timber.log('TwitchWebsocketClient', f'Dropped dataBundle ({dataBundle}) as the dataBundle queue is full ({self.__dataBundleQueue.getMetrics()=})')
+
+    async def __waitForWelcome(
+        self,
+        sessionGroup: TwitchWebsocketSessionGroup,
+        twitchWebsocketUrl: str
+    ) -> ClientConnection:
+        websocket = await websockets.connect(twitchWebsocketUrl)
+
         try:
-            self.__dataBundleQueue.put(dataBundle, block = True, timeout = self.__queueTimeoutSeconds)
-        except queue.Full as e:
-            self.__timber.log('TwitchWebsocketClient', f'Encountered queue.Full when submitting a new dataBundle ({dataBundle}) into the dataBundle queue (queue size: {self.__dataBundleQueue.qsize()}): {e}', e, traceback.format_exc())
+            while True:
+                dataBundle = await self.__parseMessageToDataBundleFor(await websocket.recv(), sessionGroup.user)
+
+                if dataBundle is None:
+                    continue
+
+                await self.__handleDataBundle(sessionGroup, dataBundle)
+
+                if dataBundle.metadata.messageType is TwitchWebsocketMessageType.WELCOME:
+                    return websocket
+        except BaseException:
+            await websocket.close()
+            raise
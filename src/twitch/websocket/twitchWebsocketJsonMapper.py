@@ -722,11 +722,15 @@ class TwitchWebsocketJsonMapper(TwitchWebsocketJsonMapperInterface):
         if not isinstance(sessionJson, dict) or len(sessionJson) == 0:
             return None
 
-        keepAliveTimeoutSeconds = utils.getIntFromDict(sessionJson, 'keepalive_timeout_seconds')
         connectedAt = utils.getDateTimeFromDict(sessionJson, 'connected_at')
         sessionId = utils.getStrFromDict(sessionJson, 'id')
         status = TwitchWebsocketConnectionStatus.fromStr(utils.getStrFromDict(sessionJson, 'status'))
 
+        # session_reconnect messages have a null keepalive_timeout_seconds
+        keepAliveTimeoutSeconds: int | None = None
+        if 'keepalive_timeout_seconds' in sessionJson and utils.isValidInt(sessionJson.get('keepalive_timeout_seconds')):
+            keepAliveTimeoutSeconds = utils.getIntFromDict(sessionJson, 'keepalive_timeout_seconds')
+
         reconnectUrl: str | None = None
         if 'reconnect_url' in sessionJson and utils.isValidUrl(sessionJson.get('reconnect_url')):
             reconnectUrl = utils.getStrFromDict(sessionJson, 'reconnect_url')
@@ -0,0 +1,14 @@
+from dataclasses import dataclass
+
+from .twitchWebsocketUser import TwitchWebsocketUser
+from ..api.websocket.twitchWebsocketSubscriptionType import TwitchWebsocketSubscriptionType
+
+
+@dataclass(frozen = True)
+class TwitchWebsocketSessionGroup:
+    index: int
+    subscriptionTypes: frozenset[TwitchWebsocketSubscriptionType]
+    user: TwitchWebsocketUser
+
+    def __repr__(self) -> str:
+        return f'{self.user.userName}#{self.index}'
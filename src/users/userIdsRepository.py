@@ -10,7 +10,6 @@ from ..misc import utils as utils
 from ..network.exceptions import GenericNetworkException
 from ..storage.backingDatabase import BackingDatabase
 from ..storage.databaseConnection import DatabaseConnection
-from ..storage.databaseType import DatabaseType
 from ..timber.timberInterface import TimberInterface
 from ..twitch.api.twitchApiServiceInterface import TwitchApiServiceInterface
 from ..twitch.officialTwitchAccountUserIdProviderInterface import OfficialTwitchAccountUserIdProviderInterface
@@ -44,7 +43,6 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         self.__timber: TimberInterface = timber
         self.__twitchApiService: TwitchApiServiceInterface = twitchApiService
 
-        self.__isDatabaseReady: bool = False
         self.__cache: LRU[str, str | None] = LRU(cacheSize)
 
     async def clearCaches(self):
@@ -208,42 +206,8 @@ class UserIdsRepository(UserIdsRepositoryInterface):
         return userDetails.login
 
     async def __getDatabaseConnection(self) -> DatabaseConnection:
-        await self.__initDatabaseTable()
         return await self.__backingDatabase.getConnection()
 
-    async def __initDatabaseTable(self):
-        if self.__isDatabaseReady:
-            return
-
-        self.__isDatabaseReady = True
-        connection = await self.__backingDatabase.getConnection()
-
-        match connection.databaseType:
-            case DatabaseType.POSTGRESQL:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS userids (
-                            userid text NOT NULL PRIMARY KEY,
-                            username public.citext NOT NULL
-                        )
-                    '''
-                )
-
-            case DatabaseType.SQLITE:
-                await connection.createTableIfNotExists(
-                    '''
-                        CREATE TABLE IF NOT EXISTS userids (
-                            userid TEXT NOT NULL PRIMARY KEY,
-                            username TEXT NOT NULL COLLATE NOCASE
-                        )
-                    '''
-                )
-
-            case _:
-                raise RuntimeError(f'Encountered unexpected DatabaseType when trying to create tables: \"{connection.databaseType}\"')
-
-        await connection.close()
-
     async def optionallySetUser(self, userId: str | None, userName: str | None):
         if utils.isValidStr(userId) and utils.isValidStr(userName):
             await self.setUser(userId = userId, userName = userName)
@@ -345,3 +309,37 @@ class UserIdsRepository(UserIdsRepositoryInterface):
 
         await connection.close()
         self.__cache[userId] = userName
+
+    async def setUsers(self, userIdsToUserNames: dict[str, str]):
+        if not isinstance(userIdsToUserNames, dict):
+            raise TypeError(f'userIdsToUserNames argument is malformed: \"{userIdsToUserNames}\"')
+
+        records: list[tuple[str, str]] = list()
+
+        for userId, userName in userIdsToUserNames.items():
+            if not utils.isValidStr(userId):
+                raise TypeError(f'userId value is malformed: \"{userId}\"')
+            elif not utils.isValidStr(userName):
+                raise TypeError(f'userName value is malformed: \"{userName}\"')
+            elif self.__cache.get(userId, None) == userName:
+                continue
+
+            records.append((userId, userName))
+
+        if len(records) == 0:
+            return
+
+        connection = await self.__getDatabaseConnection()
+        await connection.executeMany(
+            '''
+                INSERT INTO userids (userid, username)
+                VALUES ($1, $2)
+                ON CONFLICT (userid) DO UPDATE SET username = EXCLUDED.username
+            ''',
+            records
+        )
+
+        await connection.close()
+
+        for userId, userName in records:
+            self.__cache[userId] = userName
@@ -80,3 +80,7 @@ class UserIdsRepositoryInterface(Clearable):
     @abstractmethod
     async def setUser(self, userId: str, userName: str):
         pass
+
+    @abstractmethod
+    async def setUsers(self, userIdsToUserNames: dict[str, str]):
+        pass
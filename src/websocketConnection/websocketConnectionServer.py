@@ -1,9 +1,7 @@
 import asyncio
 import json
-import queue
 import traceback
 from datetime import datetime, timedelta
-from queue import SimpleQueue
 from typing import Any
 
 import websockets
@@ -13,6 +11,7 @@ from .websocketEvent import WebsocketEvent
 from ..location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
 from ..misc import utils as utils
 from ..misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from ..misc.batchingQueue import BatchingQueue
 from ..storage.jsonReaderInterface import JsonReaderInterface
 from ..timber.timberInterface import TimberInterface
 
@@ -29,7 +28,8 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
         port: int = 8765,
         host: str = '0.0.0.0',
         websocketSettingsFile: str = 'websocketSettings.json',
-        eventTimeToLive: timedelta = timedelta(seconds = 30)
+        eventTimeToLive: timedelta = timedelta(seconds = 30),
+        maxQueueSize: int = 1000
     ):
         if not isinstance(backgroundTaskHelper, BackgroundTaskHelperInterface):
             raise TypeError(f'backgroundTaskHelper argument is malformed: \"{backgroundTaskHelper}\"')
@@ -53,6 +53,10 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
             raise TypeError(f'websocketSettingsFile argument is malformed: \"{websocketSettingsFile}\"')
         elif not isinstance(eventTimeToLive, timedelta):
             raise TypeError(f'eventTimeToLive argument is malformed: \"{eventTimeToLive}\"')
+        elif not utils.isValidInt(maxQueueSize):
+            raise TypeError(f'maxQueueSize argument is malformed: \"{maxQueueSize}\"')
+        elif maxQueueSize < 1 or maxQueueSize > utils.getIntMaxSafeSize():
+            raise ValueError(f'maxQueueSize argument is out of bounds: {maxQueueSize}')
 
         self.__backgroundTaskHelper: BackgroundTaskHelperInterface = backgroundTaskHelper
         self.__settingsJsonReader: JsonReaderInterface = settingsJsonReader
@@ -66,7 +70,7 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
 
         self.__isStarted: bool = False
         self.__cache: dict[str, Any] | None = None
-        self.__eventQueue: SimpleQueue[WebsocketEvent] = SimpleQueue()
+        self.__eventQueue: BatchingQueue[WebsocketEvent] = BatchingQueue(maxSize = maxQueueSize)
 
     async def clearCaches(self):
         self.__cache = None
@@ -116,10 +120,11 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
             currentSize = self.__eventQueue.qsize()
             self.__timber.log('WebsocketConnectionServer', f'Adding event to queue (current qsize is {currentSize}): {event}')
 
-        self.__eventQueue.put(WebsocketEvent(
-            eventTime = datetime.now(self.__timeZoneRepository.getDefault()), 
+        if not self.__eventQueue.put(WebsocketEvent(
+            eventTime = datetime.now(self.__timeZoneRepository.getDefault()),
             eventData = event
-        ))
+        )):
+            self.__timber.log('WebsocketConnectionServer', f'Dropped event as the event queue is full ({self.__eventQueue.getMetrics()=}): {event}')
 
     def start(self):
         if self.__isStarted:
@@ -161,29 +166,28 @@ class WebsocketConnectionServer(WebsocketConnectionServerInterface):
             self.__timber.log('WebsocketConnectionServer', f'Entered `__websocketConnectionReceived()` (path: \"{path}\") (qsize: {self.__eventQueue.qsize()})')
 
         while websocket.open:
-            while not self.__eventQueue.empty():
-                isDebugLoggingEnabled = await self.__isDebugLoggingEnabled()
+            # wake up at least every sleepTimeSeconds so that we notice a closed websocket
+            events = await self.__eventQueue.getBatch(self.__sleepTimeSeconds)
 
-                try:
-                    event = self.__eventQueue.get_nowait()
+            if len(events) == 0:
+                continue
 
-                    if event.eventTime + self.__eventTimeToLive >= datetime.now(self.__timeZoneRepository.getDefault()):
-                        eventJson = json.dumps(event.eventData, sort_keys = True)
-                        await websocket.send(eventJson)
+            isDebugLoggingEnabled = await self.__isDebugLoggingEnabled()
 
-                        if isDebugLoggingEnabled:
-                            self.__timber.log('WebsocketConnectionServer', f'Sent event to \"{path}\": {event.eventData}')
-                        else:
-                            self.__timber.log('WebsocketConnectionServer', f'Sent event to \"{path}\"')
-                    else:
-                        if isDebugLoggingEnabled:
-                            self.__timber.log('WebsocketConnectionServer', f'Discarded an event meant for \"{path}\": {event.eventData}')
-                        else:
-                            self.__timber.log('WebsocketConnectionServer', f'Discarded an event meant for \"{path}\"')
-                except queue.Empty as e:
-                    self.__timber.log('WebsocketConnectionServer', f'Encountered queue.Empty error when looping through events (qsize: {self.__eventQueue.qsize()}): {e}', e, traceback.format_exc())
+            for event in events:
+                if event.eventTime + self.__eventTimeToLive >= datetime.now(self.__timeZoneRepository.getDefault()):
+                    eventJson = json.dumps(event.eventData, sort_keys = True)
+                    await websocket.send(eventJson)
 
-            await asyncio.sleep(self.__sleepTimeSeconds)
+                    if isDebugLoggingEnabled:
+                        self.__timber.log('WebsocketConnectionServer', f'Sent event to \"{path}\": {event.eventData}')
+                    else:
+                        self.__timber.log('WebsocketConnectionServer', f'Sent event to \"{path}\"')
+                else:
+                    if isDebugLoggingEnabled:
+                        self.__timber.log('WebsocketConnectionServer', f'Discarded an event meant for \"{path}\": {event.eventData}')
+                    else:
+                        self.__timber.log('WebsocketConnectionServer', f'Discarded an event meant for \"{path}\"')
 
         if await self.__isDebugLoggingEnabled():
             self.__timber.log('WebsocketConnectionServer', f'Exiting `__websocketConnectionReceived()`')
@@ -0,0 +1,220 @@
+import gzip
+import json
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.chatLogger.absChatMessage import AbsChatMessage
+from src.chatLogger.chatArchive import ChatArchive
+from src.chatLogger.chatArchiveInterface import ChatArchiveInterface
+from src.chatLogger.chatMessage import ChatMessage
+from src.chatLogger.raidMessage import RaidMessage
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.simpleDateTime import SimpleDateTime
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+
+
+class TestChatArchive:
+
+    startTime: datetime = datetime(2024, 1, 1, tzinfo = timezone.utc)
+
+    timber: TimberInterface = TimberStub()
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    def __createArchive(self, tmp_path: Path) -> ChatArchiveInterface:
+        return ChatArchive(
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository,
+            maxSegmentRecords = 3,
+            archiveRootDirectory = str(tmp_path)
+        )
+
+    def __createMessage(self, minute: int, userId: str) -> ChatMessage:
+        return ChatMessage(
+            dateTime = SimpleDateTime(now = self.startTime + timedelta(minutes = minute)),
+            msg = f'message {minute}',
+            twitchChannel = 'smCharles',
+            twitchChannelId = '123',
+            userId = userId,
+            userName = f'user{userId}'
+        )
+
+    async def __populate(self, chatArchive: ChatArchiveInterface):
+        messages: list[AbsChatMessage] = list()
+
+        for minute in range(10):
+            messages.append(self.__createMessage(minute, 'a' if minute % 2 == 0 else 'b'))
+
+        messages.append(RaidMessage(
+            raidSize = 50,
+            dateTime = SimpleDateTime(now = self.startTime + timedelta(minutes = 10)),
+            fromWho = 'stashiocat',
+            twitchChannel = 'smCharles',
+            twitchChannelId = '123'
+        ))
+
+        await chatArchive.append(messages)
+
+    async def __getAllMessages(self, chatArchive: ChatArchiveInterface) -> list[AbsChatMessage]:
+        return await chatArchive.getMessagesInWindow(
+            twitchChannelId = '123',
+            startTime = self.startTime,
+            endTime = self.startTime + timedelta(days = 1)
+        )
+
+    @pytest.mark.asyncio
+    async def test_append_sealsAndCompressesSegments(self, tmp_path: Path):
+        chatArchive = self.__createArchive(tmp_path)
+        await self.__populate(chatArchive)
+
+        channelDirectory = tmp_path / '123'
+        assert (channelDirectory / 'index.json').exists()
+        assert (channelDirectory / 'segment-1.jsonl.gz').exists()
+        assert (channelDirectory / 'segment-3.jsonl.gz').exists()
+        assert (channelDirectory / 'segment-4.jsonl').exists()
+        assert not (channelDirectory / 'segment-1.jsonl').exists()
+
+    @pytest.mark.asyncio
+    async def test_append_withFailingIndexWrite_keepsActiveSegment(self, tmp_path: Path):
+        chatArchive = self.__createArchive(tmp_path)
+        await chatArchive.append([ self.__createMessage(0, 'a'), self.__createMessage(1, 'b') ])
+
+        # a directory in the way of the index's temporary file makes writing the index fail
+        channelDirectory = tmp_path / '123'
+        (channelDirectory / 'index.json.tmp').mkdir()
+
+        # the message itself was still archived, only sealing its segment failed
+        assert await chatArchive.append([ self.__createMessage(2, 'a') ]) == list()
+        assert (channelDirectory / 'segment-1.jsonl').exists()
+        assert not (channelDirectory / 'segment-1.jsonl.gz').exists()
+
+        (channelDirectory / 'index.json.tmp').rmdir()
+        chatArchive = self.__createArchive(tmp_path)
+        await chatArchive.append([ self.__createMessage(3, 'b'), self.__createMessage(4, 'a'), self.__createMessage(5, 'b') ])
+
+        messages = await self.__getAllMessages(chatArchive)
+        assert [ message.msg for message in messages ] == [ f'message {minute}' for minute in range(6) ]
+
+    @pytest.mark.asyncio
+    async def test_append_afterInterruptedSeal_finishesSeal(self, tmp_path: Path):
+        await self.__populate(self.__createArchive(tmp_path))
+
+        # put things back how they'd be if the bot died after writing the index, but before moving
+        # the sealed segment into place
+        channelDirectory = tmp_path / '123'
+
+        with gzip.open(channelDirectory / 'segment-3.jsonl.gz', mode = 'rt', encoding = 'utf-8') as file:
+            (channelDirectory / 'segment-3.jsonl').write_text(file.read(), encoding = 'utf-8')
+
+        (channelDirectory / 'segment-3.jsonl.gz').unlink()
+
+        chatArchive = self.__createArchive(tmp_path)
+        messages = await self.__getAllMessages(chatArchive)
+        assert len(messages) == 11
+        assert (channelDirectory / 'segment-3.jsonl.gz').exists()
+        assert not (channelDirectory / 'segment-3.jsonl').exists()
+
+    @pytest.mark.asyncio
+    async def test_append_withStaleIndex_doesNotOverwriteSealedSegment(self, tmp_path: Path):
+        await self.__populate(self.__createArchive(tmp_path))
+
+        # an index that was never updated for the most recently sealed segment
+        channelDirectory = tmp_path / '123'
+        indexJson = json.loads((channelDirectory / 'index.json').read_text(encoding = 'utf-8'))
+        indexJson['activeSegment'] = 3
+        indexJson['segments'] = indexJson['segments'][0:2]
+        (channelDirectory / 'index.json').write_text(json.dumps(indexJson), encoding = 'utf-8')
+
+        chatArchive = self.__createArchive(tmp_path)
+        await chatArchive.append([ self.__createMessage(11, 'a') ])
+
+        messages = await self.__getAllMessages(chatArchive)
+        assert len(messages) == 12
+        assert (channelDirectory / 'segment-3.jsonl.gz').exists()
+        assert (channelDirectory / 'segment-4.jsonl.gz').exists()
+        assert not (channelDirectory / 'segment-5.jsonl').exists()
+
+        indexJson = json.loads((channelDirectory / 'index.json').read_text(encoding = 'utf-8'))
+        assert indexJson['activeSegment'] == 5
+        assert [ segment['fileName'] for segment in indexJson['segments'] ] == [ 'segment-1.jsonl.gz', 'segment-2.jsonl.gz', 'segment-3.jsonl.gz', 'segment-4.jsonl.gz' ]
+
+    @pytest.mark.asyncio
+    async def test_append_withBrokenChannel_returnsOnlyThatChannelsMessages(self, tmp_path: Path):
+        # a directory in the way of the active segment makes appending to it fail
+        (tmp_path / '456' / 'segment-1.jsonl').mkdir(parents = True)
+        chatArchive = self.__createArchive(tmp_path)
+
+        brokenMessage = ChatMessage(
+            dateTime = SimpleDateTime(now = self.startTime),
+            msg = 'broken',
+            twitchChannel = 'stashiocat',
+            twitchChannelId = '456',
+            userId = 'a',
+            userName = 'usera'
+        )
+
+        unarchivedMessages = await chatArchive.append([ self.__createMessage(0, 'a'), brokenMessage, self.__createMessage(1, 'b') ])
+        assert unarchivedMessages == [ brokenMessage ]
+
+        messages = await self.__getAllMessages(chatArchive)
+        assert [ message.msg for message in messages ] == [ 'message 0', 'message 1' ]
+
+    @pytest.mark.asyncio
+    async def test_getLastMessagesFromUser(self, tmp_path: Path):
+        chatArchive = self.__createArchive(tmp_path)
+        await self.__populate(chatArchive)
+
+        messages = await chatArchive.getLastMessagesFromUser(
+            twitchChannelId = '123',
+            userId = 'b',
+            count = 3
+        )
+
+        assert [ message.msg for message in messages ] == [ 'message 5', 'message 7', 'message 9' ]
+
+    @pytest.mark.asyncio
+    async def test_getLastMessagesFromUser_afterReload(self, tmp_path: Path):
+        await self.__populate(self.__createArchive(tmp_path))
+        chatArchive = self.__createArchive(tmp_path)
+
+        messages = await chatArchive.getLastMessagesFromUser(
+            twitchChannelId = '123',
+            userId = 'a',
+            count = 100
+        )
+
+        assert [ message.msg for message in messages ] == [ 'message 0', 'message 2', 'message 4', 'message 6', 'message 8' ]
+        assert all(message.twitchChannel == 'smCharles' for message in messages)
+
+    @pytest.mark.asyncio
+    async def test_getLastMessagesFromUser_withUnknownChannel(self, tmp_path: Path):
+        chatArchive = self.__createArchive(tmp_path)
+
+        messages = await chatArchive.getLastMessagesFromUser(
+            twitchChannelId = '456',
+            userId = 'a',
+            count = 5
+        )
+
+        assert len(messages) == 0
+
+    @pytest.mark.asyncio
+    async def test_getMessagesInWindow(self, tmp_path: Path):
+        chatArchive = self.__createArchive(tmp_path)
+        await self.__populate(chatArchive)
+
+        messages = await chatArchive.getMessagesInWindow(
+            twitchChannelId = '123',
+            startTime = self.startTime + timedelta(minutes = 2),
+            endTime = self.startTime + timedelta(minutes = 10)
+        )
+
+        assert len(messages) == 9
+        assert isinstance(messages[0], ChatMessage)
+        assert messages[0].msg == 'message 2'
+        assert isinstance(messages[8], RaidMessage)
+        assert messages[8].raidSize == 50
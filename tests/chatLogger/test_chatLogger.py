@@ -0,0 +1,162 @@
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+
+from src.chatLogger.absChatMessage import AbsChatMessage
+from src.chatLogger.chatArchiveInterface import ChatArchiveInterface
+from src.chatLogger.chatLogger import ChatLogger
+from src.chatLogger.chatLoggerInterface import ChatLoggerInterface
+from src.chatLogger.chatMessage import ChatMessage
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+
+
+class TestChatLogger:
+
+    class BrokenChatArchive(ChatArchiveInterface):
+
+        def __init__(self):
+            self.appendCount: int = 0
+
+        async def append(self, messages: list[AbsChatMessage]) -> list[AbsChatMessage]:
+            self.appendCount += 1
+            raise RuntimeError('the chat archive is broken')
+
+        async def getLastMessagesFromUser(
+            self,
+            twitchChannelId: str,
+            userId: str,
+            count: int
+        ) -> list[ChatMessage]:
+            return list()
+
+        async def getMessagesInWindow(
+            self,
+            twitchChannelId: str,
+            startTime: datetime,
+            endTime: datetime
+        ) -> list[AbsChatMessage]:
+            return list()
+
+    class PartiallyBrokenChatArchive(ChatArchiveInterface):
+
+        def __init__(self):
+            self.archivedMessages: list[AbsChatMessage] = list()
+
+        async def append(self, messages: list[AbsChatMessage]) -> list[AbsChatMessage]:
+            unarchivedMessages: list[AbsChatMessage] = list()
+
+            for message in messages:
+                if message.twitchChannelId == '123':
+                    self.archivedMessages.append(message)
+                else:
+                    unarchivedMessages.append(message)
+
+            return unarchivedMessages
+
+        async def getLastMessagesFromUser(
+            self,
+            twitchChannelId: str,
+            userId: str,
+            count: int
+        ) -> list[ChatMessage]:
+            return list()
+
+        async def getMessagesInWindow(
+            self,
+            twitchChannelId: str,
+            startTime: datetime,
+            endTime: datetime
+        ) -> list[AbsChatMessage]:
+            return list()
+
+    timber: TimberInterface = TimberStub()
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    async def __waitForLogFiles(self, tmp_path: Path) -> list[Path]:
+        logFiles: list[Path] = list()
+
+        for _ in range(100):
+            logFiles = list(tmp_path.rglob('*.log'))
+
+            if len(logFiles) >= 1:
+                break
+
+            await asyncio.sleep(0.01)
+
+        return logFiles
+
+    @pytest.mark.asyncio
+    async def test_logMessage_withBrokenChatArchive_fallsBackToLogFiles(self, tmp_path: Path):
+        chatArchive = TestChatLogger.BrokenChatArchive()
+
+        chatLogger: ChatLoggerInterface = ChatLogger(
+            backgroundTaskHelper = BackgroundTaskHelper(asyncio.get_running_loop()),
+            chatArchive = chatArchive,
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository,
+            maxLatencySeconds = 0,
+            logRootDirectory = str(tmp_path)
+        )
+
+        chatLogger.start()
+
+        chatLogger.logMessage(
+            msg = 'Hello, World!',
+            twitchChannel = 'smCharles',
+            twitchChannelId = '123',
+            userId = '456',
+            userName = 'stashiocat'
+        )
+
+        logFiles = await self.__waitForLogFiles(tmp_path)
+        assert chatArchive.appendCount == 1
+        assert len(logFiles) == 1
+        assert logFiles[0].parent.parent.parent.name == 'smcharles'
+        assert 'stashiocat (456) — Hello, World!' in logFiles[0].read_text(encoding = 'utf-8')
+
+    @pytest.mark.asyncio
+    async def test_logMessage_withPartiallyBrokenChatArchive_fallsBackToLogFilesForUnarchivedMessages(self, tmp_path: Path):
+        chatArchive = TestChatLogger.PartiallyBrokenChatArchive()
+
+        chatLogger: ChatLoggerInterface = ChatLogger(
+            backgroundTaskHelper = BackgroundTaskHelper(asyncio.get_running_loop()),
+            chatArchive = chatArchive,
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository,
+            maxLatencySeconds = 0,
+            logRootDirectory = str(tmp_path)
+        )
+
+        chatLogger.start()
+
+        chatLogger.logMessage(
+            msg = 'Hello, World!',
+            twitchChannel = 'smCharles',
+            twitchChannelId = '123',
+            userId = '456',
+            userName = 'stashiocat'
+        )
+
+        chatLogger.logMessage(
+            msg = 'Hello, Archive!',
+            twitchChannel = 'imyt',
+            twitchChannelId = '789',
+            userId = '456',
+            userName = 'stashiocat'
+        )
+
+        logFiles = await self.__waitForLogFiles(tmp_path)
+        assert len(chatArchive.archivedMessages) == 1
+        assert len(logFiles) == 1
+        assert logFiles[0].parent.parent.parent.name == 'imyt'
+
+        logText = logFiles[0].read_text(encoding = 'utf-8')
+        assert 'Hello, Archive!' in logText
+        assert 'Hello, World!' not in logText
@@ -0,0 +1,78 @@
+import asyncio
+
+from src.latencyTracing.latencyHistogram import LatencyHistogram
+from src.latencyTracing.latencyStage import LatencyStage
+from src.latencyTracing.latencyTracer import LatencyTracer
+from src.latencyTracing.latencyTracerInterface import LatencyTracerInterface
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+
+
+class TestLatencyTracer:
+
+    eventLoop = asyncio.new_event_loop()
+
+    backgroundTaskHelper: BackgroundTaskHelperInterface = BackgroundTaskHelper(
+        eventLoop = eventLoop
+    )
+
+    timber: TimberInterface = TimberStub()
+
+    def test_histogram_percentiles(self):
+        histogram = LatencyHistogram(stage = LatencyStage.GET_USER)
+
+        for durationMillis in range(1, 101):
+            histogram.record(float(durationMillis))
+
+        snapshot = histogram.toSnapshot()
+        assert snapshot is not None
+        assert snapshot.p50Millis == 50
+        assert snapshot.p95Millis == 95
+        assert snapshot.p99Millis == 99
+        assert snapshot.maxMillis == 100
+        assert snapshot.sampleCount == 100
+        assert snapshot.totalCount == 100
+
+    def test_histogram_rollsOverOldestSamples(self):
+        histogram = LatencyHistogram(stage = LatencyStage.GET_USER, maxSamples = 10)
+
+        for _ in range(10):
+            histogram.record(1000)
+
+        for _ in range(10):
+            histogram.record(1)
+
+        snapshot = histogram.toSnapshot()
+        assert snapshot is not None
+        assert snapshot.maxMillis == 1
+        assert snapshot.sampleCount == 10
+        assert snapshot.totalCount == 20
+
+    def test_histogram_withNoSamples(self):
+        histogram = LatencyHistogram(stage = LatencyStage.GET_USER)
+        assert histogram.toSnapshot() is None
+
+    def test_record_chainsStagesPerChannel(self):
+        latencyTracer: LatencyTracerInterface = LatencyTracer(
+            backgroundTaskHelper = self.backgroundTaskHelper,
+            timber = self.timber
+        )
+
+        startTime = latencyTracer.record('1', LatencyStage.ACTIVE_CHATTERS, 0)
+        endTime = latencyTracer.record('1', LatencyStage.GET_USER, startTime)
+        assert endTime >= startTime
+
+        snapshots = latencyTracer.getSnapshots('1')
+        assert len(snapshots) == 2
+        assert snapshots[0].stage is LatencyStage.ACTIVE_CHATTERS
+        assert snapshots[1].stage is LatencyStage.GET_USER
+
+        assert len(latencyTracer.getSnapshots('2')) == 0
+        assert latencyTracer.getReport('2') is None
+
+        report = latencyTracer.getReport('1')
+        assert isinstance(report, str)
+        assert 'active_chatters' in report
+        assert 'get_user' in report
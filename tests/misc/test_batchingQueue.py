@@ -0,0 +1,115 @@
+import asyncio
+import threading
+
+import pytest
+
+from src.misc.batchingQueue import BatchingQueue
+
+
+class TestBatchingQueue:
+
+    def test_drain(self):
+        queue: BatchingQueue[int] = BatchingQueue(maxBatchSize = 2, maxLatencySeconds = 60)
+
+        for item in range(5):
+            queue.put(item)
+
+        # everything comes out at once, regardless of maxBatchSize and maxLatencySeconds
+        assert queue.drain() == [ 0, 1, 2, 3, 4 ]
+        assert queue.empty()
+        assert queue.drain() == list()
+
+        metrics = queue.getMetrics()
+        assert metrics.totalBatches == 1
+        assert metrics.totalDequeued == 5
+
+    @pytest.mark.asyncio
+    async def test_getBatch_respectsMaxBatchSize(self):
+        queue: BatchingQueue[int] = BatchingQueue(maxBatchSize = 2)
+
+        for item in range(5):
+            assert queue.put(item)
+
+        assert await queue.getBatch() == [ 0, 1 ]
+        assert await queue.getBatch() == [ 2, 3 ]
+        assert await queue.getBatch() == [ 4 ]
+        assert queue.empty()
+
+    @pytest.mark.asyncio
+    async def test_getBatch_withMaxLatencyCollectsLateItems(self):
+        queue: BatchingQueue[str] = BatchingQueue(maxLatencySeconds = 0.5)
+
+        async def putLater():
+            await asyncio.sleep(0.05)
+            queue.put('b')
+
+        queue.put('a')
+        task = asyncio.create_task(putLater())
+        batch = await queue.getBatch()
+        await task
+
+        assert batch == [ 'a', 'b' ]
+
+    @pytest.mark.asyncio
+    async def test_getBatch_withMaxLatencyReturnsEarlyWhenBatchIsFull(self):
+        queue: BatchingQueue[str] = BatchingQueue(maxBatchSize = 2, maxLatencySeconds = 30)
+        queue.put('a')
+        queue.put('b')
+
+        batch = await asyncio.wait_for(queue.getBatch(), timeout = 1)
+        assert batch == [ 'a', 'b' ]
+
+    @pytest.mark.asyncio
+    async def test_getBatch_withTimeoutAndEmptyQueue(self):
+        queue: BatchingQueue[int] = BatchingQueue()
+        assert await queue.getBatch(0.01) == list()
+
+    @pytest.mark.asyncio
+    async def test_getBatch_wakesUpImmediatelyOnPut(self):
+        queue: BatchingQueue[int] = BatchingQueue()
+        eventLoop = asyncio.get_running_loop()
+        eventLoop.call_later(0.01, queue.put, 7)
+
+        batch = await asyncio.wait_for(queue.getBatch(), timeout = 1)
+        assert batch == [ 7 ]
+
+    @pytest.mark.asyncio
+    async def test_getBatch_wakesUpOnPutFromAnotherThread(self):
+        queue: BatchingQueue[int] = BatchingQueue()
+        thread = threading.Timer(0.05, queue.put, args = [ 9 ])
+        thread.start()
+
+        batch = await asyncio.wait_for(queue.getBatch(), timeout = 2)
+        thread.join()
+
+        assert batch == [ 9 ]
+
+    @pytest.mark.asyncio
+    async def test_getMetrics(self):
+        queue: BatchingQueue[int] = BatchingQueue(maxBatchSize = 2, maxSize = 3)
+
+        for item in range(4):
+            queue.put(item)
+
+        await queue.getBatch()
+        metrics = queue.getMetrics()
+
+        assert metrics.depth == 1
+        assert metrics.highWaterMark == 3
+        assert metrics.maxSize == 3
+        assert metrics.totalBatches == 1
+        assert metrics.totalDequeued == 2
+        assert metrics.totalDropped == 1
+        assert metrics.totalEnqueued == 3
+
+    def test_put_whenFull(self):
+        queue: BatchingQueue[int] = BatchingQueue(maxSize = 1)
+        assert queue.put(1)
+        assert not queue.put(2)
+        assert queue.qsize() == 1
+        assert len(queue) == 1
+
+    def test_sanity(self):
+        queue: BatchingQueue[int] = BatchingQueue()
+        assert queue.empty()
+        assert queue.qsize() == 0
@@ -0,0 +1,69 @@
+import pytest
+
+from src.misc.bloomFilter import BloomFilter
+
+
+class TestBloomFilter:
+
+    def test_add_and_contains(self):
+        bloomFilter = BloomFilter(capacity = 100)
+        assert 'abc' not in bloomFilter
+
+        bloomFilter.add('abc')
+        assert 'abc' in bloomFilter
+        assert len(bloomFilter) == 1
+
+    def test_add_withSameKeyTwice(self):
+        bloomFilter = BloomFilter(capacity = 100)
+        bloomFilter.add('abc')
+        bloomFilter.add('abc')
+        assert len(bloomFilter) == 1
+
+    def test_contains_neverHasFalseNegatives(self):
+        bloomFilter = BloomFilter(capacity = 2000)
+        keys = [ f'question:{index}' for index in range(2000) ]
+
+        for key in keys:
+            bloomFilter.add(key)
+
+        for key in keys:
+            assert key in bloomFilter
+
+    def test_contains_falsePositiveRateIsNearTarget(self):
+        bloomFilter = BloomFilter(capacity = 5000, falsePositiveRate = 0.01)
+
+        for index in range(5000):
+            bloomFilter.add(f'present:{index}')
+
+        falsePositives = 0
+
+        for index in range(20000):
+            if f'absent:{index}' in bloomFilter:
+                falsePositives += 1
+
+        # comfortably above the configured 1%, so that this can't be flaky
+        assert falsePositives / 20000 < 0.02
+
+    def test_isSaturated(self):
+        bloomFilter = BloomFilter(capacity = 3)
+        bloomFilter.add('a')
+        bloomFilter.add('b')
+        assert not bloomFilter.isSaturated
+
+        bloomFilter.add('c')
+        assert bloomFilter.isSaturated
+
+    def test_sizing(self):
+        bloomFilter = BloomFilter(capacity = 1000, falsePositiveRate = 0.01)
+        assert bloomFilter.capacity == 1000
+        assert bloomFilter.falsePositiveRate == 0.01
+        assert bloomFilter.bitCount == 9586
+        assert bloomFilter.hashCount == 7
+
+    def test_constructor_withInvalidCapacity(self):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity = 0)
+
+    def test_constructor_withInvalidFalsePositiveRate(self):
+        with pytest.raises(ValueError):
+            BloomFilter(capacity = 10, falsePositiveRate = 1)
@@ -0,0 +1,43 @@
+import time
+
+from src.misc.startupProfiler import StartupProfiler
+
+
+class TestStartupProfiler:
+
+    def test_getReport(self):
+        startupProfiler = StartupProfiler()
+        startupProfiler.markSection('core')
+        time.sleep(0.01)
+        startupProfiler.markSection('trivia')
+
+        report = startupProfiler.getReport()
+        assert report.startswith('Initialized in ')
+        assert 'trivia' in report
+        assert 'core' in report
+        assert report.index('trivia') < report.index('core')
+
+    def test_markSection(self):
+        startupProfiler = StartupProfiler()
+        startupProfiler.markSection('core')
+        startupProfiler.markSection('trivia')
+
+        sections = startupProfiler.getSections()
+        assert len(sections) == 2
+        assert sections[0][0] == 'core'
+        assert sections[1][0] == 'trivia'
+        assert sections[0][1] >= 0
+        assert sections[1][1] >= 0
+
+    def test_markSection_withStartTime(self):
+        startTime = time.perf_counter()
+        time.sleep(0.02)
+
+        # the first section runs from the given start time, not from when the profiler was created
+        startupProfiler = StartupProfiler(startTime = startTime)
+        startupProfiler.markSection('imports')
+
+        sections = startupProfiler.getSections()
+        assert len(sections) == 1
+        assert sections[0][0] == 'imports'
+        assert sections[0][1] >= 20
@@ -0,0 +1,236 @@
+import asyncio
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+import pytest
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.mostRecentChat.mostRecentChatsRepository import MostRecentChatsRepository
+from src.mostRecentChat.mostRecentChatsRepositoryInterface import MostRecentChatsRepositoryInterface
+from src.storage.backingDatabase import BackingDatabase
+from src.storage.databaseConnection import DatabaseConnection
+from src.storage.databaseType import DatabaseType
+from src.storage.sqliteDatabaseConnection import SqliteDatabaseConnection
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+
+
+# the repository's $1 style placeholders are only deprecated (not broken) for sqlite
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+class TestMostRecentChatsRepository:
+
+    class BackingDatabase(BackingDatabase):
+
+        def __init__(self, backingDatabaseFile: str):
+            self.__backingDatabaseFile: str = backingDatabaseFile
+            self.executedRecords: list[list[tuple[Any, ...]]] = list()
+            self.isExecuteManyBroken: bool = False
+            self.openConnectionsCount: int = 0
+
+            # when set, the next connection waits on this event and then fails
+            self.outageEvent: asyncio.Event | None = None
+
+        async def close(self):
+            pass
+
+        @property
+        def databaseType(self) -> DatabaseType:
+            return DatabaseType.SQLITE
+
+        async def getConnection(self) -> DatabaseConnection:
+            outageEvent = self.outageEvent
+
+            if outageEvent is not None:
+                self.outageEvent = None
+                await outageEvent.wait()
+                raise RuntimeError('the database is unavailable')
+
+            self.openConnectionsCount += 1
+
+            return TestMostRecentChatsRepository.SqliteDatabaseConnection(
+                backingDatabase = self,
+                connection = await aiosqlite.connect(self.__backingDatabaseFile)
+            )
+
+    class SqliteDatabaseConnection(SqliteDatabaseConnection):
+
+        def __init__(
+            self,
+            backingDatabase: 'TestMostRecentChatsRepository.BackingDatabase',
+            connection: aiosqlite.Connection
+        ):
+            super().__init__(connection)
+            self.__backingDatabase = backingDatabase
+
+        async def close(self):
+            if not self.isClosed():
+                self.__backingDatabase.openConnectionsCount -= 1
+
+            await super().close()
+
+        async def executeMany(self, query: str, records: list[tuple[Any, ...]]):
+            if self.__backingDatabase.isExecuteManyBroken:
+                raise RuntimeError('executeMany() is broken')
+
+            self.__backingDatabase.executedRecords.append(records)
+            await super().executeMany(query, records)
+
+    timber: TimberInterface = TimberStub()
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    async def __createBackingDatabase(self, tmp_path: Path) -> BackingDatabase:
+        backingDatabase = TestMostRecentChatsRepository.BackingDatabase(str(tmp_path / 'database.sqlite'))
+
+        connection = await backingDatabase.getConnection()
+        await connection.createTableIfNotExists(
+            '''
+                CREATE TABLE IF NOT EXISTS mostrecentchats (
+                    chatteruserid text NOT NULL,
+                    mostrecentchat text NOT NULL,
+                    twitchchannelid text NOT NULL,
+                    PRIMARY KEY (chatteruserid, twitchchannelid)
+                )
+            '''
+        )
+
+        await connection.close()
+        return backingDatabase
+
+    def __createRepository(self, backingDatabase: BackingDatabase) -> MostRecentChatsRepository:
+        return MostRecentChatsRepository(
+            backgroundTaskHelper = BackgroundTaskHelper(asyncio.get_running_loop()),
+            backingDatabase = backingDatabase,
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository,
+            writeBehindEnabled = True,
+            writeBehindSleepTimeSeconds = 300
+        )
+
+    async def __fetchRowCount(self, backingDatabase: BackingDatabase) -> int:
+        connection = await backingDatabase.getConnection()
+        record = await connection.fetchRow('SELECT COUNT(*) FROM mostrecentchats')
+        await connection.close()
+
+        assert record is not None
+        return record[0]
+
+    @pytest.mark.asyncio
+    async def test_flush_coalescesChatsFromTheSameUser(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+
+        await repository.set(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+        await repository.set(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+        await repository.set(chatterUserId = 'eddie', twitchChannelId = 'stashiocat')
+        await repository.set(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+        lastChat = await repository.get(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+
+        assert backingDatabase.executedRecords == list()
+        await repository.flush()
+
+        # only one row for each (chatterUserId, twitchChannelId), and it holds the newest chat
+        assert len(backingDatabase.executedRecords) == 1
+        assert len(backingDatabase.executedRecords[0]) == 2
+        assert await self.__fetchRowCount(backingDatabase) == 2
+
+        await repository.clearCaches()
+        assert await repository.get(chatterUserId = 'eddie', twitchChannelId = 'smCharles') == lastChat
+
+        # nothing is left over for the next flush
+        await repository.flush()
+        assert len(backingDatabase.executedRecords) == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_withDatabaseOutage_keepsNewerChats(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+
+        await repository.set(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+        await repository.set(chatterUserId = 'lucario', twitchChannelId = 'smCharles')
+        lucarioChat = await repository.get(chatterUserId = 'lucario', twitchChannelId = 'smCharles')
+
+        outageEvent = asyncio.Event()
+        backingDatabase.outageEvent = outageEvent
+        flushTask = asyncio.create_task(repository.flush())
+        await asyncio.sleep(0.05)
+
+        # this chat comes in while the failing flush is still in flight
+        await repository.set(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+        eddieChat = await repository.get(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+
+        outageEvent.set()
+        await flushTask
+        assert backingDatabase.executedRecords == list()
+
+        # the failed rows were put back, but without overwriting the newer chat
+        await repository.flush()
+        assert len(backingDatabase.executedRecords) == 1
+        assert len(backingDatabase.executedRecords[0]) == 2
+
+        await repository.clearCaches()
+        assert await repository.get(chatterUserId = 'eddie', twitchChannelId = 'smCharles') == eddieChat
+        assert await repository.get(chatterUserId = 'lucario', twitchChannelId = 'smCharles') == lucarioChat
+
+    @pytest.mark.asyncio
+    async def test_flush_withFailingExecuteMany_closesConnection(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+
+        await repository.set(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+        backingDatabase.isExecuteManyBroken = True
+
+        for _ in range(3):
+            await repository.flush()
+
+        assert backingDatabase.openConnectionsCount == 0
+        assert await self.__fetchRowCount(backingDatabase) == 0
+
+        backingDatabase.isExecuteManyBroken = False
+        await repository.flush()
+        assert backingDatabase.openConnectionsCount == 0
+        assert await self.__fetchRowCount(backingDatabase) == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_onShutdown_persistsChatsBeforeTheFlushLoopRuns(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        repository.start()
+
+        # let the flush loop run once (with nothing to flush) and go to sleep
+        await asyncio.sleep(0.05)
+
+        await repository.set(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+        await repository.set(chatterUserId = 'lucario', twitchChannelId = 'smCharles')
+        assert await self.__fetchRowCount(backingDatabase) == 0
+
+        # this is what CynanBot.close() does before the database is closed
+        await repository.flush()
+        assert await self.__fetchRowCount(backingDatabase) == 2
+
+    @pytest.mark.asyncio
+    async def test_get_returnsUnflushedChat(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+
+        assert await repository.get(chatterUserId = 'eddie', twitchChannelId = 'smCharles') is None
+
+        await repository.set(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+        mostRecentChat = await repository.get(chatterUserId = 'eddie', twitchChannelId = 'smCharles')
+        assert mostRecentChat is not None
+        assert mostRecentChat.userId == 'eddie'
+        assert mostRecentChat.twitchChannelId == 'smCharles'
+
+        # even with the caches cleared, the unflushed chat is still found
+        await repository.clearCaches()
+        assert await repository.get(chatterUserId = 'eddie', twitchChannelId = 'smCharles') == mostRecentChat
+        assert await self.__fetchRowCount(backingDatabase) == 0
+
+    @pytest.mark.asyncio
+    async def test_sanity(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        repository = self.__createRepository(backingDatabase)
+        assert isinstance(repository, MostRecentChatsRepositoryInterface)
@@ -0,0 +1,51 @@
+import sqlite3
+
+from src.storage.databaseType import DatabaseType
+from src.storage.migrations.databaseMigrationsRegistry import DatabaseMigrationsRegistry
+from src.storage.migrations.databaseMigrationsRegistryInterface import DatabaseMigrationsRegistryInterface
+
+
+class TestDatabaseMigrationsRegistry:
+
+    registry: DatabaseMigrationsRegistryInterface = DatabaseMigrationsRegistry()
+
+    def test_getMigrations_areInAscendingVersionOrder(self):
+        migrations = self.registry.getMigrations()
+        versions = [ migration.version for migration in migrations ]
+
+        assert len(migrations) >= 1
+        assert versions == sorted(set(versions))
+        assert versions[0] == 1
+
+    def test_getMigrations_haveStatementsForEveryDatabaseType(self):
+        for migration in self.registry.getMigrations():
+            for databaseType in DatabaseType:
+                assert len(migration.getStatements(databaseType)) >= 1
+
+    def test_getMigrations_isCached(self):
+        assert self.registry.getMigrations() is self.registry.getMigrations()
+
+    def test_getMigrations_sqliteStatementsExecute(self):
+        connection = sqlite3.connect(':memory:')
+
+        for migration in self.registry.getMigrations():
+            for statement in migration.getStatements(DatabaseType.SQLITE):
+                connection.execute(statement)
+
+        cursor = connection.execute('SELECT name FROM sqlite_master WHERE type = \'table\'')
+        tableNames = { row[0] for row in cursor.fetchall() }
+        connection.close()
+
+        assert 'mostrecentchats' in tableNames
+        assert 'triviahistory' in tableNames
+        assert 'userids' in tableNames
+
+    def test_getMigrations_sqliteStatementsAreIdempotent(self):
+        connection = sqlite3.connect(':memory:')
+
+        for _ in range(2):
+            for migration in self.registry.getMigrations():
+                for statement in migration.getStatements(DatabaseType.SQLITE):
+                    connection.execute(statement)
+
+        connection.close()
@@ -0,0 +1,189 @@
+import asyncio
+import threading
+from pathlib import Path
+
+import pytest
+
+from src.storage.backingDatabase import BackingDatabase
+from src.storage.backingPooledSqliteDatabase import BackingPooledSqliteDatabase
+from src.storage.databaseType import DatabaseType
+from src.storage.exceptions import DatabaseConnectionIsClosedException
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+
+
+# the repository's $1 style placeholders are only deprecated (not broken) for sqlite
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+class TestBackingPooledSqliteDatabase:
+
+    timber: TimberInterface = TimberStub()
+
+    async def __createBackingDatabase(self, tmp_path: Path) -> BackingPooledSqliteDatabase:
+        backingDatabase = BackingPooledSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            timber = self.timber,
+            backingDatabaseFile = str(tmp_path / 'database.sqlite'),
+            readerConnectionCount = 2
+        )
+
+        connection = await backingDatabase.getConnection()
+        await connection.createTableIfNotExists('CREATE TABLE IF NOT EXISTS names (name TEXT NOT NULL PRIMARY KEY)')
+        await connection.close()
+
+        return backingDatabase
+
+    async def __fetchNames(self, backingDatabase: BackingDatabase) -> list[str]:
+        connection = await backingDatabase.getConnection()
+        records = await connection.fetchRows('SELECT name FROM names ORDER BY name ASC')
+        await connection.close()
+
+        assert records is not None
+        return [ record[0] for record in records ]
+
+    @pytest.mark.asyncio
+    async def test_close(self, tmp_path: Path):
+        threadCount = threading.active_count()
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+        assert threading.active_count() > threadCount
+
+        await backingDatabase.close()
+
+        # closing twice is harmless
+        await backingDatabase.close()
+
+        with pytest.raises(DatabaseConnectionIsClosedException):
+            await backingDatabase.getConnection()
+
+        # a lease that outlived the pool fails fast instead of waiting on an empty pool
+        with pytest.raises(DatabaseConnectionIsClosedException):
+            await connection.fetchRow('SELECT name FROM names')
+
+        with pytest.raises(DatabaseConnectionIsClosedException):
+            await connection.execute('INSERT INTO names (name) VALUES ($1)', 'Eddie')
+
+        for _ in range(100):
+            if threading.active_count() <= threadCount:
+                break
+
+            await asyncio.sleep(0.01)
+
+        assert threading.active_count() == threadCount
+
+    @pytest.mark.asyncio
+    async def test_close_waitsForTransaction(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+
+        async with connection.transaction():
+            await connection.execute('INSERT INTO names (name) VALUES ($1)', 'Eddie')
+            closeTask = asyncio.create_task(backingDatabase.close())
+            await asyncio.sleep(0.05)
+            assert not closeTask.done()
+
+        await closeTask
+
+        reopenedBackingDatabase = BackingPooledSqliteDatabase(
+            eventLoop = asyncio.get_running_loop(),
+            timber = self.timber,
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+        assert await self.__fetchNames(reopenedBackingDatabase) == [ 'Eddie' ]
+        await reopenedBackingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_executeMany(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+
+        await connection.executeMany(
+            'INSERT INTO names (name) VALUES ($1)',
+            [ ('Eddie',), ('Lucario',), ('Stashiocat',) ]
+        )
+
+        await connection.close()
+        assert await self.__fetchNames(backingDatabase) == [ 'Eddie', 'Lucario', 'Stashiocat' ]
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchRow_afterWrite(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+
+        await connection.execute('INSERT INTO names (name) VALUES ($1)', 'Eddie')
+        record = await connection.fetchRow('SELECT name FROM names WHERE name = $1', 'Eddie')
+        await connection.close()
+
+        assert record == [ 'Eddie' ]
+        assert await self.__fetchNames(backingDatabase) == [ 'Eddie' ]
+
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_fetchRow_insideTransaction_readsFromWriter(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+
+        async with connection.transaction():
+            await connection.execute('INSERT INTO names (name) VALUES ($1)', 'Eddie')
+
+            # our own uncommitted write is visible to us...
+            record = await connection.fetchRow('SELECT name FROM names WHERE name = $1', 'Eddie')
+            assert record == [ 'Eddie' ]
+
+            # ...but not yet to anyone else reading from the pool
+            assert await self.__fetchNames(backingDatabase) == list()
+
+        assert await self.__fetchNames(backingDatabase) == [ 'Eddie' ]
+
+        await connection.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_transaction_commit_holdsWriterLock(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+        otherConnection = await backingDatabase.getConnection()
+
+        async with connection.transaction():
+            await connection.execute('INSERT INTO names (name) VALUES ($1)', 'Eddie')
+            otherWriteTask = asyncio.create_task(otherConnection.execute('INSERT INTO names (name) VALUES ($1)', 'Stashiocat'))
+            await asyncio.sleep(0.05)
+            assert not otherWriteTask.done()
+
+            await connection.execute('INSERT INTO names (name) VALUES ($1)', 'Lucario')
+
+        await otherWriteTask
+        assert await self.__fetchNames(backingDatabase) == [ 'Eddie', 'Lucario', 'Stashiocat' ]
+
+        await connection.close()
+        await otherConnection.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_transaction_rollback(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        connection = await backingDatabase.getConnection()
+
+        with pytest.raises(RuntimeError):
+            async with connection.transaction():
+                await connection.execute('INSERT INTO names (name) VALUES ($1)', 'Eddie')
+                raise RuntimeError()
+
+        assert await self.__fetchNames(backingDatabase) == list()
+
+        # the writer lock was released by the rolled back transaction
+        await asyncio.wait_for(connection.execute('INSERT INTO names (name) VALUES ($1)', 'Lucario'), timeout = 1)
+        assert await self.__fetchNames(backingDatabase) == [ 'Lucario' ]
+
+        await connection.close()
+        await backingDatabase.close()
+
+    @pytest.mark.asyncio
+    async def test_sanity(self, tmp_path: Path):
+        backingDatabase = await self.__createBackingDatabase(tmp_path)
+        assert isinstance(backingDatabase, BackingDatabase)
+        assert backingDatabase.databaseType is DatabaseType.SQLITE
+        await backingDatabase.close()
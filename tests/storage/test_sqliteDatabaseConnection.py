@@ -0,0 +1,161 @@
+import sqlite3
+from pathlib import Path
+
+import aiosqlite
+import pytest
+
+from src.storage.databaseConnection import DatabaseConnection
+from src.storage.databaseType import DatabaseType
+from src.storage.exceptions import DatabaseConnectionIsClosedException
+from src.storage.sqliteDatabaseConnection import SqliteDatabaseConnection
+
+
+# the repository's $1 style placeholders are only deprecated (not broken) for sqlite
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+class TestSqliteDatabaseConnection:
+
+    async def __createConnection(self, tmp_path: Path) -> SqliteDatabaseConnection:
+        connection = SqliteDatabaseConnection(await aiosqlite.connect(str(tmp_path / 'database.sqlite')))
+        await connection.createTableIfNotExists('CREATE TABLE IF NOT EXISTS names (name TEXT NOT NULL PRIMARY KEY, score INTEGER NOT NULL)')
+        return connection
+
+    async def __fetchNames(self, tmp_path: Path) -> list[str]:
+        # read through a separate connection, so that only committed rows are visible
+        connection = SqliteDatabaseConnection(await aiosqlite.connect(str(tmp_path / 'database.sqlite')))
+        records = await connection.fetchRows('SELECT name FROM names ORDER BY name ASC')
+        await connection.close()
+
+        assert records is not None
+        return [ record[0] for record in records ]
+
+    @pytest.mark.asyncio
+    async def test_executeMany(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+
+        await connection.executeMany(
+            'INSERT INTO names (name, score) VALUES ($1, $2)',
+            [ ('Eddie', 1), ('Lucario', 2), ('Stashiocat', 3) ]
+        )
+
+        assert await self.__fetchNames(tmp_path) == [ 'Eddie', 'Lucario', 'Stashiocat' ]
+        assert await connection.fetchRow('SELECT score FROM names WHERE name = $1', 'Lucario') == [ 2 ]
+
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_executeMany_withDuplicateRecord_insertsNothing(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+
+        with pytest.raises(sqlite3.IntegrityError):
+            await connection.executeMany(
+                'INSERT INTO names (name, score) VALUES ($1, $2)',
+                [ ('Eddie', 1), ('Lucario', 2), ('Eddie', 3) ]
+            )
+
+        # the batch is atomic, so the records before the failing one were rolled back too
+        assert await self.__fetchNames(tmp_path) == list()
+
+        await connection.execute('INSERT INTO names (name, score) VALUES ($1, $2)', 'Stashiocat', 4)
+        assert await self.__fetchNames(tmp_path) == [ 'Stashiocat' ]
+
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_executeMany_withEmptyRecords(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+        await connection.executeMany('INSERT INTO names (name, score) VALUES ($1, $2)', list())
+        assert await self.__fetchNames(tmp_path) == list()
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_executeMany_withClosedConnection(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+        await connection.close()
+
+        with pytest.raises(DatabaseConnectionIsClosedException):
+            await connection.executeMany('INSERT INTO names (name, score) VALUES ($1, $2)', [ ('Eddie', 1) ])
+
+    @pytest.mark.asyncio
+    async def test_transaction_commit(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+
+        async with connection.transaction():
+            await connection.execute('INSERT INTO names (name, score) VALUES ($1, $2)', 'Eddie', 1)
+            await connection.executeMany('INSERT INTO names (name, score) VALUES ($1, $2)', [ ('Lucario', 2) ])
+
+            # nothing is committed until the transaction ends...
+            assert await self.__fetchNames(tmp_path) == list()
+
+            # ...but our own writes are visible to us
+            assert await connection.fetchRow('SELECT COUNT(*) FROM names') == [ 2 ]
+
+        assert await self.__fetchNames(tmp_path) == [ 'Eddie', 'Lucario' ]
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_transaction_rollback(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+
+        with pytest.raises(RuntimeError):
+            async with connection.transaction():
+                await connection.execute('INSERT INTO names (name, score) VALUES ($1, $2)', 'Eddie', 1)
+                await connection.executeMany('INSERT INTO names (name, score) VALUES ($1, $2)', [ ('Lucario', 2) ])
+                raise RuntimeError()
+
+        assert await self.__fetchNames(tmp_path) == list()
+
+        # after a rollback, writes go back to committing on their own
+        await connection.execute('INSERT INTO names (name, score) VALUES ($1, $2)', 'Stashiocat', 3)
+        assert await self.__fetchNames(tmp_path) == [ 'Stashiocat' ]
+
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_transaction_nested_joinsOuterTransaction(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+
+        async with connection.transaction():
+            await connection.execute('INSERT INTO names (name, score) VALUES ($1, $2)', 'Eddie', 1)
+
+            async with connection.transaction():
+                await connection.execute('INSERT INTO names (name, score) VALUES ($1, $2)', 'Lucario', 2)
+
+            # leaving the inner transaction doesn't commit anything
+            assert await self.__fetchNames(tmp_path) == list()
+
+        assert await self.__fetchNames(tmp_path) == [ 'Eddie', 'Lucario' ]
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_transaction_nested_withException_rollsBackOuterTransaction(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+
+        with pytest.raises(RuntimeError):
+            async with connection.transaction():
+                await connection.execute('INSERT INTO names (name, score) VALUES ($1, $2)', 'Eddie', 1)
+
+                async with connection.transaction():
+                    await connection.execute('INSERT INTO names (name, score) VALUES ($1, $2)', 'Lucario', 2)
+                    raise RuntimeError()
+
+        assert await self.__fetchNames(tmp_path) == list()
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_transaction_withClosedConnection(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+        await connection.close()
+
+        with pytest.raises(DatabaseConnectionIsClosedException):
+            async with connection.transaction():
+                pass
+
+    @pytest.mark.asyncio
+    async def test_sanity(self, tmp_path: Path):
+        connection = await self.__createConnection(tmp_path)
+        assert isinstance(connection, DatabaseConnection)
+        assert connection.databaseType is DatabaseType.SQLITE
+        assert not connection.isClosed()
+
+        await connection.close()
+        assert connection.isClosed()
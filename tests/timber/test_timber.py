@@ -0,0 +1,116 @@
+import asyncio
+from pathlib import Path
+
+import pytest
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from src.timber.timber import Timber
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberLevel import TimberLevel
+
+
+class TestTimber:
+
+    backgroundTaskHelper: BackgroundTaskHelperInterface = BackgroundTaskHelper(
+        eventLoop = asyncio.new_event_loop()
+    )
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    def __createTimber(self) -> TimberInterface:
+        return Timber(
+            backgroundTaskHelper = self.backgroundTaskHelper,
+            timeZoneRepository = self.timeZoneRepository
+        )
+
+    @pytest.mark.asyncio
+    async def test_close_writesQueuedEntries(self, tmp_path: Path):
+        timber: TimberInterface = Timber(
+            backgroundTaskHelper = self.backgroundTaskHelper,
+            timeZoneRepository = self.timeZoneRepository,
+            maxLatencySeconds = 60,
+            timberRootDirectory = str(tmp_path)
+        )
+
+        timber.log('Test', 'hello')
+        timber.log('Test', 'world', RuntimeError('oops'))
+        await timber.close()
+
+        logFiles = [ logFile for logFile in tmp_path.rglob('*.log') if logFile.parent.name != 'errors' ]
+        errorFiles = list(tmp_path.rglob('errors/*.log'))
+        assert len(logFiles) == 1
+        assert len(errorFiles) == 1
+
+        logText = logFiles[0].read_text(encoding = 'utf-8')
+        assert 'Test — hello' in logText
+        assert 'Test — world' in logText
+        assert 'oops' in errorFiles[0].read_text(encoding = 'utf-8')
+
+        # nothing is left over to be written twice
+        await timber.close()
+        assert logFiles[0].read_text(encoding = 'utf-8') == logText
+
+    def test_debug_withDebugDisabled_doesNotRenderMessage(self):
+        timber = self.__createTimber()
+        renders: list[str] = list()
+
+        def render() -> str:
+            renders.append('rendered')
+            return 'hello'
+
+        timber.debug('Test', render)
+        assert len(renders) == 0
+
+    def test_debug_withDebugEnabledForTag_rendersMessage(self):
+        timber = self.__createTimber()
+        timber.setLevels(
+            defaultLevel = TimberLevel.WARN,
+            tagLevels = { 'Test': TimberLevel.DEBUG }
+        )
+
+        renders: list[str] = list()
+
+        def render() -> str:
+            renders.append('rendered')
+            return 'hello'
+
+        timber.debug('Test', render)
+        timber.debug('Other', render)
+        assert renders == [ 'rendered' ]
+
+    def test_info_withFormatArgs(self):
+        timber = self.__createTimber()
+        timber.info('Test', 'hello %s (%d)', 'world', 7)
+
+    def test_isEnabledFor(self):
+        timber = self.__createTimber()
+        assert not timber.isEnabledFor('Test', TimberLevel.DEBUG)
+        assert timber.isEnabledFor('Test', TimberLevel.INFO)
+        assert timber.isEnabledFor('Test', TimberLevel.WARN)
+        assert timber.isEnabledFor('Test', TimberLevel.ERROR)
+
+    def test_isEnabledFor_withTagLevels(self):
+        timber = self.__createTimber()
+        timber.setLevels(
+            defaultLevel = TimberLevel.INFO,
+            tagLevels = { 'Quiet': TimberLevel.ERROR }
+        )
+
+        assert timber.isEnabledFor('Loud', TimberLevel.INFO)
+        assert not timber.isEnabledFor('Quiet', TimberLevel.WARN)
+        assert timber.isEnabledFor('Quiet', TimberLevel.ERROR)
+
+    def test_log_withMalformedMsg(self):
+        timber = self.__createTimber()
+
+        with pytest.raises(TypeError):
+            timber.log('Test', 123) # type: ignore
+
+    def test_timberLevel_isAtLeast(self):
+        assert TimberLevel.ERROR.isAtLeast(TimberLevel.DEBUG)
+        assert TimberLevel.INFO.isAtLeast(TimberLevel.INFO)
+        assert not TimberLevel.DEBUG.isAtLeast(TimberLevel.INFO)
+        assert not TimberLevel.WARN.isAtLeast(TimberLevel.ERROR)
@@ -0,0 +1,104 @@
+import gzip
+from pathlib import Path
+
+import pytest
+
+from src.timber.timberFileSink import TimberFileSink
+
+
+class TestTimberFileSink:
+
+    @pytest.mark.asyncio
+    async def test_write_appendsToSameFile(self, tmp_path: Path):
+        sink = TimberFileSink()
+        filePath = str(tmp_path / '2024' / '01' / '02.log')
+
+        await sink.write(filePath, 'a\n')
+        await sink.write(filePath, 'b\n')
+        await sink.close()
+
+        assert Path(filePath).read_text(encoding = 'utf-8') == 'a\nb\n'
+
+    @pytest.mark.asyncio
+    async def test_write_withNewFilePath_compressesPreviousFile(self, tmp_path: Path):
+        sink = TimberFileSink(compressClosedFiles = True)
+        firstFilePath = str(tmp_path / '01.log')
+        secondFilePath = str(tmp_path / '02.log')
+
+        await sink.write(firstFilePath, 'first\n')
+        await sink.write(secondFilePath, 'second\n')
+        await sink.close()
+
+        assert not Path(firstFilePath).exists()
+        assert gzip.decompress(Path(f'{firstFilePath}.gz').read_bytes()) == b'first\n'
+        assert Path(secondFilePath).read_text(encoding = 'utf-8') == 'second\n'
+
+    @pytest.mark.asyncio
+    async def test_write_withOlderFilePath_leavesCurrentFileOpen(self, tmp_path: Path):
+        sink = TimberFileSink(compressClosedFiles = True)
+        firstFilePath = str(tmp_path / '01.log')
+        secondFilePath = str(tmp_path / '02.log')
+
+        await sink.write(secondFilePath, 'a\n')
+        await sink.write(firstFilePath, 'late\n')
+        await sink.write(secondFilePath, 'b\n')
+        await sink.close()
+
+        assert Path(firstFilePath).read_text(encoding = 'utf-8') == 'late\n'
+        assert Path(secondFilePath).read_text(encoding = 'utf-8') == 'a\nb\n'
+
+    @pytest.mark.asyncio
+    async def test_write_withOlderCompressedFilePath_writesNewSegment(self, tmp_path: Path):
+        sink = TimberFileSink(compressClosedFiles = True)
+        firstFilePath = str(tmp_path / '01.log')
+        secondFilePath = str(tmp_path / '02.log')
+
+        await sink.write(firstFilePath, 'first\n')
+        await sink.write(secondFilePath, 'a\n')
+        await sink.write(firstFilePath, 'late\n')
+        await sink.write(firstFilePath, 'later\n')
+        await sink.write(secondFilePath, 'b\n')
+        await sink.close()
+
+        # the already gzipped file is left alone, and no plain file is re-created next to it
+        assert not Path(firstFilePath).exists()
+        assert gzip.decompress(Path(f'{firstFilePath}.gz').read_bytes()) == b'first\n'
+        assert gzip.decompress(Path(tmp_path / '01.1.log.gz').read_bytes()) == b'late\n'
+        assert gzip.decompress(Path(tmp_path / '01.2.log.gz').read_bytes()) == b'later\n'
+        assert Path(secondFilePath).read_text(encoding = 'utf-8') == 'a\nb\n'
+
+    @pytest.mark.asyncio
+    async def test_write_withNewerFilePathThatSortsFirst_compressesPreviousFile(self, tmp_path: Path):
+        sink = TimberFileSink(compressClosedFiles = True)
+        firstFilePath = str(tmp_path / '2024' / '9' / '9.log')
+        secondFilePath = str(tmp_path / '2024' / '10' / '10.log')
+        thirdFilePath = str(tmp_path / '2024' / '10' / '11.log')
+
+        # as plain strings, both of these newer paths sort before the first one
+        await sink.write(firstFilePath, 'first\n')
+        await sink.write(secondFilePath, 'second\n')
+        await sink.write(thirdFilePath, 'third\n')
+        await sink.close()
+
+        assert gzip.decompress(Path(f'{firstFilePath}.gz').read_bytes()) == b'first\n'
+        assert gzip.decompress(Path(f'{secondFilePath}.gz').read_bytes()) == b'second\n'
+        assert Path(thirdFilePath).read_text(encoding = 'utf-8') == 'third\n'
+
+    @pytest.mark.asyncio
+    async def test_write_withTooLargeFile_rotates(self, tmp_path: Path):
+        sink = TimberFileSink(maxFileSizeBytes = 1024)
+        filePath = str(tmp_path / '01.log')
+        line = ('x' * 99) + '\n'
+
+        for _ in range(11):
+            await sink.write(filePath, line)
+
+        await sink.write(filePath, 'after\n')
+        await sink.close()
+
+        assert Path(tmp_path / '01.1.log').read_text(encoding = 'utf-8') == line * 11
+        assert Path(filePath).read_text(encoding = 'utf-8') == 'after\n'
+
+    def test_constructor_withTooSmallMaxFileSize(self):
+        with pytest.raises(ValueError):
+            TimberFileSink(maxFileSizeBytes = 1)
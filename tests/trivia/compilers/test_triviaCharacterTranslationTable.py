@@ -0,0 +1,27 @@
+from src.trivia.compilers.triviaCharacterTranslationTable import TriviaCharacterTranslationTable
+
+
+class TestTriviaCharacterTranslationTable:
+
+    def test_translate(self):
+        translatedChars: list[str] = list()
+
+        def translation(char: str) -> str:
+            translatedChars.append(char)
+            return '' if char == '!' else char.upper()
+
+        table = TriviaCharacterTranslationTable(translation)
+        assert 'hello!'.translate(table) == 'HELLO'
+        assert 'hello!'.translate(table) == 'HELLO'
+
+        # each distinct character is only ever translated once
+        assert sorted(translatedChars) == [ '!', 'e', 'h', 'l', 'o' ]
+
+    def test_translate_withMaxSize(self):
+        table = TriviaCharacterTranslationTable(
+            translation = lambda char: char.upper(),
+            maxSize = 2
+        )
+
+        assert 'abcd'.translate(table) == 'ABCD'
+        assert len(table) == 2
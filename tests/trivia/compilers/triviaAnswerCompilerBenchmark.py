@@ -0,0 +1,123 @@
+import asyncio
+import importlib.util
+import subprocess
+import sys
+import time
+from types import ModuleType
+from typing import Any
+
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.timber.timberStub import TimberStub
+from src.trivia.compilers.triviaAnswerCompiler import TriviaAnswerCompiler
+from src.trivia.triviaSettingsRepository import TriviaSettingsRepository
+
+# Micro-benchmark for TriviaAnswerCompiler. Run it from the repository root:
+#
+#   python -m tests.trivia.compilers.triviaAnswerCompilerBenchmark [baselineRevision]
+#
+# When a git revision is given, the TriviaAnswerCompiler from that revision is benchmarked
+# against the current one, and both are checked to produce identical output for every answer.
+
+compilerPath = 'src/trivia/compilers/triviaAnswerCompiler.py'
+
+correctAnswers: list[str] = [
+    '(President) George Washington', '(The) Beatles', '$1,000', '12 years old', '1/2', 'Abraham Lincoln',
+    'Beyoncé', 'Café', 'Charles Darwin', 'Dr. Martin Luther King Jr.', 'Emily Brontë', 'Garfield the cat',
+    'George H. Richard III', 'H2O', 'in the 1990s', 'it is a dog', 'Les Misérables', 'Mr. T', 'Pokémon',
+    'Queen Elizabeth II', 'rock & roll', 'Saint Petersburg', 'São Paulo', 'Sherlock Holmes', 'the 1st',
+    'things that are red', 'to run', 'Wal-Mart', 'Zürich', '<i>Hamlet</i>', 'x = 5', 'Mount Everest'
+]
+
+userGuesses: list[str] = [
+    'paris', 'Paris!', 'paris ', 'PARIS', 'walmart', 'wal mart', 'beyonce', 'pokemon', 'ｐｏｋｅｍｏｎ',
+    '𝓹𝓸𝓴𝓮𝓶𝓸𝓷', 'the beatles', 'beatles!!!', 'george washington', 'washington', 'abe lincoln',
+    'darwin', 'sao paulo', 'zurich', 'zuerich', 'mt everest', 'everest', 'H20', 'water', 'hamlet',
+    '12', 'twelve', 'one half', '5', 'x=5', 'rock and roll', 'rock n roll', 'les miserables',
+    'sherlock', 'holmes', 'the first', '1st', 'red', 'running', 'run', 'Cafe', 'café ☕',
+    'idk lol', 'A', 'true', 'ｔｒｕｅ', 'sankt petersburg', 'st petersburg', 'queen elizabeth 2',
+    'mr t', 'martin luther king', 'mlk', 'emily bronte', 'garfield', 'a dog', 'its a dog'
+]
+
+
+async def compileAll(compiler: Any, answers: list[str], rounds: int) -> float:
+    start = time.perf_counter()
+
+    for _ in range(rounds):
+        for answer in answers:
+            await compiler.compileTextAnswer(answer)
+
+        await compiler.compileTextAnswersList(answers)
+
+    return time.perf_counter() - start
+
+
+async def compileResults(compiler: Any, answers: list[str]) -> list[Any]:
+    results: list[Any] = list()
+
+    for answer in answers:
+        results.append(await compiler.compileTextAnswer(answer))
+        results.append(sorted(await compiler.compileTextAnswersList([ answer ])))
+        results.append(sorted(await compiler.compileTextAnswersList([ answer ], expandParentheses = False)))
+
+    return results
+
+
+def loadBaselineCompilerModule(revision: str) -> ModuleType:
+    source = subprocess.run(
+        args = [ 'git', 'show', f'{revision}:{compilerPath}' ],
+        capture_output = True,
+        check = True,
+        text = True
+    ).stdout
+
+    # loaded as a sibling of the current module, so that its relative imports still resolve
+    moduleName = 'src.trivia.compilers.baselineTriviaAnswerCompiler'
+    spec = importlib.util.spec_from_loader(moduleName, loader = None)
+    module = importlib.util.module_from_spec(spec)
+    module.__package__ = 'src.trivia.compilers'
+    exec(compile(source, f'{revision}:{compilerPath}', 'exec'), module.__dict__)
+
+    return module
+
+
+async def main(baselineRevision: str | None, rounds: int = 200):
+    timber = TimberStub()
+    triviaSettingsRepository = TriviaSettingsRepository(settingsJsonReader = JsonStaticReader(dict()))
+    answers = correctAnswers + userGuesses
+    answersPerPass = len(answers) * 2
+
+    compilers: dict[str, Any] = {
+        'current': TriviaAnswerCompiler(
+            timber = timber,
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+    }
+
+    if baselineRevision is not None:
+        baselineModule = loadBaselineCompilerModule(baselineRevision)
+
+        compilers[baselineRevision] = baselineModule.TriviaAnswerCompiler(
+            timber = timber,
+            triviaSettingsRepository = triviaSettingsRepository
+        )
+
+        currentResults = await compileResults(compilers['current'], answers)
+        baselineResults = await compileResults(compilers[baselineRevision], answers)
+
+        if currentResults != baselineResults:
+            raise RuntimeError(f'Compiled output differs from the baseline revision ({baselineRevision=})')
+
+        print(f'Output is identical to {baselineRevision} for all {len(answers)} answers')
+
+    for name, compiler in compilers.items():
+        # warm up
+        await compileAll(compiler, answers, 5)
+
+        elapsed = await compileAll(compiler, answers, rounds)
+        answersPerSecond = int(rounds * answersPerPass / elapsed)
+        microsPerAnswer = elapsed * 1000000 / (rounds * answersPerPass)
+        print(f'{name}: {answersPerSecond:,} answers/sec ({microsPerAnswer:.2f}µs per answer)')
+
+
+if __name__ == '__main__':
+    asyncio.run(main(sys.argv[1] if len(sys.argv) >= 2 else None))
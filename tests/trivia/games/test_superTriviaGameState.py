@@ -0,0 +1,63 @@
+from datetime import datetime, timezone
+
+from src.trivia.games.superTriviaGameState import SuperTriviaGameState
+from src.trivia.questions.absTriviaQuestion import AbsTriviaQuestion
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.questions.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+from src.trivia.triviaAnswerCheckResult import TriviaAnswerCheckResult
+from src.trivia.triviaDifficulty import TriviaDifficulty
+
+
+class TestSuperTriviaGameState:
+
+    def __createState(self) -> SuperTriviaGameState:
+        triviaQuestion: AbsTriviaQuestion = TrueFalseTriviaQuestion(
+            correctAnswer = True,
+            category = None,
+            categoryId = None,
+            question = 'Is stashiocat a bully?',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.BONGO
+        )
+
+        return SuperTriviaGameState(
+            triviaQuestion = triviaQuestion,
+            endTime = datetime.now(timezone.utc),
+            basePointsForWinning = 25,
+            perUserAttempts = 2,
+            pointsForWinning = 25,
+            regularTriviaPointsForWinning = 5,
+            secondsToLive = 60,
+            toxicTriviaPunishmentMultiplier = 2,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🍔',
+            gameId = 'fdsafdsafsafdsafasz',
+            twitchChannel = 'smCharles',
+            twitchChannelId = 'c'
+        )
+
+    def test_getCheckedAnswer(self):
+        state = self.__createState()
+        assert state.getCheckedAnswer('paris') is None
+        assert state.getCheckedAnswerHits() == 0
+        assert state.getCheckedAnswerMisses() == 1
+
+        state.setCheckedAnswer('paris', TriviaAnswerCheckResult.INCORRECT)
+        assert state.getCheckedAnswer('paris') is TriviaAnswerCheckResult.INCORRECT
+        assert state.getCheckedAnswer('paris') is TriviaAnswerCheckResult.INCORRECT
+        assert state.getCheckedAnswer('london') is None
+        assert state.getCheckedAnswerHits() == 2
+        assert state.getCheckedAnswerMisses() == 2
+
+    def test_getCheckedAnswer_doesNotAffectAnswerCount(self):
+        state = self.__createState()
+        state.setCheckedAnswer('paris', TriviaAnswerCheckResult.INCORRECT)
+        assert state.getCheckedAnswer('paris') is TriviaAnswerCheckResult.INCORRECT
+        assert state.isEligibleToAnswer('s')
+
+        state.incrementAnswerCount('s')
+        state.incrementAnswerCount('s')
+        assert not state.isEligibleToAnswer('s')
@@ -0,0 +1,148 @@
+import pytest
+
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+from src.trivia.questions.absTriviaQuestion import AbsTriviaQuestion
+from src.trivia.questions.questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+from src.trivia.questions.triviaQuestionType import TriviaQuestionType
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.scraper.triviaScraper import TriviaScraper
+from src.trivia.scraper.triviaScraperInterface import TriviaScraperInterface
+from src.trivia.triviaDifficulty import TriviaDifficulty
+from src.trivia.triviaFetchOptions import TriviaFetchOptions
+from src.trivia.triviaRepositories.glacialTriviaQuestionRepositoryInterface import GlacialTriviaQuestionRepositoryInterface
+from src.trivia.triviaSettingsRepository import TriviaSettingsRepository
+from src.trivia.triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
+
+
+class TestTriviaScraper:
+
+    class GlacialTriviaQuestionRepository(GlacialTriviaQuestionRepositoryInterface):
+
+        def __init__(self):
+            self.isBroken: bool = False
+            self.storedQuestions: list[list[AbsTriviaQuestion]] = list()
+
+        async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+            raise NotImplementedError()
+
+        async def hasQuestionSetAvailable(self) -> bool:
+            return True
+
+        async def remove(self, triviaId: str, originalTriviaSource: TriviaSource):
+            raise NotImplementedError()
+
+        async def store(self, question: AbsTriviaQuestion) -> bool:
+            return await self.storeAll([ question ]) >= 1
+
+        async def storeAll(self, questions: list[AbsTriviaQuestion]) -> int:
+            if self.isBroken:
+                raise RuntimeError('glacial storage is broken')
+
+            self.storedQuestions.append(questions)
+            return len(questions)
+
+        @property
+        def supportedTriviaTypes(self) -> set[TriviaQuestionType]:
+            return { TriviaQuestionType.QUESTION_ANSWER }
+
+        @property
+        def triviaSource(self) -> TriviaSource:
+            return TriviaSource.GLACIAL
+
+    timber: TimberInterface = TimberStub()
+
+    triviaSettingsRepository: TriviaSettingsRepositoryInterface = TriviaSettingsRepository(
+        settingsJsonReader = JsonStaticReader({
+            'scraper_enabled': True
+        })
+    )
+
+    def __createQuestion(
+        self,
+        triviaId: str,
+        triviaSource: TriviaSource = TriviaSource.J_SERVICE
+    ) -> AbsTriviaQuestion:
+        return QuestionAnswerTriviaQuestion(
+            allWords = None,
+            compiledCorrectAnswers = [ 'stashiocat' ],
+            correctAnswers = [ 'stashiocat' ],
+            originalCorrectAnswers = [ 'stashiocat' ],
+            category = None,
+            categoryId = None,
+            question = 'This user is a member of the Chicago Bullies.',
+            triviaId = triviaId,
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = triviaSource
+        )
+
+    def __createScraper(
+        self,
+        glacialTriviaQuestionRepository: GlacialTriviaQuestionRepositoryInterface
+    ) -> TriviaScraper:
+        return TriviaScraper(
+            glacialTriviaQuestionRepository = glacialTriviaQuestionRepository,
+            timber = self.timber,
+            triviaSettingsRepository = self.triviaSettingsRepository,
+            bufferSize = 3
+        )
+
+    @pytest.mark.asyncio
+    async def test_flush(self):
+        glacialTriviaQuestionRepository = TestTriviaScraper.GlacialTriviaQuestionRepository()
+        scraper = self.__createScraper(glacialTriviaQuestionRepository)
+
+        await scraper.store(self.__createQuestion('abc'))
+        await scraper.store(self.__createQuestion('def'))
+        assert glacialTriviaQuestionRepository.storedQuestions == list()
+
+        await scraper.flush()
+        assert len(glacialTriviaQuestionRepository.storedQuestions) == 1
+        assert [ question.triviaId for question in glacialTriviaQuestionRepository.storedQuestions[0] ] == [ 'abc', 'def' ]
+
+        # there's nothing left to flush
+        await scraper.flush()
+        assert len(glacialTriviaQuestionRepository.storedQuestions) == 1
+
+    @pytest.mark.asyncio
+    async def test_flush_withBrokenGlacialStorage(self):
+        glacialTriviaQuestionRepository = TestTriviaScraper.GlacialTriviaQuestionRepository()
+        glacialTriviaQuestionRepository.isBroken = True
+        scraper = self.__createScraper(glacialTriviaQuestionRepository)
+
+        await scraper.store(self.__createQuestion('abc'))
+        await scraper.flush()
+
+        # the failure is logged rather than raised, so the spooler isn't interrupted by it
+        glacialTriviaQuestionRepository.isBroken = False
+        await scraper.store(self.__createQuestion('def'))
+        await scraper.flush()
+
+        assert len(glacialTriviaQuestionRepository.storedQuestions) == 1
+        assert [ question.triviaId for question in glacialTriviaQuestionRepository.storedQuestions[0] ] == [ 'def' ]
+
+    @pytest.mark.asyncio
+    async def test_store_withFullBuffer_storesAllBufferedQuestionsAtOnce(self):
+        glacialTriviaQuestionRepository = TestTriviaScraper.GlacialTriviaQuestionRepository()
+        scraper = self.__createScraper(glacialTriviaQuestionRepository)
+
+        await scraper.store(self.__createQuestion('abc'))
+        await scraper.store(self.__createQuestion('def'))
+
+        # the same question twice only takes up a single spot in the buffer
+        await scraper.store(self.__createQuestion('def'))
+
+        # as does a question from glacial storage itself, which isn't buffered at all
+        await scraper.store(self.__createQuestion('ghi', TriviaSource.GLACIAL))
+        assert glacialTriviaQuestionRepository.storedQuestions == list()
+
+        await scraper.store(self.__createQuestion('jkl'))
+        assert len(glacialTriviaQuestionRepository.storedQuestions) == 1
+        assert [ question.triviaId for question in glacialTriviaQuestionRepository.storedQuestions[0] ] == [ 'abc', 'def', 'jkl' ]
+
+    @pytest.mark.asyncio
+    async def test_sanity(self):
+        scraper = self.__createScraper(TestTriviaScraper.GlacialTriviaQuestionRepository())
+        assert isinstance(scraper, TriviaScraperInterface)
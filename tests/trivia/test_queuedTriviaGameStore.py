@@ -491,3 +491,64 @@ class TestQueuedTriviaGameStore7:
     def test_sanity(self):
         assert self.queuedTriviaGameStore is not None
         assert isinstance(self.queuedTriviaGameStore, QueuedTriviaGameStoreInterface)
+
+
+class TestQueuedTriviaGameStore8:
+
+    timber: TimberInterface = TimberStub()
+
+    triviaIdGenerator: TriviaIdGeneratorInterface = TriviaIdGenerator()
+
+    triviaSettingsRepository: TriviaSettingsRepositoryInterface = TriviaSettingsRepository(
+        settingsJsonReader = JsonStaticReader(dict())
+    )
+
+    queuedTriviaGameStore: QueuedTriviaGameStoreInterface = QueuedTriviaGameStore(
+        timber = timber,
+        triviaIdGenerator = triviaIdGenerator,
+        triviaSettingsRepository = triviaSettingsRepository
+    )
+
+    startNewSuperTriviaGameAction = StartNewSuperTriviaGameAction(
+        isQueueActionConsumed = False,
+        isShinyTriviaEnabled = False,
+        isToxicTriviaEnabled = False,
+        numberOfGames = 3,
+        perUserAttempts = 2,
+        pointsForWinning = 25,
+        regularTriviaPointsForWinning = 5,
+        secondsToLive = 50,
+        shinyMultiplier = 8,
+        toxicMultiplier = 16,
+        toxicTriviaPunishmentMultiplier = 0,
+        actionId = 'action9',
+        twitchChannel = 'smCharles',
+        twitchChannelId = 'c',
+        triviaFetchOptions = TriviaFetchOptions(
+            twitchChannel = 'smCharles',
+            twitchChannelId = 'c',
+            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
+        )
+    )
+
+    @pytest.mark.asyncio
+    async def test_popQueuedSuperGame(self):
+        assert await self.queuedTriviaGameStore.popQueuedSuperGame('c') is None
+
+        addResult = await self.queuedTriviaGameStore.addSuperGames(
+            isSuperTriviaGameCurrentlyInProgress = True,
+            action = self.startNewSuperTriviaGameAction
+        )
+        assert addResult.amountAdded == 3
+
+        queuedSuperGame = await self.queuedTriviaGameStore.popQueuedSuperGame('c')
+        assert isinstance(queuedSuperGame, StartNewSuperTriviaGameAction)
+        assert queuedSuperGame.getTwitchChannelId() == 'c'
+        assert await self.queuedTriviaGameStore.getQueuedSuperGamesSize('c') == 2
+
+        assert await self.queuedTriviaGameStore.popQueuedSuperGame('d') is None
+        assert await self.queuedTriviaGameStore.getQueuedSuperGamesSize('c') == 2
+
+    def test_sanity(self):
+        assert self.queuedTriviaGameStore is not None
+        assert isinstance(self.queuedTriviaGameStore, QueuedTriviaGameStoreInterface)
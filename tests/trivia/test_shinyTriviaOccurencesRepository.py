@@ -0,0 +1,65 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.storage.backingSqliteDatabase import BackingSqliteDatabase
+from src.storage.databaseType import DatabaseType
+from src.storage.migrations.databaseMigrationsRegistry import DatabaseMigrationsRegistry
+from src.trivia.specialStatus.shinyTriviaOccurencesRepository import ShinyTriviaOccurencesRepository
+from src.trivia.specialStatus.shinyTriviaOccurencesRepositoryInterface import \
+    ShinyTriviaOccurencesRepositoryInterface
+
+
+# the repository's $1 style placeholders are only deprecated (not broken) for sqlite
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+class TestShinyTriviaOccurencesRepository:
+
+    def __createRepository(self, tmp_path: Path) -> ShinyTriviaOccurencesRepositoryInterface:
+        databaseFile = str(tmp_path / 'database.sqlite')
+        connection = sqlite3.connect(databaseFile)
+
+        for migration in DatabaseMigrationsRegistry().getMigrations():
+            for statement in migration.getStatements(DatabaseType.SQLITE):
+                connection.execute(statement)
+
+        connection.commit()
+        connection.close()
+
+        return ShinyTriviaOccurencesRepository(
+            backingDatabase = BackingSqliteDatabase(
+                eventLoop = asyncio.get_running_loop(),
+                backingDatabaseFile = databaseFile
+            ),
+            timeZoneRepository = TimeZoneRepository()
+        )
+
+    @pytest.mark.asyncio
+    async def test_incrementShinyCount(self, tmp_path: Path):
+        repository = self.__createRepository(tmp_path)
+
+        result = await repository.incrementShinyCount('smCharles', 'c', 'e')
+        assert result.oldShinyCount == 0
+        assert result.newShinyCount == 1
+
+        result = await repository.incrementShinyCount('smCharles', 'c', 'e')
+        assert result.oldShinyCount == 1
+        assert result.newShinyCount == 2
+
+        result = await repository.fetchDetails('smCharles', 'c', 'e')
+        assert result.newShinyCount == 2
+        assert result.mostRecent is not None
+
+    @pytest.mark.asyncio
+    async def test_incrementShinyCountForUsers(self, tmp_path: Path):
+        repository = self.__createRepository(tmp_path)
+        await repository.incrementShinyCount('smCharles', 'c', 's')
+
+        results = await repository.incrementShinyCountForUsers('smCharles', 'c', [ 'e', 's' ])
+        assert [ result.userId for result in results ] == [ 'e', 's' ]
+        assert [ result.newShinyCount for result in results ] == [ 1, 2 ]
+
+        result = await repository.fetchDetails('smCharles', 'c', 'e')
+        assert result.newShinyCount == 1
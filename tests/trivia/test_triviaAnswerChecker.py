@@ -1179,6 +1179,102 @@ class TestTriviaAnswerChecker:
         result = await self.triviaAnswerChecker.checkAnswer('wally world', question)
         assert result is TriviaAnswerCheckResult.INCORRECT
 
+    @pytest.mark.asyncio
+    async def test_compileAnswerMemoKey_withMultipleChoiceQuestion(self):
+        question: AbsTriviaQuestion = MultipleChoiceTriviaQuestion(
+            correctAnswers = [ 'stashiocat' ],
+            multipleChoiceResponses = [ 'Eddie', 'Imyt', 'smCharles', 'stashiocat' ],
+            category = None,
+            categoryId = None,
+            question = 'Which of these Super Metroid players is a bully?',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.BONGO
+        )
+
+        key = await self.triviaAnswerChecker.compileAnswerMemoKey('d', question)
+        assert key is not None
+        assert key == await self.triviaAnswerChecker.compileAnswerMemoKey('[D]', question)
+        assert key != await self.triviaAnswerChecker.compileAnswerMemoKey('a', question)
+
+        assert await self.triviaAnswerChecker.compileAnswerMemoKey('stashiocat', question) is None
+        assert await self.triviaAnswerChecker.compileAnswerMemoKey('', question) is None
+        assert await self.triviaAnswerChecker.compileAnswerMemoKey(None, question) is None
+
+    @pytest.mark.asyncio
+    async def test_compileAnswerMemoKey_withQuestionAnswerQuestion(self):
+        originalCorrectAnswers: list[str] = [ 'Paris' ]
+        correctAnswers = await self.triviaQuestionCompiler.compileResponses(originalCorrectAnswers)
+        compiledCorrectAnswers = await self.triviaAnswerCompiler.compileTextAnswersList(originalCorrectAnswers)
+
+        question: AbsTriviaQuestion = QuestionAnswerTriviaQuestion(
+            allWords = None,
+            compiledCorrectAnswers = compiledCorrectAnswers,
+            correctAnswers = correctAnswers,
+            originalCorrectAnswers = originalCorrectAnswers,
+            category = 'Test Category',
+            categoryId = None,
+            question = 'What is the capital of France?',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.J_SERVICE
+        )
+
+        key = await self.triviaAnswerChecker.compileAnswerMemoKey('paris', question)
+        assert key == await self.triviaAnswerCompiler.compileTextAnswer('paris')
+        assert key == await self.triviaAnswerChecker.compileAnswerMemoKey('Paris!', question)
+        assert key == await self.triviaAnswerChecker.compileAnswerMemoKey('paris ', question)
+        assert key != await self.triviaAnswerChecker.compileAnswerMemoKey('london', question)
+
+    @pytest.mark.asyncio
+    async def test_compileAnswerMemoKey_withQuestionAnswerQuestion_withSpecialCase(self):
+        originalCorrectAnswers: list[str] = [ '1' ]
+        correctAnswers = await self.triviaQuestionCompiler.compileResponses(originalCorrectAnswers)
+        compiledCorrectAnswers = await self.triviaAnswerCompiler.compileTextAnswersList(originalCorrectAnswers)
+
+        expandedCompiledCorrectAnswers: set[str] = set()
+        for compiledCorrectAnswer in compiledCorrectAnswers:
+            expandedCompiledCorrectAnswers.update(await self.triviaAnswerCompiler.expandNumerals(compiledCorrectAnswer))
+
+        question: AbsTriviaQuestion = QuestionAnswerTriviaQuestion(
+            allWords = None,
+            compiledCorrectAnswers = list(expandedCompiledCorrectAnswers),
+            correctAnswers = correctAnswers,
+            originalCorrectAnswers = originalCorrectAnswers,
+            category = 'Test Category',
+            categoryId = None,
+            question = 'What is the smallest positive integer?',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.J_SERVICE
+        )
+
+        # both of these compile to the text "12", but they aren't checked the same way
+        assert await self.triviaAnswerCompiler.compileTextAnswer('1/2') == await self.triviaAnswerCompiler.compileTextAnswer('12')
+        assert await self.triviaAnswerChecker.compileAnswerMemoKey('1/2', question) != await self.triviaAnswerChecker.compileAnswerMemoKey('12', question)
+
+    @pytest.mark.asyncio
+    async def test_compileAnswerMemoKey_withTrueFalseQuestion(self):
+        question: AbsTriviaQuestion = TrueFalseTriviaQuestion(
+            correctAnswer = True,
+            category = None,
+            categoryId = None,
+            question = 'Is stashiocat a bully?',
+            triviaId = 'abc123',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.BONGO
+        )
+
+        key = await self.triviaAnswerChecker.compileAnswerMemoKey('true', question)
+        assert key is not None
+        assert key == await self.triviaAnswerChecker.compileAnswerMemoKey('TRUE!', question)
+        assert key != await self.triviaAnswerChecker.compileAnswerMemoKey('false', question)
+        assert await self.triviaAnswerChecker.compileAnswerMemoKey('maybe', question) is None
+
     @pytest.mark.asyncio
     async def test_findWords_with_categoryHelloWorld_questionHelloWorld(self):
         result = await self.triviaQuestionCompiler.findAllWordsInQuestion(
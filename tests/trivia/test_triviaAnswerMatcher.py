@@ -0,0 +1,55 @@
+import re
+from typing import Generator
+
+from src.trivia.triviaAnswerMatcher import TriviaAnswerMatcher
+
+
+class TestTriviaAnswerMatcher:
+
+    def __genVariants(self, word: str) -> Generator[str, None, None]:
+        yield word
+
+        if word == 'st':
+            yield 'saint'
+
+    def __createMatcher(self, compiledCorrectAnswers: list[str]) -> TriviaAnswerMatcher:
+        return TriviaAnswerMatcher(
+            compiledCorrectAnswers = compiledCorrectAnswers,
+            variantGenerator = self.__genVariants,
+            whitespacePattern = re.compile(r'\s\s+', re.IGNORECASE)
+        )
+
+    def test_isMatch_withExactAnswer(self):
+        matcher = self.__createMatcher([ 'saint louis' ])
+        assert matcher.isMatch([ 'saint louis' ], 7)
+
+    def test_isMatch_withLongWrongAnswer(self):
+        # there are C(63, 31) ways to group this answer's words, so this only finishes quickly
+        # if the matcher doesn't try each one of them
+        matcher = self.__createMatcher([ ' '.join([ 'ab' ] * 64) ])
+        assert not matcher.isMatch([ ' '.join([ 'abab' ] * 31 + [ 'zzzz' ]) ], 7)
+        assert matcher.isMatch([ ' '.join([ 'abab' ] * 32) ], 7)
+
+    def test_isMatch_withMergedGuessWords(self):
+        matcher = self.__createMatcher([ 'walmart supercenter' ])
+        assert matcher.isMatch([ 'wal mart super center' ], 7)
+        assert matcher.isMatch([ 'wal mart supercenter' ], 7)
+        assert not matcher.isMatch([ 'wal mart super' ], 7)
+
+    def test_isMatch_withMergedWords(self):
+        matcher = self.__createMatcher([ 'new york city' ])
+        assert matcher.isMatch([ 'newyork city' ], 7)
+        assert matcher.isMatch([ 'newyorkcity' ], 7)
+
+    def test_isMatch_withTypo(self):
+        matcher = self.__createMatcher([ 'pennsylvania' ])
+        assert matcher.isMatch([ 'pensylvania' ], 7)
+        assert not matcher.isMatch([ 'pensylvanai' ], 7)
+
+    def test_isMatch_withVariant(self):
+        matcher = self.__createMatcher([ 'saint louis' ])
+        assert matcher.isMatch([ 'st louis' ], 7)
+
+    def test_isMatch_withWrongAnswer(self):
+        matcher = self.__createMatcher([ 'saint louis' ])
+        assert not matcher.isMatch([ 'kansas city' ], 7)
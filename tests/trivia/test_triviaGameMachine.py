@@ -0,0 +1,567 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+
+from src.cuteness.cutenessRepository import CutenessRepository
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.authRepository import AuthRepository
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.network.requestsClientProvider import RequestsClientProvider
+from src.storage.backingSqliteDatabase import BackingSqliteDatabase
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+from src.trivia.actions.clearSuperTriviaQueueTriviaAction import ClearSuperTriviaQueueTriviaAction
+from src.trivia.actions.startNewSuperTriviaGameAction import StartNewSuperTriviaGameAction
+from src.trivia.addQueuedGamesResult import AddQueuedGamesResult
+from src.trivia.clearQueuedGamesResult import ClearQueuedGamesResult
+from src.trivia.compilers.triviaAnswerCompiler import TriviaAnswerCompiler
+from src.trivia.emotes.triviaEmoteGenerator import TriviaEmoteGenerator
+from src.trivia.emotes.triviaEmoteRepository import TriviaEmoteRepository
+from src.trivia.emotes.twitch.triviaTwitchEmoteHelperInterface import TriviaTwitchEmoteHelperInterface
+from src.trivia.events.absTriviaEvent import AbsTriviaEvent
+from src.trivia.events.clearedSuperTriviaQueueTriviaEvent import ClearedSuperTriviaQueueTriviaEvent
+from src.trivia.events.outOfTimeSuperTriviaEvent import OutOfTimeSuperTriviaEvent
+from src.trivia.games.absTriviaGameState import AbsTriviaGameState
+from src.trivia.games.queuedTriviaGameStoreInterface import QueuedTriviaGameStoreInterface
+from src.trivia.games.superTriviaGameState import SuperTriviaGameState
+from src.trivia.games.triviaGameStore import TriviaGameStore
+from src.trivia.questions.absTriviaQuestion import AbsTriviaQuestion
+from src.trivia.questions.questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.score.triviaScoreRepository import TriviaScoreRepository
+from src.trivia.specialStatus.shinyTriviaHelper import ShinyTriviaHelper
+from src.trivia.specialStatus.shinyTriviaOccurencesRepository import ShinyTriviaOccurencesRepository
+from src.trivia.specialStatus.toxicTriviaHelper import ToxicTriviaHelper
+from src.trivia.specialStatus.toxicTriviaOccurencesRepository import ToxicTriviaOccurencesRepository
+from src.trivia.superTriviaCooldownHelperInterface import SuperTriviaCooldownHelperInterface
+from src.trivia.triviaAnswerChecker import TriviaAnswerChecker
+from src.trivia.triviaDifficulty import TriviaDifficulty
+from src.trivia.triviaEventListener import TriviaEventListener
+from src.trivia.triviaFetchOptions import TriviaFetchOptions
+from src.trivia.triviaGameMachine import TriviaGameMachine
+from src.trivia.triviaGameMachineInterface import TriviaGameMachineInterface
+from src.trivia.triviaIdGenerator import TriviaIdGenerator
+from src.trivia.triviaRepositories.triviaQuestionSpoolStats import TriviaQuestionSpoolStats
+from src.trivia.triviaRepositories.triviaRepositoryInterface import TriviaRepositoryInterface
+from src.trivia.triviaSettingsRepository import TriviaSettingsRepository
+from src.twitch.api.twitchApiService import TwitchApiService
+from src.twitch.api.twitchJsonMapper import TwitchJsonMapper
+from src.twitch.officialTwitchAccountUserIdProvider import OfficialTwitchAccountUserIdProvider
+from src.twitch.twitchTokensRepository import TwitchTokensRepository
+from src.twitch.websocket.twitchWebsocketJsonMapper import TwitchWebsocketJsonMapper
+from src.users.userIdsRepository import UserIdsRepository
+
+
+class TestTriviaGameMachine:
+
+    class Clock:
+
+        def __init__(self):
+            self.offset: timedelta = timedelta()
+
+        def __call__(self) -> datetime:
+            return datetime.now(timezone.utc) + self.offset
+
+    class QueuedTriviaGameStore(QueuedTriviaGameStoreInterface):
+
+        def __init__(self):
+            self.addedSuperGames: list[StartNewSuperTriviaGameAction] = list()
+            self.blockedTwitchChannelIds: dict[str, asyncio.Event] = dict()
+            self.poppedTimes: list[float] = list()
+            self.queueSizes: dict[str, int] = dict()
+
+        async def addSuperGames(
+            self,
+            isSuperTriviaGameCurrentlyInProgress: bool,
+            action: StartNewSuperTriviaGameAction
+        ) -> AddQueuedGamesResult:
+            self.addedSuperGames.append(action)
+
+            return AddQueuedGamesResult(
+                amountAdded = 0,
+                newQueueSize = 0,
+                oldQueueSize = 0
+            )
+
+        async def clearQueuedSuperGames(self, twitchChannelId: str) -> ClearQueuedGamesResult:
+            blocker = self.blockedTwitchChannelIds.get(twitchChannelId, None)
+
+            if blocker is not None:
+                await blocker.wait()
+
+            return ClearQueuedGamesResult(
+                amountRemoved = 0,
+                oldQueueSize = 0
+            )
+
+        async def getQueuedSuperGamesSize(self, twitchChannelId: str) -> int:
+            return self.queueSizes.get(twitchChannelId, 0)
+
+        async def popQueuedSuperGame(self, twitchChannelId: str) -> StartNewSuperTriviaGameAction | None:
+            self.poppedTimes.append(asyncio.get_running_loop().time())
+            return None
+
+    class SuperTriviaCooldownHelper(SuperTriviaCooldownHelperInterface):
+
+        def __init__(self):
+            self.isInCooldown: bool = False
+            self.failingUpdateCount: int = 0
+
+        async def getTwitchChannelIdsInCooldown(self) -> set[str]:
+            return set()
+
+        def isTwitchChannelInCooldown(self, twitchChannelId: str) -> bool:
+            return self.isInCooldown
+
+        async def update(self, twitchChannelId: str):
+            if self.failingUpdateCount >= 1:
+                self.failingUpdateCount -= 1
+                raise RuntimeError('the cooldown helper is broken')
+
+    class TriviaEventListener(TriviaEventListener):
+
+        def __init__(self):
+            self.events: list[AbsTriviaEvent] = list()
+
+        async def onNewTriviaEvent(self, event: AbsTriviaEvent):
+            self.events.append(event)
+
+    class TriviaGameStore(TriviaGameStore):
+
+        def __init__(self):
+            super().__init__()
+            self.expiredGames: list[AbsTriviaGameState] = list()
+            self.nextEndTimes: dict[str, datetime] = dict()
+            self.removeExpiredGamesTimes: list[float] = list()
+
+        async def getNextEndTime(self, twitchChannelId: str) -> datetime | None:
+            return self.nextEndTimes.get(twitchChannelId, None)
+
+        async def removeExpiredGames(
+            self,
+            twitchChannelId: str,
+            now: datetime
+        ) -> list[AbsTriviaGameState]:
+            self.removeExpiredGamesTimes.append(asyncio.get_running_loop().time())
+            nextEndTime = self.nextEndTimes.get(twitchChannelId, None)
+
+            if nextEndTime is not None and nextEndTime <= now:
+                del self.nextEndTimes[twitchChannelId]
+
+            expiredGames = self.expiredGames
+            self.expiredGames = list()
+            return expiredGames
+
+    class TriviaRepository(TriviaRepositoryInterface):
+
+        async def fetchTrivia(
+            self,
+            emote: str,
+            triviaFetchOptions: TriviaFetchOptions
+        ) -> AbsTriviaQuestion | None:
+            return None
+
+        async def getSpoolStats(self) -> list[TriviaQuestionSpoolStats]:
+            return list()
+
+        def startSpooler(self):
+            pass
+
+    class TriviaTwitchEmoteHelper(TriviaTwitchEmoteHelperInterface):
+
+        async def getCelebratoryEmote(self) -> str | None:
+            return None
+
+        async def getOutOfTimeEmote(self) -> str | None:
+            return None
+
+        async def getWrongAnswerEmote(self) -> str | None:
+            return None
+
+    timber: TimberInterface = TimberStub()
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    def __createMachine(
+        self,
+        tmp_path: Path,
+        clock: Clock,
+        queuedTriviaGameStore: QueuedTriviaGameStoreInterface,
+        superTriviaCooldownHelper: SuperTriviaCooldownHelperInterface,
+        triviaGameStore: TriviaGameStore
+    ) -> TriviaGameMachine:
+        eventLoop = asyncio.get_running_loop()
+        backgroundTaskHelper = BackgroundTaskHelper(eventLoop)
+
+        # nothing exercised here ever touches the database, but these repositories want one anyway
+        backingDatabase = BackingSqliteDatabase(
+            eventLoop = eventLoop,
+            backingDatabaseFile = str(tmp_path / 'database.sqlite')
+        )
+
+        triviaSettingsRepository = TriviaSettingsRepository(
+            settingsJsonReader = JsonStaticReader({
+                'super_trivia_first_question_delay_seconds': 5
+            })
+        )
+
+        twitchJsonMapper = TwitchJsonMapper(
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository
+        )
+
+        twitchApiService = TwitchApiService(
+            networkClientProvider = RequestsClientProvider(
+                timber = self.timber
+            ),
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository,
+            twitchCredentialsProvider = AuthRepository(
+                authJsonReader = JsonStaticReader(dict())
+            ),
+            twitchJsonMapper = twitchJsonMapper,
+            twitchWebsocketJsonMapper = TwitchWebsocketJsonMapper(
+                timber = self.timber,
+                twitchJsonMapper = twitchJsonMapper
+            )
+        )
+
+        userIdsRepository = UserIdsRepository(
+            backingDatabase = backingDatabase,
+            officialTwitchAccountUserIdProvider = OfficialTwitchAccountUserIdProvider(),
+            timber = self.timber,
+            twitchApiService = twitchApiService
+        )
+
+        cutenessRepository = CutenessRepository(
+            backingDatabase = backingDatabase,
+            userIdsRepository = userIdsRepository
+        )
+
+        return TriviaGameMachine(
+            backgroundTaskHelper = backgroundTaskHelper,
+            cutenessRepository = cutenessRepository,
+            queuedTriviaGameStore = queuedTriviaGameStore,
+            shinyTriviaHelper = ShinyTriviaHelper(
+                cutenessRepository = cutenessRepository,
+                shinyTriviaOccurencesRepository = ShinyTriviaOccurencesRepository(
+                    backingDatabase = backingDatabase,
+                    timeZoneRepository = self.timeZoneRepository
+                ),
+                timber = self.timber,
+                timeZoneRepository = self.timeZoneRepository,
+                triviaSettingsRepository = triviaSettingsRepository
+            ),
+            superTriviaCooldownHelper = superTriviaCooldownHelper,
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository,
+            toxicTriviaHelper = ToxicTriviaHelper(
+                toxicTriviaOccurencesRepository = ToxicTriviaOccurencesRepository(
+                    backingDatabase = backingDatabase,
+                    timeZoneRepository = self.timeZoneRepository
+                ),
+                timber = self.timber,
+                triviaSettingsRepository = triviaSettingsRepository
+            ),
+            triviaAnswerChecker = TriviaAnswerChecker(
+                timber = self.timber,
+                triviaAnswerCompiler = TriviaAnswerCompiler(
+                    timber = self.timber,
+                    triviaSettingsRepository = triviaSettingsRepository
+                ),
+                triviaSettingsRepository = triviaSettingsRepository
+            ),
+            triviaEmoteGenerator = TriviaEmoteGenerator(
+                timber = self.timber,
+                triviaEmoteRepository = TriviaEmoteRepository(
+                    backingDatabase = backingDatabase
+                )
+            ),
+            triviaGameStore = triviaGameStore,
+            triviaIdGenerator = TriviaIdGenerator(),
+            triviaRepository = TestTriviaGameMachine.TriviaRepository(),
+            triviaScoreRepository = TriviaScoreRepository(
+                backingDatabase = backingDatabase
+            ),
+            triviaSettingsRepository = triviaSettingsRepository,
+            triviaTwitchEmoteHelper = TestTriviaGameMachine.TriviaTwitchEmoteHelper(),
+            twitchTokensRepository = TwitchTokensRepository(
+                backgroundTaskHelper = backgroundTaskHelper,
+                backingDatabase = backingDatabase,
+                timber = self.timber,
+                timeZoneRepository = self.timeZoneRepository,
+                twitchApiService = twitchApiService,
+                userIdsRepository = userIdsRepository
+            ),
+            userIdsRepository = userIdsRepository,
+            clock = clock,
+            sleepTimeSeconds = 0.25
+        )
+
+    def __createClearAction(self, actionId: str, twitchChannelId: str) -> ClearSuperTriviaQueueTriviaAction:
+        return ClearSuperTriviaQueueTriviaAction(
+            actionId = actionId,
+            twitchChannel = f'channel{twitchChannelId}',
+            twitchChannelId = twitchChannelId,
+            twitchChatMessageId = f'message{actionId}'
+        )
+
+    def __createExpiredSuperGame(self, gameId: str, twitchChannelId: str) -> SuperTriviaGameState:
+        return SuperTriviaGameState(
+            triviaQuestion = QuestionAnswerTriviaQuestion(
+                allWords = None,
+                compiledCorrectAnswers = [ 'stashiocat' ],
+                correctAnswers = [ 'stashiocat' ],
+                originalCorrectAnswers = [ 'stashiocat' ],
+                category = None,
+                categoryId = None,
+                question = 'This user is a member of the Chicago Bullies.',
+                triviaId = f'trivia{gameId}',
+                triviaDifficulty = TriviaDifficulty.UNKNOWN,
+                originalTriviaSource = None,
+                triviaSource = TriviaSource.FUNTOON
+            ),
+            endTime = datetime.now(timezone.utc) - timedelta(seconds = 1),
+            basePointsForWinning = 25,
+            perUserAttempts = 2,
+            pointsForWinning = 25,
+            regularTriviaPointsForWinning = 5,
+            secondsToLive = 50,
+            toxicTriviaPunishmentMultiplier = 0,
+            specialTriviaStatus = None,
+            actionId = f'action{gameId}',
+            emote = '🏫',
+            gameId = gameId,
+            twitchChannel = f'channel{twitchChannelId}',
+            twitchChannelId = twitchChannelId
+        )
+
+    def __createSuperGameAction(self, twitchChannelId: str) -> StartNewSuperTriviaGameAction:
+        return StartNewSuperTriviaGameAction(
+            isQueueActionConsumed = False,
+            isShinyTriviaEnabled = False,
+            isToxicTriviaEnabled = False,
+            numberOfGames = 1,
+            perUserAttempts = 2,
+            pointsForWinning = 25,
+            regularTriviaPointsForWinning = 5,
+            secondsToLive = 50,
+            shinyMultiplier = 8,
+            toxicMultiplier = 16,
+            toxicTriviaPunishmentMultiplier = 0,
+            actionId = 'superGameAction',
+            twitchChannel = f'channel{twitchChannelId}',
+            twitchChannelId = twitchChannelId,
+            triviaFetchOptions = TriviaFetchOptions(
+                twitchChannel = f'channel{twitchChannelId}',
+                twitchChannelId = twitchChannelId
+            )
+        )
+
+    def __getClearedActionIds(
+        self,
+        eventListener: 'TestTriviaGameMachine.TriviaEventListener',
+        twitchChannelId: str
+    ) -> list[str]:
+        actionIds: list[str] = list()
+
+        for event in eventListener.events:
+            if isinstance(event, ClearedSuperTriviaQueueTriviaEvent) and event.twitchChannelId == twitchChannelId:
+                actionIds.append(event.actionId)
+
+        return actionIds
+
+    async def __waitFor(self, condition, timeoutSeconds: float = 5):
+        eventLoop = asyncio.get_running_loop()
+        deadline = eventLoop.time() + timeoutSeconds
+
+        while not condition():
+            assert eventLoop.time() < deadline
+            await asyncio.sleep(0.01)
+
+    @pytest.mark.asyncio
+    async def test_channelActionLoop_retriesDeferredSuperGame(self, tmp_path: Path):
+        clock = TestTriviaGameMachine.Clock()
+        queuedTriviaGameStore = TestTriviaGameMachine.QueuedTriviaGameStore()
+        superTriviaCooldownHelper = TestTriviaGameMachine.SuperTriviaCooldownHelper()
+        superTriviaCooldownHelper.isInCooldown = True
+
+        triviaGameMachine = self.__createMachine(
+            tmp_path = tmp_path,
+            clock = clock,
+            queuedTriviaGameStore = queuedTriviaGameStore,
+            superTriviaCooldownHelper = superTriviaCooldownHelper,
+            triviaGameStore = TestTriviaGameMachine.TriviaGameStore()
+        )
+
+        triviaGameMachine.startMachine()
+        triviaGameMachine.submitAction(self.__createSuperGameAction('c'))
+
+        # the super game was created too recently to start, so it keeps getting deferred
+        await asyncio.sleep(0.6)
+        assert len(queuedTriviaGameStore.addedSuperGames) == 0
+
+        # once the first question delay has passed, the deferred action is retried without
+        # anything new being submitted, and as the channel is in cooldown, it is deferred again
+        clock.offset = timedelta(seconds = 10)
+        await self.__waitFor(lambda: len(queuedTriviaGameStore.addedSuperGames) >= 2, timeoutSeconds = 2)
+
+    @pytest.mark.asyncio
+    async def test_channelActionLoop_retriesQueuedSuperGames(self, tmp_path: Path):
+        clock = TestTriviaGameMachine.Clock()
+        queuedTriviaGameStore = TestTriviaGameMachine.QueuedTriviaGameStore()
+        queuedTriviaGameStore.queueSizes['c'] = 1
+
+        triviaGameMachine = self.__createMachine(
+            tmp_path = tmp_path,
+            clock = clock,
+            queuedTriviaGameStore = queuedTriviaGameStore,
+            superTriviaCooldownHelper = TestTriviaGameMachine.SuperTriviaCooldownHelper(),
+            triviaGameStore = TestTriviaGameMachine.TriviaGameStore()
+        )
+
+        triviaGameMachine.startMachine()
+        triviaGameMachine.submitAction(self.__createClearAction('action1', 'c'))
+
+        await self.__waitFor(lambda: len(queuedTriviaGameStore.poppedTimes) >= 4)
+
+        # the actor checks back on its queue every sleepTimeSeconds, rather than spinning
+        poppedTimes = queuedTriviaGameStore.poppedTimes
+
+        for index in range(1, len(poppedTimes)):
+            assert poppedTimes[index] - poppedTimes[index - 1] >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_channelActionLoop_wakesAtNextEndTime(self, tmp_path: Path):
+        clock = TestTriviaGameMachine.Clock()
+        triviaGameStore = TestTriviaGameMachine.TriviaGameStore()
+
+        triviaGameMachine = self.__createMachine(
+            tmp_path = tmp_path,
+            clock = clock,
+            queuedTriviaGameStore = TestTriviaGameMachine.QueuedTriviaGameStore(),
+            superTriviaCooldownHelper = TestTriviaGameMachine.SuperTriviaCooldownHelper(),
+            triviaGameStore = triviaGameStore
+        )
+
+        triviaGameMachine.startMachine()
+        startTime = asyncio.get_running_loop().time()
+        triviaGameStore.nextEndTimes['c'] = clock() + timedelta(seconds = 0.8)
+        triviaGameMachine.submitAction(self.__createClearAction('action1', 'c'))
+
+        await self.__waitFor(lambda: len(triviaGameStore.removeExpiredGamesTimes) >= 2)
+
+        # no polling in between: the actor sleeps straight through until the game's end time...
+        assert len(triviaGameStore.removeExpiredGamesTimes) == 2
+        assert triviaGameStore.removeExpiredGamesTimes[1] - startTime >= 0.75
+
+        # ...and once there's nothing left to wait on, it sleeps until the next action
+        await asyncio.sleep(0.6)
+        assert len(triviaGameStore.removeExpiredGamesTimes) == 2
+
+    @pytest.mark.asyncio
+    async def test_channelActionLoop_withFailingDeadGame_removesOtherDeadGames(self, tmp_path: Path):
+        clock = TestTriviaGameMachine.Clock()
+        eventListener = TestTriviaGameMachine.TriviaEventListener()
+        superTriviaCooldownHelper = TestTriviaGameMachine.SuperTriviaCooldownHelper()
+        superTriviaCooldownHelper.failingUpdateCount = 1
+        triviaGameStore = TestTriviaGameMachine.TriviaGameStore()
+
+        triviaGameStore.expiredGames = [
+            self.__createExpiredSuperGame('game1', 'c'),
+            self.__createExpiredSuperGame('game2', 'c')
+        ]
+
+        triviaGameMachine = self.__createMachine(
+            tmp_path = tmp_path,
+            clock = clock,
+            queuedTriviaGameStore = TestTriviaGameMachine.QueuedTriviaGameStore(),
+            superTriviaCooldownHelper = superTriviaCooldownHelper,
+            triviaGameStore = triviaGameStore
+        )
+
+        triviaGameMachine.setEventListener(eventListener)
+        triviaGameMachine.startMachine()
+        triviaGameMachine.submitAction(self.__createClearAction('action1', 'c'))
+
+        await self.__waitFor(lambda: any(isinstance(event, OutOfTimeSuperTriviaEvent) for event in eventListener.events))
+        await asyncio.sleep(0.1)
+
+        outOfTimeEvents = [ event for event in eventListener.events if isinstance(event, OutOfTimeSuperTriviaEvent) ]
+        assert len(outOfTimeEvents) == 1
+        assert outOfTimeEvents[0].gameId == 'game2'
+
+    @pytest.mark.asyncio
+    async def test_submitAction_keepsPerChannelOrder(self, tmp_path: Path):
+        clock = TestTriviaGameMachine.Clock()
+        eventListener = TestTriviaGameMachine.TriviaEventListener()
+
+        triviaGameMachine = self.__createMachine(
+            tmp_path = tmp_path,
+            clock = clock,
+            queuedTriviaGameStore = TestTriviaGameMachine.QueuedTriviaGameStore(),
+            superTriviaCooldownHelper = TestTriviaGameMachine.SuperTriviaCooldownHelper(),
+            triviaGameStore = TestTriviaGameMachine.TriviaGameStore()
+        )
+
+        triviaGameMachine.setEventListener(eventListener)
+        triviaGameMachine.startMachine()
+
+        for index in range(10):
+            triviaGameMachine.submitAction(self.__createClearAction(f'a{index}', 'a'))
+            triviaGameMachine.submitAction(self.__createClearAction(f'b{index}', 'b'))
+
+        await self.__waitFor(lambda: len(eventListener.events) == 20)
+
+        assert self.__getClearedActionIds(eventListener, 'a') == [ f'a{index}' for index in range(10) ]
+        assert self.__getClearedActionIds(eventListener, 'b') == [ f'b{index}' for index in range(10) ]
+
+    @pytest.mark.asyncio
+    async def test_submitAction_withSlowChannel_doesNotBlockOtherChannels(self, tmp_path: Path):
+        clock = TestTriviaGameMachine.Clock()
+        eventListener = TestTriviaGameMachine.TriviaEventListener()
+        queuedTriviaGameStore = TestTriviaGameMachine.QueuedTriviaGameStore()
+        slowChannelBlocker = asyncio.Event()
+        queuedTriviaGameStore.blockedTwitchChannelIds['slow'] = slowChannelBlocker
+
+        triviaGameMachine = self.__createMachine(
+            tmp_path = tmp_path,
+            clock = clock,
+            queuedTriviaGameStore = queuedTriviaGameStore,
+            superTriviaCooldownHelper = TestTriviaGameMachine.SuperTriviaCooldownHelper(),
+            triviaGameStore = TestTriviaGameMachine.TriviaGameStore()
+        )
+
+        triviaGameMachine.setEventListener(eventListener)
+        triviaGameMachine.startMachine()
+
+        triviaGameMachine.submitAction(self.__createClearAction('slow1', 'slow'))
+        triviaGameMachine.submitAction(self.__createClearAction('slow2', 'slow'))
+        triviaGameMachine.submitAction(self.__createClearAction('fast1', 'fast'))
+        triviaGameMachine.submitAction(self.__createClearAction('fast2', 'fast'))
+
+        await self.__waitFor(lambda: len(self.__getClearedActionIds(eventListener, 'fast')) == 2)
+        assert self.__getClearedActionIds(eventListener, 'slow') == list()
+
+        slowChannelBlocker.set()
+        await self.__waitFor(lambda: len(self.__getClearedActionIds(eventListener, 'slow')) == 2)
+        assert self.__getClearedActionIds(eventListener, 'slow') == [ 'slow1', 'slow2' ]
+
+    @pytest.mark.asyncio
+    async def test_sanity(self, tmp_path: Path):
+        clock = TestTriviaGameMachine.Clock()
+
+        triviaGameMachine = self.__createMachine(
+            tmp_path = tmp_path,
+            clock = clock,
+            queuedTriviaGameStore = TestTriviaGameMachine.QueuedTriviaGameStore(),
+            superTriviaCooldownHelper = TestTriviaGameMachine.SuperTriviaCooldownHelper(),
+            triviaGameStore = TestTriviaGameMachine.TriviaGameStore()
+        )
+
+        assert triviaGameMachine is not None
+        assert isinstance(triviaGameMachine, TriviaGameMachineInterface)
@@ -1,4 +1,4 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 
@@ -339,3 +339,141 @@ class TriviaGameStoreTests:
     def test_sanity(self):
         assert self.triviaGameStore is not None
         assert isinstance(self.triviaGameStore, TriviaGameStoreInterface)
+
+
+class TestTriviaGameStoreExpirations:
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    question: AbsTriviaQuestion = TrueFalseTriviaQuestion(
+        correctAnswer = True,
+        category = None,
+        categoryId = None,
+        question = 'Is stashiocat a member of the Chicago Bullies?',
+        triviaId = 'def456',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        originalTriviaSource = None,
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+    )
+
+    now: datetime = datetime.now(timeZoneRepository.getDefault())
+
+    def createNormalGame(
+        self,
+        gameId: str,
+        secondsToLive: int,
+        twitchChannelId: str,
+        userId: str
+    ) -> TriviaGameState:
+        return TriviaGameState(
+            triviaQuestion = self.question,
+            endTime = self.now + timedelta(seconds = secondsToLive),
+            basePointsForWinning = 5,
+            pointsForWinning = 5,
+            secondsToLive = secondsToLive,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🍔',
+            gameId = gameId,
+            twitchChannel = twitchChannelId,
+            twitchChannelId = twitchChannelId,
+            userId = userId,
+            userName = userId
+        )
+
+    def createSuperGame(
+        self,
+        gameId: str,
+        secondsToLive: int,
+        twitchChannelId: str
+    ) -> SuperTriviaGameState:
+        return SuperTriviaGameState(
+            triviaQuestion = self.question,
+            endTime = self.now + timedelta(seconds = secondsToLive),
+            basePointsForWinning = 25,
+            perUserAttempts = 2,
+            pointsForWinning = 25,
+            regularTriviaPointsForWinning = 5,
+            secondsToLive = secondsToLive,
+            toxicTriviaPunishmentMultiplier = 2,
+            specialTriviaStatus = None,
+            actionId = 'abc123',
+            emote = '🍔',
+            gameId = gameId,
+            twitchChannel = twitchChannelId,
+            twitchChannelId = twitchChannelId
+        )
+
+    @pytest.mark.asyncio
+    async def test_getNextEndTime(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        assert await triviaGameStore.getNextEndTime('c') is None
+
+        game1 = self.createNormalGame('g1', 30, 'c', 'e')
+        game2 = self.createSuperGame('g2', 10, 'c')
+        game3 = self.createNormalGame('g3', 5, 'i', 's')
+        await triviaGameStore.add(game1)
+        await triviaGameStore.add(game2)
+        await triviaGameStore.add(game3)
+
+        assert await triviaGameStore.getNextEndTime('c') == game2.endTime
+        assert await triviaGameStore.getNextEndTime('i') == game3.endTime
+
+        # a removed game no longer counts towards the next end time
+        assert await triviaGameStore.removeSuperGame('c') is True
+        assert await triviaGameStore.getNextEndTime('c') == game1.endTime
+
+        assert await triviaGameStore.removeNormalGame('c', 'e') is True
+        assert await triviaGameStore.getNextEndTime('c') is None
+
+    @pytest.mark.asyncio
+    async def test_getNormalGame_afterReplacingGame(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        game1 = self.createNormalGame('g1', 5, 'c', 'e')
+        game2 = self.createNormalGame('g2', 60, 'c', 'e')
+        await triviaGameStore.add(game1)
+        await triviaGameStore.add(game2)
+
+        assert await triviaGameStore.getNormalGame('c', 'e') is game2
+        assert len(await triviaGameStore.getNormalGames()) == 1
+
+        # the replaced game's end time is skipped over
+        assert await triviaGameStore.getNextEndTime('c') == game2.endTime
+        assert await triviaGameStore.removeExpiredGames('c', self.now + timedelta(seconds = 10)) == list()
+
+    @pytest.mark.asyncio
+    async def test_removeExpiredGames(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        game1 = self.createNormalGame('g1', 30, 'c', 'e')
+        game2 = self.createSuperGame('g2', 10, 'c')
+        game3 = self.createNormalGame('g3', 20, 'c', 's')
+        game4 = self.createNormalGame('g4', 5, 'i', 's')
+        await triviaGameStore.add(game1)
+        await triviaGameStore.add(game2)
+        await triviaGameStore.add(game3)
+        await triviaGameStore.add(game4)
+
+        assert await triviaGameStore.removeExpiredGames('c', self.now) == list()
+
+        expiredGames = await triviaGameStore.removeExpiredGames('c', self.now + timedelta(seconds = 20))
+        assert expiredGames == [ game2, game3 ]
+        assert await triviaGameStore.getSuperGame('c') is None
+        assert await triviaGameStore.getNormalGame('c', 's') is None
+        assert await triviaGameStore.getNormalGame('c', 'e') is game1
+        assert await triviaGameStore.getTwitchChannelIdsWithActiveSuperGames() == list()
+
+        # other Twitch channels are left alone
+        assert await triviaGameStore.getNormalGame('i', 's') is game4
+
+        expiredGames = await triviaGameStore.removeExpiredGames('c', self.now + timedelta(seconds = 60))
+        assert expiredGames == [ game1 ]
+        assert await triviaGameStore.getNextEndTime('c') is None
+        assert len(await triviaGameStore.getAll()) == 1
+
+    @pytest.mark.asyncio
+    async def test_removeExpiredGames_withEmptyTriviaGameStore(self):
+        triviaGameStore: TriviaGameStoreInterface = TriviaGameStore()
+        assert await triviaGameStore.removeExpiredGames('c', self.now) == list()
+
+    def test_sanity(self):
+        assert isinstance(TriviaGameStore(), TriviaGameStoreInterface)
@@ -0,0 +1,113 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.storage.backingSqliteDatabase import BackingSqliteDatabase
+from src.storage.databaseType import DatabaseType
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.storage.migrations.databaseMigrationsRegistry import DatabaseMigrationsRegistry
+from src.timber.timberStub import TimberStub
+from src.trivia.content.triviaContentCode import TriviaContentCode
+from src.trivia.misc.triviaQuestionTypeParser import TriviaQuestionTypeParser
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.questions.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+from src.trivia.triviaDifficulty import TriviaDifficulty
+from src.trivia.triviaHistoryRepository import TriviaHistoryRepository
+from src.trivia.triviaHistoryRepositoryInterface import TriviaHistoryRepositoryInterface
+from src.trivia.triviaSettingsRepository import TriviaSettingsRepository
+
+
+# the repository's $1 style placeholders are only deprecated (not broken) for sqlite
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+class TestTriviaHistoryRepository:
+
+    def __createDatabaseFile(self, tmp_path: Path) -> str:
+        databaseFile = str(tmp_path / 'database.sqlite')
+        connection = sqlite3.connect(databaseFile)
+
+        for migration in DatabaseMigrationsRegistry().getMigrations():
+            for statement in migration.getStatements(DatabaseType.SQLITE):
+                connection.execute(statement)
+
+        connection.commit()
+        connection.close()
+        return databaseFile
+
+    def __createQuestion(self, triviaId: str) -> TrueFalseTriviaQuestion:
+        return TrueFalseTriviaQuestion(
+            correctAnswer = True,
+            category = None,
+            categoryId = None,
+            question = 'Is this a question?',
+            triviaId = triviaId,
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+        )
+
+    def __createRepository(self, databaseFile: str) -> TriviaHistoryRepositoryInterface:
+        return TriviaHistoryRepository(
+            backingDatabase = BackingSqliteDatabase(
+                eventLoop = asyncio.get_running_loop(),
+                backingDatabaseFile = databaseFile
+            ),
+            timber = TimberStub(),
+            timeZoneRepository = TimeZoneRepository(),
+            triviaQuestionTypeParser = TriviaQuestionTypeParser(),
+            triviaSettingsRepository = TriviaSettingsRepository(
+                settingsJsonReader = JsonStaticReader(dict())
+            )
+        )
+
+    def __countHistoryRows(self, databaseFile: str) -> int:
+        connection = sqlite3.connect(databaseFile)
+        count = connection.execute('SELECT COUNT(*) FROM triviahistory').fetchone()[0]
+        connection.close()
+        return count
+
+    @pytest.mark.asyncio
+    async def test_verify_withNewQuestion(self, tmp_path: Path):
+        databaseFile = self.__createDatabaseFile(tmp_path)
+        repository = self.__createRepository(databaseFile)
+
+        result = await repository.verify(self.__createQuestion('abc'), '🍕', 'smCharles', '12345')
+        assert result is TriviaContentCode.OK
+        assert self.__countHistoryRows(databaseFile) == 1
+
+    @pytest.mark.asyncio
+    async def test_verify_withRepeatQuestion(self, tmp_path: Path):
+        databaseFile = self.__createDatabaseFile(tmp_path)
+        repository = self.__createRepository(databaseFile)
+
+        assert await repository.verify(self.__createQuestion('abc'), '🍕', 'smCharles', '12345') is TriviaContentCode.OK
+        assert await repository.verify(self.__createQuestion('abc'), '🍕', 'smCharles', '12345') is TriviaContentCode.REPEAT
+        assert await repository.verify(self.__createQuestion('abc'), '🍕', 'stashiocat', '67890') is TriviaContentCode.OK
+        assert self.__countHistoryRows(databaseFile) == 2
+
+    @pytest.mark.asyncio
+    async def test_verify_withHistoryFromBeforeStartup(self, tmp_path: Path):
+        databaseFile = self.__createDatabaseFile(tmp_path)
+        firstRepository = self.__createRepository(databaseFile)
+        assert await firstRepository.verify(self.__createQuestion('abc'), '🍕', 'smCharles', '12345') is TriviaContentCode.OK
+
+        # a new repository has to seed its history filter from the database
+        secondRepository = self.__createRepository(databaseFile)
+        assert await secondRepository.verify(self.__createQuestion('abc'), '🍕', 'smCharles', '12345') is TriviaContentCode.REPEAT
+        assert await secondRepository.verify(self.__createQuestion('def'), '🍕', 'smCharles', '12345') is TriviaContentCode.OK
+        assert self.__countHistoryRows(databaseFile) == 2
+
+    @pytest.mark.asyncio
+    async def test_verify_withManyQuestions(self, tmp_path: Path):
+        databaseFile = self.__createDatabaseFile(tmp_path)
+        repository = self.__createRepository(databaseFile)
+
+        for index in range(50):
+            assert await repository.verify(self.__createQuestion(f'question{index}'), '🍕', 'smCharles', '12345') is TriviaContentCode.OK
+
+        for index in range(50):
+            assert await repository.verify(self.__createQuestion(f'question{index}'), '🍕', 'smCharles', '12345') is TriviaContentCode.REPEAT
+
+        assert self.__countHistoryRows(databaseFile) == 50
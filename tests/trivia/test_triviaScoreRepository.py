@@ -0,0 +1,115 @@
+import asyncio
+import sqlite3
+from pathlib import Path
+
+import pytest
+
+from src.storage.backingSqliteDatabase import BackingSqliteDatabase
+from src.storage.databaseType import DatabaseType
+from src.storage.migrations.databaseMigrationsRegistry import DatabaseMigrationsRegistry
+from src.trivia.score.triviaScoreRepository import TriviaScoreRepository
+from src.trivia.score.triviaScoreRepositoryInterface import TriviaScoreRepositoryInterface
+
+
+# the repository's $1 style placeholders are only deprecated (not broken) for sqlite
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+class TestTriviaScoreRepository:
+
+    def __createDatabaseFile(self, tmp_path: Path) -> str:
+        databaseFile = str(tmp_path / 'database.sqlite')
+        connection = sqlite3.connect(databaseFile)
+
+        for migration in DatabaseMigrationsRegistry().getMigrations():
+            for statement in migration.getStatements(DatabaseType.SQLITE):
+                connection.execute(statement)
+
+        connection.commit()
+        connection.close()
+        return databaseFile
+
+    def __createRepository(self, databaseFile: str) -> TriviaScoreRepositoryInterface:
+        return TriviaScoreRepository(
+            backingDatabase = BackingSqliteDatabase(
+                eventLoop = asyncio.get_running_loop(),
+                backingDatabaseFile = databaseFile
+            )
+        )
+
+    @pytest.mark.asyncio
+    async def test_incrementSuperTriviaWins(self, tmp_path: Path):
+        repository = self.__createRepository(self.__createDatabaseFile(tmp_path))
+
+        result = await repository.incrementSuperTriviaWins('smCharles', 'c', 'e')
+        assert result.getSuperTriviaWins() == 1
+        assert result.getStreak() == 0
+
+        result = await repository.incrementSuperTriviaWins('smCharles', 'c', 'e')
+        assert result.getSuperTriviaWins() == 2
+
+        result = await repository.fetchTriviaScore('smCharles', 'c', 'e')
+        assert result.getSuperTriviaWins() == 2
+        assert result.getTriviaWins() == 0
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaLossesAndWins_tracksStreak(self, tmp_path: Path):
+        repository = self.__createRepository(self.__createDatabaseFile(tmp_path))
+
+        result = await repository.incrementTriviaLosses('smCharles', 'c', 'e')
+        assert result.getStreak() == -1
+        assert result.getTriviaLosses() == 1
+
+        result = await repository.incrementTriviaLosses('smCharles', 'c', 'e')
+        assert result.getStreak() == -2
+        assert result.getTriviaLosses() == 2
+
+        result = await repository.incrementTriviaWins('smCharles', 'c', 'e')
+        assert result.getStreak() == 1
+        assert result.getTriviaWins() == 1
+
+        result = await repository.incrementTriviaWins('smCharles', 'c', 'e')
+        assert result.getStreak() == 2
+        assert result.getTriviaWins() == 2
+
+        result = await repository.incrementTriviaLosses('smCharles', 'c', 'e')
+        assert result.getStreak() == -1
+        assert result.getTriviaLosses() == 3
+        assert result.getTriviaWins() == 2
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaWins_concurrently(self, tmp_path: Path):
+        repository = self.__createRepository(self.__createDatabaseFile(tmp_path))
+
+        await asyncio.gather(*[ repository.incrementTriviaWins('smCharles', 'c', 'e') for _ in range(10) ])
+
+        result = await repository.fetchTriviaScore('smCharles', 'c', 'e')
+        assert result.getTriviaWins() == 10
+        assert result.getStreak() == 10
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaWinsForUsers(self, tmp_path: Path):
+        repository = self.__createRepository(self.__createDatabaseFile(tmp_path))
+        await repository.incrementTriviaWins('smCharles', 'c', 's')
+
+        results = await repository.incrementTriviaWinsForUsers('smCharles', 'c', [ 'e', 's', 'i' ])
+        assert [ result.getUserId() for result in results ] == [ 'e', 's', 'i' ]
+        assert [ result.getTriviaWins() for result in results ] == [ 1, 2, 1 ]
+        assert all(result.getTwitchChannelId() == 'c' for result in results)
+
+        result = await repository.fetchTriviaScore('smCharles', 'c', 'i')
+        assert result.getTriviaWins() == 1
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaWinsForUsers_withEmptyUserIds(self, tmp_path: Path):
+        repository = self.__createRepository(self.__createDatabaseFile(tmp_path))
+        assert await repository.incrementTriviaWinsForUsers('smCharles', 'c', list()) == list()
+
+    @pytest.mark.asyncio
+    async def test_incrementTriviaWinsForUsers_withMalformedUserId(self, tmp_path: Path):
+        repository = self.__createRepository(self.__createDatabaseFile(tmp_path))
+
+        with pytest.raises(TypeError):
+            await repository.incrementTriviaWinsForUsers('smCharles', 'c', [ 'e', '' ])
+
+        # nothing at all was written
+        result = await repository.fetchTriviaScore('smCharles', 'c', 'e')
+        assert result.getTriviaWins() == 0
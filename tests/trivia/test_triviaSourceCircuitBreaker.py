@@ -0,0 +1,230 @@
+import pytest
+
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.triviaSourceCircuitBreaker import TriviaSourceCircuitBreaker
+from src.trivia.triviaSourceCircuitBreakerInterface import TriviaSourceCircuitBreakerInterface
+from src.trivia.triviaSourceCircuitState import TriviaSourceCircuitState
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now: float = 1000
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestTriviaSourceCircuitBreaker:
+
+    timber: TimberInterface = TimberStub()
+
+    def __createCircuitBreaker(self, clock: FakeClock) -> TriviaSourceCircuitBreakerInterface:
+        return TriviaSourceCircuitBreaker(
+            timber = self.timber,
+            clock = clock,
+            minSamples = 4,
+            openDurationSeconds = 30,
+            sampleWindowSeconds = 300,
+            slowFetchSeconds = 5,
+            targetLatencySeconds = 1
+        )
+
+    def test_isAvailable_withNoSamples(self):
+        circuitBreaker = self.__createCircuitBreaker(FakeClock())
+
+        for triviaSource in TriviaSource:
+            assert circuitBreaker.isAvailable(triviaSource)
+            assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.CLOSED
+
+    def test_recordFailure_opensCircuit(self):
+        clock = FakeClock()
+        circuitBreaker = self.__createCircuitBreaker(clock)
+        triviaSource = TriviaSource.BONGO
+
+        circuitBreaker.recordSuccess(triviaSource, 0.2)
+        circuitBreaker.recordFailure(triviaSource, 0.2)
+        circuitBreaker.recordSuccess(triviaSource, 0.2)
+        assert circuitBreaker.isAvailable(triviaSource)
+
+        circuitBreaker.recordFailure(triviaSource, 0.2)
+        assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.OPEN
+        assert not circuitBreaker.isAvailable(triviaSource)
+        assert not circuitBreaker.tryAcquire(triviaSource)
+
+        # other trivia sources are unaffected
+        assert circuitBreaker.isAvailable(TriviaSource.FUNTOON)
+
+    def test_recordSuccess_withSlowFetchesOpensCircuit(self):
+        circuitBreaker = self.__createCircuitBreaker(FakeClock())
+        triviaSource = TriviaSource.WILL_FRY_TRIVIA
+
+        for _ in range(4):
+            circuitBreaker.recordSuccess(triviaSource, 8)
+
+        assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.OPEN
+
+    def test_recordFailure_withOldSamplesFallingOutOfWindow(self):
+        clock = FakeClock()
+        circuitBreaker = self.__createCircuitBreaker(clock)
+        triviaSource = TriviaSource.BONGO
+
+        for _ in range(3):
+            circuitBreaker.recordFailure(triviaSource, 0.2)
+
+        clock.now += 301
+
+        circuitBreaker.recordFailure(triviaSource, 0.2)
+        assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.CLOSED
+        assert circuitBreaker.getSnapshot(triviaSource).sampleCount == 1
+
+    def test_tryAcquire_halfOpensAfterOpenDuration(self):
+        clock = FakeClock()
+        circuitBreaker = self.__createCircuitBreaker(clock)
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+
+        for _ in range(4):
+            circuitBreaker.recordFailure(triviaSource, 1)
+
+        clock.now += 29
+        assert not circuitBreaker.isAvailable(triviaSource)
+
+        clock.now += 1
+        assert circuitBreaker.isAvailable(triviaSource)
+        assert circuitBreaker.tryAcquire(triviaSource)
+        assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.HALF_OPEN
+
+        # only a single probe is allowed through while half-open
+        assert not circuitBreaker.isAvailable(triviaSource)
+        assert not circuitBreaker.tryAcquire(triviaSource)
+
+    def test_recordSuccess_whileHalfOpenClosesCircuit(self):
+        clock = FakeClock()
+        circuitBreaker = self.__createCircuitBreaker(clock)
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+
+        for _ in range(4):
+            circuitBreaker.recordFailure(triviaSource, 1)
+
+        clock.now += 30
+        assert circuitBreaker.tryAcquire(triviaSource)
+
+        circuitBreaker.recordSuccess(triviaSource, 0.5)
+        assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.CLOSED
+        assert circuitBreaker.getSnapshot(triviaSource).sampleCount == 0
+
+        # the failures from before the circuit closed don't count against it anymore
+        circuitBreaker.recordFailure(triviaSource, 1)
+        assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.CLOSED
+
+    def test_recordFailure_whileHalfOpenReopensCircuit(self):
+        clock = FakeClock()
+        circuitBreaker = self.__createCircuitBreaker(clock)
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+
+        for _ in range(4):
+            circuitBreaker.recordFailure(triviaSource, 1)
+
+        clock.now += 30
+        assert circuitBreaker.tryAcquire(triviaSource)
+
+        circuitBreaker.recordFailure(triviaSource, 1)
+        assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.OPEN
+        assert not circuitBreaker.isAvailable(triviaSource)
+
+        clock.now += 30
+        assert circuitBreaker.isAvailable(triviaSource)
+
+    def test_recordSuccess_whileHalfOpenWithSlowFetchReopensCircuit(self):
+        clock = FakeClock()
+        circuitBreaker = self.__createCircuitBreaker(clock)
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+
+        for _ in range(4):
+            circuitBreaker.recordFailure(triviaSource, 1)
+
+        clock.now += 30
+        assert circuitBreaker.tryAcquire(triviaSource)
+
+        circuitBreaker.recordSuccess(triviaSource, 12)
+        assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.OPEN
+
+    def test_recordCancellation_whileHalfOpenReleasesProbe(self):
+        clock = FakeClock()
+        circuitBreaker = self.__createCircuitBreaker(clock)
+        triviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+
+        for _ in range(4):
+            circuitBreaker.recordFailure(triviaSource, 1)
+
+        clock.now += 30
+        assert circuitBreaker.tryAcquire(triviaSource)
+
+        circuitBreaker.recordCancellation(triviaSource, 1)
+        assert circuitBreaker.getState(triviaSource) is TriviaSourceCircuitState.HALF_OPEN
+        assert circuitBreaker.tryAcquire(triviaSource)
+
+    def test_getHedgeDelaySeconds(self):
+        circuitBreaker = self.__createCircuitBreaker(FakeClock())
+        triviaSource = TriviaSource.FUNTOON
+
+        circuitBreaker.recordSuccess(triviaSource, 0.5)
+        circuitBreaker.recordSuccess(triviaSource, 0.6)
+        circuitBreaker.recordSuccess(triviaSource, 0.7)
+        assert circuitBreaker.getHedgeDelaySeconds(triviaSource) is None
+
+        circuitBreaker.recordSuccess(triviaSource, 2)
+        assert circuitBreaker.getHedgeDelaySeconds(triviaSource) == 2
+
+    def test_getHedgeDelaySeconds_isClamped(self):
+        circuitBreaker = self.__createCircuitBreaker(FakeClock())
+
+        for _ in range(4):
+            circuitBreaker.recordSuccess(TriviaSource.FUNTOON, 0.01)
+
+        assert circuitBreaker.getHedgeDelaySeconds(TriviaSource.FUNTOON) == 0.25
+
+        for latencySeconds in (0.5, 0.5, 0.5, 4.5, 4.9):
+            circuitBreaker.recordSuccess(TriviaSource.BONGO, latencySeconds)
+
+        assert circuitBreaker.getHedgeDelaySeconds(TriviaSource.BONGO) == 4.9
+
+    def test_getWeightMultiplier(self):
+        circuitBreaker = self.__createCircuitBreaker(FakeClock())
+
+        for _ in range(4):
+            circuitBreaker.recordSuccess(TriviaSource.BONGO, 0.5)
+            circuitBreaker.recordSuccess(TriviaSource.FUNTOON, 4)
+
+        assert circuitBreaker.getWeightMultiplier(TriviaSource.BONGO) == 1
+        assert circuitBreaker.getWeightMultiplier(TriviaSource.FUNTOON) == 0.25
+        assert circuitBreaker.getWeightMultiplier(TriviaSource.GLACIAL) == 1
+
+    def test_getSnapshot(self):
+        circuitBreaker = self.__createCircuitBreaker(FakeClock())
+        triviaSource = TriviaSource.MILLIONAIRE
+
+        snapshot = circuitBreaker.getSnapshot(triviaSource)
+        assert snapshot.sampleCount == 0
+        assert snapshot.p50LatencySeconds is None
+        assert snapshot.p95LatencySeconds is None
+
+        circuitBreaker.recordSuccess(triviaSource, 0.1)
+        circuitBreaker.recordSuccess(triviaSource, 0.3)
+        circuitBreaker.recordFailure(triviaSource, 0.2)
+
+        snapshot = circuitBreaker.getSnapshot(triviaSource)
+        assert snapshot.badFetchRate == pytest.approx(1 / 3)
+        assert snapshot.p50LatencySeconds == 0.2
+        assert snapshot.p95LatencySeconds == 0.3
+        assert snapshot.sampleCount == 3
+        assert snapshot.state is TriviaSourceCircuitState.CLOSED
+        assert snapshot.triviaSource is triviaSource
+
+    def test_sanity(self):
+        circuitBreaker = self.__createCircuitBreaker(FakeClock())
+        assert circuitBreaker is not None
+        assert isinstance(circuitBreaker, TriviaSourceCircuitBreaker)
+        assert isinstance(circuitBreaker, TriviaSourceCircuitBreakerInterface)
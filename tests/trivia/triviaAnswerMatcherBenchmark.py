@@ -0,0 +1,119 @@
+import importlib.util
+import math
+import random
+import re
+import subprocess
+import sys
+import time
+from types import ModuleType
+from typing import Any, Callable
+
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.timber.timberStub import TimberStub
+from src.trivia.compilers.triviaAnswerCompiler import TriviaAnswerCompiler
+from src.trivia.triviaAnswerChecker import TriviaAnswerChecker
+from src.trivia.triviaAnswerMatcher import TriviaAnswerMatcher
+from src.trivia.triviaSettingsRepository import TriviaSettingsRepository
+
+# Worst case benchmark for TriviaAnswerMatcher. Run it from the repository root:
+#
+#   python -m tests.trivia.triviaAnswerMatcherBenchmark [baselineRevision]
+#
+# The worst case is a long answer paired with a wrong guess that has about half as many words.
+# Every way of grouping the answer's words has to be ruled out, and there are exponentially many
+# of those groupings. When a git revision is given, the TriviaAnswerMatcher from
+# that revision is benchmarked too, for as long as its grouping count stays reasonable.
+
+matcherPath = 'src/trivia/triviaAnswerMatcher.py'
+
+maxBaselineGroupings = 200000
+
+
+def loadBaselineMatcherModule(revision: str) -> ModuleType:
+    source = subprocess.run(
+        args = [ 'git', 'show', f'{revision}:{matcherPath}' ],
+        capture_output = True,
+        check = True,
+        text = True
+    ).stdout
+
+    # loaded as a sibling of the current module, so that its relative imports still resolve
+    moduleName = 'src.trivia.baselineTriviaAnswerMatcher'
+    spec = importlib.util.spec_from_loader(moduleName, loader = None)
+    module = importlib.util.module_from_spec(spec)
+    module.__package__ = 'src.trivia'
+    exec(compile(source, f'{revision}:{matcherPath}', 'exec'), module.__dict__)
+
+    return module
+
+
+def randomWords(rng: random.Random, count: int) -> list[str]:
+    return [ ''.join(rng.choice('bcdfghjklmnpqrstvwxz') for _ in range(rng.randint(4, 8))) for _ in range(count) ]
+
+
+def timeMatch(matcherClass: Any, answer: str, guess: str, variantGenerator: Any) -> tuple[bool, float]:
+    start = time.perf_counter()
+
+    matcher = matcherClass(
+        compiledCorrectAnswers = [ answer ],
+        variantGenerator = variantGenerator,
+        whitespacePattern = re.compile(r'\s\s+', re.IGNORECASE)
+    )
+
+    isMatch = matcher.isMatch([ guess ], 3)
+    return isMatch, time.perf_counter() - start
+
+
+def main(baselineRevision: str | None):
+    timber = TimberStub()
+    triviaSettingsRepository = TriviaSettingsRepository(settingsJsonReader = JsonStaticReader(dict()))
+
+    triviaAnswerChecker = TriviaAnswerChecker(
+        timber = timber,
+        triviaAnswerCompiler = TriviaAnswerCompiler(
+            timber = timber,
+            triviaSettingsRepository = triviaSettingsRepository
+        ),
+        triviaSettingsRepository = triviaSettingsRepository
+    )
+
+    # the same variant generator that the answer checker itself hands to its matchers
+    variantGenerator = getattr(triviaAnswerChecker, '_TriviaAnswerChecker__genVariantPossibilities')
+
+    baselineMatcherClass: Any | None = None
+    if baselineRevision is not None:
+        baselineMatcherClass = loadBaselineMatcherModule(baselineRevision).TriviaAnswerMatcher
+
+    rng = random.Random(0)
+
+    # "distinct" guesses share nothing with the answer, while "repetitive" guesses match every
+    # partial grouping of the answer, and only fail on their very last word
+    scenarios: list[tuple[str, Callable[[int], tuple[str, str]]]] = [
+        ('distinct', lambda count: (' '.join(randomWords(rng, count)), ' '.join(randomWords(rng, count // 2)))),
+        ('repetitive', lambda count: (' '.join([ 'ab' ] * count), ' '.join([ 'abab' ] * (count // 2 - 1) + [ 'zzzz' ])))
+    ]
+
+    print(f'{"scenario":>10} {"answer words":>12} {"guess words":>11} {"groupings":>26} {"current ms":>10} {"baseline ms":>11}')
+
+    for scenario, createAnswerAndGuess in scenarios:
+        for answerWordCount in (4, 8, 12, 16, 20, 24, 32, 48, 64):
+            answer, guess = createAnswerAndGuess(answerWordCount)
+            guessWordCount = len(guess.split(' '))
+            groupings = math.comb(answerWordCount - 1, guessWordCount - 1)
+
+            isMatch, elapsed = timeMatch(TriviaAnswerMatcher, answer, guess, variantGenerator)
+            baselineMillis = '-'
+
+            if baselineMatcherClass is not None and groupings <= maxBaselineGroupings:
+                baselineIsMatch, baselineElapsed = timeMatch(baselineMatcherClass, answer, guess, variantGenerator)
+
+                if baselineIsMatch != isMatch:
+                    raise RuntimeError(f'Result differs from the baseline revision ({baselineRevision=}) ({answer=}) ({guess=})')
+
+                baselineMillis = f'{baselineElapsed * 1000:.2f}'
+
+            print(f'{scenario:>10} {answerWordCount:>12} {guessWordCount:>11} {groupings:>26,} {elapsed * 1000:>10.2f} {baselineMillis:>11}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1] if len(sys.argv) >= 2 else None)
@@ -0,0 +1,416 @@
+import asyncio
+from pathlib import Path
+from typing import Collection
+
+import aiosqlite
+import pytest
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.authRepository import AuthRepository
+from src.network.requestsClientProvider import RequestsClientProvider
+from src.storage.backingSqliteDatabase import BackingSqliteDatabase
+from src.storage.jsonStaticReader import JsonStaticReader
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+from src.trivia.additionalAnswers.additionalTriviaAnswers import AdditionalTriviaAnswers
+from src.trivia.additionalAnswers.additionalTriviaAnswersRepositoryInterface import AdditionalTriviaAnswersRepositoryInterface
+from src.trivia.compilers.triviaAnswerCompiler import TriviaAnswerCompiler
+from src.trivia.compilers.triviaQuestionCompiler import TriviaQuestionCompiler
+from src.trivia.questionAnswerTriviaConditions import QuestionAnswerTriviaConditions
+from src.trivia.questions.absTriviaQuestion import AbsTriviaQuestion
+from src.trivia.questions.multipleChoiceTriviaQuestion import MultipleChoiceTriviaQuestion
+from src.trivia.questions.questionAnswerTriviaQuestion import QuestionAnswerTriviaQuestion
+from src.trivia.questions.triviaQuestionType import TriviaQuestionType
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.triviaDifficulty import TriviaDifficulty
+from src.trivia.triviaExceptions import NoTriviaCorrectAnswersException
+from src.trivia.triviaFetchOptions import TriviaFetchOptions
+from src.trivia.triviaRepositories.glacialTriviaQuestionRepository import GlacialTriviaQuestionRepository
+from src.trivia.triviaRepositories.glacialTriviaQuestionRepositoryInterface import GlacialTriviaQuestionRepositoryInterface
+from src.trivia.triviaSettingsRepository import TriviaSettingsRepository
+from src.trivia.triviaSettingsRepositoryInterface import TriviaSettingsRepositoryInterface
+from src.twitch.api.twitchApiService import TwitchApiService
+from src.twitch.api.twitchJsonMapper import TwitchJsonMapper
+from src.twitch.officialTwitchAccountUserIdProvider import OfficialTwitchAccountUserIdProvider
+from src.twitch.websocket.twitchWebsocketJsonMapper import TwitchWebsocketJsonMapper
+from src.users.userIdsRepository import UserIdsRepository
+
+
+# the repository's $1 style placeholders are only deprecated (not broken) for sqlite
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+class TestGlacialTriviaQuestionRepository:
+
+    class MisconstruedTriviaQuestion(QuestionAnswerTriviaQuestion):
+
+        @property
+        def triviaType(self) -> TriviaQuestionType:
+            return TriviaQuestionType.TRUE_FALSE
+
+    class AdditionalTriviaAnswersRepository(AdditionalTriviaAnswersRepositoryInterface):
+
+        def __init__(self):
+            self.additionalAnswers: dict[str, list[str]] = dict()
+
+        async def addAdditionalTriviaAnswer(
+            self,
+            additionalAnswer: str,
+            triviaId: str,
+            userId: str,
+            triviaQuestionType: TriviaQuestionType,
+            triviaSource: TriviaSource
+        ) -> AdditionalTriviaAnswers:
+            raise NotImplementedError()
+
+        async def addAdditionalTriviaAnswers(
+            self,
+            currentAnswers: list[str],
+            triviaId: str,
+            triviaQuestionType: TriviaQuestionType,
+            triviaSource: TriviaSource
+        ) -> bool:
+            additionalAnswers = self.additionalAnswers.get(triviaId, None)
+
+            if additionalAnswers is None:
+                return False
+
+            currentAnswers.extend(additionalAnswers)
+            return True
+
+        async def deleteAdditionalTriviaAnswers(
+            self,
+            triviaId: str,
+            triviaQuestionType: TriviaQuestionType,
+            triviaSource: TriviaSource
+        ) -> AdditionalTriviaAnswers | None:
+            raise NotImplementedError()
+
+        async def getAdditionalTriviaAnswers(
+            self,
+            triviaId: str,
+            triviaQuestionType: TriviaQuestionType,
+            triviaSource: TriviaSource
+        ) -> AdditionalTriviaAnswers | None:
+            raise NotImplementedError()
+
+    class TriviaAnswerCompiler(TriviaAnswerCompiler):
+
+        def __init__(
+            self,
+            timber: TimberInterface,
+            triviaSettingsRepository: TriviaSettingsRepositoryInterface
+        ):
+            super().__init__(
+                timber = timber,
+                triviaSettingsRepository = triviaSettingsRepository
+            )
+
+            self.compiledAnswers: list[list[str]] = list()
+
+        async def compileTextAnswersList(
+            self,
+            answers: Collection[str | None] | None,
+            expandParentheses: bool = True
+        ) -> list[str]:
+            if answers is not None:
+                self.compiledAnswers.append([ answer for answer in answers if answer is not None ])
+
+            return await super().compileTextAnswersList(answers, expandParentheses)
+
+    timber: TimberInterface = TimberStub()
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    triviaSettingsRepository: TriviaSettingsRepositoryInterface = TriviaSettingsRepository(
+        settingsJsonReader = JsonStaticReader({
+            'scraper_enabled': True
+        })
+    )
+
+    fetchOptions: TriviaFetchOptions = TriviaFetchOptions(
+        twitchChannel = 'smCharles',
+        twitchChannelId = '123',
+        questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.REQUIRED
+    )
+
+    multipleChoiceQuestion: AbsTriviaQuestion = MultipleChoiceTriviaQuestion(
+        correctAnswers = [ 'Nintendo' ],
+        multipleChoiceResponses = [ 'Microsoft', 'Nintendo', 'Sega', 'Sony' ],
+        category = None,
+        categoryId = None,
+        question = 'Which company made the SNES?',
+        triviaId = 'xyz321',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        originalTriviaSource = None,
+        triviaSource = TriviaSource.MILLIONAIRE
+    )
+
+    questionAnswerQuestion1: AbsTriviaQuestion = QuestionAnswerTriviaQuestion(
+        allWords = None,
+        compiledCorrectAnswers = [ 'chicago bullies', 'bullies' ],
+        correctAnswers = [ 'Chicago Bullies', 'Bullies' ],
+        originalCorrectAnswers = [ 'Chicago Bullies', 'Bullies' ],
+        category = None,
+        categoryId = None,
+        question = 'One of this team\'s members is stashiocat.',
+        triviaId = 'ghi789',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        originalTriviaSource = None,
+        triviaSource = TriviaSource.FUNTOON
+    )
+
+    questionAnswerQuestion2: AbsTriviaQuestion = QuestionAnswerTriviaQuestion(
+        allWords = None,
+        compiledCorrectAnswers = [ 'stashiocat' ],
+        correctAnswers = [ 'stashiocat' ],
+        originalCorrectAnswers = [ 'stashiocat' ],
+        category = None,
+        categoryId = None,
+        question = 'This user is a member of the Chicago Bullies.',
+        triviaId = 'jkl012',
+        triviaDifficulty = TriviaDifficulty.UNKNOWN,
+        originalTriviaSource = None,
+        triviaSource = TriviaSource.J_SERVICE
+    )
+
+    def __createRepository(
+        self,
+        tmp_path: Path,
+        additionalTriviaAnswersRepository: AdditionalTriviaAnswersRepositoryInterface,
+        triviaAnswerCompiler: TriviaAnswerCompiler,
+        maxCompiledCorrectAnswers: int = 256
+    ) -> GlacialTriviaQuestionRepository:
+        # nothing exercised here ever touches these, but the repository wants them anyway
+        authRepository = AuthRepository(
+            authJsonReader = JsonStaticReader(dict())
+        )
+
+        twitchJsonMapper = TwitchJsonMapper(
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository
+        )
+
+        userIdsRepository = UserIdsRepository(
+            backingDatabase = BackingSqliteDatabase(
+                eventLoop = asyncio.get_running_loop(),
+                backingDatabaseFile = str(tmp_path / 'database.sqlite')
+            ),
+            officialTwitchAccountUserIdProvider = OfficialTwitchAccountUserIdProvider(),
+            timber = self.timber,
+            twitchApiService = TwitchApiService(
+                networkClientProvider = RequestsClientProvider(
+                    timber = self.timber
+                ),
+                timber = self.timber,
+                timeZoneRepository = self.timeZoneRepository,
+                twitchCredentialsProvider = authRepository,
+                twitchJsonMapper = twitchJsonMapper,
+                twitchWebsocketJsonMapper = TwitchWebsocketJsonMapper(
+                    timber = self.timber,
+                    twitchJsonMapper = twitchJsonMapper
+                )
+            )
+        )
+
+        return GlacialTriviaQuestionRepository(
+            additionalTriviaAnswersRepository = additionalTriviaAnswersRepository,
+            timber = self.timber,
+            triviaAnswerCompiler = triviaAnswerCompiler,
+            triviaQuestionCompiler = TriviaQuestionCompiler(
+                timber = self.timber
+            ),
+            triviaSettingsRepository = self.triviaSettingsRepository,
+            twitchHandleProvider = authRepository,
+            userIdsRepository = userIdsRepository,
+            triviaDatabaseFile = str(tmp_path / 'glacialTriviaQuestionsDatabase.sqlite'),
+            maxCompiledCorrectAnswers = maxCompiledCorrectAnswers
+        )
+
+    def __createTriviaAnswerCompiler(self) -> TriviaAnswerCompiler:
+        return TestGlacialTriviaQuestionRepository.TriviaAnswerCompiler(
+            timber = self.timber,
+            triviaSettingsRepository = self.triviaSettingsRepository
+        )
+
+    async def __fetchAnswerRowCount(self, tmp_path: Path, triviaId: str) -> int:
+        connection = await aiosqlite.connect(str(tmp_path / 'glacialTriviaQuestionsDatabase.sqlite'))
+        cursor = await connection.execute('SELECT COUNT(*) FROM glacialAnswers WHERE triviaId = ?', (triviaId, ))
+        row = await cursor.fetchone()
+        await cursor.close()
+        await connection.close()
+
+        assert row is not None
+        return row[0]
+
+    def __getOriginalCorrectAnswers(
+        self,
+        questions: list[QuestionAnswerTriviaQuestion]
+    ) -> dict[str, list[str]]:
+        originalCorrectAnswers: dict[str, list[str]] = dict()
+
+        for question in questions:
+            originalCorrectAnswers[question.triviaId] = question.originalCorrectAnswers
+
+        return originalCorrectAnswers
+
+    @pytest.mark.asyncio
+    async def test_fetchAllQuestionAnswerTriviaQuestions_groupsAnswersByQuestion(self, tmp_path: Path):
+        repository = self.__createRepository(
+            tmp_path = tmp_path,
+            additionalTriviaAnswersRepository = TestGlacialTriviaQuestionRepository.AdditionalTriviaAnswersRepository(),
+            triviaAnswerCompiler = self.__createTriviaAnswerCompiler()
+        )
+
+        await repository.storeAll([ self.multipleChoiceQuestion, self.questionAnswerQuestion1, self.questionAnswerQuestion2 ])
+        questions = await repository.fetchAllQuestionAnswerTriviaQuestions(self.fetchOptions)
+
+        # the multiple choice question is left out, and each question answer question shows up
+        # once, holding all of its own answers (and nobody else's)
+        assert len(questions) == 2
+        assert self.__getOriginalCorrectAnswers(questions) == {
+            'ghi789': [ 'Chicago Bullies', 'Bullies' ],
+            'jkl012': [ 'stashiocat' ]
+        }
+
+        for question in questions:
+            assert question.triviaSource is TriviaSource.GLACIAL
+
+            if question.triviaId == 'ghi789':
+                assert question.originalTriviaSource is TriviaSource.FUNTOON
+            else:
+                assert question.originalTriviaSource is TriviaSource.J_SERVICE
+
+    @pytest.mark.asyncio
+    async def test_fetchAllQuestionAnswerTriviaQuestions_withQuestionMissingAnswers(self, tmp_path: Path):
+        repository = self.__createRepository(
+            tmp_path = tmp_path,
+            additionalTriviaAnswersRepository = TestGlacialTriviaQuestionRepository.AdditionalTriviaAnswersRepository(),
+            triviaAnswerCompiler = self.__createTriviaAnswerCompiler()
+        )
+
+        await repository.storeAll([ self.questionAnswerQuestion1, self.questionAnswerQuestion2 ])
+
+        connection = await aiosqlite.connect(str(tmp_path / 'glacialTriviaQuestionsDatabase.sqlite'))
+        await connection.execute('DELETE FROM glacialAnswers WHERE triviaId = ?', ('jkl012', ))
+        await connection.commit()
+        await connection.close()
+
+        # the LEFT OUTER JOIN still yields a row for the question, just without an answer
+        with pytest.raises(NoTriviaCorrectAnswersException):
+            await repository.fetchAllQuestionAnswerTriviaQuestions(self.fetchOptions)
+
+    @pytest.mark.asyncio
+    async def test_fetchAllQuestionAnswerTriviaQuestions_recompilesAnswersOnlyWhenTheyChange(self, tmp_path: Path):
+        additionalTriviaAnswersRepository = TestGlacialTriviaQuestionRepository.AdditionalTriviaAnswersRepository()
+        triviaAnswerCompiler = self.__createTriviaAnswerCompiler()
+
+        repository = self.__createRepository(
+            tmp_path = tmp_path,
+            additionalTriviaAnswersRepository = additionalTriviaAnswersRepository,
+            triviaAnswerCompiler = triviaAnswerCompiler
+        )
+
+        await repository.storeAll([ self.questionAnswerQuestion1, self.questionAnswerQuestion2 ])
+
+        await repository.fetchAllQuestionAnswerTriviaQuestions(self.fetchOptions)
+        assert len(triviaAnswerCompiler.compiledAnswers) == 2
+
+        # nothing changed, so the cached compiled answers are reused
+        await repository.fetchAllQuestionAnswerTriviaQuestions(self.fetchOptions)
+        assert len(triviaAnswerCompiler.compiledAnswers) == 2
+
+        # an additional answer changes that question's answers, and so only it gets recompiled
+        additionalTriviaAnswersRepository.additionalAnswers['jkl012'] = [ 'Eddie' ]
+        questions = await repository.fetchAllQuestionAnswerTriviaQuestions(self.fetchOptions)
+        assert triviaAnswerCompiler.compiledAnswers[2:] == [ [ 'stashiocat', 'Eddie' ] ]
+
+        question = next(question for question in questions if question.triviaId == 'jkl012')
+        assert question.originalCorrectAnswers == [ 'stashiocat', 'Eddie' ]
+        assert 'eddie' in question.compiledCorrectAnswers
+
+        # and once the additional answer is gone again, so is the stale compiled answer
+        del additionalTriviaAnswersRepository.additionalAnswers['jkl012']
+        questions = await repository.fetchAllQuestionAnswerTriviaQuestions(self.fetchOptions)
+        assert len(triviaAnswerCompiler.compiledAnswers) == 4
+
+        question = next(question for question in questions if question.triviaId == 'jkl012')
+        assert 'eddie' not in question.compiledCorrectAnswers
+
+    @pytest.mark.asyncio
+    async def test_fetchAllQuestionAnswerTriviaQuestions_withFullCompiledAnswersCache(self, tmp_path: Path):
+        triviaAnswerCompiler = self.__createTriviaAnswerCompiler()
+
+        repository = self.__createRepository(
+            tmp_path = tmp_path,
+            additionalTriviaAnswersRepository = TestGlacialTriviaQuestionRepository.AdditionalTriviaAnswersRepository(),
+            triviaAnswerCompiler = triviaAnswerCompiler,
+            maxCompiledCorrectAnswers = 1
+        )
+
+        await repository.storeAll([ self.questionAnswerQuestion1, self.questionAnswerQuestion2 ])
+
+        # only one question's compiled answers fit in the cache, so each fetch has to recompile
+        # the other question's answers
+        await repository.fetchAllQuestionAnswerTriviaQuestions(self.fetchOptions)
+        assert len(triviaAnswerCompiler.compiledAnswers) == 2
+
+        await repository.fetchAllQuestionAnswerTriviaQuestions(self.fetchOptions)
+        assert len(triviaAnswerCompiler.compiledAnswers) == 4
+
+    @pytest.mark.asyncio
+    async def test_storeAll_skipsAlreadyStoredQuestions(self, tmp_path: Path):
+        repository = self.__createRepository(
+            tmp_path = tmp_path,
+            additionalTriviaAnswersRepository = TestGlacialTriviaQuestionRepository.AdditionalTriviaAnswersRepository(),
+            triviaAnswerCompiler = self.__createTriviaAnswerCompiler()
+        )
+
+        assert await repository.storeAll([ self.questionAnswerQuestion1 ]) == 1
+        assert await repository.storeAll([ self.questionAnswerQuestion1, self.questionAnswerQuestion2, self.multipleChoiceQuestion ]) == 2
+        assert await repository.storeAll([ self.questionAnswerQuestion2 ]) == 0
+        assert not await repository.store(self.multipleChoiceQuestion)
+
+        # the skipped questions' answers weren't inserted a second time
+        assert await self.__fetchAnswerRowCount(tmp_path, 'ghi789') == 2
+        assert await self.__fetchAnswerRowCount(tmp_path, 'jkl012') == 1
+        assert await self.__fetchAnswerRowCount(tmp_path, 'xyz321') == 1
+
+    @pytest.mark.asyncio
+    async def test_storeAll_withMisconstruedQuestion_storesTheOtherQuestions(self, tmp_path: Path):
+        repository = self.__createRepository(
+            tmp_path = tmp_path,
+            additionalTriviaAnswersRepository = TestGlacialTriviaQuestionRepository.AdditionalTriviaAnswersRepository(),
+            triviaAnswerCompiler = self.__createTriviaAnswerCompiler()
+        )
+
+        misconstruedQuestion = TestGlacialTriviaQuestionRepository.MisconstruedTriviaQuestion(
+            allWords = None,
+            compiledCorrectAnswers = [ 'eddie' ],
+            correctAnswers = [ 'eddie' ],
+            originalCorrectAnswers = [ 'Eddie' ],
+            category = None,
+            categoryId = None,
+            question = 'This user is definitely a true or false question.',
+            triviaId = 'mno345',
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = None,
+            triviaSource = TriviaSource.J_SERVICE
+        )
+
+        assert await repository.storeAll([ self.questionAnswerQuestion1, misconstruedQuestion, self.questionAnswerQuestion2 ]) == 2
+        assert await repository.storeAll([ misconstruedQuestion ]) == 0
+
+        assert await self.__fetchAnswerRowCount(tmp_path, 'ghi789') == 2
+        assert await self.__fetchAnswerRowCount(tmp_path, 'jkl012') == 1
+        assert await self.__fetchAnswerRowCount(tmp_path, 'mno345') == 0
+
+    @pytest.mark.asyncio
+    async def test_sanity(self, tmp_path: Path):
+        repository = self.__createRepository(
+            tmp_path = tmp_path,
+            additionalTriviaAnswersRepository = TestGlacialTriviaQuestionRepository.AdditionalTriviaAnswersRepository(),
+            triviaAnswerCompiler = self.__createTriviaAnswerCompiler()
+        )
+
+        assert isinstance(repository, GlacialTriviaQuestionRepositoryInterface)
+        assert repository.triviaSource is TriviaSource.GLACIAL
@@ -0,0 +1,196 @@
+import asyncio
+import sqlite3
+
+import aiosqlite
+import pytest
+
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+from src.trivia.triviaRepositories.readOnlySqliteConnectionManager import ReadOnlySqliteConnectionManager
+from src.trivia.triviaRepositories.readOnlySqliteConnectionManagerInterface import \
+    ReadOnlySqliteConnectionManagerInterface
+from src.trivia.triviaRepositories.readOnlySqliteConnectionStats import ReadOnlySqliteConnectionStats
+
+
+class TestReadOnlySqliteConnectionManager:
+
+    timber: TimberInterface = TimberStub()
+
+    async def __createDatabase(self, databaseFile: str):
+        connection = await aiosqlite.connect(databaseFile)
+        await connection.execute('CREATE TABLE questions (question TEXT NOT NULL)')
+        await connection.executemany('INSERT INTO questions (question) VALUES (?)', [ ('a', ), ('b', ) ])
+        await connection.commit()
+        await connection.close()
+
+    async def __fetchQuestionsCount(self, connection: aiosqlite.Connection) -> int:
+        cursor = await connection.execute('SELECT COUNT(*) FROM questions')
+        row = await cursor.fetchone()
+        await cursor.close()
+        return row[0]
+
+    @pytest.mark.asyncio
+    async def test_closeConnection_whileConnectionIsInUse(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile)
+        manager: ReadOnlySqliteConnectionManagerInterface = ReadOnlySqliteConnectionManager(timber = self.timber)
+
+        fetchStarted = asyncio.Event()
+        resumeFetch = asyncio.Event()
+        fetchConnections: list[aiosqlite.Connection] = list()
+
+        async def fetch() -> int:
+            async with manager.useConnection(databaseFile) as connection:
+                fetchConnections.append(connection)
+                fetchStarted.set()
+                await resumeFetch.wait()
+                return await self.__fetchQuestionsCount(connection)
+
+        fetchTask = asyncio.create_task(fetch())
+        await fetchStarted.wait()
+
+        # the connection is swapped out right away, but not closed out from under the fetch
+        await manager.closeConnection(databaseFile)
+        stats = await manager.getStats()
+        assert not stats[0].isOpen
+
+        async with manager.useConnection(databaseFile) as connection:
+            assert connection is not fetchConnections[0]
+            assert await self.__fetchQuestionsCount(connection) == 2
+
+        resumeFetch.set()
+        assert await fetchTask == 2
+
+        # now that the fetch is done with it, the old connection has been closed
+        with pytest.raises(ValueError):
+            await fetchConnections[0].execute('SELECT COUNT(*) FROM questions')
+
+        stats = await manager.getStats()
+        assert stats[0].connectionOpens == 2
+        assert stats[0].connectionUses == 2
+
+        await manager.closeConnection(databaseFile)
+
+    @pytest.mark.asyncio
+    async def test_closeConnection_racingConcurrentFetches(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile)
+        manager: ReadOnlySqliteConnectionManagerInterface = ReadOnlySqliteConnectionManager(timber = self.timber)
+
+        async def fetch() -> int:
+            async with manager.useConnection(databaseFile) as connection:
+                return await self.__fetchQuestionsCount(connection)
+
+        async def fetchThenClose() -> int:
+            async with manager.useConnection(databaseFile) as connection:
+                count = await self.__fetchQuestionsCount(connection)
+
+            await manager.closeConnection(databaseFile)
+            return count
+
+        results = await asyncio.gather(*[ fetch() if index % 2 == 0 else fetchThenClose() for index in range(16) ])
+        assert results == [ 2 ] * 16
+
+        await manager.closeConnection(databaseFile)
+
+    @pytest.mark.asyncio
+    async def test_useConnection_reusesConnection(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile)
+        manager: ReadOnlySqliteConnectionManagerInterface = ReadOnlySqliteConnectionManager(timber = self.timber)
+
+        async with manager.useConnection(databaseFile) as connection:
+            async with manager.useConnection(databaseFile) as otherConnection:
+                assert otherConnection is connection
+
+            assert await self.__fetchQuestionsCount(connection) == 2
+
+        async with manager.useConnection(databaseFile) as otherConnection:
+            assert otherConnection is connection
+
+        await manager.closeConnection(databaseFile)
+
+    @pytest.mark.asyncio
+    async def test_useConnection_isReadOnly(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile)
+        manager: ReadOnlySqliteConnectionManagerInterface = ReadOnlySqliteConnectionManager(timber = self.timber)
+
+        async with manager.useConnection(databaseFile) as connection:
+            with pytest.raises(sqlite3.OperationalError):
+                await connection.execute('INSERT INTO questions (question) VALUES (?)', ('c', ))
+
+        await manager.closeConnection(databaseFile)
+
+    @pytest.mark.asyncio
+    async def test_useConnection_withMissingDatabaseFile(self, tmp_path):
+        databaseFile = str(tmp_path / 'missing.sqlite')
+        manager: ReadOnlySqliteConnectionManagerInterface = ReadOnlySqliteConnectionManager(timber = self.timber)
+
+        with pytest.raises(FileNotFoundError):
+            async with manager.useConnection(databaseFile):
+                pass
+
+        assert not (tmp_path / 'missing.sqlite').exists()
+
+    @pytest.mark.asyncio
+    async def test_useConnection_setsMmapSize(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile)
+        manager: ReadOnlySqliteConnectionManagerInterface = ReadOnlySqliteConnectionManager(
+            timber = self.timber,
+            mmapSizeBytes = 1048576
+        )
+
+        async with manager.useConnection(databaseFile) as connection:
+            cursor = await connection.execute('PRAGMA mmap_size')
+            row = await cursor.fetchone()
+            await cursor.close()
+
+        await manager.closeConnection(databaseFile)
+
+        # SQLite builds without memory mapping support always report 0
+        assert row[0] in (0, 1048576)
+
+    @pytest.mark.asyncio
+    async def test_getStats(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile)
+        manager: ReadOnlySqliteConnectionManagerInterface = ReadOnlySqliteConnectionManager(timber = self.timber)
+        assert await manager.getStats() == list()
+
+        for _ in range(3):
+            async with manager.useConnection(databaseFile):
+                pass
+
+        assert await manager.getStats() == [ ReadOnlySqliteConnectionStats(
+            isOpen = True,
+            connectionOpens = 1,
+            connectionUses = 3,
+            databaseFile = databaseFile
+        ) ]
+
+        await manager.closeConnection(databaseFile)
+
+        assert await manager.getStats() == [ ReadOnlySqliteConnectionStats(
+            isOpen = False,
+            connectionOpens = 1,
+            connectionUses = 3,
+            databaseFile = databaseFile
+        ) ]
+
+        async with manager.useConnection(databaseFile):
+            pass
+
+        stats = await manager.getStats()
+        assert stats[0].isOpen
+        assert stats[0].connectionOpens == 2
+        assert stats[0].connectionUses == 4
+
+        await manager.closeConnection(databaseFile)
+
+    def test_sanity(self):
+        manager = ReadOnlySqliteConnectionManager(timber = self.timber)
+        assert manager is not None
+        assert isinstance(manager, ReadOnlySqliteConnectionManager)
+        assert isinstance(manager, ReadOnlySqliteConnectionManagerInterface)
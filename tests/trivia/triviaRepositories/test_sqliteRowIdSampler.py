@@ -0,0 +1,100 @@
+import os
+
+import aiosqlite
+import pytest
+
+from src.trivia.triviaRepositories.sqliteRowIdSampler import SqliteRowIdSampler
+
+
+class TestSqliteRowIdSampler:
+
+    async def __createDatabase(self, databaseFile: str, questionTypes: list[str]):
+        connection = await aiosqlite.connect(databaseFile)
+        await connection.execute('CREATE TABLE questions (question TEXT NOT NULL, questionType TEXT NOT NULL)')
+        await connection.executemany(
+            'INSERT INTO questions (question, questionType) VALUES (?, ?)',
+            [ (f'question {index}', questionType) for index, questionType in enumerate(questionTypes) ]
+        )
+        await connection.commit()
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_sampleRowId(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile, [ 'a', 'b', 'a', 'b', 'a' ])
+        sampler = SqliteRowIdSampler(databaseFile)
+
+        connection = await aiosqlite.connect(databaseFile)
+        sampledRowIds: set[int] = set()
+
+        for _ in range(200):
+            sampledRowIds.add(await sampler.sampleRowId(connection, 'SELECT rowid FROM questions WHERE questionType = ?', ('a', )))
+
+        await connection.close()
+        assert sampledRowIds == { 1, 3, 5 }
+
+    @pytest.mark.asyncio
+    async def test_sampleRowId_withEmptyTable(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile, list())
+        sampler = SqliteRowIdSampler(databaseFile)
+
+        connection = await aiosqlite.connect(databaseFile)
+        assert await sampler.sampleRowId(connection, 'SELECT rowid FROM questions') is None
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_sampleRowId_refreshesWhenDatabaseFileChanges(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile, [ 'a' ])
+        sampler = SqliteRowIdSampler(databaseFile)
+
+        connection = await aiosqlite.connect(databaseFile)
+        assert await sampler.sampleRowId(connection, 'SELECT rowid FROM questions WHERE questionType = ?', ('b', )) is None
+
+        await connection.execute('INSERT INTO questions (question, questionType) VALUES (?, ?)', ('question', 'b'))
+        await connection.commit()
+
+        # make sure that the change is visible even on file systems with a coarse modification time
+        stat = os.stat(databaseFile)
+        os.utime(databaseFile, ns = (stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+
+        assert await sampler.sampleRowId(connection, 'SELECT rowid FROM questions WHERE questionType = ?', ('b', )) == 2
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_sampleRowId_withoutDatabaseFile_onlyRefreshesAfterInvalidate(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile, [ 'a' ])
+        sampler = SqliteRowIdSampler()
+
+        connection = await aiosqlite.connect(databaseFile)
+        assert await sampler.sampleRowId(connection, 'SELECT rowid FROM questions WHERE questionType = ?', ('b', )) is None
+
+        await connection.execute('INSERT INTO questions (question, questionType) VALUES (?, ?)', ('question', 'b'))
+        await connection.commit()
+
+        stat = os.stat(databaseFile)
+        os.utime(databaseFile, ns = (stat.st_atime_ns, stat.st_mtime_ns + 1000000000))
+        assert await sampler.sampleRowId(connection, 'SELECT rowid FROM questions WHERE questionType = ?', ('b', )) is None
+
+        sampler.invalidate()
+        assert await sampler.sampleRowId(connection, 'SELECT rowid FROM questions WHERE questionType = ?', ('b', )) == 2
+        await connection.close()
+
+    @pytest.mark.asyncio
+    async def test_sampleRowId_afterInvalidate(self, tmp_path):
+        databaseFile = str(tmp_path / 'questions.sqlite')
+        await self.__createDatabase(databaseFile, [ 'a' ])
+        sampler = SqliteRowIdSampler(databaseFile)
+
+        connection = await aiosqlite.connect(databaseFile)
+        assert await sampler.sampleRowId(connection, 'SELECT rowid FROM questions') == 1
+
+        await connection.execute('DELETE FROM questions')
+        await connection.execute('INSERT INTO questions (rowid, question, questionType) VALUES (?, ?, ?)', (7, 'question', 'a'))
+        await connection.commit()
+
+        sampler.invalidate()
+        assert await sampler.sampleRowId(connection, 'SELECT rowid FROM questions') == 7
+        await connection.close()
@@ -0,0 +1,136 @@
+import pytest
+
+from src.trivia.questionAnswerTriviaConditions import QuestionAnswerTriviaConditions
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.questions.trueFalseTriviaQuestion import TrueFalseTriviaQuestion
+from src.trivia.triviaDifficulty import TriviaDifficulty
+from src.trivia.triviaFetchOptions import TriviaFetchOptions
+from src.trivia.triviaRepositories.triviaQuestionSpool import TriviaQuestionSpool
+from src.trivia.triviaRepositories.triviaQuestionSpoolStats import TriviaQuestionSpoolStats
+
+
+class TestTriviaQuestionSpool:
+
+    triviaFetchOptions = TriviaFetchOptions(
+        twitchChannel = 'smCharles',
+        twitchChannelId = '12345',
+        questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED
+    )
+
+    def __createQuestion(
+        self,
+        triviaId: str,
+        triviaSource: TriviaSource = TriviaSource.OPEN_TRIVIA_DATABASE,
+        originalTriviaSource: TriviaSource | None = None
+    ) -> TrueFalseTriviaQuestion:
+        return TrueFalseTriviaQuestion(
+            correctAnswer = True,
+            category = None,
+            categoryId = None,
+            question = 'Is this a question?',
+            triviaId = triviaId,
+            triviaDifficulty = TriviaDifficulty.UNKNOWN,
+            originalTriviaSource = originalTriviaSource,
+            triviaSource = triviaSource
+        )
+
+    def test_beginRefill(self):
+        spool = TriviaQuestionSpool(self.triviaFetchOptions)
+        assert not spool.isRefilling
+
+        assert spool.beginRefill()
+        assert spool.isRefilling
+        assert not spool.beginRefill()
+
+        spool.endRefill()
+        assert not spool.isRefilling
+        assert spool.beginRefill()
+
+    def test_get_isFirstInFirstOut(self):
+        spool = TriviaQuestionSpool(self.triviaFetchOptions)
+        first = self.__createQuestion('abc')
+        second = self.__createQuestion('def')
+
+        assert spool.put(first)
+        assert spool.put(second)
+        assert spool.qsize() == 2
+
+        assert spool.get() is first
+        assert spool.get() is second
+        assert spool.get() is None
+        assert spool.qsize() == 0
+
+    def test_put_withAlreadySpooledQuestion(self):
+        spool = TriviaQuestionSpool(self.triviaFetchOptions)
+
+        assert spool.put(self.__createQuestion('abc'))
+        assert not spool.put(self.__createQuestion('abc'))
+        assert spool.put(self.__createQuestion('abc', triviaSource = TriviaSource.WILL_FRY_TRIVIA))
+        assert spool.qsize() == 2
+
+        # the glacial copy of a question is the same question as its original
+        assert not spool.put(self.__createQuestion(
+            triviaId = 'abc',
+            triviaSource = TriviaSource.GLACIAL,
+            originalTriviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+        ))
+
+    def test_put_afterQuestionWasRetrieved(self):
+        spool = TriviaQuestionSpool(self.triviaFetchOptions)
+
+        assert spool.put(self.__createQuestion('abc'))
+        assert spool.get() is not None
+        assert spool.put(self.__createQuestion('abc'))
+
+    def test_toStats(self):
+        spool = TriviaQuestionSpool(self.triviaFetchOptions)
+        spool.get()
+        spool.put(self.__createQuestion('abc'))
+        spool.put(self.__createQuestion('def'))
+        spool.put(self.__createQuestion('ghi'))
+        spool.get()
+        spool.recordHit()
+        spool.get()
+        spool.recordHit()
+        spool.get()
+        spool.recordRejection()
+        spool.get()
+        spool.put(self.__createQuestion('jkl'))
+
+        stats = spool.toStats()
+        assert stats == TriviaQuestionSpoolStats(
+            hits = 2,
+            misses = 2,
+            rejections = 1,
+            size = 1,
+            questionAnswerTriviaConditions = QuestionAnswerTriviaConditions.NOT_ALLOWED,
+            twitchChannel = 'smCharles',
+            twitchChannelId = '12345'
+        )
+
+        assert stats.getHitRate() == 0.4
+
+    def test_toStats_withRetrievedQuestionNotYetHandedOut(self):
+        spool = TriviaQuestionSpool(self.triviaFetchOptions)
+        spool.put(self.__createQuestion('abc'))
+        assert spool.get() is not None
+
+        # retrieving a question alone doesn't count as a hit, as it could still be rejected
+        stats = spool.toStats()
+        assert stats.hits == 0
+        assert stats.rejections == 0
+
+    def test_toStats_withNoRequests(self):
+        stats = TriviaQuestionSpool(self.triviaFetchOptions).toStats()
+        assert stats.hits == 0
+        assert stats.misses == 0
+        assert stats.rejections == 0
+        assert stats.getHitRate() == 0
+
+    def test_constructor_withRequiredTriviaSource(self):
+        with pytest.raises(ValueError):
+            TriviaQuestionSpool(TriviaFetchOptions(
+                twitchChannel = 'smCharles',
+                twitchChannelId = '12345',
+                requiredTriviaSource = TriviaSource.OPEN_TRIVIA_DATABASE
+            ))
@@ -0,0 +1,192 @@
+import asyncio
+
+import pytest
+
+from src.misc.backgroundTaskHelper import BackgroundTaskHelper
+from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+from src.trivia.questions.absTriviaQuestion import AbsTriviaQuestion
+from src.trivia.questions.triviaQuestionType import TriviaQuestionType
+from src.trivia.questions.triviaSource import TriviaSource
+from src.trivia.triviaFetchOptions import TriviaFetchOptions
+from src.trivia.triviaRepositories.triviaQuestionRepositoryInterface import TriviaQuestionRepositoryInterface
+from src.trivia.triviaRepositories.triviaSourceAvailabilityCache import TriviaSourceAvailabilityCache
+from src.trivia.triviaRepositories.triviaSourceAvailabilityCacheInterface import TriviaSourceAvailabilityCacheInterface
+from src.trivia.triviaRepositories.triviaSourceAvailabilityListener import TriviaSourceAvailabilityListener
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now: float = 1000
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeTriviaQuestionRepository(TriviaQuestionRepositoryInterface):
+
+    def __init__(self, triviaSource: TriviaSource):
+        self.__triviaSource: TriviaSource = triviaSource
+
+        self.isAvailable: bool = True
+        self.probeCount: int = 0
+        self.probeDelaySeconds: float = 0
+        self.raiseException: bool = False
+
+    async def fetchTriviaQuestion(self, fetchOptions: TriviaFetchOptions) -> AbsTriviaQuestion:
+        raise NotImplementedError()
+
+    async def hasQuestionSetAvailable(self) -> bool:
+        self.probeCount += 1
+
+        if self.probeDelaySeconds > 0:
+            await asyncio.sleep(self.probeDelaySeconds)
+
+        if self.raiseException:
+            raise RuntimeError('probe failed')
+
+        return self.isAvailable
+
+    @property
+    def supportedTriviaTypes(self) -> set[TriviaQuestionType]:
+        return { TriviaQuestionType.MULTIPLE_CHOICE }
+
+    @property
+    def triviaSource(self) -> TriviaSource:
+        return self.__triviaSource
+
+
+class RecordingListener(TriviaSourceAvailabilityListener):
+
+    def __init__(self):
+        self.events: list[tuple[TriviaSource, bool]] = list()
+
+    async def onTriviaSourceAvailabilityChanged(
+        self,
+        isAvailable: bool,
+        triviaSource: TriviaSource
+    ):
+        self.events.append((triviaSource, isAvailable))
+
+
+class TestTriviaSourceAvailabilityCache:
+
+    eventLoop = asyncio.new_event_loop()
+
+    backgroundTaskHelper: BackgroundTaskHelperInterface = BackgroundTaskHelper(
+        eventLoop = eventLoop
+    )
+
+    timber: TimberInterface = TimberStub()
+
+    def __createCache(self, clock: FakeClock) -> TriviaSourceAvailabilityCacheInterface:
+        return TriviaSourceAvailabilityCache(
+            backgroundTaskHelper = self.backgroundTaskHelper,
+            timber = self.timber,
+            clock = clock,
+            defaultTimeToLiveSeconds = 60,
+            triviaSourceTimeToLiveSeconds = {
+                TriviaSource.GLACIAL: 5
+            }
+        )
+
+    @pytest.mark.asyncio
+    async def test_isAvailable_isCachedUntilExpired(self):
+        clock = FakeClock()
+        cache = self.__createCache(clock)
+        repository = FakeTriviaQuestionRepository(TriviaSource.BONGO)
+
+        assert await cache.isAvailable(repository)
+        assert await cache.isAvailable(repository)
+        assert repository.probeCount == 1
+
+        repository.isAvailable = False
+        clock.now += 59
+        assert await cache.isAvailable(repository)
+        assert repository.probeCount == 1
+
+        clock.now += 1
+        assert not await cache.isAvailable(repository)
+        assert repository.probeCount == 2
+
+    @pytest.mark.asyncio
+    async def test_isAvailable_withTriviaSourceTimeToLive(self):
+        clock = FakeClock()
+        cache = self.__createCache(clock)
+        glacial = FakeTriviaQuestionRepository(TriviaSource.GLACIAL)
+        bongo = FakeTriviaQuestionRepository(TriviaSource.BONGO)
+
+        await cache.isAvailable(glacial)
+        await cache.isAvailable(bongo)
+
+        clock.now += 5
+        await cache.isAvailable(glacial)
+        await cache.isAvailable(bongo)
+
+        assert glacial.probeCount == 2
+        assert bongo.probeCount == 1
+
+    @pytest.mark.asyncio
+    async def test_isAvailable_withProbeException(self):
+        cache = self.__createCache(FakeClock())
+        repository = FakeTriviaQuestionRepository(TriviaSource.BONGO)
+        repository.raiseException = True
+
+        assert not await cache.isAvailable(repository)
+
+    @pytest.mark.asyncio
+    async def test_isAvailable_withConcurrentProbesSharesOneProbe(self):
+        cache = self.__createCache(FakeClock())
+        repository = FakeTriviaQuestionRepository(TriviaSource.BONGO)
+        repository.probeDelaySeconds = 0.01
+
+        results = await asyncio.gather(*[ cache.isAvailable(repository) for _ in range(5) ])
+
+        assert results == [ True ] * 5
+        assert repository.probeCount == 1
+
+    @pytest.mark.asyncio
+    async def test_refresh_notifiesListenerWhenAvailabilityFlips(self):
+        cache = self.__createCache(FakeClock())
+        listener = RecordingListener()
+        cache.setEventListener(listener)
+        repository = FakeTriviaQuestionRepository(TriviaSource.BONGO)
+
+        assert await cache.isAvailable(repository)
+        assert len(listener.events) == 0
+
+        await cache.refresh(TriviaSource.BONGO)
+        assert len(listener.events) == 0
+
+        repository.isAvailable = False
+        await cache.refresh(TriviaSource.BONGO)
+        assert listener.events == [ (TriviaSource.BONGO, False) ]
+        assert not await cache.isAvailable(repository)
+
+        repository.isAvailable = True
+        await cache.refresh(TriviaSource.BONGO)
+        assert listener.events == [ (TriviaSource.BONGO, False), (TriviaSource.BONGO, True) ]
+
+    @pytest.mark.asyncio
+    async def test_refresh_withUnknownTriviaSource(self):
+        cache = self.__createCache(FakeClock())
+        await cache.refresh(TriviaSource.WWTBAM)
+
+    @pytest.mark.asyncio
+    async def test_clearCaches(self):
+        cache = self.__createCache(FakeClock())
+        repository = FakeTriviaQuestionRepository(TriviaSource.BONGO)
+
+        await cache.isAvailable(repository)
+        await cache.clearCaches()
+        await cache.isAvailable(repository)
+
+        assert repository.probeCount == 2
+
+    def test_sanity(self):
+        cache = self.__createCache(FakeClock())
+        assert cache is not None
+        assert isinstance(cache, TriviaSourceAvailabilityCache)
+        assert isinstance(cache, TriviaSourceAvailabilityCacheInterface)
@@ -0,0 +1,421 @@
+import asyncio
+import json
+from asyncio import AbstractEventLoop
+from datetime import datetime, timezone
+from typing import Any, Callable, Coroutine
+
+import pytest
+import websockets
+
+from src.location.timeZoneRepository import TimeZoneRepository
+from src.location.timeZoneRepositoryInterface import TimeZoneRepositoryInterface
+from src.misc.backgroundTaskHelperInterface import BackgroundTaskHelperInterface
+from src.timber.timberInterface import TimberInterface
+from src.timber.timberStub import TimberStub
+from src.twitch.api.twitchApiServiceInterface import TwitchApiServiceInterface
+from src.twitch.api.twitchEventSubRequest import TwitchEventSubRequest
+from src.twitch.api.twitchEventSubResponse import TwitchEventSubResponse
+from src.twitch.api.twitchJsonMapper import TwitchJsonMapper
+from src.twitch.api.websocket.twitchWebsocketConnectionStatus import TwitchWebsocketConnectionStatus
+from src.twitch.api.websocket.twitchWebsocketDataBundle import TwitchWebsocketDataBundle
+from src.twitch.api.websocket.twitchWebsocketSubscriptionType import TwitchWebsocketSubscriptionType
+from src.twitch.twitchTokensRepositoryInterface import TwitchTokensRepositoryInterface
+from src.twitch.websocket.twitchWebsocketAllowedUsersRepositoryInterface import TwitchWebsocketAllowedUsersRepositoryInterface
+from src.twitch.websocket.twitchWebsocketClient import TwitchWebsocketClient
+from src.twitch.websocket.twitchWebsocketClientInterface import TwitchWebsocketClientInterface
+from src.twitch.websocket.twitchWebsocketDataBundleListener import TwitchWebsocketDataBundleListener
+from src.twitch.websocket.twitchWebsocketJsonMapper import TwitchWebsocketJsonMapper
+from src.twitch.websocket.twitchWebsocketUser import TwitchWebsocketUser
+
+
+class TestTwitchWebsocketClient:
+
+    class BackgroundTaskHelper(BackgroundTaskHelperInterface):
+
+        def __init__(self, eventLoop: AbstractEventLoop):
+            self.__eventLoop: AbstractEventLoop = eventLoop
+            self.tasks: list[asyncio.Task] = list()
+
+        async def cancelAll(self):
+            for task in self.tasks:
+                task.cancel()
+
+            await asyncio.gather(*self.tasks, return_exceptions = True)
+
+        def createTask(self, coro: Coroutine):
+            self.tasks.append(self.__eventLoop.create_task(coro))
+
+        @property
+        def eventLoop(self) -> AbstractEventLoop:
+            return self.__eventLoop
+
+    class DataBundleListener(TwitchWebsocketDataBundleListener):
+
+        def __init__(self):
+            self.messageIds: list[str] = list()
+
+        async def onNewWebsocketDataBundle(self, dataBundle: TwitchWebsocketDataBundle):
+            self.messageIds.append(dataBundle.metadata.messageId)
+
+    class TwitchApiService(TwitchApiServiceInterface):
+
+        def __init__(self):
+            self.eventSubRequests: list[TwitchEventSubRequest] = list()
+
+        async def addModerator(self, *args: Any, **kwargs: Any) -> bool:
+            raise NotImplementedError()
+
+        async def banUser(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def createEventSubSubscription(
+            self,
+            twitchAccessToken: str,
+            eventSubRequest: TwitchEventSubRequest
+        ) -> TwitchEventSubResponse:
+            self.eventSubRequests.append(eventSubRequest)
+
+            return TwitchEventSubResponse(
+                createdAt = datetime.now(timezone.utc),
+                cost = 0,
+                maxTotalCost = 10000,
+                total = len(self.eventSubRequests),
+                totalCost = 0,
+                subscriptionId = f'subscription-{len(self.eventSubRequests)}',
+                version = '1',
+                condition = eventSubRequest.condition,
+                subscriptionType = eventSubRequest.subscriptionType,
+                status = TwitchWebsocketConnectionStatus.ENABLED,
+                transport = eventSubRequest.transport
+            )
+
+        async def fetchBannedUser(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def fetchEmotes(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def fetchFollower(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def fetchLiveUserDetails(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def fetchModerator(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def fetchTokens(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def fetchUserDetailsWithUserId(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def fetchUserDetailsWithUserName(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def fetchUserSubscription(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def refreshTokens(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def removeModerator(self, *args: Any, **kwargs: Any) -> bool:
+            raise NotImplementedError()
+
+        async def sendChatMessage(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+        async def unbanUser(self, *args: Any, **kwargs: Any) -> bool:
+            raise NotImplementedError()
+
+        async def validate(self, *args: Any, **kwargs: Any) -> Any:
+            raise NotImplementedError()
+
+    class TwitchTokensRepository(TwitchTokensRepositoryInterface):
+
+        async def addUser(self, code: str, twitchChannel: str, twitchChannelId: str):
+            pass
+
+        async def clearCaches(self):
+            pass
+
+        async def getAccessToken(self, twitchChannel: str) -> str | None:
+            return 'accessToken'
+
+        async def getAccessTokenById(self, twitchChannelId: str) -> str | None:
+            return 'accessToken'
+
+        async def hasAccessToken(self, twitchChannel: str) -> bool:
+            return True
+
+        async def hasAccessTokenById(self, twitchChannelId: str) -> bool:
+            return True
+
+        async def removeUser(self, twitchChannel: str):
+            pass
+
+        async def removeUserById(self, twitchChannelId: str):
+            pass
+
+        async def requireAccessToken(self, twitchChannel: str) -> str:
+            return 'accessToken'
+
+        async def requireAccessTokenById(self, twitchChannelId: str) -> str:
+            return 'accessToken'
+
+        def start(self):
+            pass
+
+    class TwitchWebsocketAllowedUsersRepository(TwitchWebsocketAllowedUsersRepositoryInterface):
+
+        async def getUsers(self) -> frozenset[TwitchWebsocketUser]:
+            return frozenset({
+                TwitchWebsocketUser(
+                    userId = '12345',
+                    userName = 'smCharles'
+                )
+            })
+
+    class FakeEventSubServer:
+
+        # Speaks just enough of the EventSub websocket protocol for the client: every connection
+        # to /ws is welcomed into a brand new session, while a connection to /reconnect carries
+        # over the session named in its query string, just like Twitch's own reconnect URLs.
+
+        def __init__(
+            self,
+            onSessionWelcomed: Callable[[Any, str, bool], Coroutine[Any, Any, None]] | None = None
+        ):
+            self.__onSessionWelcomed = onSessionWelcomed
+            self.connectionCount: int = 0
+            self.sessionIds: list[str] = list()
+            self.url: str = ''
+            self.__messageCount: int = 0
+            self.__server: Any | None = None
+
+        async def __aenter__(self):
+            self.__server = await websockets.serve(self.__handleConnection, 'localhost', 0)
+            port = list(self.__server.sockets)[0].getsockname()[1]
+            self.url = f'ws://localhost:{port}'
+            return self
+
+        async def __aexit__(self, *args: Any):
+            if self.__server is not None:
+                self.__server.close()
+                await self.__server.wait_closed()
+
+        def createMessage(self, messageType: str, session: dict[str, Any] | None = None) -> str:
+            self.__messageCount += 1
+
+            payload: dict[str, Any] = dict()
+            if session is not None:
+                payload['session'] = session
+
+            return json.dumps({
+                'metadata': {
+                    'message_id': f'message-{self.__messageCount}',
+                    'message_timestamp': datetime.now(timezone.utc).isoformat(),
+                    'message_type': messageType
+                },
+                'payload': payload
+            })
+
+        def createSession(self, sessionId: str, status: str, reconnectUrl: str | None = None) -> dict[str, Any]:
+            return {
+                'connected_at': datetime.now(timezone.utc).isoformat(),
+                'id': sessionId,
+                'keepalive_timeout_seconds': None if status == 'reconnecting' else 10,
+                'reconnect_url': reconnectUrl,
+                'status': status
+            }
+
+        async def __handleConnection(self, connection: Any):
+            self.connectionCount += 1
+            path = connection.request.path
+            isReconnect = path.startswith('/reconnect')
+
+            if isReconnect:
+                sessionId = path.split('session=')[1]
+            else:
+                sessionId = f'session-{len(self.sessionIds) + 1}'
+                self.sessionIds.append(sessionId)
+
+            await connection.send(self.createMessage('session_welcome', self.createSession(sessionId, 'connected')))
+
+            if self.__onSessionWelcomed is not None:
+                await self.__onSessionWelcomed(connection, sessionId, isReconnect)
+
+            try:
+                await connection.wait_closed()
+            except Exception:
+                pass
+
+    timber: TimberInterface = TimberStub()
+
+    timeZoneRepository: TimeZoneRepositoryInterface = TimeZoneRepository()
+
+    def createClient(
+        self,
+        backgroundTaskHelper: BackgroundTaskHelperInterface,
+        twitchApiService: TwitchApiServiceInterface,
+        twitchWebsocketUrl: str,
+        maxSubscriptionsPerSession: int = 300
+    ) -> TwitchWebsocketClient:
+        return TwitchWebsocketClient(
+            backgroundTaskHelper = backgroundTaskHelper,
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository,
+            twitchApiService = twitchApiService,
+            twitchTokensRepository = TestTwitchWebsocketClient.TwitchTokensRepository(),
+            twitchWebsocketAllowedUsersRepository = TestTwitchWebsocketClient.TwitchWebsocketAllowedUsersRepository(),
+            twitchWebsocketJsonMapper = TwitchWebsocketJsonMapper(
+                timber = self.timber,
+                twitchJsonMapper = TwitchJsonMapper(
+                    timber = self.timber,
+                    timeZoneRepository = self.timeZoneRepository
+                )
+            ),
+            websocketCreationDelayTimeSeconds = 0.1,
+            maxSubscriptionsPerSession = maxSubscriptionsPerSession,
+            subscriptionTypes = frozenset({
+                TwitchWebsocketSubscriptionType.CHEER,
+                TwitchWebsocketSubscriptionType.FOLLOW,
+                TwitchWebsocketSubscriptionType.RAID
+            }),
+            twitchWebsocketUrl = f'{twitchWebsocketUrl}/ws'
+        )
+
+    async def waitFor(self, condition: Callable[[], bool], timeoutSeconds: float = 10):
+        eventLoop = asyncio.get_running_loop()
+        deadline = eventLoop.time() + timeoutSeconds
+
+        while not condition():
+            assert eventLoop.time() < deadline
+            await asyncio.sleep(0.05)
+
+    @pytest.mark.asyncio
+    async def test_start_packsSubscriptionsIntoSessions(self):
+        backgroundTaskHelper = TestTwitchWebsocketClient.BackgroundTaskHelper(asyncio.get_running_loop())
+        twitchApiService = TestTwitchWebsocketClient.TwitchApiService()
+
+        async with TestTwitchWebsocketClient.FakeEventSubServer() as server:
+            client = self.createClient(
+                backgroundTaskHelper = backgroundTaskHelper,
+                twitchApiService = twitchApiService,
+                twitchWebsocketUrl = server.url,
+                maxSubscriptionsPerSession = 2
+            )
+
+            try:
+                client.start()
+                await self.waitFor(lambda: len(twitchApiService.eventSubRequests) == 3)
+            finally:
+                await backgroundTaskHelper.cancelAll()
+
+        assert server.sessionIds == [ 'session-1', 'session-2' ]
+
+        sessionIds = [ eventSubRequest.transport.sessionId for eventSubRequest in twitchApiService.eventSubRequests ]
+        assert sessionIds.count('session-1') + sessionIds.count('session-2') == 3
+        assert 1 <= sessionIds.count('session-1') <= 2
+
+        subscriptionTypes = { eventSubRequest.subscriptionType for eventSubRequest in twitchApiService.eventSubRequests }
+        assert subscriptionTypes == {
+            TwitchWebsocketSubscriptionType.CHEER,
+            TwitchWebsocketSubscriptionType.FOLLOW,
+            TwitchWebsocketSubscriptionType.RAID
+        }
+
+    @pytest.mark.asyncio
+    async def test_start_subscribesAndDeliversDataBundles(self):
+        backgroundTaskHelper = TestTwitchWebsocketClient.BackgroundTaskHelper(asyncio.get_running_loop())
+        twitchApiService = TestTwitchWebsocketClient.TwitchApiService()
+        listener = TestTwitchWebsocketClient.DataBundleListener()
+
+        async def onSessionWelcomed(connection: Any, sessionId: str, isReconnect: bool):
+            await connection.send(server.createMessage('session_keepalive'))
+
+        async with TestTwitchWebsocketClient.FakeEventSubServer(onSessionWelcomed) as server:
+            client = self.createClient(
+                backgroundTaskHelper = backgroundTaskHelper,
+                twitchApiService = twitchApiService,
+                twitchWebsocketUrl = server.url
+            )
+
+            client.setDataBundleListener(listener)
+
+            try:
+                client.start()
+                await self.waitFor(lambda: len(listener.messageIds) == 2)
+            finally:
+                await backgroundTaskHelper.cancelAll()
+
+        assert server.sessionIds == [ 'session-1' ]
+        assert listener.messageIds == [ 'message-1', 'message-2' ]
+        assert len(twitchApiService.eventSubRequests) == 3
+
+        for eventSubRequest in twitchApiService.eventSubRequests:
+            assert eventSubRequest.transport.sessionId == 'session-1'
+
+    @pytest.mark.asyncio
+    async def test_start_withSessionReconnect_doesNotLoseMessages(self):
+        backgroundTaskHelper = TestTwitchWebsocketClient.BackgroundTaskHelper(asyncio.get_running_loop())
+        twitchApiService = TestTwitchWebsocketClient.TwitchApiService()
+        listener = TestTwitchWebsocketClient.DataBundleListener()
+        oldConnectionMessageIds: list[str] = list()
+        newConnectionMessageIds: list[str] = list()
+
+        async def onSessionWelcomed(connection: Any, sessionId: str, isReconnect: bool):
+            if isReconnect:
+                message = server.createMessage('session_keepalive')
+                newConnectionMessageIds.append(json.loads(message)['metadata']['message_id'])
+                await connection.send(message)
+            else:
+                reconnectUrl = f'{server.url}/reconnect?session={sessionId}'
+                await connection.send(server.createMessage('session_reconnect', server.createSession(sessionId, 'reconnecting', reconnectUrl)))
+
+                # Twitch keeps sending events on the old connection until the new one is welcomed
+                message = server.createMessage('session_keepalive')
+                oldConnectionMessageIds.append(json.loads(message)['metadata']['message_id'])
+                await connection.send(message)
+
+        async with TestTwitchWebsocketClient.FakeEventSubServer(onSessionWelcomed) as server:
+            client = self.createClient(
+                backgroundTaskHelper = backgroundTaskHelper,
+                twitchApiService = twitchApiService,
+                twitchWebsocketUrl = server.url
+            )
+
+            client.setDataBundleListener(listener)
+
+            try:
+                client.start()
+                await self.waitFor(lambda: len(newConnectionMessageIds) == 1 and newConnectionMessageIds[0] in listener.messageIds)
+                await self.waitFor(lambda: oldConnectionMessageIds[0] in listener.messageIds)
+            finally:
+                await backgroundTaskHelper.cancelAll()
+
+        assert server.connectionCount == 2
+        assert server.sessionIds == [ 'session-1' ]
+
+        # the session carried over, so its subscriptions did too
+        assert len(twitchApiService.eventSubRequests) == 3
+
+    def test_sanity(self):
+        client = TwitchWebsocketClient(
+            backgroundTaskHelper = TestTwitchWebsocketClient.BackgroundTaskHelper(asyncio.new_event_loop()),
+            timber = self.timber,
+            timeZoneRepository = self.timeZoneRepository,
+            twitchApiService = TestTwitchWebsocketClient.TwitchApiService(),
+            twitchTokensRepository = TestTwitchWebsocketClient.TwitchTokensRepository(),
+            twitchWebsocketAllowedUsersRepository = TestTwitchWebsocketClient.TwitchWebsocketAllowedUsersRepository(),
+            twitchWebsocketJsonMapper = TwitchWebsocketJsonMapper(
+                timber = self.timber,
+                twitchJsonMapper = TwitchJsonMapper(
+                    timber = self.timber,
+                    timeZoneRepository = self.timeZoneRepository
+                )
+            )
+        )
+
+        assert client is not None
+        assert isinstance(client, TwitchWebsocketClientInterface)
@@ -7,6 +7,7 @@ from src.timber.timberStub import TimberStub
 from src.twitch.api.twitchJsonMapper import TwitchJsonMapper
 from src.twitch.api.twitchJsonMapperInterface import TwitchJsonMapperInterface
 from src.twitch.api.websocket.twitchWebsocketCondition import TwitchWebsocketCondition
+from src.twitch.api.websocket.twitchWebsocketConnectionStatus import TwitchWebsocketConnectionStatus
 from src.twitch.api.websocket.twitchWebsocketTransportMethod import TwitchWebsocketTransportMethod
 from src.twitch.websocket.twitchWebsocketJsonMapper import TwitchWebsocketJsonMapper
 from src.twitch.websocket.twitchWebsocketJsonMapperInterface import TwitchWebsocketJsonMapperInterface
@@ -177,6 +178,22 @@ class TestTwitchWebsocketJsonMapper:
         result = await self.websocketJsonMapper.parseTwitchWebsocketSession(None)
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_parseWebsocketSession_withReconnectSession(self):
+        result = await self.websocketJsonMapper.parseTwitchWebsocketSession({
+            'connected_at': '2022-11-16T10:11:12.634234626Z',
+            'id': 'AQoQexAWVYKSTIu4ec_2VAxyuhAB',
+            'keepalive_timeout_seconds': None,
+            'reconnect_url': 'wss://eventsub.wss.twitch.tv?...',
+            'status': 'reconnecting'
+        })
+
+        assert result is not None
+        assert result.keepAliveTimeoutSeconds is None
+        assert result.reconnectUrl == 'wss://eventsub.wss.twitch.tv?...'
+        assert result.sessionId == 'AQoQexAWVYKSTIu4ec_2VAxyuhAB'
+        assert result.status is TwitchWebsocketConnectionStatus.RECONNECTING
+
     @pytest.mark.asyncio
     async def test_parseWebsocketSubGift_withEmptyDictionary(self):
         result = await self.websocketJsonMapper.parseWebsocketSubGift(dict())